@@ -0,0 +1,47 @@
+"""add journal entry full text search
+
+Revision ID: 0a856c1c2de9
+Revises: 4c6449b4d84f
+Create Date: 2026-10-17 20:47:36.213561
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+from database.full_text_search import (
+    POSTGRES_CREATE_STATEMENTS,
+    POSTGRES_DROP_STATEMENTS,
+    SQLITE_CREATE_STATEMENTS,
+    SQLITE_DROP_STATEMENTS,
+    SQLITE_REBUILD_STATEMENT,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0a856c1c2de9"
+down_revision: Union[str, None] = "4c6449b4d84f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_CREATE_STATEMENTS:
+            op.execute(statement)
+        # Index the entries that existed before the triggers did
+        op.execute(SQLITE_REBUILD_STATEMENT)
+    elif dialect == "postgresql":
+        for statement in POSTGRES_CREATE_STATEMENTS:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_DROP_STATEMENTS:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        for statement in POSTGRES_DROP_STATEMENTS:
+            op.execute(statement)
@@ -0,0 +1,46 @@
+"""add journal entry embedding
+
+Revision ID: 11e6a6bc362e
+Revises: 0bc3c41b36e4
+Create Date: 2026-10-17 21:45:16.175378
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "11e6a6bc362e"
+down_revision: Union[str, None] = "0bc3c41b36e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "journal_entry_embedding",
+        sa.Column(
+            "journal_entry_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("user_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("embedder", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["journal_entry_id"], ["journal_entry.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("journal_entry_id"),
+    )
+    op.create_index(
+        "ix_journal_entry_embedding_user_id", "journal_entry_embedding", ["user_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_journal_entry_embedding_user_id", table_name="journal_entry_embedding"
+    )
+    op.drop_table("journal_entry_embedding")
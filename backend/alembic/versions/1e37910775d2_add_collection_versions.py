@@ -0,0 +1,49 @@
+"""add collection versions
+
+Revision ID: 1e37910775d2
+Revises: b55b0a385f6e
+Create Date: 2026-10-17 21:08:14.994108
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1e37910775d2"
+down_revision: Union[str, None] = "b55b0a385f6e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_version",
+        sa.Column("user_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("collection", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("user_id", "collection"),
+    )
+    # Project listings are now filtered by user, so the sort index leads with it
+    op.drop_index("ix_project_last_entry_date_name", table_name="project")
+    op.create_index(
+        "ix_project_user_id_last_entry_date_name",
+        "project",
+        ["user_id", sa.text("last_entry_date DESC"), "name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_user_id_last_entry_date_name", table_name="project")
+    op.create_index(
+        "ix_project_last_entry_date_name",
+        "project",
+        [sa.text("last_entry_date DESC"), "name"],
+        unique=False,
+    )
+    op.drop_table("collection_version")
@@ -0,0 +1,48 @@
+"""add technology usage count
+
+Revision ID: 44b265c758ff
+Revises: 0a856c1c2de9
+Create Date: 2026-10-17 20:55:34.439849
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "44b265c758ff"
+down_revision: Union[str, None] = "0a856c1c2de9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "technology",
+        sa.Column("usage_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE technology
+        SET usage_count = (
+            SELECT count(*)
+            FROM journal_entry_technology_link
+            WHERE journal_entry_technology_link.technology_id = technology.id
+        )
+        """
+    )
+    op.create_index(
+        "ix_technology_user_id_usage_count_name",
+        "technology",
+        ["user_id", sa.text("usage_count DESC"), "name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_technology_user_id_usage_count_name", table_name="technology")
+    with op.batch_alter_table("technology") as batch_op:
+        batch_op.drop_column("usage_count")
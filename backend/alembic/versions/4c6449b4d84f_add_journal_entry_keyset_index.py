@@ -0,0 +1,32 @@
+"""add journal entry keyset index
+
+Revision ID: 4c6449b4d84f
+Revises: f162846e6c36
+Create Date: 2026-10-17 20:43:24.919033
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c6449b4d84f"
+down_revision: Union[str, None] = "f162846e6c36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_journal_entry_user_id_date_id",
+        "journal_entry",
+        ["user_id", sa.text("date DESC"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_journal_entry_user_id_date_id", table_name="journal_entry")
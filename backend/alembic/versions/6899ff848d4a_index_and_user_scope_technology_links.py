@@ -0,0 +1,68 @@
+"""index and user scope technology links
+
+Revision ID: 6899ff848d4a
+Revises: 44b265c758ff
+Create Date: 2026-10-17 20:58:42.334015
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6899ff848d4a"
+down_revision: Union[str, None] = "44b265c758ff"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+LINK_TABLE = "journal_entry_technology_link"
+USER_FK = "fk_journal_entry_technology_link_user_id_user"
+
+
+def upgrade() -> None:
+    with op.batch_alter_table(LINK_TABLE) as batch_op:
+        batch_op.add_column(sa.Column("user_id", sa.String(), nullable=True))
+    op.execute(
+        f"""
+        UPDATE {LINK_TABLE}
+        SET user_id = (
+            SELECT journal_entry.user_id
+            FROM journal_entry
+            WHERE journal_entry.id = {LINK_TABLE}.journal_entry_id
+        )
+        """
+    )
+    with op.batch_alter_table(LINK_TABLE) as batch_op:
+        batch_op.alter_column("user_id", existing_type=sa.String(), nullable=False)
+        batch_op.create_foreign_key(USER_FK, "user", ["user_id"], ["id"])
+
+    op.create_index(
+        "ix_journal_entry_technology_link_technology_id_journal_entry_id",
+        LINK_TABLE,
+        ["technology_id", "journal_entry_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_journal_entry_technology_link_user_id_technology_id",
+        LINK_TABLE,
+        ["user_id", "technology_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_journal_entry_technology_link_user_id_technology_id",
+        table_name=LINK_TABLE,
+    )
+    op.drop_index(
+        "ix_journal_entry_technology_link_technology_id_journal_entry_id",
+        table_name=LINK_TABLE,
+    )
+    with op.batch_alter_table(LINK_TABLE) as batch_op:
+        batch_op.drop_constraint(USER_FK, type_="foreignkey")
+        batch_op.drop_column("user_id")
@@ -0,0 +1,58 @@
+"""add project entry stats
+
+Revision ID: b55b0a385f6e
+Revises: 6899ff848d4a
+Create Date: 2026-10-17 21:04:32.950638
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b55b0a385f6e"
+down_revision: Union[str, None] = "6899ff848d4a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "project",
+        sa.Column("entry_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.create_index(
+        "ix_journal_entry_project_id_date",
+        "journal_entry",
+        ["project_id", "date"],
+        unique=False,
+    )
+    op.execute(
+        """
+        UPDATE project
+        SET entry_count = (
+                SELECT count(*) FROM journal_entry
+                WHERE journal_entry.project_id = project.id
+            ),
+            last_entry_date = (
+                SELECT max(journal_entry.date) FROM journal_entry
+                WHERE journal_entry.project_id = project.id
+            )
+        """
+    )
+    op.create_index(
+        "ix_project_last_entry_date_name",
+        "project",
+        [sa.text("last_entry_date DESC"), "name"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_last_entry_date_name", table_name="project")
+    op.drop_index("ix_journal_entry_project_id_date", table_name="journal_entry")
+    with op.batch_alter_table("project") as batch_op:
+        batch_op.drop_column("entry_count")
@@ -0,0 +1,93 @@
+"""add activity rollups
+
+Revision ID: d355e67ab9de
+Revises: 11e6a6bc362e
+Create Date: 2026-10-17 21:56:35.585094
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d355e67ab9de"
+down_revision: Union[str, None] = "11e6a6bc362e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Rollup table, its period column and how to truncate an entry's date to it
+ROLLUPS = {
+    "sqlite": [
+        ("daily_activity", "day", "date(journal_entry.date)"),
+        ("monthly_activity", "month", "date(journal_entry.date, 'start of month')"),
+    ],
+    "postgresql": [
+        ("daily_activity", "day", "CAST(journal_entry.date AS DATE)"),
+        (
+            "monthly_activity",
+            "month",
+            "CAST(date_trunc('month', journal_entry.date) AS DATE)",
+        ),
+    ],
+}
+
+
+def upgrade() -> None:
+    for table, period in (("daily_activity", "day"), ("monthly_activity", "month")):
+        op.create_table(
+            table,
+            sa.Column("user_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column("project_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+            sa.Column(
+                "technology_id", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+            ),
+            sa.Column(period, sa.Date(), nullable=False),
+            sa.Column("entry_count", sa.Integer(), nullable=False),
+            sa.Column("chars", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+            sa.PrimaryKeyConstraint("user_id", "project_id", "technology_id", period),
+        )
+
+    # Count the existing journal, as database/activity.py would have
+    for table, period, truncate in ROLLUPS.get(op.get_bind().dialect.name, []):
+        columns = f"user_id, project_id, technology_id, {period}, entry_count, chars"
+        counts = "count(*), sum(length(journal_entry.content))"
+        op.execute(
+            f"""
+            INSERT INTO {table} ({columns})
+            SELECT journal_entry.user_id, '', '', {truncate}, {counts}
+            FROM journal_entry
+            GROUP BY journal_entry.user_id, {truncate}
+            """
+        )
+        op.execute(
+            f"""
+            INSERT INTO {table} ({columns})
+            SELECT journal_entry.user_id, journal_entry.project_id, '', {truncate},
+                   {counts}
+            FROM journal_entry
+            WHERE journal_entry.project_id IS NOT NULL
+            GROUP BY journal_entry.user_id, journal_entry.project_id, {truncate}
+            """
+        )
+        op.execute(
+            f"""
+            INSERT INTO {table} ({columns})
+            SELECT journal_entry.user_id, '', link.technology_id, {truncate},
+                   {counts}
+            FROM journal_entry
+            JOIN journal_entry_technology_link AS link
+                ON link.journal_entry_id = journal_entry.id
+            GROUP BY journal_entry.user_id, link.technology_id, {truncate}
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("monthly_activity")
+    op.drop_table("daily_activity")
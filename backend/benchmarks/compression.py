@@ -0,0 +1,89 @@
+"""Benchmark response compression: CPU time against bytes saved.
+
+Serializes a journal entry page (see ``benchmarks.response_serialization``) and
+the same entries as an NDJSON export, then compresses both with every available
+encoding at a range of levels. Use the table to pick ``GZIP_LEVEL``,
+``BROTLI_QUALITY`` and ``ZSTD_LEVEL``.
+
+Usage (from ``backend/``):
+    python -m benchmarks.compression --entries 100
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.response_serialization import build_payloads
+from core.compression import (
+    BrotliEncoder,
+    GzipEncoder,
+    ZstdEncoder,
+    available_encoders,
+)
+from core.responses import ModelResponse
+
+LEVELS = {
+    "gzip": (GzipEncoder, (1, 3, 6, 9)),
+    "br": (BrotliEncoder, (1, 4, 6, 9, 11)),
+    "zstd": (ZstdEncoder, (1, 3, 6, 9, 19)),
+}
+
+
+def compress(encoder_class, level: int, chunks: list[bytes]) -> bytes:
+    encoder = encoder_class(level)
+    return b"".join(encoder.compress(chunk) for chunk in chunks) + encoder.finish()
+
+
+def time_compression(
+    encoder_class, level: int, chunks: list[bytes], repeat: int
+) -> tuple[int, float]:
+    """Return the compressed size and median wall time in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(compress(encoder_class, level, chunks))
+        timings.append((time.perf_counter() - started) * 1000)
+    return size, statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100)
+    parser.add_argument("--technologies-per-entry", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    response_model, page = build_payloads(args.entries, args.technologies_per_entry)[
+        "journal entry page"
+    ]
+    item_model = response_model.model_fields["items"].annotation.__args__[0]
+    bodies = {
+        "page (one body)": [ModelResponse(page).body],
+        "export (per-row flush)": [
+            ModelResponse(item, item_model).body + b"\n" for item in page.items
+        ],
+    }
+
+    available = available_encoders()
+    print(
+        f"{'body':<22}  {'coding':<6}  {'level':>5}  {'bytes':>9}  {'ratio':>6}"
+        f"  {'ms':>7}  {'MB/s':>7}"
+    )
+    for name, chunks in bodies.items():
+        raw_size = sum(len(chunk) for chunk in chunks)
+        print(f"{name:<22}  {'none':<6}  {'':>5}  {raw_size:>9,}")
+        for coding, (encoder_class, levels) in LEVELS.items():
+            if coding not in available:
+                print(f"{name:<22}  {coding:<6}  (library not installed)")
+                continue
+            for level in levels:
+                size, ms = time_compression(encoder_class, level, chunks, args.repeat)
+                throughput = raw_size / 1_000_000 / (ms / 1000)
+                print(
+                    f"{name:<22}  {coding:<6}  {level:>5}  {size:>9,}"
+                    f"  {raw_size / size:>5.1f}x  {ms:>7.2f}  {throughput:>7.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
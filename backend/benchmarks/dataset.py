@@ -0,0 +1,315 @@
+"""Generate a large, deterministic dataset for load testing.
+
+Creates ``--users`` users, each with ``--projects`` projects, ``--technologies``
+technologies and ``--entries`` journal entries spread over ``--days`` days.
+Entry lengths are log-normal, so most entries are a paragraph and a few run to
+pages. The number of technologies per entry follows ``FAN_OUT_WEIGHTS``, and the
+choice of technology and project is Zipf-skewed, so every user has a few
+favourites and a long tail. The same ``--seed`` always yields the same rows,
+ids included.
+
+Rows are written with bulk ``executemany`` inserts in batches of
+``--batch-size`` entries. ``usage_count``, ``entry_count`` and
+``last_entry_date`` are computed with the repair queries of
+``recount-technology-usage`` and ``check-project-stats --repair``, and the
+activity rollups as by ``rebuild-activity``. Every user
+gets the password ``--password`` (hashed once).
+
+The target is ``DATABASE_URL``; tables are created if missing. Users are
+``bench-<n>@example.com``, so a run against a database that already holds a
+dataset fails on the unique email. Start from an empty database.
+
+Usage (from ``backend/``):
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.dataset --entries 20000
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+
+from benchmarks.response_serialization import WORDS
+from database.activity import rebuild_activity
+from database.db import engine as default_engine
+from database.slow_queries import slow_query_log
+from database.models import (
+    JournalEntry,
+    JournalEntryTechnologyLink,
+    Project,
+    SQLModel,
+    Technology,
+    User,
+)
+from database.technology_seed_data import TECHNOLOGY_SEED_DATA
+from domain.project.project_repo import ProjectRepo
+from domain.technology.technology_repo import TechnologyRepo
+from domain.user.password_hasher import password_hasher
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Fixed so a dataset does not depend on the day it was generated
+END_DATE = datetime(2025, 1, 1)
+# Probability of an entry having 0, 1, 2, ... technologies
+FAN_OUT_WEIGHTS = (10, 22, 26, 18, 11, 6, 4, 2, 1)
+# Log-normal word count: median e**4.3 ~ 74 words, 99th percentile ~ 750
+CONTENT_WORDS_MU = 4.3
+CONTENT_WORDS_SIGMA = 1.0
+CONTENT_WORDS_MAX = 3000
+PROJECTLESS_SHARE = 0.25
+PRIVATE_SHARE = 0.1
+FIRST_NAMES = ("Ada", "Grace", "Linus", "Guido", "Barbara", "Ken", "Radia", "Yukihiro")
+LAST_NAMES = ("Lovelace", "Hopper", "Torvalds", "Rossum", "Liskov", "Thompson")
+
+
+@dataclass
+class DatasetSpec:
+    users: int = 10
+    projects: int = 20  # per user
+    technologies: int = 40  # per user
+    entries: int = 10_000  # per user
+    days: int = 3 * 365
+    seed: int = 42
+    batch_size: int = 5_000
+
+
+@dataclass
+class DatasetStats:
+    users: int = 0
+    projects: int = 0
+    technologies: int = 0
+    journal_entries: int = 0
+    links: int = 0
+
+
+def user_email(n: int) -> str:
+    return f"bench-{n}@example.com"
+
+
+def zipf_weights(n: int, exponent: float = 1.1) -> list[float]:
+    return [1 / (rank**exponent) for rank in range(1, n + 1)]
+
+
+class DatasetGenerator:
+    """Produces the rows of a dataset from a seeded ``random.Random``."""
+
+    def __init__(self, spec: DatasetSpec) -> None:
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.technology_weights = zipf_weights(spec.technologies)
+        self.project_weights = zipf_weights(spec.projects)
+
+    def new_id(self) -> str:
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def content(self) -> str:
+        words = math.ceil(
+            self.rng.lognormvariate(CONTENT_WORDS_MU, CONTENT_WORDS_SIGMA)
+        )
+        words = min(words, CONTENT_WORDS_MAX)
+        text = " ".join(self.rng.choices(WORDS, k=words))
+        return text[0].upper() + text[1:] + "."
+
+    def user(self, n: int, password_hash: str) -> dict:
+        return {
+            "id": self.new_id(),
+            "email": user_email(n),
+            "first_name": FIRST_NAMES[n % len(FIRST_NAMES)],
+            "last_name": LAST_NAMES[n % len(LAST_NAMES)],
+            "password": password_hash,
+        }
+
+    def technologies(self, user_id: str) -> list[dict]:
+        rows = []
+        for t in range(self.spec.technologies):
+            seed = TECHNOLOGY_SEED_DATA[t % len(TECHNOLOGY_SEED_DATA)]
+            round_ = t // len(TECHNOLOGY_SEED_DATA)
+            rows.append(
+                {
+                    "id": self.new_id(),
+                    "name": seed["name"] + (f" {round_ + 1}" if round_ else ""),
+                    "description": seed.get("description"),
+                    # str-valued ``Language`` members; not every seed has one
+                    "language": seed.get("language"),
+                    "usage_count": 0,
+                    "user_id": user_id,
+                }
+            )
+        return rows
+
+    def projects(self, user_n: int, user_id: str) -> list[dict]:
+        # Project names are unique across all users
+        return [
+            {
+                "id": self.new_id(),
+                "name": f"Project {user_n}-{p}",
+                "description": self.content()[:200],
+                "link": f"https://example.com/projects/{user_n}-{p}",
+                "is_private": self.rng.random() < PRIVATE_SHARE,
+                "entry_count": 0,
+                "user_id": user_id,
+            }
+            for p in range(self.spec.projects)
+        ]
+
+    def journal_entry(
+        self, user_id: str, technology_ids: list[str], project_ids: list[str]
+    ) -> tuple[dict, list[dict]]:
+        """Return an entry row and its link rows."""
+        entry_id = self.new_id()
+        project_id = None
+        if project_ids and self.rng.random() >= PROJECTLESS_SHARE:
+            project_id = self.rng.choices(project_ids, self.project_weights)[0]
+        entry = {
+            "id": entry_id,
+            "content": self.content(),
+            "date": END_DATE
+            - timedelta(seconds=self.rng.randrange(self.spec.days * 86_400)),
+            "is_private": self.rng.random() < PRIVATE_SHARE,
+            "project_id": project_id,
+            "user_id": user_id,
+        }
+        fan_out = self.rng.choices(range(len(FAN_OUT_WEIGHTS)), FAN_OUT_WEIGHTS)[0]
+        fan_out = min(fan_out, len(technology_ids))
+        linked: set[str] = set()
+        while len(linked) < fan_out:
+            linked.add(self.rng.choices(technology_ids, self.technology_weights)[0])
+        links = [
+            {
+                "journal_entry_id": entry_id,
+                "technology_id": technology_id,
+                "user_id": user_id,
+            }
+            for technology_id in sorted(linked)
+        ]
+        return entry, links
+
+
+async def generate_dataset(
+    engine: AsyncEngine,
+    spec: DatasetSpec,
+    password_hash: str,
+    progress: bool = False,
+) -> DatasetStats:
+    """Insert the dataset described by ``spec`` and fix up the counters.
+
+    Returns:
+        DatasetStats: Number of rows written per table
+    """
+    generator = DatasetGenerator(spec)
+    stats = DatasetStats()
+    total_entries = spec.users * spec.entries
+    started = time.perf_counter()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    user_ids = []
+    for n in range(spec.users):
+        user = generator.user(n, password_hash)
+        user_ids.append(user["id"])
+        technologies = generator.technologies(user["id"])
+        projects = generator.projects(n, user["id"])
+        async with engine.begin() as conn:
+            await conn.execute(insert(User.__table__), [user])
+            if technologies:
+                await conn.execute(insert(Technology.__table__), technologies)
+            if projects:
+                await conn.execute(insert(Project.__table__), projects)
+        stats.users += 1
+        stats.technologies += len(technologies)
+        stats.projects += len(projects)
+
+        technology_ids = [technology["id"] for technology in technologies]
+        project_ids = [project["id"] for project in projects]
+        for batch_start in range(0, spec.entries, spec.batch_size):
+            batch = min(spec.batch_size, spec.entries - batch_start)
+            entries, links = [], []
+            for _ in range(batch):
+                entry, entry_links = generator.journal_entry(
+                    user["id"], technology_ids, project_ids
+                )
+                entries.append(entry)
+                links.extend(entry_links)
+            async with engine.begin() as conn:
+                await conn.execute(insert(JournalEntry.__table__), entries)
+                if links:
+                    await conn.execute(
+                        insert(JournalEntryTechnologyLink.__table__), links
+                    )
+            stats.journal_entries += len(entries)
+            stats.links += len(links)
+            if progress:
+                elapsed = time.perf_counter() - started
+                print(
+                    f"\r{stats.journal_entries}/{total_entries} entries "
+                    f"({stats.journal_entries / elapsed:,.0f}/s)",
+                    end="",
+                    flush=True,
+                )
+    if progress:
+        print()
+
+    async with AsyncSession(engine) as session:
+        await TechnologyRepo(session).recount_usage()
+        await ProjectRepo(session).recompute_stats()
+        for user_id in user_ids:
+            await rebuild_activity(session, user_id)
+            await session.commit()
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    defaults = DatasetSpec()
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument(
+        "--projects", type=int, default=defaults.projects, help="per user"
+    )
+    parser.add_argument(
+        "--technologies", type=int, default=defaults.technologies, help="per user"
+    )
+    parser.add_argument(
+        "--entries", type=int, default=defaults.entries, help="per user"
+    )
+    parser.add_argument("--days", type=int, default=defaults.days)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--password", default="benchmark")
+    args = parser.parse_args()
+    spec = DatasetSpec(
+        users=args.users,
+        projects=args.projects,
+        technologies=args.technologies,
+        entries=args.entries,
+        days=args.days,
+        seed=args.seed,
+        batch_size=args.batch_size,
+    )
+
+    # Every bulk insert batch would be reported as a slow query
+    slow_query_log.threshold = math.inf
+
+    async def run() -> DatasetStats:
+        try:
+            password_hash = await password_hasher.hash(args.password)
+            return await generate_dataset(
+                default_engine, spec, password_hash, progress=True
+            )
+        finally:
+            await default_engine.dispose()
+
+    started = time.perf_counter()
+    stats = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+    for table, rows in asdict(stats).items():
+        print(f"{table:<16} {rows:>12,}")
+    print(f"Generated in {elapsed:.1f} s; log in as {user_email(0)} / {args.password}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Benchmark reverse lookups on ``journal_entry_technology_link``.
+
+Builds a throwaway SQLite database from the models, fills it with ``--links``
+link rows and times the queries that start from a technology or a user, first
+without and then with the ``technology_id``/``user_id`` indexes.
+
+Usage (from ``backend/``):
+    python -m benchmarks.link_table_lookups --links 1000000
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from database.models import SQLModel
+from sqlalchemy import create_engine
+from sqlalchemy.schema import CreateIndex
+
+LINK_INDEXES = (
+    "ix_journal_entry_technology_link_technology_id_journal_entry_id",
+    "ix_journal_entry_technology_link_user_id_technology_id",
+)
+
+QUERIES = {
+    "entries of a technology": (
+        "SELECT journal_entry_id FROM journal_entry_technology_link "
+        "WHERE technology_id = :technology_id",
+        None,
+    ),
+    "technology in use (EXISTS)": (
+        "SELECT EXISTS (SELECT 1 FROM journal_entry_technology_link "
+        "WHERE technology_id = :technology_id)",
+        None,
+    ),
+    "per-user technology counts": (
+        # Before: the owner is only known through journal_entry
+        "SELECT link.technology_id, count(*) FROM journal_entry_technology_link link "
+        "JOIN journal_entry ON journal_entry.id = link.journal_entry_id "
+        "WHERE journal_entry.user_id = :user_id GROUP BY link.technology_id",
+        "SELECT technology_id, count(*) FROM journal_entry_technology_link "
+        "WHERE user_id = :user_id GROUP BY technology_id",
+    ),
+}
+
+
+def build_database(
+    path: Path, links: int, users: int, technologies_per_user: int, per_entry: int
+) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+
+    rng = random.Random(42)
+    entries = links // per_entry
+    start = datetime(2020, 1, 1)
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO user (id, email, first_name, last_name, password) "
+            "VALUES (?, ?, 'Bench', 'User', 'x')",
+            ((f"u{u}", f"u{u}@example.com") for u in range(users)),
+        )
+        conn.executemany(
+            "INSERT INTO technology (id, name, user_id, usage_count) VALUES (?, ?, ?, 0)",
+            (
+                (f"u{u}-t{t}", f"tech {t}", f"u{u}")
+                for u in range(users)
+                for t in range(technologies_per_user)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO journal_entry (id, content, date, is_private, user_id) "
+            "VALUES (?, 'benchmark entry', ?, 0, ?)",
+            (
+                (f"e{e}", start + timedelta(minutes=e), f"u{e % users}")
+                for e in range(entries)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO journal_entry_technology_link "
+            "(journal_entry_id, technology_id, user_id) VALUES (?, ?, ?)",
+            (
+                (f"e{e}", f"u{e % users}-t{t}", f"u{e % users}")
+                for e in range(entries)
+                for t in rng.sample(range(technologies_per_user), per_entry)
+            ),
+        )
+    conn.close()
+
+
+def time_query(
+    conn: sqlite3.Connection, sql: str, params: list[dict], repeat: int
+) -> float:
+    """Return the median wall time of ``sql`` over ``params``, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        for param in params:
+            started = time.perf_counter()
+            conn.execute(sql, param).fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run(conn: sqlite3.Connection, params: dict, repeat: int, after: bool) -> dict:
+    results = {}
+    for name, (before_sql, after_sql) in QUERIES.items():
+        sql = after_sql if after and after_sql else before_sql
+        key = "user_id" if ":user_id" in sql else "technology_id"
+        results[name] = time_query(conn, sql, params[key], repeat)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--links", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--technologies-per-user", type=int, default=50)
+    parser.add_argument("--technologies-per-entry", type=int, default=5)
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "links.db"
+        started = time.perf_counter()
+        build_database(
+            path,
+            args.links,
+            args.users,
+            args.technologies_per_user,
+            args.technologies_per_entry,
+        )
+        print(f"Built {args.links:,} links in {time.perf_counter() - started:.1f}s")
+
+        rng = random.Random(7)
+        params = {
+            "technology_id": [
+                {
+                    "technology_id": f"u{rng.randrange(args.users)}"
+                    f"-t{rng.randrange(args.technologies_per_user)}"
+                }
+                for _ in range(args.samples)
+            ],
+            "user_id": [
+                {"user_id": f"u{rng.randrange(args.users)}"}
+                for _ in range(args.samples)
+            ],
+        }
+
+        conn = sqlite3.connect(path)
+        index_ddl = [
+            str(CreateIndex(index).compile(dialect=create_engine("sqlite://").dialect))
+            for index in SQLModel.metadata.tables[
+                "journal_entry_technology_link"
+            ].indexes
+            if index.name in LINK_INDEXES
+        ]
+        for name in LINK_INDEXES:
+            conn.execute(f"DROP INDEX {name}")
+        conn.execute("ANALYZE")
+        before = run(conn, params, args.repeat, after=False)
+
+        for ddl in index_ddl:
+            conn.execute(ddl)
+        conn.execute("ANALYZE")
+        after = run(conn, params, args.repeat, after=True)
+        conn.close()
+
+    width = max(len(name) for name in QUERIES)
+    print(f"{'query':<{width}}  {'before ms':>10}  {'after ms':>10}  {'speedup':>8}")
+    for name in QUERIES:
+        speedup = before[name] / after[name] if after[name] else float("inf")
+        print(
+            f"{name:<{width}}  {before[name]:>10.3f}  {after[name]:>10.3f}"
+            f"  {speedup:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
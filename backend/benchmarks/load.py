@@ -0,0 +1,445 @@
+"""Load-test the API in process and write per-endpoint latency percentiles.
+
+Logs in as the first ``--users`` users of a ``benchmarks.dataset`` database and
+drives every router through ``httpx.AsyncClient`` over the ASGI transport, so
+the full middleware stack runs but no network or server process is involved.
+Each endpoint gets ``--warmup`` untimed requests, then ``--requests`` requests
+from ``--concurrency`` concurrent workers. Reported per endpoint: p50, p95 and
+p99 latency, mean, throughput and non-2xx/3xx responses. The users' entries
+that have no vector are embedded first, as by ``embed-journal-entries``, so
+the similar entries search has vectors to rank.
+
+The results are written as JSON to ``--output``, together with the git commit
+and the dataset size. ``--compare`` prints the change against an earlier file,
+e.g. one produced on the parent commit.
+
+Writes (creating and updating journal entries, and bcrypt-bound logins) only
+run with ``--writes``. The entries created are deleted directly in the database
+afterwards, with their vectors and the jobs the writes queued, and the counters
+and activity rollups they changed are recomputed, so the dataset stays the same
+between runs.
+
+Usage (from ``backend/``):
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.load \\
+        --output load.json --compare load-main.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable
+
+import httpx
+from benchmarks.dataset import END_DATE, user_email
+from benchmarks.response_serialization import WORDS
+from database.activity import rebuild_activity
+from database.db import engine
+from database.models import (
+    Job,
+    JournalEntry,
+    JournalEntryEmbedding,
+    JournalEntryTechnologyLink,
+    Project,
+    Technology,
+    User,
+)
+from domain.auth.auth_config import security
+from domain.embedding.embedder import get_embedder
+from domain.embedding.embedding_repo import EmbeddingRepo
+from domain.embedding.embedding_service import EmbeddingService
+from main import app
+from domain.project.project_repo import ProjectRepo
+from domain.technology.technology_repo import TechnologyRepo
+from sqlalchemy import delete, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from tests.conftest import send_csrf_header
+
+BASE_URL = "https://bench"  # https so the secure auth cookies are sent back
+PAGE_SIZE = 20
+# Analytics and trends cover the last year of the dataset, not the days before
+# today
+ANALYTICS_END = END_DATE.date()
+ANALYTICS_START = ANALYTICS_END.replace(year=ANALYTICS_END.year - 1)
+
+
+@dataclass
+class UserContext:
+    """A logged-in client and ids to request, gathered from the API."""
+
+    client: httpx.AsyncClient
+    email: str
+    user_id: str
+    technology_ids: list[str] = field(default_factory=list)
+    technology_names: list[str] = field(default_factory=list)
+    project_ids: list[str] = field(default_factory=list)
+    entry_ids: list[str] = field(default_factory=list)
+    next_cursor: str | None = None
+    technologies_etag: str | None = None
+    created_entry_ids: list[str] = field(default_factory=list)
+
+
+# A request builder returns the response of one request for a user
+Scenario = Callable[[UserContext, random.Random], Awaitable[httpx.Response]]
+
+
+def read_scenarios() -> dict[str, Scenario]:
+    return {
+        "GET /api/auth/session": lambda user, rng: user.client.get("/api/auth/session"),
+        "GET /api/users/{id}": lambda user, rng: user.client.get(
+            f"/api/users/{user.user_id}"
+        ),
+        "GET /api/technologies": lambda user, rng: user.client.get("/api/technologies"),
+        "GET /api/technologies (304)": lambda user, rng: user.client.get(
+            "/api/technologies",
+            headers={"If-None-Match": user.technologies_etag or ""},
+        ),
+        "GET /api/technologies/cooccurrence": lambda user, rng: user.client.get(
+            "/api/technologies/cooccurrence"
+        ),
+        "GET /api/technologies/cooccurrence?by=lift": lambda user, rng: (
+            user.client.get("/api/technologies/cooccurrence", params={"by": "lift"})
+        ),
+        "GET /api/technologies/trends": lambda user, rng: user.client.get(
+            "/api/technologies/trends", params={"end": ANALYTICS_END, "months": 12}
+        ),
+        "GET /api/projects": lambda user, rng: user.client.get("/api/projects"),
+        "GET /api/projects/{id}": lambda user, rng: user.client.get(
+            f"/api/projects/{rng.choice(user.project_ids)}"
+        ),
+        "GET /api/journal-entries/": lambda user, rng: user.client.get(
+            "/api/journal-entries/", params={"limit": PAGE_SIZE}
+        ),
+        "GET /api/journal-entries/ (next page)": lambda user, rng: user.client.get(
+            "/api/journal-entries/",
+            params={"limit": PAGE_SIZE, "cursor": user.next_cursor},
+        ),
+        "GET /api/journal-entries/{id}": lambda user, rng: user.client.get(
+            f"/api/journal-entries/{rng.choice(user.entry_ids)}"
+        ),
+        "GET /api/journal-entries/search": lambda user, rng: user.client.get(
+            "/api/journal-entries/search",
+            params={"q": " ".join(rng.sample(WORDS, 2)), "limit": PAGE_SIZE},
+        ),
+        "GET /api/journal-entries/{id}/similar": lambda user, rng: user.client.get(
+            f"/api/journal-entries/{rng.choice(user.entry_ids)}/similar"
+        ),
+        "GET /api/jobs/": lambda user, rng: user.client.get("/api/jobs/"),
+        # A POST, but one that only reads
+        "POST /api/journal-entries/suggest-technologies": suggest_technologies,
+        "GET /api/analytics/calendar": lambda user, rng: user.client.get(
+            "/api/analytics/calendar", params={"end": ANALYTICS_END}
+        ),
+        "GET /api/analytics/months": lambda user, rng: user.client.get(
+            "/api/analytics/months",
+            params={"start": ANALYTICS_START, "end": ANALYTICS_END},
+        ),
+        "GET /api/analytics/months?by=technology": lambda user, rng: user.client.get(
+            "/api/analytics/months",
+            params={"start": ANALYTICS_START, "end": ANALYTICS_END, "by": "technology"},
+        ),
+    }
+
+
+async def create_entry(user: UserContext, rng: random.Random) -> httpx.Response:
+    response = await user.client.post(
+        "/api/journal-entries/",
+        json={
+            "content": " ".join(rng.choices(WORDS, k=80)),
+            "isPrivate": False,
+            "projectId": rng.choice(user.project_ids) if user.project_ids else None,
+            "technologyIds": rng.sample(
+                user.technology_ids, min(3, len(user.technology_ids))
+            ),
+        },
+    )
+    if response.status_code == 201:
+        user.created_entry_ids.append(response.json()["id"])
+    return response
+
+
+async def update_entry(user: UserContext, rng: random.Random) -> httpx.Response:
+    return await user.client.patch(
+        f"/api/journal-entries/{rng.choice(user.created_entry_ids)}",
+        json={
+            "content": " ".join(rng.choices(WORDS, k=80)),
+            "technologyIds": rng.sample(
+                user.technology_ids, min(2, len(user.technology_ids))
+            ),
+        },
+    )
+
+
+async def suggest_technologies(user: UserContext, rng: random.Random) -> httpx.Response:
+    """Ask for tags for a draft naming a few of the user's technologies."""
+    words = rng.choices(WORDS, k=80)
+    for name in rng.sample(user.technology_names, min(3, len(user.technology_names))):
+        words.insert(rng.randrange(len(words) + 1), name)
+    return await user.client.post(
+        "/api/journal-entries/suggest-technologies",
+        json={"content": " ".join(words)},
+    )
+
+
+def write_scenarios(password: str) -> dict[str, Scenario]:
+    return {
+        "POST /api/journal-entries/": create_entry,
+        "PATCH /api/journal-entries/{id}": update_entry,
+        "POST /api/auth/login": lambda user, rng: user.client.post(
+            "/api/auth/login",
+            json={"email": user.email, "password": password},
+        ),
+    }
+
+
+async def log_in(email: str, password: str) -> UserContext:
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url=BASE_URL,
+    )
+    response = await client.post(
+        "/api/auth/login", json={"email": email, "password": password}
+    )
+    response.raise_for_status()
+    send_csrf_header(client, client.cookies[security.config.JWT_ACCESS_COOKIE_NAME])
+    user = UserContext(client=client, email=email, user_id=response.json()["userId"])
+
+    technologies = await client.get("/api/technologies")
+    user.technology_ids = [technology["id"] for technology in technologies.json()]
+    user.technology_names = [technology["name"] for technology in technologies.json()]
+    user.technologies_etag = technologies.headers.get("ETag")
+    projects = await client.get("/api/projects")
+    user.project_ids = [project["id"] for project in projects.json()]
+    page = (await client.get("/api/journal-entries/", params={"limit": 100})).json()
+    user.entry_ids = [entry["id"] for entry in page["items"]]
+    first_page = await client.get("/api/journal-entries/", params={"limit": PAGE_SIZE})
+    user.next_cursor = first_page.json()["nextCursor"]
+    return user
+
+
+async def embed_entries(users: list[UserContext]) -> None:
+    async with AsyncSession(engine) as session:
+        service = EmbeddingService(EmbeddingRepo(session), get_embedder())
+        for user in users:
+            await service.sync(user.user_id)
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    """Reduce request latencies (seconds) to the reported figures."""
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 0.95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "throughput_rps": round(len(ordered) / elapsed, 1),
+    }
+
+
+async def run_scenario(
+    scenario: Scenario,
+    users: list[UserContext],
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+) -> dict:
+    rng = random.Random(seed)
+    for i in range(warmup):
+        await scenario(users[i % len(users)], rng)
+
+    latencies: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker(user: UserContext) -> None:
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await scenario(user, rng)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(users[w % len(users)]) for w in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def dataset_size() -> dict[str, int]:
+    tables = {
+        "users": User,
+        "projects": Project,
+        "technologies": Technology,
+        "journal_entries": JournalEntry,
+        "links": JournalEntryTechnologyLink,
+    }
+    async with engine.connect() as conn:
+        return {
+            name: await conn.scalar(select(func.count()).select_from(model))
+            for name, model in tables.items()
+        }
+
+
+async def remove_created_entries(users: list[UserContext], since: datetime) -> None:
+    """Delete the benchmark's entries, which the API cannot delete yet, with
+    their vectors and the jobs the writes queued after ``since``."""
+    ids = [entry_id for user in users for entry_id in user.created_entry_ids]
+    if not ids:
+        return
+    async with engine.begin() as conn:
+        await conn.execute(
+            delete(Job).where(
+                Job.user_id.in_([user.user_id for user in users]),
+                Job.created_at >= since,
+            )
+        )
+        await conn.execute(
+            delete(JournalEntryEmbedding).where(
+                JournalEntryEmbedding.journal_entry_id.in_(ids)
+            )
+        )
+        await conn.execute(
+            delete(JournalEntryTechnologyLink).where(
+                JournalEntryTechnologyLink.journal_entry_id.in_(ids)
+            )
+        )
+        await conn.execute(delete(JournalEntry).where(JournalEntry.id.in_(ids)))
+    async with AsyncSession(engine) as session:
+        await TechnologyRepo(session).recount_usage()
+        await ProjectRepo(session).recompute_stats()
+        for user in users:
+            if user.created_entry_ids:
+                await rebuild_activity(session, user.user_id)
+                await session.commit()
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict:
+    started = datetime.now()
+    users = [await log_in(user_email(n), args.password) for n in range(args.users)]
+    await embed_entries(users)
+    scenarios = read_scenarios()
+    if args.writes:
+        scenarios.update(write_scenarios(args.password))
+    if args.only:
+        scenarios = {
+            name: scenario
+            for name, scenario in scenarios.items()
+            if any(pattern in name for pattern in args.only)
+        }
+
+    results = {}
+    try:
+        if args.writes:
+            # Updates only touch entries created by the benchmark
+            for user in users:
+                await create_entry(user, random.Random(args.seed))
+        for name, scenario in scenarios.items():
+            results[name] = await run_scenario(
+                scenario, users, args.requests, args.concurrency, args.warmup, args.seed
+            )
+            print(_format_row(name, results[name]), flush=True)
+    finally:
+        await remove_created_entries(users, started)
+        for user in users:
+            await user.client.aclose()
+    try:
+        size = await dataset_size()
+    finally:
+        await engine.dispose()
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "dataset": size,
+        "settings": {
+            "users": args.users,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "endpoints": results,
+    }
+
+
+def _format_row(name: str, result: dict) -> str:
+    return (
+        f"{name:<48} p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms"
+        f"  p99 {result['p99_ms']:>8.2f} ms  {result['throughput_rps']:>8.1f} req/s"
+        + (f"  {result['errors']} errors" if result["errors"] else "")
+    )
+
+
+def compare(baseline: dict, current: dict) -> None:
+    """Print p50/p95 and throughput of ``current`` relative to ``baseline``."""
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'}:")
+    for name, result in current["endpoints"].items():
+        before = baseline["endpoints"].get(name)
+        if before is None:
+            print(f"{name:<48} (new)")
+            continue
+        changes = [
+            f"{metric} {(result[metric] / before[metric] - 1) * 100:+6.1f}%"
+            for metric in ("p50_ms", "p95_ms", "throughput_rps")
+            if before[metric]
+        ]
+        print(f"{name:<48} " + "  ".join(changes))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1, help="users to log in as")
+    parser.add_argument("--password", default="benchmark")
+    parser.add_argument("--requests", type=int, default=500, help="per endpoint")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--writes", action="store_true", help="include writes")
+    parser.add_argument(
+        "--only", nargs="+", help="run endpoints whose name contains any of these"
+    )
+    parser.add_argument("--output", default="load-results.json")
+    parser.add_argument("--compare", help="earlier results file to compare with")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    with open(args.output, "w") as file:
+        json.dump(results, file, indent=2)
+    print(f"Wrote {args.output}")
+    if args.compare:
+        with open(args.compare) as file:
+            compare(json.load(file), results)
+
+
+if __name__ == "__main__":
+    main()
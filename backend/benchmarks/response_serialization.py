@@ -0,0 +1,154 @@
+"""Benchmark serializing list responses.
+
+Builds ``--entries`` journal entries (with technologies and a project) and as
+many technologies in memory, validates them once into the response schemas as
+the services do, then times turning those into response bytes:
+
+- ``response_model``: FastAPI's default path, which dumps the returned schema,
+  validates it against ``response_model`` again and renders a ``JSONResponse``
+- ``response_model + orjson``: the same with ``ORJSONResponse`` as the class
+- ``ModelResponse``: the pre-validated schema written by a cached ``TypeAdapter``
+
+Usage (from ``backend/``):
+    python -m benchmarks.response_serialization --entries 1000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from core.responses import ModelResponse, ORJSONResponse, type_adapter
+from database.models import JournalEntry, Project, Technology
+from domain.journal_entry.journal_entry_schema import JournalEntryPage
+from domain.technology.technology_schema import TechnologyWithCount
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+
+# Vocabulary for entry text, so compression ratios resemble real journal prose
+WORDS = (
+    "today I worked on the API and fixed a bug in how pagination handles cursors "
+    "then reviewed a pull request about caching wrote tests for the repository "
+    "layer learned how indexes change query plans paired with a teammate on "
+    "deployment scripts profiled slow endpoints refactored the service to return "
+    "validated models migrated the database added metrics and documented decisions "
+    "for next sprint planning while reading about async python performance"
+).split()
+
+
+def sample_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)) + "."
+
+
+def build_payloads(entries: int, per_entry: int) -> dict[str, tuple[Any, Any]]:
+    """Return ``{name: (response_model, validated content)}``."""
+    technologies = [
+        Technology(
+            id=f"t{t}",
+            name=f"tech {t}",
+            description="A technology used in the benchmark",
+            language="python",
+            usage_count=t,
+            user_id="u1",
+        )
+        for t in range(max(entries, per_entry))
+    ]
+    project = Project(id="p1", name="Benchmark", user_id="u1", entry_count=entries)
+    start = datetime(2020, 1, 1)
+    rng = random.Random(42)
+    journal_entries = []
+    for e in range(entries):
+        entry = JournalEntry(
+            id=f"e{e}",
+            content=sample_text(rng, 120),
+            date=start + timedelta(minutes=e),
+            project_id=project.id,
+            user_id="u1",
+        )
+        entry.technologies = [
+            technologies[(e + t) % len(technologies)] for t in range(per_entry)
+        ]
+        entry.project = project
+        journal_entries.append(entry)
+
+    return {
+        "journal entry page": (
+            JournalEntryPage,
+            JournalEntryPage(items=journal_entries, next_cursor="cursor"),
+        ),
+        "technology list": (
+            list[TechnologyWithCount],
+            type_adapter(list[TechnologyWithCount]).validate_python(
+                technologies[:entries]
+            ),
+        ),
+    }
+
+
+async def time_async(work: Callable, repeat: int) -> float:
+    """Return the median wall time of ``await work()``, in milliseconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await work()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def run(payloads: dict, repeat: int) -> dict[str, dict[str, float]]:
+    results = {}
+    for name, (response_model, content) in payloads.items():
+        field = create_model_field(
+            name=f"Response_{name}", type_=response_model, mode="serialization"
+        )
+
+        async def default(response_class=JSONResponse):
+            body = await serialize_response(field=field, response_content=content)
+            return response_class(body).body
+
+        async def orjson():
+            return await default(ORJSONResponse)
+
+        async def prevalidated():
+            return ModelResponse(content, response_model).body
+
+        # Warm up caches (schema compilation, the cached TypeAdapter)
+        for work in (default, orjson, prevalidated):
+            await work()
+        results[name] = {
+            "response_model": await time_async(default, repeat),
+            "response_model + orjson": await time_async(orjson, repeat),
+            "ModelResponse": await time_async(prevalidated, repeat),
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--technologies-per-entry", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.entries, args.technologies_per_entry)
+    results = asyncio.run(run(payloads, args.repeat))
+
+    paths = ("response_model", "response_model + orjson", "ModelResponse")
+    width = max(len(name) for name in results)
+    print(f"{'payload':<{width}}  " + "  ".join(f"{path:>23}" for path in paths))
+    for name, timings in results.items():
+        baseline = timings["response_model"]
+        cells = [
+            f"{timings[path]:>9.2f} ms ({baseline / timings[path]:>4.1f}x)"
+            for path in paths
+        ]
+        print(f"{name:<{width}}  " + "  ".join(f"{cell:>23}" for cell in cells))
+
+
+if __name__ == "__main__":
+    main()
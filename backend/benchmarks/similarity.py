@@ -0,0 +1,79 @@
+"""Benchmark the "similar entries" search over one user's embeddings.
+
+Embeds ``--entries`` synthetic journal entries with the hashing embedder,
+encodes them as stored in ``journal_entry_embedding``, then times:
+
+- ``embed``: the hashing embedder, per entry (what a sync job spends)
+- ``load``: decoding the blobs into the user's matrix (a cold index)
+- ``top_k``: one search, the matrix-vector product plus ``argpartition``,
+  for ``--k`` neighbours of random entries
+
+Usage (from ``backend/``):
+    python -m benchmarks.similarity --entries 100000 --k 10
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from benchmarks.response_serialization import sample_text
+from domain.embedding.embedder import HashingEmbedder
+from domain.embedding.embedding_config import EMBEDDING_DIMENSIONS
+from domain.embedding.embedding_index import UserMatrix, encode_vector
+
+
+def percentile(timings: list[float], fraction: float) -> float:
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(entries: int, dimensions: int, k: int, queries: int) -> None:
+    rng = random.Random(42)
+    texts = [sample_text(rng, rng.randint(15, 120)) for _ in range(entries)]
+    ids = [f"e{n}" for n in range(entries)]
+    embedder = HashingEmbedder(dimensions)
+
+    started = time.perf_counter()
+    vectors = await embedder.embed(texts)
+    embed_s = time.perf_counter() - started
+    blobs = [encode_vector(vector) for vector in vectors]
+
+    started = time.perf_counter()
+    matrix = UserMatrix.from_blobs(ids, blobs, dimensions)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    timings = []
+    for _ in range(queries):
+        id = rng.choice(ids)
+        started = time.perf_counter()
+        matrix.top_k(matrix.vector(id), k, exclude=id)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    megabytes = matrix.matrix.nbytes / 1e6
+    print(f"{entries:,} entries x {dimensions} dimensions ({megabytes:.0f} MB)")
+    print(
+        f"embed   {embed_s * 1e6 / entries:8.1f} us/entry"
+        f"  ({entries / embed_s:,.0f} entries/s)"
+    )
+    print(f"load    {load_ms:8.1f} ms")
+    print(
+        f"top_k   p50 {statistics.median(timings):.2f} ms"
+        f"  p95 {percentile(timings, 0.95):.2f} ms"
+        f"  max {max(timings):.2f} ms  (k={k}, {queries} queries)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--dimensions", type=int, default=EMBEDDING_DIMENSIONS)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.entries, args.dimensions, args.k, args.queries))
+
+
+if __name__ == "__main__":
+    main()
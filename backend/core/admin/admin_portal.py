@@ -1,9 +1,17 @@
+from pathlib import Path
+
 from core.admin.auth import AdminAuth
+from core.admin.slow_queries_view import SlowQueriesView
 from database.db import engine
 from database.models import JournalEntry, Project, Technology, User
 from starlette_admin.contrib.sqla import Admin, ModelView
 
-admin = Admin(engine, title="Journal Entry Assistant", auth_provider=AdminAuth())
+admin = Admin(
+    engine,
+    title="Journal Entry Assistant",
+    auth_provider=AdminAuth(),
+    templates_dir=str(Path(__file__).parent / "templates"),
+)
 
 admin.add_view(
     ModelView(
@@ -33,3 +41,4 @@ admin.add_view(
         label="Journal Entries",
     )
 )
+admin.add_view(SlowQueriesView())
@@ -0,0 +1,43 @@
+from database.slow_queries import SlowQueryLog, slow_query_log
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.templating import Jinja2Templates
+from starlette_admin import CustomView
+
+SORT_KEYS = {
+    "total": "total_time",
+    "max": "max_time",
+    "mean": "mean_time",
+    "count": "count",
+}
+
+
+class SlowQueriesView(CustomView):
+    """Top slow-query fingerprints with their captured plans."""
+
+    def __init__(self, log: SlowQueryLog = slow_query_log, limit: int = 50) -> None:
+        super().__init__(
+            label="Slow Queries",
+            icon="fa fa-stopwatch",
+            path="/slow-queries",
+            template_path="slow_queries.html",
+            name="slow-queries",
+        )
+        self.log = log
+        self.limit = limit
+
+    async def render(self, request: Request, templates: Jinja2Templates) -> Response:
+        sort = request.query_params.get("sort", "total")
+        if sort not in SORT_KEYS:
+            sort = "total"
+        return templates.TemplateResponse(
+            self.template_path,
+            {
+                "request": request,
+                "title": self.title(request),
+                "queries": self.log.top(self.limit, SORT_KEYS[sort]),
+                "sort": sort,
+                "sort_keys": SORT_KEYS,
+                "threshold_ms": self.log.threshold * 1000,
+            },
+        )
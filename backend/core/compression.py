@@ -0,0 +1,260 @@
+"""Negotiated response compression.
+
+``CompressionMiddleware`` picks the best encoding both sides support from
+``Accept-Encoding`` (zstd, brotli and gzip, in the configured order) and
+compresses text-like responses of at least ``minimum_size`` bytes. Streaming
+responses are compressed chunk by chunk and each chunk is flushed, so a client
+reading the NDJSON export still receives rows as they are produced.
+
+Responses that already carry a ``Content-Encoding`` or have a non-text content
+type (e.g. the ``.gz`` export) pass through untouched.
+"""
+
+import zlib
+from typing import Callable, Protocol
+
+from core.http_config import (
+    BROTLI_QUALITY,
+    COMPRESSION_ENCODINGS,
+    COMPRESSION_MIN_SIZE,
+    GZIP_LEVEL,
+    ZSTD_LEVEL,
+)
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "text/",
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+)
+# Server-sent events must reach the client unbuffered
+EXCLUDED_CONTENT_TYPES = ("text/event-stream",)
+
+
+class Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """Compress ``data`` and flush it, so the output is decodable so far."""
+
+    def finish(self) -> bytes:
+        """Return the end of the stream."""
+
+
+class GzipEncoder:
+    def __init__(self, level: int = GZIP_LEVEL) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int = BROTLI_QUALITY) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self, level: int = ZSTD_LEVEL) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encoders() -> dict[str, Callable[[], Encoder]]:
+    """Return the encoders whose libraries are installed, by coding name."""
+    encoders: dict[str, Callable[[], Encoder]] = {"gzip": GzipEncoder}
+    if brotli is not None:
+        encoders["br"] = BrotliEncoder
+    if zstandard is not None:
+        encoders["zstd"] = ZstdEncoder
+    return encoders
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Parse ``Accept-Encoding`` into ``{coding: q}``; invalid q-values count as 0."""
+    accepted = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate_encoding(header: str, preferred: list[str]) -> str | None:
+    """Choose the highest-q coding in ``preferred``; ties go to the earlier one."""
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in preferred:
+        q = accepted.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    if content_type.startswith(EXCLUDED_CONTENT_TYPES):
+        return False
+    media_type = content_type.split(";", 1)[0].strip()
+    return (
+        media_type.startswith(COMPRESSIBLE_CONTENT_TYPES)
+        or media_type.endswith("+json")
+        or media_type.endswith("+xml")
+    )
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with the negotiated encoding.
+
+    Args:
+        app: The wrapped application
+        encodings: Codings in server preference order; unavailable ones are
+            skipped
+        minimum_size: Complete responses smaller than this are sent as is
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encodings: list[str] = COMPRESSION_ENCODINGS,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        encoders = available_encoders()
+        self.encoders = {
+            coding: encoders[coding] for coding in encodings if coding in encoders
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encoders:
+            await self.app(scope, receive, send)
+            return
+
+        coding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), list(self.encoders)
+        )
+        responder = _CompressionResponder(
+            send, coding, self.encoders.get(coding), self.minimum_size
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-request ``send`` wrapper holding back the start message until the
+    first body chunk shows whether and how to compress."""
+
+    def __init__(
+        self,
+        send: Send,
+        coding: str | None,
+        encoder_factory: Callable[[], Encoder] | None,
+        minimum_size: int,
+    ) -> None:
+        self._send = send
+        self.coding = coding
+        self.encoder_factory = encoder_factory
+        self.minimum_size = minimum_size
+        self.start_message: Message | None = None
+        self.encoder: Encoder | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = "content-encoding" in headers or not is_compressible(
+                headers.get("content-type", "")
+            )
+            if not self.passthrough:
+                # The body differs by Accept-Encoding even when sent as is
+                MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+            return
+
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.start_message is not None:
+            await self._start(message)
+        elif self.encoder is not None:
+            await self._send_compressed(message)
+        else:
+            await self._send(message)
+
+    async def _start(self, message: Message) -> None:
+        start_message, self.start_message = self.start_message, None
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if (
+            self.passthrough
+            or self.encoder_factory is None
+            or (not more_body and len(body) < self.minimum_size)
+        ):
+            await self._send(start_message)
+            await self._send(message)
+            return
+
+        self.encoder = self.encoder_factory()
+        headers = MutableHeaders(scope=start_message)
+        headers["Content-Encoding"] = self.coding
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            compressed = self.encoder.compress(body) + self.encoder.finish()
+            headers["Content-Length"] = str(len(compressed))
+            message["body"] = compressed
+            await self._send(start_message)
+            await self._send(message)
+            return
+        await self._send(start_message)
+        await self._send_compressed(message)
+
+    async def _send_compressed(self, message: Message) -> None:
+        body = message.get("body", b"")
+        if not message.get("more_body", False):
+            body = self.encoder.compress(body) + self.encoder.finish()
+        elif body:
+            body = self.encoder.compress(body)
+        message["body"] = body
+        await self._send(message)
@@ -0,0 +1,63 @@
+"""Conditional GET for per-user list endpoints.
+
+``conditional_list(collection)`` is a route dependency that reads the user's
+collection version (one primary-key lookup), derives a weak ``ETag`` from it and
+answers a matching ``If-None-Match`` with ``304 Not Modified`` before the
+endpoint runs its query.
+"""
+
+import hashlib
+
+from authx import TokenPayload
+from database.collection_versions import Collection, get_collection_version
+from database.session import SessionDep
+from domain.auth.auth_config import security
+from fastapi import Depends, HTTPException, Request, Response, status
+
+# Browsers may keep the response but must revalidate it on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def collection_etag(
+    collection: Collection, user_id: str, version: int, query: str = ""
+) -> str:
+    """Build the weak ETag of one user's view of a collection."""
+    scope = hashlib.blake2s(
+        f"{user_id}|{collection.value}|{query}".encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return f'W/"{scope}-{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_list(collection: Collection):
+    """Create a dependency adding ETag/304 handling for ``collection``."""
+
+    async def check_not_modified(
+        request: Request,
+        response: Response,
+        session: SessionDep,
+        payload: TokenPayload = Depends(security.access_token_required),
+    ) -> str:
+        version = await get_collection_version(session, payload.user_id, collection)
+        etag = collection_etag(collection, payload.user_id, version, request.url.query)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        response.headers.update(headers)
+        return etag
+
+    return check_not_modified
@@ -0,0 +1,27 @@
+import os
+
+from database.db_config import env_bool
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Response compression (see core/compression.py). Encodings in server preference
+# order; brotli and zstd are used only when the `brotli`/`zstandard` packages are
+# installed. An empty list disables compression.
+COMPRESSION_ENCODINGS = [
+    encoding.strip()
+    for encoding in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+    if encoding.strip()
+]
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))  # bytes
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "3"))  # 1-9
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))  # 0-11
+ZSTD_LEVEL = int(os.getenv("ZSTD_LEVEL", "3"))  # 1-22
+
+# Request metrics (see core/metrics.py). A request running more SQL statements
+# than the threshold logs an N+1 warning; 0 disables the alarm. /api/metrics
+# only answers requests with the bearer token METRICS_TOKEN; unset, it answers
+# none.
+METRICS_ENABLED = env_bool("METRICS_ENABLED", True)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+QUERY_COUNT_ALARM_THRESHOLD = int(os.getenv("QUERY_COUNT_ALARM_THRESHOLD", "25"))
@@ -0,0 +1,243 @@
+"""Request timing, SQL statement counts and Prometheus-format histograms.
+
+``RequestMetricsMiddleware`` times every HTTP request and counts its SQL
+statements (via ``database.query_stats``). Observations are labelled with the
+route template (``/api/projects/{id}``), not the raw path, so each endpoint maps
+to one series. Each response gets a ``Server-Timing`` header, and a request
+running more than ``QUERY_COUNT_ALARM_THRESHOLD`` statements logs an N+1
+warning. ``GET /api/metrics`` renders the histograms in the Prometheus text
+format for scrapers sending ``METRICS_TOKEN`` as a bearer token.
+"""
+
+import hmac
+import time
+from bisect import bisect_left
+from logging import getLogger
+
+from core.http_config import METRICS_TOKEN, QUERY_COUNT_ALARM_THRESHOLD
+from database.query_stats import QueryStats, track_queries
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+UNMATCHED_ROUTE = "<unmatched>"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """A cumulative-bucket histogram in the Prometheus model."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def samples(self) -> list[tuple[str, float]]:
+        """Return ``(le, cumulative count)`` pairs, ending with ``+Inf``."""
+        cumulative, samples = 0, []
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            cumulative += count
+            samples.append(
+                ("+Inf" if bound == float("inf") else f"{bound:g}", cumulative)
+            )
+        return samples
+
+
+class MetricsRegistry:
+    """In-process request metrics, keyed by ``(method, route)``."""
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        stats: QueryStats,
+        alarm: bool = False,
+    ) -> None:
+        key = (method, route)
+        self.durations.setdefault(
+            (method, route, str(status)), Histogram(LATENCY_BUCKETS)
+        ).observe(duration)
+        self.db_durations.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(
+            stats.duration
+        )
+        self.statements.setdefault(key, Histogram(STATEMENT_BUCKETS)).observe(
+            stats.statements
+        )
+        if alarm:
+            self.query_alarms[key] = self.query_alarms.get(key, 0) + 1
+
+    def clear(self) -> None:
+        self.durations: dict[tuple[str, str, str], Histogram] = {}
+        self.db_durations: dict[tuple[str, str], Histogram] = {}
+        self.statements: dict[tuple[str, str], Histogram] = {}
+        self.query_alarms: dict[tuple[str, str], int] = {}
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        _render_histograms(
+            lines,
+            "http_request_duration_seconds",
+            "Wall time of HTTP requests by route template",
+            ("method", "route", "status"),
+            self.durations,
+        )
+        _render_histograms(
+            lines,
+            "http_request_db_duration_seconds",
+            "Time spent executing SQL per HTTP request",
+            ("method", "route"),
+            self.db_durations,
+        )
+        _render_histograms(
+            lines,
+            "http_request_db_statements",
+            "SQL statements executed per HTTP request",
+            ("method", "route"),
+            self.statements,
+        )
+        lines.append(
+            "# HELP http_request_query_alarms_total Requests exceeding the SQL "
+            "statement threshold (suspected N+1)"
+        )
+        lines.append("# TYPE http_request_query_alarms_total counter")
+        for key, count in sorted(self.query_alarms.items()):
+            labels = _labels(("method", "route"), key)
+            lines.append(f"http_request_query_alarms_total{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _render_histograms(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    label_names: tuple[str, ...],
+    histograms: dict[tuple, Histogram],
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for key, histogram in sorted(histograms.items()):
+        labels = _labels(label_names, key)
+        for le, count in histogram.samples():
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+        lines.append(f"{name}_sum{{{labels}}} {histogram.sum:g}")
+        lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+metrics = MetricsRegistry()
+
+
+def route_template(scope: Scope) -> str:
+    """Return the matched route's path template, e.g. ``/api/projects/{id}``."""
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+def server_timing(duration: float, stats: QueryStats) -> str:
+    return (
+        f"app;dur={duration * 1000:.1f}, "
+        f'db;dur={stats.duration * 1000:.1f};desc="{stats.statements} queries"'
+    )
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware recording request time and SQL statements per route.
+
+    Args:
+        app: The wrapped application
+        registry: Where observations are recorded
+        query_alarm_threshold: Statement count above which a request is logged
+            as a suspected N+1; 0 disables the alarm
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        registry: MetricsRegistry = metrics,
+        query_alarm_threshold: int = QUERY_COUNT_ALARM_THRESHOLD,
+    ) -> None:
+        self.app = app
+        self.registry = registry
+        self.query_alarm_threshold = query_alarm_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing",
+                        server_timing(time.perf_counter() - started, stats),
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._record(scope, status, time.perf_counter() - started, stats)
+
+    def _record(
+        self, scope: Scope, status: int, duration: float, stats: QueryStats
+    ) -> None:
+        method, route = scope["method"], route_template(scope)
+        alarm = 0 < self.query_alarm_threshold < stats.statements
+        if alarm:
+            logger.warning(
+                f"Suspected N+1: {method} {route} ran {stats.statements} SQL "
+                f"statements (threshold {self.query_alarm_threshold})"
+            )
+        self.registry.observe(method, route, status, duration, stats, alarm=alarm)
+
+
+def require_metrics_token(authorization: str = Header("")) -> None:
+    """Reject requests without the ``METRICS_TOKEN`` bearer token."""
+    if not METRICS_TOKEN or not hmac.compare_digest(
+        authorization.encode(), f"Bearer {METRICS_TOKEN}".encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(dependencies=[Depends(require_metrics_token)])
+
+
+@router.get("", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """Expose the request metrics in the Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
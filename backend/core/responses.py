@@ -0,0 +1,57 @@
+"""JSON responses for the API.
+
+``ORJSONResponse`` is the app-wide default response class. Endpoints whose
+service already returns validated schema objects can return ``ModelResponse``
+instead: FastAPI passes a returned ``Response`` through untouched, so the
+``response_model`` (kept on the route for the OpenAPI schema) is not validated a
+second time, and pydantic-core writes the JSON bytes directly.
+"""
+
+from functools import cache
+from typing import Any, Mapping
+
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+
+__all__ = ["ORJSONResponse", "ModelResponse", "type_adapter"]
+
+
+@cache
+def type_adapter(annotation: Any) -> TypeAdapter:
+    """Return the process-wide ``TypeAdapter`` for ``annotation``.
+
+    Building an adapter compiles a core schema, which costs far more than using
+    it; ``list[Schema]`` and friends are hashable, so one adapter is kept per type.
+    """
+    return TypeAdapter(annotation)
+
+
+class ModelResponse(Response):
+    """Serialize already-validated schema objects without re-validating them.
+
+    Args:
+        content: Schema instance(s) matching ``response_model``
+        response_model: Type to serialize ``content`` as; defaults to
+            ``type(content)``, so it is required for lists
+        headers: Extra headers, e.g. the ``Response`` parameter's headers set by
+            dependencies such as ``conditional_list``
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        response_model: Any = None,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        self.response_model = (
+            type(content) if response_model is None else response_model
+        )
+        super().__init__(content, status_code, headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        return type_adapter(self.response_model).dump_json(content, by_alias=True)
@@ -0,0 +1,56 @@
+"""Per-user LRU caches of values derived from a versioned collection.
+
+A value is stored with the collection version it was built from (see
+``database/collection_versions.py``) and served only while the caller reads
+the same version, so a write in any process sharing the database makes it
+stale. A write made by this process may instead be applied to the cached value
+in place with ``advance``, which keeps it only if no other write came between.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class VersionedCache(Generic[T]):
+    """LRU cache of values by user, each tagged with a collection version."""
+
+    def __init__(self, max_users: int) -> None:
+        self.max_users = max_users
+        self._entries: OrderedDict[str, tuple[int, T]] = OrderedDict()
+
+    def get(self, user_id: str, version: int) -> T | None:
+        """Return the user's value if it was built at ``version``."""
+        cached = self._entries.get(user_id)
+        if cached is None or cached[0] != version:
+            return None
+        self._entries.move_to_end(user_id)
+        return cached[1]
+
+    def put(self, user_id: str, version: int, value: T) -> None:
+        self._entries[user_id] = (version, value)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+    def advance(self, user_id: str, version: int, update: Callable[[T], None]) -> None:
+        """Apply a write made as ``version`` to the user's value in place.
+
+        Only a value at the version just before is updated and retagged; a
+        value that missed a write is dropped and rebuilt when next used.
+        """
+        cached = self._entries.get(user_id)
+        if cached is None:
+            return
+        if cached[0] != version - 1:
+            del self._entries[user_id]
+            return
+        update(cached[1])
+        self._entries[user_id] = (version, cached[1])
+
+    def discard(self, user_id: str) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,215 @@
+"""Daily and monthly rollups of journal entry activity.
+
+Analytics read ``daily_activity`` and ``monthly_activity`` instead of grouping
+a user's whole journal. An entry counts once in the total row of its day and
+month (``project_id`` and ``technology_id`` both ``ALL``), once in its
+project's row and once in the row of each of its technologies; there are no
+project-by-technology rows.
+
+Journal entry writes apply their difference to the rows in the same
+transaction. Deleting a project drops its rows, deleting or merging
+technologies recounts theirs, and ``python manage.py rebuild-activity``
+recomputes everything from the journal.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Iterable, NamedTuple
+
+from database.models import (
+    DailyActivity,
+    JournalEntry,
+    JournalEntryTechnologyLink,
+    MonthlyActivity,
+)
+from sqlalchemy import delete, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# Dimension value of the rows not broken down by project or technology
+ALL = ""
+
+# Rows per INSERT; keeps SQLite under its bound parameter limit
+_INSERT_BATCH_SIZE = 1000
+
+# Rollup table and the column holding its period's first day
+_ROLLUPS = ((DailyActivity, "day"), (MonthlyActivity, "month"))
+
+
+class EntryActivity(NamedTuple):
+    """What one journal entry contributes to the rollups."""
+
+    date: datetime
+    project_id: str | None
+    technology_ids: frozenset[str]
+    chars: int
+
+    @classmethod
+    def of(cls, entry: JournalEntry, technology_ids: Iterable[str]) -> "EntryActivity":
+        return cls(
+            entry.date, entry.project_id, frozenset(technology_ids), len(entry.content)
+        )
+
+
+# (project_id, technology_id, day) -> [entry_count, chars]
+Deltas = dict[tuple[str, str, date], list[int]]
+
+
+def _add(deltas: Deltas, entry: EntryActivity, sign: int) -> None:
+    day = entry.date.date()
+    dimensions = [(ALL, ALL)]
+    if entry.project_id:
+        dimensions.append((entry.project_id, ALL))
+    dimensions.extend((ALL, technology_id) for technology_id in entry.technology_ids)
+    for project_id, technology_id in dimensions:
+        delta = deltas[(project_id, technology_id, day)]
+        delta[0] += sign
+        delta[1] += sign * entry.chars
+
+
+def _by_month(deltas: Deltas) -> Deltas:
+    monthly: Deltas = defaultdict(lambda: [0, 0])
+    for (project_id, technology_id, day), (entry_count, chars) in deltas.items():
+        delta = monthly[(project_id, technology_id, day.replace(day=1))]
+        delta[0] += entry_count
+        delta[1] += chars
+    return monthly
+
+
+async def record_activity(
+    session: AsyncSession,
+    user_id: str,
+    added: Iterable[EntryActivity] = (),
+    removed: Iterable[EntryActivity] = (),
+) -> None:
+    """Count ``added`` entries in and ``removed`` ones out of a user's
+    rollups, without committing.
+
+    An updated entry is removed as it was and added as it is; only the rows
+    whose counts end up different are written.
+    """
+    deltas: Deltas = defaultdict(lambda: [0, 0])
+    for entries, sign in ((added, 1), (removed, -1)):
+        for entry in entries:
+            _add(deltas, entry, sign)
+    await _apply(session, user_id, DailyActivity, "day", deltas)
+    await _apply(session, user_id, MonthlyActivity, "month", _by_month(deltas))
+
+
+async def _apply(
+    session: AsyncSession, user_id: str, table, period: str, deltas: Deltas
+) -> None:
+    # An edit that changed neither the period nor the dimensions nets out
+    deltas = {key: delta for key, delta in deltas.items() if any(delta)}
+    if not deltas:
+        return
+    dialect_insert = (
+        postgresql.insert
+        if session.bind.dialect.name == "postgresql"
+        else sqlite.insert
+    )
+    rows = [
+        {
+            "user_id": user_id,
+            "project_id": project_id,
+            "technology_id": technology_id,
+            period: start,
+            "entry_count": entry_count,
+            "chars": chars,
+        }
+        for (project_id, technology_id, start), (entry_count, chars) in deltas.items()
+    ]
+    for offset in range(0, len(rows), _INSERT_BATCH_SIZE):
+        statement = dialect_insert(table).values(
+            rows[offset : offset + _INSERT_BATCH_SIZE]
+        )
+        await session.exec(
+            statement.on_conflict_do_update(
+                index_elements=["user_id", "project_id", "technology_id", period],
+                set_={
+                    "entry_count": table.entry_count + statement.excluded.entry_count,
+                    "chars": table.chars + statement.excluded.chars,
+                },
+            )
+        )
+    if any(entry_count < 0 for entry_count, _ in deltas.values()):
+        # Rows of periods or dimensions left without entries
+        await session.exec(
+            delete(table).where(
+                table.user_id == user_id,
+                getattr(table, period).in_({start for _, _, start in deltas}),
+                table.entry_count <= 0,
+            )
+        )
+
+
+async def forget_project_activity(session: AsyncSession, project_ids) -> None:
+    """Delete the rows of the given projects, a list or a subquery of IDs,
+    without committing."""
+    for table, _ in _ROLLUPS:
+        await session.exec(delete(table).where(table.project_id.in_(project_ids)))
+
+
+async def recount_technology_activity(
+    session: AsyncSession, user_id: str, *technology_ids: str
+) -> None:
+    """Recompute the rows of the given technologies from their current links,
+    without committing; e.g. after links were moved or deleted in bulk."""
+    for table, _ in _ROLLUPS:
+        await session.exec(
+            delete(table).where(
+                table.user_id == user_id, table.technology_id.in_(technology_ids)
+            )
+        )
+    results = await session.exec(
+        select(
+            JournalEntryTechnologyLink.technology_id,
+            JournalEntry.date,
+            func.length(JournalEntry.content),
+        )
+        .join(
+            JournalEntry, JournalEntry.id == JournalEntryTechnologyLink.journal_entry_id
+        )
+        .where(JournalEntryTechnologyLink.technology_id.in_(technology_ids))
+    )
+    deltas: Deltas = defaultdict(lambda: [0, 0])
+    for technology_id, moment, chars in results.all():
+        delta = deltas[(ALL, technology_id, moment.date())]
+        delta[0] += 1
+        delta[1] += chars
+    await _apply(session, user_id, DailyActivity, "day", deltas)
+    await _apply(session, user_id, MonthlyActivity, "month", _by_month(deltas))
+
+
+async def rebuild_activity(session: AsyncSession, user_id: str) -> int:
+    """Recompute all of a user's rows from their journal, without committing.
+
+    Returns:
+        int: Number of journal entries counted
+    """
+    for table, _ in _ROLLUPS:
+        await session.exec(delete(table).where(table.user_id == user_id))
+    links = await session.exec(
+        select(
+            JournalEntryTechnologyLink.journal_entry_id,
+            JournalEntryTechnologyLink.technology_id,
+        ).where(JournalEntryTechnologyLink.user_id == user_id)
+    )
+    technology_ids = defaultdict(set)
+    for journal_entry_id, technology_id in links.all():
+        technology_ids[journal_entry_id].add(technology_id)
+    entries = await session.exec(
+        select(
+            JournalEntry.id,
+            JournalEntry.date,
+            JournalEntry.project_id,
+            func.length(JournalEntry.content),
+        ).where(JournalEntry.user_id == user_id)
+    )
+    activity = [
+        EntryActivity(moment, project_id, frozenset(technology_ids[id]), chars)
+        for id, moment, project_id, chars in entries.all()
+    ]
+    await record_activity(session, user_id, added=activity)
+    return len(activity)
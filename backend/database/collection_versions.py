@@ -0,0 +1,75 @@
+"""Per-user version counters for the list endpoints.
+
+Every write that can change what a user's list endpoint returns bumps that
+collection's counter in the same transaction. A list response is then fully
+identified by ``(user, collection, version, query string)``, which is what the
+conditional GET in ``core/conditional_get.py`` turns into an ``ETag``.
+"""
+
+from enum import Enum
+
+from database.models import CollectionVersion
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class Collection(str, Enum):
+    TECHNOLOGIES = "technologies"
+    PROJECTS = "projects"
+    JOURNAL_ENTRIES = "journal_entries"
+    # Bumped when entry vectors are written; keys the in-memory embedding index
+    EMBEDDINGS = "embeddings"
+    # Bumped when a technology is added, renamed or deleted; keys the cached
+    # technology name matchers
+    TECHNOLOGY_NAMES = "technology_names"
+
+
+async def get_collection_version(
+    session: AsyncSession, user_id: str, collection: Collection
+) -> int:
+    """Return the current version, 0 if the collection was never written."""
+    result = await session.exec(
+        select(CollectionVersion.version).where(
+            CollectionVersion.user_id == user_id,
+            CollectionVersion.collection == collection.value,
+        )
+    )
+    return result.first() or 0
+
+
+async def bump_collection_versions(
+    session: AsyncSession, user_id: str, *collections: Collection
+) -> None:
+    """Increment the versions of ``collections`` for a user without committing."""
+    if not collections:
+        return
+    dialect_insert = (
+        postgresql.insert
+        if session.bind.dialect.name == "postgresql"
+        else sqlite.insert
+    )
+    statement = dialect_insert(CollectionVersion).values(
+        [
+            {"user_id": user_id, "collection": collection.value, "version": 1}
+            for collection in dict.fromkeys(collections)
+        ]
+    )
+    await session.exec(
+        statement.on_conflict_do_update(
+            index_elements=["user_id", "collection"],
+            set_={"version": CollectionVersion.version + 1},
+        )
+    )
+
+
+async def bump_collection_for_all_users(
+    session: AsyncSession, collection: Collection
+) -> None:
+    """Increment a collection's version for every user, e.g. after a repair."""
+    await session.exec(
+        update(CollectionVersion)
+        .where(CollectionVersion.collection == collection.value)
+        .values(version=CollectionVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
@@ -1,10 +1,70 @@
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlmodel import SQLModel, create_engine
+from database.db_config import (
+    DATABASE_URL,
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_POOL_PRE_PING,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
+from database.query_stats import register_query_stats
+from database.slow_queries import register_slow_query_log
+from database.sqlite_tuning import register_sqlite_pragmas
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
 
-sqlite_file_name = "database.db"
-sqlite_url = f"sqlite+aiosqlite:///{sqlite_file_name}"
+# Async drivers used when a URL names only the backend (e.g. ``postgresql://``)
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgres": "postgresql+asyncpg",
+    "postgresql": "postgresql+asyncpg",
+}
 
-engine = AsyncEngine(create_engine(sqlite_url, echo=True, future=True))
+
+def to_async_url(url: str | URL) -> URL:
+    """Return ``url`` with an async driver, keeping an explicit one as is."""
+    url = make_url(url)
+    if url.drivername in ASYNC_DRIVERS:
+        url = url.set(drivername=ASYNC_DRIVERS[url.drivername])
+    return url
+
+
+def create_engine_from_settings(url: str | URL = DATABASE_URL) -> AsyncEngine:
+    """Create the application's async engine from the database settings.
+
+    Args:
+        url: Database URL; ``sqlite+aiosqlite`` and ``postgresql+asyncpg`` are
+            supported, and driverless URLs are upgraded to those drivers
+
+    Returns:
+        AsyncEngine: A natively async engine with the configured pool
+    """
+    url = to_async_url(url)
+    options = {
+        "echo": DB_ECHO,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    is_memory_sqlite = url.get_backend_name() == "sqlite" and url.database in (
+        None,
+        "",
+        ":memory:",
+    )
+    if not is_memory_sqlite:
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+    engine = create_async_engine(url, **options)
+    register_sqlite_pragmas(engine)
+    register_query_stats(engine)
+    register_slow_query_log(engine)
+    return engine
+
+
+engine = create_engine_from_settings()
 
 
 async def create_db_and_tables():
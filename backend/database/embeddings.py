@@ -0,0 +1,25 @@
+"""Invalidation of journal entry embeddings.
+
+A write that changes an entry's content deletes its vector in the same
+transaction; the entry is embedded again by the next ``embeddings.sync`` job
+(see domain/embedding), which only looks at entries without a current vector.
+The deletion bumps the user's ``EMBEDDINGS`` version too, so cached matrices
+stop serving the old vector even if the job is never run.
+"""
+
+from database.collection_versions import Collection, bump_collection_versions
+from database.models import JournalEntryEmbedding
+from sqlalchemy import delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+async def forget_embeddings(
+    session: AsyncSession, user_id: str, *journal_entry_ids: str
+) -> None:
+    """Delete the vectors of the given entries of a user, without committing."""
+    await session.exec(
+        delete(JournalEntryEmbedding).where(
+            JournalEntryEmbedding.journal_entry_id.in_(journal_entry_ids)
+        )
+    )
+    await bump_collection_versions(session, user_id, Collection.EMBEDDINGS)
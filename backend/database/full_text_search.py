@@ -0,0 +1,161 @@
+"""Full-text search index over ``journal_entry.content``.
+
+SQLite uses an external-content FTS5 table kept in sync by triggers, so the
+entry text is not stored twice. Postgres uses a generated ``tsvector`` column
+with a GIN index. The same statements are applied by the alembic migration and,
+through ``register_full_text_search``, whenever ``create_all`` builds the table.
+"""
+
+import html
+import re
+
+from sqlalchemy import DDL, Table, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+FTS_TABLE = "journal_entry_fts"
+
+# Private-use characters mark matches in raw snippets so the entry text can be
+# HTML-escaped before the markers are turned into <mark> tags.
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_END = "\ue001"
+
+SQLITE_CREATE_STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        content,
+        content='journal_entry',
+        content_rowid='rowid',
+        tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON journal_entry BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.rowid, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON journal_entry BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF content ON journal_entry BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, content)
+        VALUES ('delete', old.rowid, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, content) VALUES (new.rowid, new.content);
+    END
+    """,
+]
+
+# Re-reads every row of journal_entry. The index is keyed on journal_entry's
+# implicit rowid, which SQLite does not keep when a table is copied: alembic
+# batch migrations, VACUUM and dump/restore may renumber it. See
+# ``rebuild_search_index``.
+SQLITE_REBUILD_STATEMENT = f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+
+SQLITE_DROP_STATEMENTS = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+POSTGRES_CREATE_STATEMENTS = [
+    """
+    ALTER TABLE journal_entry ADD COLUMN IF NOT EXISTS content_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', content)) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_journal_entry_content_tsv
+    ON journal_entry USING GIN (content_tsv)
+    """,
+]
+
+POSTGRES_DROP_STATEMENTS = [
+    "DROP INDEX IF EXISTS ix_journal_entry_content_tsv",
+    "ALTER TABLE journal_entry DROP COLUMN IF EXISTS content_tsv",
+]
+
+
+def include_name(name: str | None, type_: str, parent_names: dict) -> bool:
+    """Hide the search index from alembic autogenerate, which reflects it but
+    cannot find it in the models and would drop it.
+
+    Covers the FTS5 table and its shadow tables on SQLite, and the generated
+    column and its GIN index on Postgres.
+    """
+    if type_ == "table":
+        return not (name or "").startswith(FTS_TABLE)
+    if type_ == "column" and parent_names.get("table_name") == "journal_entry":
+        return name != "content_tsv"
+    if type_ == "index":
+        return name != "ix_journal_entry_content_tsv"
+    return True
+
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_fts5_query(query: str) -> str | None:
+    """Turn free text from the search box into a safe FTS5 MATCH expression.
+
+    Every word is quoted so FTS5 operators typed by the user are matched
+    literally, and the last word gets a prefix wildcard for search-as-you-type.
+
+    Args:
+        query: Raw user input
+
+    Returns:
+        str | None: The MATCH expression, or None if the input has no words
+    """
+    tokens = _TOKEN_PATTERN.findall(query)
+    if not tokens:
+        return None
+    quoted = [f'"{token}"' for token in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def highlight_snippet(snippet: str) -> str:
+    """Escape a raw snippet and wrap its matches in ``<mark>`` tags."""
+    return (
+        html.escape(snippet)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_END, "</mark>")
+    )
+
+
+async def rebuild_search_index(engine: AsyncEngine) -> None:
+    """Re-index every journal entry under its current rowid, on SQLite.
+
+    Run by ``manage.py migrate`` and ``manage.py vacuum``, after the steps that
+    may renumber rowids. Postgres keeps its index on the row itself.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(SQLITE_REBUILD_STATEMENT)
+
+
+def register_full_text_search(journal_entry_table: Table) -> None:
+    """Create and drop the search index alongside ``journal_entry``."""
+    for statement in SQLITE_CREATE_STATEMENTS:
+        event.listen(
+            journal_entry_table,
+            "after_create",
+            DDL(statement).execute_if(dialect="sqlite"),
+        )
+    for statement in POSTGRES_CREATE_STATEMENTS:
+        event.listen(
+            journal_entry_table,
+            "after_create",
+            DDL(statement).execute_if(dialect="postgresql"),
+        )
+    for statement in SQLITE_DROP_STATEMENTS:
+        event.listen(
+            journal_entry_table,
+            "before_drop",
+            DDL(statement).execute_if(dialect="sqlite"),
+        )
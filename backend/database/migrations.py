@@ -0,0 +1,108 @@
+"""Schema migration helpers shared by the app startup and ``manage.py``.
+
+Workers only compare the alembic head revision with the ``alembic_version``
+row on boot; migrations are applied once, before the workers start, with
+``python manage.py migrate``.
+"""
+
+from enum import Enum
+from logging import getLogger
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from database.db_config import DB_STARTUP_MODE
+from database.models import SQLModel
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+class StartupMode(str, Enum):
+    CHECK = "check"
+    STRICT = "strict"
+    CREATE_ALL = "create_all"
+    OFF = "off"
+
+
+class MigrationStateError(RuntimeError):
+    """Raised when the database schema is not at the alembic head revision."""
+
+
+def alembic_config() -> Config:
+    """Load ``alembic.ini`` independently of the current working directory."""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return config
+
+
+def head_revisions() -> set[str]:
+    """Return the head revision(s) of the migration scripts on disk."""
+    return set(ScriptDirectory.from_config(alembic_config()).get_heads())
+
+
+async def current_revisions(engine: AsyncEngine) -> set[str]:
+    """Return the revision(s) recorded in the database's ``alembic_version`` table.
+
+    An empty set means the database has never been migrated.
+    """
+    async with engine.connect() as conn:
+        heads = await conn.run_sync(
+            lambda sync_conn: MigrationContext.configure(sync_conn).get_current_heads()
+        )
+    return set(heads)
+
+
+async def check_migration_state(engine: AsyncEngine, strict: bool = False) -> bool:
+    """Compare the database revision with the migration head.
+
+    Only the single ``alembic_version`` row is read; no tables are reflected.
+
+    Args:
+        engine: Engine of the database to check
+        strict: Raise instead of logging a warning on mismatch
+
+    Returns:
+        bool: True if the database is at head
+
+    Raises:
+        MigrationStateError: If ``strict`` and the database is not at head
+    """
+    expected = head_revisions()
+    current = await current_revisions(engine)
+    if current == expected:
+        return True
+
+    message = (
+        f"Database revision {sorted(current) or 'none'} does not match migration "
+        f"head {sorted(expected)}; run `python manage.py migrate`"
+    )
+    if strict:
+        raise MigrationStateError(message)
+    logger.warning(message)
+    return False
+
+
+def upgrade_to_head() -> None:
+    """Apply all pending migrations."""
+    command.upgrade(alembic_config(), "head")
+
+
+async def prepare_database(
+    engine: AsyncEngine, mode: StartupMode | str = DB_STARTUP_MODE
+) -> None:
+    """Run the configured startup schema step for an app worker.
+
+    Raises:
+        MigrationStateError: In ``strict`` mode if the database is not at head
+    """
+    mode = StartupMode(mode)
+    if mode is StartupMode.CREATE_ALL:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+    elif mode in (StartupMode.CHECK, StartupMode.STRICT):
+        await check_migration_state(engine, strict=mode is StartupMode.STRICT)
@@ -1,7 +1,9 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, List, Optional
 from uuid import uuid4
 
+from database.full_text_search import register_full_text_search
+from sqlalchemy import JSON, Index, LargeBinary
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -23,6 +25,10 @@ class JournalEntryTechnologyLink(SQLModel, table=True):
     __tablename__ = "journal_entry_technology_link"
     journal_entry_id: str = Field(foreign_key="journal_entry.id", primary_key=True)
     technology_id: str = Field(foreign_key="technology.id", primary_key=True)
+    # Owner of the journal entry, copied so per-user technology queries can skip
+    # journal_entry. Links are therefore written explicitly by JournalEntryRepo
+    # rather than through the ``technologies`` relationship.
+    user_id: str = Field(foreign_key="user.id")
 
 
 class Technology(SQLModel, table=True):
@@ -33,6 +39,9 @@ class Technology(SQLModel, table=True):
     name: str = Field(index=True)
     description: str | None = Field(default=None)
     language: str | None = Field(default=None, index=True)
+    # Number of journal entries linked to this technology, maintained by
+    # JournalEntryRepo on every write; `manage.py recount-technology-usage` repairs it
+    usage_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     journal_entries: List["JournalEntry"] = Relationship(
         back_populates="technologies", link_model=JournalEntryTechnologyLink
     )
@@ -66,11 +75,158 @@ class Project(SQLModel, table=True):
     description: str | None = Field(default=None)
     link: str | None = Field(default=None)
     is_private: bool = Field(default=True)
+    # Both maintained by JournalEntryRepo on every write;
+    # `manage.py check-project-stats --repair` recomputes them
     last_entry_date: datetime | None = Field(default=None)
+    entry_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     journal_entries: List[JournalEntry] = Relationship(back_populates="project")
     user_id: str = Field(foreign_key="user.id", index=True)
     user: User = Relationship(back_populates="projects")
 
 
+class CollectionVersion(SQLModel, table=True):
+    """Per-user change counter of a list endpoint (see collection_versions.py)."""
+
+    __tablename__ = "collection_version"
+    # No foreign key: the row is a cache validator, not data owned by the user
+    user_id: str = Field(primary_key=True)
+    collection: str = Field(primary_key=True)
+    version: int = Field(default=0)
+
+
+class Summary(SQLModel, table=True):
+    """Generated summary of a user's journal over one period (see insights)."""
+
+    __tablename__ = "summary"
+    user_id: str = Field(foreign_key="user.id", primary_key=True)
+    period: str = Field(primary_key=True)  # database.summaries.Period
+    period_start: date = Field(primary_key=True)
+    content: str
+    # Hash of the texts the summary was generated from; equal inputs are not
+    # summarized again
+    input_hash: str
+    entry_count: int = Field(default=0)
+    # Set by journal entry writes in the period, cleared when it is refreshed
+    stale: bool = Field(default=False)
+    model: str
+    generated_at: datetime = Field(default_factory=datetime.now)
+
+
+class DailyActivity(SQLModel, table=True):
+    """A user's journal entries of one day, in total or for one project or
+    technology (see database/activity.py)."""
+
+    __tablename__ = "daily_activity"
+    user_id: str = Field(foreign_key="user.id", primary_key=True)
+    # "" in rows not broken down by project/technology, hence no foreign keys;
+    # the dimensions lead the key so each breakdown is a contiguous range
+    project_id: str = Field(default="", primary_key=True)
+    technology_id: str = Field(default="", primary_key=True)
+    day: date = Field(primary_key=True)
+    entry_count: int = Field(default=0)
+    chars: int = Field(default=0)
+
+
+class MonthlyActivity(SQLModel, table=True):
+    """``DailyActivity`` summed over calendar months, ``month`` being the 1st."""
+
+    __tablename__ = "monthly_activity"
+    user_id: str = Field(foreign_key="user.id", primary_key=True)
+    project_id: str = Field(default="", primary_key=True)
+    technology_id: str = Field(default="", primary_key=True)
+    month: date = Field(primary_key=True)
+    entry_count: int = Field(default=0)
+    chars: int = Field(default=0)
+
+
+class JournalEntryEmbedding(SQLModel, table=True):
+    """Vector of a journal entry's content (see domain/embedding)."""
+
+    __tablename__ = "journal_entry_embedding"
+    journal_entry_id: str = Field(foreign_key="journal_entry.id", primary_key=True)
+    user_id: str = Field(foreign_key="user.id", index=True)
+    # Name of the embedder that produced the vector; other embedders re-embed
+    embedder: str
+    # Little-endian float32, L2-normalized
+    vector: bytes = Field(sa_type=LargeBinary)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+
+class Job(SQLModel, table=True):
+    """A unit of background work (see domain/job)."""
+
+    __tablename__ = "job"
+    id: str = Field(
+        default_factory=lambda: str(uuid4()), primary_key=True, nullable=False
+    )
+    kind: str
+    user_id: str = Field(foreign_key="user.id", index=True)
+    payload: dict[str, Any] = Field(default_factory=dict, sa_type=JSON)
+    # Hash of kind, user and payload; at most one pending job per key
+    dedup_key: str
+    status: str = Field(default="pending")  # domain.job.job_schema.JobStatus
+    attempts: int = Field(default=0)
+    max_attempts: int
+    # Not claimed before this time; pushed back by the retry backoff
+    run_after: datetime = Field(default_factory=datetime.now)
+    locked_by: str | None = Field(default=None)
+    locked_at: datetime | None = Field(default=None)
+    last_error: str | None = Field(default=None)
+    result: dict[str, Any] | None = Field(default=None, sa_type=JSON)
+    created_at: datetime = Field(default_factory=datetime.now)
+    finished_at: datetime | None = Field(default=None)
+
+
 JournalEntry.model_rebuild()
 Project.model_rebuild()
+
+# Keyset pagination walks a user's entries newest first with ``id`` as tie-breaker.
+Index(
+    "ix_journal_entry_user_id_date_id",
+    JournalEntry.user_id,
+    JournalEntry.date.desc(),
+    JournalEntry.id,
+)
+# Recomputing a project's last_entry_date after an entry leaves it is a MAX
+# over this index.
+Index("ix_journal_entry_project_id_date", JournalEntry.project_id, JournalEntry.date)
+# The project listing reads a user's projects most recently written to first.
+Index(
+    "ix_project_user_id_last_entry_date_name",
+    Project.user_id,
+    Project.last_entry_date.desc(),
+    Project.name,
+)
+
+# The technology listing reads a user's technologies most used first.
+Index(
+    "ix_technology_user_id_usage_count_name",
+    Technology.user_id,
+    Technology.usage_count.desc(),
+    Technology.name,
+)
+# Reverse lookups from a technology to its entries; the primary key is led by
+# journal_entry_id and cannot serve them.
+Index(
+    "ix_journal_entry_technology_link_technology_id_journal_entry_id",
+    JournalEntryTechnologyLink.technology_id,
+    JournalEntryTechnologyLink.journal_entry_id,
+)
+Index(
+    "ix_journal_entry_technology_link_user_id_technology_id",
+    JournalEntryTechnologyLink.user_id,
+    JournalEntryTechnologyLink.technology_id,
+)
+
+# Workers claim the oldest due pending job.
+Index("ix_job_status_run_after", Job.status, Job.run_after)
+# Enqueueing a job identical to a pending one is a no-op.
+Index(
+    "ux_job_dedup_key_pending",
+    Job.dedup_key,
+    unique=True,
+    sqlite_where=Job.status == "pending",
+    postgresql_where=Job.status == "pending",
+)
+
+register_full_text_search(JournalEntry.__table__)
@@ -0,0 +1,70 @@
+"""Per-request SQL statement counting.
+
+``register_query_stats`` hooks ``before/after_cursor_execute`` on an engine.
+While a ``track_queries()`` block is open (``core/metrics.py`` opens one per
+HTTP request), every statement executed in that context adds to the block's
+``QueryStats``. Outside such a block the hooks only read a ``ContextVar``.
+"""
+
+import contextlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    duration: float = 0.0  # seconds spent in the database driver
+
+
+# Holds a mutable object rather than counters, so work running in a copied
+# context (threadpool dependencies, the session's greenlet) adds to the same stats
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextlib.contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed in the current context until exit."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Return the stats of the enclosing ``track_queries()`` block, if any."""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.duration += time.perf_counter() - started
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def register_query_stats(engine: AsyncEngine) -> None:
+    """Count every statement the engine executes into ``track_queries()``."""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
@@ -2,13 +2,26 @@ from typing import Annotated
 
 from database.db import engine
 from fastapi import Depends
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+# Built once per process; creating a sessionmaker per request is wasted work
+async_session_factory = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
+
+
+def new_session() -> AsyncSession:
+    """Create a session whose lifetime is managed by the caller.
+
+    Use this for work that outlives the request scope (e.g. streaming responses);
+    the caller is responsible for closing it.
+    """
+    return async_session_factory()
+
 
 async def get_session() -> AsyncSession:
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with async_session() as session:
+    async with async_session_factory() as session:
         yield session
 
 
@@ -0,0 +1,267 @@
+"""Slow-query log with query plan capture.
+
+``register_slow_query_log`` times every statement an engine executes. A
+statement slower than ``SLOW_QUERY_THRESHOLD_MS`` is aggregated under its
+fingerprint (the SQL with literals and bound parameters replaced by ``?``, and
+``IN`` lists collapsed). The first time a fingerprint is slow it is logged with
+its redacted parameters, duration and plan from ``EXPLAIN QUERY PLAN`` (SQLite)
+or ``EXPLAIN (FORMAT JSON)`` (Postgres). Neither form executes the statement.
+The aggregates back the admin portal's "Slow queries" page.
+"""
+
+import hashlib
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from logging import getLogger
+from typing import Any
+
+from database.db_config import (
+    SLOW_QUERY_EXPLAIN,
+    SLOW_QUERY_MAX_FINGERPRINTS,
+    SLOW_QUERY_THRESHOLD_MS,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+# $1 (asyncpg), %(name)s / %s (format styles), :name (named, not ::casts), ?
+_BIND_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+EXPLAIN_SAVEPOINT = "slow_query_explain"
+
+
+def normalize_sql(statement: str) -> str:
+    """Replace literals and parameters with ``?`` and collapse whitespace."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _BIND_PARAMETER.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("(?, ...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def fingerprint(normalized_sql: str) -> str:
+    return hashlib.blake2s(normalized_sql.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> str:
+    """Describe parameters by type only, e.g. ``['<str>', '<int>', NULL]``."""
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return repr({name: _redact(value) for name, value in parameters.items()})
+    if isinstance(parameters, (list, tuple)):
+        return repr([_redact(value) for value in parameters])
+    return _redact(parameters)
+
+
+def _redact(value: Any) -> str:
+    return "NULL" if value is None else f"<{type(value).__name__}>"
+
+
+def explain(conn: Connection, statement: str, parameters: Any) -> str | None:
+    """Return the plan of ``statement``, or ``None`` if it cannot be explained.
+
+    Runs on a fresh cursor of the same DBAPI connection so the EXPLAIN sees the
+    same transaction and is not itself timed or logged. On Postgres a failed
+    statement aborts its transaction, so the EXPLAIN runs in a savepoint that
+    is rolled back if it fails.
+    """
+    if not statement.lstrip().upper().startswith(EXPLAINABLE):
+        return None
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    elif dialect == "postgresql":
+        prefix = "EXPLAIN (FORMAT JSON) "
+    else:
+        return None
+
+    savepoint = dialect == "postgresql"
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if savepoint:
+            cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception:
+            if savepoint:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            raise
+        finally:
+            if savepoint:
+                cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+    except Exception as e:
+        return f"EXPLAIN failed: {str(e)}"
+    finally:
+        cursor.close()
+
+    if dialect == "sqlite":
+        return _format_sqlite_plan(rows)
+    plan = rows[0][0]
+    return plan if isinstance(plan, str) else json.dumps(plan, indent=2)
+
+
+def _format_sqlite_plan(rows: list[tuple]) -> str:
+    """Indent ``EXPLAIN QUERY PLAN`` rows ``(id, parent, notused, detail)``."""
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return "\n".join(lines)
+
+
+def has_full_scan(plan: str | None) -> bool:
+    """Whether a captured plan reads a whole table.
+
+    SQLite reports ``SCAN <table>`` (a covering index scan reads ``USING
+    COVERING INDEX`` and is not counted); Postgres reports ``Seq Scan``.
+    """
+    if not plan:
+        return False
+    for line in plan.splitlines():
+        line = line.strip()
+        if line.startswith("SCAN ") and "COVERING INDEX" not in line:
+            return True
+    return '"Seq Scan"' in plan
+
+
+@dataclass
+class SlowQuery:
+    fingerprint: str
+    sql: str
+    parameters: str
+    plan: str | None
+    count: int = 0
+    total_time: float = 0.0  # seconds
+    max_time: float = 0.0  # seconds
+    last_seen: datetime = field(default_factory=datetime.now)
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    @property
+    def full_scan(self) -> bool:
+        return has_full_scan(self.plan)
+
+
+class SlowQueryLog:
+    """Aggregates statements slower than ``threshold_ms`` by fingerprint.
+
+    Args:
+        threshold_ms: Duration above which a statement counts as slow
+        explain: Capture the plan the first time a fingerprint is slow
+        max_fingerprints: Entries kept; the one with the least total time is
+            dropped to make room
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = SLOW_QUERY_THRESHOLD_MS,
+        explain: bool = SLOW_QUERY_EXPLAIN,
+        max_fingerprints: int = SLOW_QUERY_MAX_FINGERPRINTS,
+    ) -> None:
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.max_fingerprints = max_fingerprints
+        self.queries: dict[str, SlowQuery] = {}
+
+    def record(
+        self,
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        duration: float,
+    ) -> None:
+        if duration < self.threshold:
+            return
+        sql = normalize_sql(statement)
+        key = fingerprint(sql)
+        query = self.queries.get(key)
+        if query is None:
+            query = self._add(conn, key, sql, statement, parameters, executemany)
+            logger.warning(
+                f"Slow query ({duration * 1000:.1f} ms) [{key}]: {sql}\n"
+                f"parameters: {query.parameters}\n"
+                f"plan:\n{query.plan or '(not captured)'}"
+            )
+        query.count += 1
+        query.total_time += duration
+        query.max_time = max(query.max_time, duration)
+        query.last_seen = datetime.now()
+
+    def _add(
+        self,
+        conn: Connection,
+        key: str,
+        sql: str,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+    ) -> SlowQuery:
+        if len(self.queries) >= self.max_fingerprints:
+            cheapest = min(self.queries.values(), key=lambda q: q.total_time)
+            del self.queries[cheapest.fingerprint]
+        plan = (
+            explain(conn, statement, parameters)
+            if self.explain and not executemany
+            else None
+        )
+        query = SlowQuery(
+            fingerprint=key,
+            sql=sql,
+            parameters=redact_parameters(parameters, executemany),
+            plan=plan,
+        )
+        self.queries[key] = query
+        return query
+
+    def top(self, n: int = 20, sort: str = "total_time") -> list[SlowQuery]:
+        """Return the ``n`` worst fingerprints by ``total_time``, ``max_time``,
+        ``mean_time`` or ``count``."""
+        return sorted(
+            self.queries.values(), key=lambda q: getattr(q, sort), reverse=True
+        )[:n]
+
+    def clear(self) -> None:
+        self.queries.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+def register_slow_query_log(
+    engine: AsyncEngine, log: SlowQueryLog = slow_query_log
+) -> None:
+    """Feed every statement the engine executes to ``log``."""
+    if log.threshold <= 0:
+        return
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        duration = time.perf_counter() - conn.info["slow_query_started"].pop()
+        log.record(conn, statement, parameters, many, duration)
+
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("slow_query_started"):
+            connection.info["slow_query_started"].pop()
+
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(sync_engine, "handle_error", handle_error)
@@ -0,0 +1,101 @@
+"""Connection PRAGMAs and periodic maintenance for SQLite databases.
+
+WAL mode lets readers proceed while a writer holds the lock, and
+``busy_timeout`` makes a blocked writer wait instead of failing immediately
+with ``database is locked``.
+"""
+
+import asyncio
+import contextlib
+from logging import getLogger
+
+from database.db_config import (
+    SQLITE_BUSY_TIMEOUT,
+    SQLITE_CACHE_SIZE,
+    SQLITE_FOREIGN_KEYS,
+    SQLITE_JOURNAL_MODE,
+    SQLITE_MAINTENANCE_INTERVAL,
+    SQLITE_MMAP_SIZE,
+    SQLITE_SYNCHRONOUS,
+    SQLITE_TEMP_STORE,
+)
+from database.full_text_search import rebuild_search_index
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = getLogger(__name__)
+
+
+def sqlite_pragmas() -> dict[str, str | int]:
+    """Return the PRAGMAs applied to each new SQLite connection, in order."""
+    return {
+        "busy_timeout": SQLITE_BUSY_TIMEOUT,
+        "journal_mode": SQLITE_JOURNAL_MODE,
+        "synchronous": SQLITE_SYNCHRONOUS,
+        "cache_size": SQLITE_CACHE_SIZE,
+        "mmap_size": SQLITE_MMAP_SIZE,
+        "temp_store": SQLITE_TEMP_STORE,
+        "foreign_keys": "ON" if SQLITE_FOREIGN_KEYS else "OFF",
+    }
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """SQLAlchemy ``connect`` hook applying ``sqlite_pragmas``."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def register_sqlite_pragmas(engine: AsyncEngine) -> None:
+    """Apply the PRAGMAs to every connection the engine opens, if it is SQLite."""
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", apply_sqlite_pragmas)
+
+
+async def run_sqlite_maintenance(engine: AsyncEngine) -> None:
+    """Checkpoint the WAL and refresh query planner statistics."""
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("PRAGMA wal_checkpoint(PASSIVE)")
+        await conn.exec_driver_sql("PRAGMA optimize")
+
+
+async def vacuum_sqlite(engine: AsyncEngine) -> None:
+    """Compact the database file, then rebuild the search index in case
+    VACUUM renumbered the rowids it is keyed on."""
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.exec_driver_sql("VACUUM")
+    await rebuild_search_index(engine)
+
+
+async def _maintenance_loop(engine: AsyncEngine, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_sqlite_maintenance(engine)
+        except Exception as e:
+            logger.warning(f"SQLite maintenance failed: {str(e)}")
+
+
+@contextlib.asynccontextmanager
+async def sqlite_maintenance(
+    engine: AsyncEngine, interval: float = SQLITE_MAINTENANCE_INTERVAL
+):
+    """Run ``run_sqlite_maintenance`` every ``interval`` seconds while open.
+
+    Does nothing for non-SQLite engines or when ``interval`` is 0.
+    """
+    if engine.dialect.name != "sqlite" or interval <= 0:
+        yield
+        return
+
+    task = asyncio.create_task(_maintenance_loop(engine, interval))
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,70 @@
+"""Calendar periods of the summary hierarchy and their invalidation.
+
+Days are summarized from journal entries; weeks and months from their days
+(weeks straddle months, so they are siblings rather than levels); years from
+their months. A journal entry write marks the summaries of every period
+containing the entry stale in the same transaction, so a refresh only revisits
+those.
+"""
+
+from datetime import date, datetime, timedelta
+from enum import Enum
+
+from database.models import Summary
+from sqlalchemy import and_, or_
+from sqlmodel import update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class Period(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+
+
+def period_start(period: Period, day: date) -> date:
+    """Return the first day of the ``period`` containing ``day``."""
+    if period is Period.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period is Period.MONTH:
+        return day.replace(day=1)
+    if period is Period.YEAR:
+        return day.replace(month=1, day=1)
+    return day
+
+
+def period_end(period: Period, start: date) -> date:
+    """Return the first day after the ``period`` starting on ``start``."""
+    if period is Period.WEEK:
+        return start + timedelta(days=7)
+    if period is Period.MONTH:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    if period is Period.YEAR:
+        return start.replace(year=start.year + 1)
+    return start + timedelta(days=1)
+
+
+async def mark_summaries_stale(
+    session: AsyncSession, user_id: str, *moments: datetime
+) -> None:
+    """Mark every summary containing one of ``moments`` stale, without committing."""
+    keys = {
+        (period.value, period_start(period, moment.date()))
+        for moment in moments
+        for period in Period
+    }
+    await session.exec(
+        update(Summary)
+        .where(
+            Summary.user_id == user_id,
+            or_(
+                *(
+                    and_(Summary.period == period, Summary.period_start == start)
+                    for period, start in keys
+                )
+            ),
+        )
+        .values(stale=True)
+        .execution_options(synchronize_session=False)
+    )
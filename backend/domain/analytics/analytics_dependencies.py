@@ -0,0 +1,19 @@
+from typing import Annotated
+
+from database.session import SessionDep
+from domain.analytics.analytics_repo import AnalyticsRepo
+from domain.analytics.analytics_service import AnalyticsService
+from fastapi import Depends
+
+
+def get_analytics_repo(session: SessionDep) -> AnalyticsRepo:
+    return AnalyticsRepo(session=session)
+
+
+def get_analytics_service(
+    repo: AnalyticsRepo = Depends(get_analytics_repo),
+) -> AnalyticsService:
+    return AnalyticsService(repo=repo)
+
+
+AnalyticsServiceDep = Annotated[AnalyticsService, Depends(get_analytics_service)]
@@ -0,0 +1,26 @@
+"""Domain-specific exceptions for the analytics module."""
+
+from enum import Enum
+
+from core.domain_exceptions import create_domain_exceptions
+
+
+class AnalyticsErrorCode(str, Enum):
+    """Enumeration of possible error codes for better error handling."""
+
+    DATABASE_ERROR = "analytics.database_error"
+    VALIDATION_ERROR = "analytics.validation_error"
+
+
+# Create standard domain exceptions
+exceptions = create_domain_exceptions(
+    domain_name="Analytics",
+    error_codes={
+        "database_error": AnalyticsErrorCode.DATABASE_ERROR,
+        "validation_error": AnalyticsErrorCode.VALIDATION_ERROR,
+    },
+)
+
+# Extract exceptions for easier imports
+AnalyticsDatabaseError = exceptions["database_error"]
+AnalyticsValidationError = exceptions["validation_error"]
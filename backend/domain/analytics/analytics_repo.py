@@ -0,0 +1,140 @@
+from datetime import date
+
+from database.activity import ALL, rebuild_activity
+from database.models import (
+    DailyActivity,
+    MonthlyActivity,
+    Project,
+    Technology,
+    User,
+)
+from database.session import SessionDep
+from domain.analytics.analytics_exceptions import AnalyticsDatabaseError
+from domain.analytics.analytics_schema import ActivityBreakdown
+from sqlalchemy import literal
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import select
+
+
+class AnalyticsRepo:
+    def __init__(self, session: SessionDep):
+        """Initialize the Analytics repository.
+
+        Args:
+            session (SessionDep): Database session dependency
+        """
+        self.session = session
+
+    async def get_daily_totals(
+        self, user_id: str, start: date, end: date
+    ) -> list[DailyActivity]:
+        """Get a user's total rows of the days in ``[start, end]``, in order.
+
+        One range of the primary key, one row per active day.
+
+        Raises:
+            AnalyticsDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(DailyActivity)
+                .where(
+                    DailyActivity.user_id == user_id,
+                    DailyActivity.project_id == ALL,
+                    DailyActivity.technology_id == ALL,
+                    DailyActivity.day >= start,
+                    DailyActivity.day <= end,
+                )
+                .order_by(DailyActivity.day)
+            )
+            return results.all()
+        except SQLAlchemyError as e:
+            raise AnalyticsDatabaseError(
+                message=f"Failed to fetch daily activity: {str(e)}"
+            )
+
+    async def get_monthly_activity(
+        self, user_id: str, start: date, end: date, by: ActivityBreakdown
+    ) -> list[tuple[MonthlyActivity, str | None]]:
+        """Get a user's rows of the months starting in ``[start, end]`` with the
+        name of the project or technology they count.
+
+        Returns:
+            list[tuple[MonthlyActivity, str | None]]: By month, then by
+                decreasing entry count
+
+        Raises:
+            AnalyticsDatabaseError: If database operation fails
+        """
+        conditions = [
+            MonthlyActivity.user_id == user_id,
+            MonthlyActivity.month >= start,
+            MonthlyActivity.month <= end,
+        ]
+        if by is ActivityBreakdown.PROJECT:
+            statement = (
+                select(MonthlyActivity, Project.name)
+                .outerjoin(Project, Project.id == MonthlyActivity.project_id)
+                .where(*conditions, MonthlyActivity.project_id != ALL)
+            )
+        elif by is ActivityBreakdown.TECHNOLOGY:
+            statement = (
+                select(MonthlyActivity, Technology.name)
+                .outerjoin(Technology, Technology.id == MonthlyActivity.technology_id)
+                .where(
+                    *conditions,
+                    MonthlyActivity.project_id == ALL,
+                    MonthlyActivity.technology_id != ALL,
+                )
+            )
+        else:
+            statement = select(MonthlyActivity, literal(None)).where(
+                *conditions,
+                MonthlyActivity.project_id == ALL,
+                MonthlyActivity.technology_id == ALL,
+            )
+        try:
+            results = await self.session.exec(
+                statement.order_by(
+                    MonthlyActivity.month,
+                    MonthlyActivity.entry_count.desc(),
+                    MonthlyActivity.project_id,
+                    MonthlyActivity.technology_id,
+                )
+            )
+            return results.all()
+        except SQLAlchemyError as e:
+            raise AnalyticsDatabaseError(
+                message=f"Failed to fetch monthly activity: {str(e)}"
+            )
+
+    async def rebuild(self, user_id: str) -> int:
+        """Recompute a user's rollups from their journal.
+
+        Returns:
+            int: Number of journal entries counted
+
+        Raises:
+            AnalyticsDatabaseError: If database operation fails
+        """
+        try:
+            counted = await rebuild_activity(self.session, user_id)
+            await self.session.commit()
+            return counted
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise AnalyticsDatabaseError(
+                message=f"Failed to rebuild activity: {str(e)}"
+            )
+
+    async def get_user_ids(self) -> list[str]:
+        """Get the ids of all users.
+
+        Raises:
+            AnalyticsDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(select(User.id))
+            return results.all()
+        except SQLAlchemyError as e:
+            raise AnalyticsDatabaseError(message=f"Failed to fetch users: {str(e)}")
@@ -0,0 +1,65 @@
+from datetime import date
+
+from authx import TokenPayload
+from core.responses import ModelResponse
+from domain.analytics.analytics_dependencies import AnalyticsServiceDep
+from domain.analytics.analytics_schema import (
+    ActivityBreakdown,
+    ActivityCalendar,
+    MonthActivity,
+)
+from domain.auth.auth_config import security
+from fastapi import APIRouter, Depends
+
+router = APIRouter()
+
+
+@router.get("/calendar", response_model=ActivityCalendar)
+async def get_calendar(
+    service: AnalyticsServiceDep,
+    start: date | None = None,
+    end: date | None = None,
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Get the current user's journal activity per day, for a heatmap.
+
+    Args:
+        start: First day; defaults to a year before ``end``
+        end: Last day; defaults to today
+
+    Returns:
+        ActivityCalendar: Entry counts of the active days, with streaks
+
+    Raises:
+        AnalyticsValidationError: 400 if the range is reversed or longer than
+            366 days
+    """
+    calendar = await service.get_calendar(payload.user_id, end or date.today(), start)
+    return ModelResponse(calendar)
+
+
+@router.get("/months", response_model=list[MonthActivity])
+async def get_monthly_activity(
+    service: AnalyticsServiceDep,
+    start: date,
+    end: date | None = None,
+    by: ActivityBreakdown = ActivityBreakdown.TOTAL,
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Get the current user's journal entry counts per month.
+
+    Args:
+        start: Any day of the first month
+        end: Any day of the last month; defaults to today
+        by: ``total``, or one row per ``project`` or ``technology`` and month
+
+    Returns:
+        list[MonthActivity]: Months with entries, in order
+
+    Raises:
+        AnalyticsValidationError: 400 if the range is reversed
+    """
+    months = await service.get_monthly_activity(
+        payload.user_id, start, end or date.today(), by
+    )
+    return ModelResponse(months, list[MonthActivity])
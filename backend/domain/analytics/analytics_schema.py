@@ -0,0 +1,45 @@
+from datetime import date
+from enum import Enum
+
+from core.schema.base import BaseSchema
+
+# Widest range of the activity calendar: a year, leap day included
+MAX_CALENDAR_DAYS = 366
+
+
+class ActivityBreakdown(str, Enum):
+    """How monthly activity is split."""
+
+    TOTAL = "total"
+    PROJECT = "project"
+    TECHNOLOGY = "technology"
+
+
+class DayActivity(BaseSchema):
+    day: date
+    entry_count: int
+    chars: int
+
+
+class ActivityCalendar(BaseSchema):
+    """A user's activity per day over a range, for a contribution heatmap."""
+
+    start: date
+    end: date  # inclusive
+    # Days with entries only, in order
+    days: list[DayActivity]
+    total_entries: int
+    active_days: int
+    # Run of active days up to ``end``, or up to the day before while ``end``
+    # has no entries yet
+    current_streak: int
+    longest_streak: int
+
+
+class MonthActivity(BaseSchema):
+    month: date  # first day
+    # Project or technology the row counts, ``None`` for totals
+    id: str | None = None
+    name: str | None = None
+    entry_count: int
+    chars: int
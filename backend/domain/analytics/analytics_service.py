@@ -0,0 +1,122 @@
+"""Activity analytics answered from the rollups in ``database/activity.py``.
+
+A calendar reads at most one row per day of its range and a monthly breakdown
+one row per month and project or technology, however many entries the user
+wrote.
+"""
+
+from datetime import date, timedelta
+
+from domain.analytics.analytics_exceptions import AnalyticsValidationError
+from domain.analytics.analytics_repo import AnalyticsRepo
+from domain.analytics.analytics_schema import (
+    MAX_CALENDAR_DAYS,
+    ActivityBreakdown,
+    ActivityCalendar,
+    DayActivity,
+    MonthActivity,
+)
+
+
+class AnalyticsService:
+    def __init__(self, repo: AnalyticsRepo) -> None:
+        self.repo = repo
+
+    async def get_calendar(
+        self, user_id: str, end: date, start: date | None = None
+    ) -> ActivityCalendar:
+        """Get a user's activity per day with their streaks.
+
+        Args:
+            user_id: ID of the user owning the entries
+            end: Last day of the range
+            start: First day of the range; defaults to a year before ``end``
+
+        Returns:
+            ActivityCalendar: The active days and streaks within the range
+
+        Raises:
+            AnalyticsValidationError: If the range is reversed or longer than
+                ``MAX_CALENDAR_DAYS``
+            AnalyticsDatabaseError: If database operation fails
+        """
+        if start is None:
+            start = end - timedelta(days=364)
+        _check_range(start, end)
+        if (end - start).days >= MAX_CALENDAR_DAYS:
+            raise AnalyticsValidationError(
+                message=f"The calendar spans at most {MAX_CALENDAR_DAYS} days",
+                params={"start": start.isoformat(), "end": end.isoformat()},
+            )
+
+        rows = await self.repo.get_daily_totals(user_id, start, end)
+        longest_streak = streak = 0
+        previous = None
+        for row in rows:
+            streak = streak + 1 if previous == row.day - timedelta(days=1) else 1
+            longest_streak = max(longest_streak, streak)
+            previous = row.day
+        current_streak = (
+            streak
+            if previous is not None and previous >= end - timedelta(days=1)
+            else 0
+        )
+        return ActivityCalendar(
+            start=start,
+            end=end,
+            days=[
+                DayActivity(day=row.day, entry_count=row.entry_count, chars=row.chars)
+                for row in rows
+            ],
+            total_entries=sum(row.entry_count for row in rows),
+            active_days=len(rows),
+            current_streak=current_streak,
+            longest_streak=longest_streak,
+        )
+
+    async def get_monthly_activity(
+        self,
+        user_id: str,
+        start: date,
+        end: date,
+        by: ActivityBreakdown = ActivityBreakdown.TOTAL,
+    ) -> list[MonthActivity]:
+        """Get a user's entry counts per month, in total or by project or
+        technology.
+
+        Args:
+            user_id: ID of the user owning the entries
+            start: Any day of the first month
+            end: Any day of the last month
+            by: Split of each month's counts
+
+        Returns:
+            list[MonthActivity]: Months with entries, in order; within a month,
+                projects or technologies by decreasing entry count
+
+        Raises:
+            AnalyticsValidationError: If the range is reversed
+            AnalyticsDatabaseError: If database operation fails
+        """
+        _check_range(start, end)
+        rows = await self.repo.get_monthly_activity(
+            user_id, start.replace(day=1), end, by
+        )
+        return [
+            MonthActivity(
+                month=row.month,
+                id=row.project_id or row.technology_id or None,
+                name=name,
+                entry_count=row.entry_count,
+                chars=row.chars,
+            )
+            for row, name in rows
+        ]
+
+
+def _check_range(start: date, end: date) -> None:
+    if start > end:
+        raise AnalyticsValidationError(
+            message="The range must not end before it starts",
+            params={"start": start.isoformat(), "end": end.isoformat()},
+        )
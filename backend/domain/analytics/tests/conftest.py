@@ -0,0 +1,12 @@
+import pytest
+from domain.analytics.analytics_repo import AnalyticsRepo
+from domain.analytics.analytics_service import AnalyticsService
+
+# flake8: noqa: F401
+from tests.conftest import *
+
+
+@pytest.fixture
+def analytics_service(db_session) -> AnalyticsService:
+    """Create an AnalyticsService reading the test database."""
+    return AnalyticsService(AnalyticsRepo(db_session))
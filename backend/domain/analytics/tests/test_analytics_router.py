@@ -0,0 +1,103 @@
+"""Tests for the analytics router endpoints."""
+
+from datetime import date
+
+import pytest
+from domain.analytics.analytics_dependencies import get_analytics_service
+from domain.analytics.analytics_exceptions import AnalyticsValidationError
+from domain.analytics.analytics_router import router
+from domain.analytics.analytics_schema import (
+    ActivityBreakdown,
+    ActivityCalendar,
+    DayActivity,
+    MonthActivity,
+)
+from domain.analytics.analytics_service import AnalyticsService
+from fastapi import FastAPI, status
+from tests.conftest import authed_client
+
+mock_user_id = "123"
+
+
+@pytest.fixture
+def mock_analytics_service(mocker):
+    """Create a mock analytics service."""
+    return mocker.Mock(spec=AnalyticsService)
+
+
+@pytest.fixture
+def client(mock_analytics_service):
+    """Create a test client with the service overridden and a logged-in user."""
+    app = FastAPI()
+    app.include_router(router, prefix="/api/analytics")
+    app.dependency_overrides[get_analytics_service] = lambda: mock_analytics_service
+    return authed_client(app, mock_user_id)
+
+
+def test_get_calendar(client, mock_analytics_service):
+    """Test fetching the activity calendar of a range."""
+    mock_analytics_service.get_calendar.return_value = ActivityCalendar(
+        start=date(2024, 1, 1),
+        end=date(2024, 1, 31),
+        days=[DayActivity(day=date(2024, 1, 2), entry_count=2, chars=40)],
+        total_entries=2,
+        active_days=1,
+        current_streak=0,
+        longest_streak=1,
+    )
+
+    response = client.get("/api/analytics/calendar?start=2024-01-01&end=2024-01-31")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["days"] == [
+        {"day": "2024-01-02", "entryCount": 2, "chars": 40}
+    ]
+    assert response.json()["longestStreak"] == 1
+    mock_analytics_service.get_calendar.assert_called_once_with(
+        mock_user_id, date(2024, 1, 31), date(2024, 1, 1)
+    )
+
+
+def test_get_calendar_invalid_range(client, mock_analytics_service):
+    """Test that an invalid range is a 400."""
+    mock_analytics_service.get_calendar.side_effect = AnalyticsValidationError(
+        message="The calendar spans at most 366 days"
+    )
+
+    response = client.get("/api/analytics/calendar?start=2020-01-01&end=2024-01-31")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_monthly_activity(client, mock_analytics_service):
+    """Test fetching monthly counts by technology."""
+    mock_analytics_service.get_monthly_activity.return_value = [
+        MonthActivity(
+            month=date(2024, 1, 1), id="py", name="Python", entry_count=3, chars=90
+        )
+    ]
+
+    response = client.get(
+        "/api/analytics/months?start=2024-01-01&end=2024-06-30&by=technology"
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {
+            "month": "2024-01-01",
+            "id": "py",
+            "name": "Python",
+            "entryCount": 3,
+            "chars": 90,
+        }
+    ]
+    mock_analytics_service.get_monthly_activity.assert_called_once_with(
+        mock_user_id, date(2024, 1, 1), date(2024, 6, 30), ActivityBreakdown.TECHNOLOGY
+    )
+
+
+def test_get_monthly_activity_requires_start(client):
+    """Test that the first month is required."""
+    response = client.get("/api/analytics/months")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,155 @@
+"""Tests for the analytics service."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from database.activity import EntryActivity, record_activity
+from database.models import Project, Technology
+from domain.analytics.analytics_exceptions import AnalyticsValidationError
+from domain.analytics.analytics_schema import (
+    ActivityBreakdown,
+    DayActivity,
+    MonthActivity,
+)
+from domain.analytics.analytics_service import AnalyticsService
+
+mock_user_id = "123"
+
+
+def entry(day: date, project_id=None, technology_ids=(), chars=10) -> EntryActivity:
+    return EntryActivity(
+        datetime.combine(day, datetime.min.time()),
+        project_id,
+        frozenset(technology_ids),
+        chars,
+    )
+
+
+@pytest_asyncio.fixture
+async def activity(db_session):
+    """Record a journal with two streaks and entries in two months."""
+    db_session.add_all(
+        [
+            Project(id="p1", name="Project 1", user_id=mock_user_id),
+            Technology(id="py", name="Python", user_id=mock_user_id),
+            Technology(id="go", name="Go", user_id=mock_user_id),
+        ]
+    )
+    days = [date(2024, 1, 30), date(2024, 1, 31), date(2024, 2, 1)]
+    days += [date(2024, 2, 10), date(2024, 2, 11)]
+    await record_activity(
+        db_session,
+        mock_user_id,
+        added=[
+            *(entry(day, "p1", ["py"]) for day in days),
+            entry(date(2024, 2, 11), technology_ids=["go", "py"], chars=5),
+        ],
+    )
+    # Another user's activity is never counted
+    await record_activity(db_session, "456", added=[entry(date(2024, 2, 12))])
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_get_calendar_counts_days_and_streaks(
+    analytics_service: AnalyticsService, activity
+):
+    """Test the active days and the streaks up to the end of the range."""
+    calendar = await analytics_service.get_calendar(
+        mock_user_id, date(2024, 2, 12), date(2024, 1, 31)
+    )
+
+    assert calendar.days[0] == DayActivity(
+        day=date(2024, 1, 31), entry_count=1, chars=10
+    )
+    assert calendar.days[-1] == DayActivity(
+        day=date(2024, 2, 11), entry_count=2, chars=15
+    )
+    assert calendar.active_days == 4
+    assert calendar.total_entries == 5
+    assert calendar.longest_streak == 2
+    # The end day has no entry yet, so the streak up to the day before counts
+    assert calendar.current_streak == 2
+
+    calendar = await analytics_service.get_calendar(mock_user_id, date(2024, 2, 13))
+    assert calendar.start == date(2023, 2, 14)
+    assert calendar.longest_streak == 3
+    assert calendar.current_streak == 0
+
+
+@pytest.mark.asyncio
+async def test_get_calendar_rejects_invalid_ranges(analytics_service: AnalyticsService):
+    """Test that reversed ranges and ranges over a year are rejected."""
+    end = date(2024, 12, 31)
+    with pytest.raises(AnalyticsValidationError):
+        await analytics_service.get_calendar(mock_user_id, end, end + timedelta(days=1))
+    with pytest.raises(AnalyticsValidationError):
+        await analytics_service.get_calendar(
+            mock_user_id, end, end - timedelta(days=366)
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "by, expected",
+    [
+        (
+            ActivityBreakdown.TOTAL,
+            [
+                MonthActivity(month=date(2024, 1, 1), entry_count=2, chars=20),
+                MonthActivity(month=date(2024, 2, 1), entry_count=4, chars=35),
+            ],
+        ),
+        (
+            ActivityBreakdown.PROJECT,
+            [
+                MonthActivity(
+                    month=date(2024, 1, 1),
+                    id="p1",
+                    name="Project 1",
+                    entry_count=2,
+                    chars=20,
+                ),
+                MonthActivity(
+                    month=date(2024, 2, 1),
+                    id="p1",
+                    name="Project 1",
+                    entry_count=3,
+                    chars=30,
+                ),
+            ],
+        ),
+        (
+            ActivityBreakdown.TECHNOLOGY,
+            [
+                MonthActivity(
+                    month=date(2024, 1, 1),
+                    id="py",
+                    name="Python",
+                    entry_count=2,
+                    chars=20,
+                ),
+                MonthActivity(
+                    month=date(2024, 2, 1),
+                    id="py",
+                    name="Python",
+                    entry_count=4,
+                    chars=35,
+                ),
+                MonthActivity(
+                    month=date(2024, 2, 1), id="go", name="Go", entry_count=1, chars=5
+                ),
+            ],
+        ),
+    ],
+)
+async def test_get_monthly_activity_by_dimension(
+    analytics_service: AnalyticsService, activity, by, expected
+):
+    """Test the monthly counts in total, by project and by technology."""
+    months = await analytics_service.get_monthly_activity(
+        mock_user_id, date(2024, 1, 15), date(2024, 2, 29), by
+    )
+
+    assert months == expected
@@ -10,6 +10,18 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 1 day
 ACCESS_TOKEN_EXPIRE_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60  # 1 day in seconds
 REFRESH_TOKEN_EXPIRE_MINUTES = timedelta(days=20)  # 20 days
 
+# bcrypt cost factor for new hashes; stored hashes with another cost are
+# rehashed on the next successful login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Threads dedicated to bcrypt, and how many operations may be running or queued
+# for them before new ones are rejected with 503
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+
+# In-process cache of user principals used by token refresh; 0 TTL disables it
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))  # seconds
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+
 config = AuthXConfig(
     JWT_ALGORITHM=os.getenv("JWT_ALGORITHM"),
     JWT_SECRET_KEY=os.getenv("JWT_SECRET_KEY"),
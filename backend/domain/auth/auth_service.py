@@ -1,13 +1,18 @@
 from datetime import datetime, timedelta, timezone
+from logging import getLogger
 from typing import TypedDict, Any, Coroutine
 
 from authx import TokenPayload
+from core.exceptions import BaseDomainError
 from database.models import User
 from domain.auth.auth_config import security
 from domain.auth.auth_schema import AuthSuccess
+from domain.user.user_cache import UserPrincipal
 from domain.user.user_service import UserService
 from fastapi import HTTPException
 
+logger = getLogger(__name__)
+
 
 class Tokens(TypedDict):
     access_token: str
@@ -22,9 +27,12 @@ class AuthService:
         user = await self.user_service.get_user_by_email(email)
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
-        if not self.user_service.check_password(password, user.password):
+        if not await self.user_service.check_password(password, user.password):
             raise HTTPException(status_code=401, detail="Invalid credentials")
+        if self.user_service.needs_rehash(user.password):
+            await self._rehash_password(user, password)
 
+        self.user_service.cache_principal(user)
         tokens = await self.create_tokens(user)
 
         return {
@@ -35,19 +43,24 @@ class AuthService:
             **tokens,
         }
 
+    async def _rehash_password(self, user: User, password: str) -> None:
+        # Opportunistic: a failed upgrade must not fail an otherwise valid login
+        try:
+            await self.user_service.rehash_password(user, password)
+        except BaseDomainError as e:
+            logger.warning(f"Password rehash skipped for user {user.id}: {e.message}")
+
     async def refresh_access_token(self, payload: TokenPayload):
         today = datetime.now(timezone.utc)
         if payload.exp < today:
             raise HTTPException(status_code=401, detail="Refresh token expired")
 
-        user = await self.user_service.get_user(payload.user_id)
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
+        principal = await self.user_service.get_principal(payload.user_id)
 
-        tokens = await self.create_tokens(user)
+        tokens = await self.create_tokens(principal)
         return tokens["access_token"]
 
-    async def create_tokens(self, user: User) -> Tokens:
+    async def create_tokens(self, user: User | UserPrincipal) -> Tokens:
         token_payload = {
             "email": user.email,
             "user_id": user.id,
@@ -0,0 +1,85 @@
+"""Backends that turn journal entry texts into vectors.
+
+``EmbeddingService`` only talks to the ``Embedder`` protocol. ``get_embedder``
+builds the backend named by ``EMBEDDER``:
+
+- ``hashing``: feature hashing of words and word pairs; deterministic, local
+  and fast enough to embed inline; the default, and what the tests use
+- ``package.module:Class``: any class implementing the protocol, e.g. one
+  calling a sentence embedding model
+"""
+
+import importlib
+import math
+import re
+import zlib
+from collections import Counter
+from functools import cache
+from typing import Protocol
+
+import numpy as np
+from domain.embedding.embedding_config import EMBEDDER, EMBEDDING_DIMENSIONS
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset(
+    """a about after all also an and any are as at be been but by can could did
+    do does for from had has have he her his how i if in into is it its just me
+    more my no not of on or our out so some than that the their them then there
+    these they this to too up us was we were what when which while who will with
+    would you your""".split()
+)
+
+
+class Embedder(Protocol):
+    # Stored with every vector it writes; vectors of other names are redone
+    name: str
+    dimensions: int
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        """Embed ``texts`` as the rows of a ``(len(texts), dimensions)``
+        float32 array, each of unit length (or zero for an empty text)."""
+        ...
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length in place, leaving zero rows as they are."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+class HashingEmbedder:
+    """Hashes the words and adjacent word pairs of a text (stopwords dropped)
+    into ``dimensions`` signed buckets weighted by ``1 + log(tf)``.
+
+    Texts sharing vocabulary get a high cosine similarity. There is no
+    vocabulary to fit, so vectors never change once written.
+    """
+
+    def __init__(self, dimensions: int = EMBEDDING_DIMENSIONS) -> None:
+        self.dimensions = dimensions
+        self.name = f"hashing-{dimensions}"
+
+    def features(self, text: str) -> Counter:
+        words = [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS]
+        return Counter(words + [f"{a} {b}" for a, b in zip(words, words[1:])])
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, count in self.features(text).items():
+                bucket = zlib.crc32(feature.encode("utf-8"))
+                # The top bit picks the sign so collisions tend to cancel out
+                sign = 1.0 if bucket & 0x80000000 else -1.0
+                vectors[row, bucket % self.dimensions] += sign * (1 + math.log(count))
+        return normalize_rows(vectors)
+
+
+@cache
+def get_embedder(name: str = EMBEDDER) -> Embedder:
+    """Return the process-wide embedder named by ``EMBEDDER``."""
+    if name == "hashing":
+        return HashingEmbedder()
+    module_name, _, class_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
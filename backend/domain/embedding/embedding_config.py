@@ -0,0 +1,16 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Backend that embeds journal entries: "hashing" (local, deterministic, no
+# model) or the import path of an Embedder class, e.g.
+# "my_package.embedders:MyEmbedder"
+EMBEDDER = os.getenv("EMBEDDER", "hashing")
+# Width of the hashing embedder's vectors; 100k entries take 100 MB at 256
+EMBEDDING_DIMENSIONS = int(os.getenv("EMBEDDING_DIMENSIONS", "256"))
+# Entries embedded and written per transaction by a sync job
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "500"))
+# Users whose vector matrix is kept in memory, least recently searched evicted
+EMBEDDING_INDEX_MAX_USERS = int(os.getenv("EMBEDDING_INDEX_MAX_USERS", "32"))
@@ -0,0 +1,20 @@
+from typing import Annotated
+
+from database.session import SessionDep
+from domain.embedding.embedder import get_embedder
+from domain.embedding.embedding_repo import EmbeddingRepo
+from domain.embedding.embedding_service import EmbeddingService
+from fastapi import Depends
+
+
+def get_embedding_repo(session: SessionDep) -> EmbeddingRepo:
+    return EmbeddingRepo(session=session)
+
+
+def get_embedding_service(
+    repo: EmbeddingRepo = Depends(get_embedding_repo),
+) -> EmbeddingService:
+    return EmbeddingService(repo=repo, embedder=get_embedder())
+
+
+EmbeddingServiceDep = Annotated[EmbeddingService, Depends(get_embedding_service)]
@@ -0,0 +1,23 @@
+"""Domain-specific exceptions for the embedding module."""
+
+from enum import Enum
+
+from core.domain_exceptions import create_domain_exceptions
+
+
+class EmbeddingErrorCode(str, Enum):
+    """Enumeration of possible error codes for better error handling."""
+
+    DATABASE_ERROR = "embedding.database_error"
+
+
+# Create standard domain exceptions
+exceptions = create_domain_exceptions(
+    domain_name="Embedding",
+    error_codes={
+        "database_error": EmbeddingErrorCode.DATABASE_ERROR,
+    },
+)
+
+# Extract exceptions for easier imports
+EmbeddingDatabaseError = exceptions["database_error"]
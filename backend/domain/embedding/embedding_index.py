@@ -0,0 +1,100 @@
+"""In-memory matrices of journal entry vectors, one per user.
+
+A user's vectors are loaded from ``journal_entry_embedding`` into one float32
+matrix, so a similarity search is a single matrix-vector product. Matrices are
+tagged with the user's ``EMBEDDINGS`` collection version: a search first reads
+the version and reloads the matrix if another process wrote vectors since.
+Vectors written by this process are applied to the cached matrix in place.
+"""
+
+import numpy as np
+from core.versioned_cache import VersionedCache
+from domain.embedding.embedding_config import EMBEDDING_INDEX_MAX_USERS
+
+VECTOR_DTYPE = np.dtype("<f4")
+
+
+def encode_vector(vector: np.ndarray) -> bytes:
+    return vector.astype(VECTOR_DTYPE, copy=False).tobytes()
+
+
+class UserMatrix:
+    """The vectors of one user's entries, rows in ``ids`` order."""
+
+    def __init__(self, ids: list[str], vectors: np.ndarray, dimensions: int) -> None:
+        self.dimensions = dimensions
+        self.ids = list(ids)
+        self.rows = {id: row for row, id in enumerate(self.ids)}
+        # Spare rows let appends amortize to O(1) per vector
+        self._vectors = np.zeros(
+            (max(len(self.ids), 16), dimensions), dtype=VECTOR_DTYPE
+        )
+        self._vectors[: len(self.ids)] = vectors
+
+    @classmethod
+    def from_blobs(
+        cls, ids: list[str], blobs: list[bytes], dimensions: int
+    ) -> "UserMatrix":
+        vectors = np.frombuffer(b"".join(blobs), dtype=VECTOR_DTYPE)
+        return cls(ids, vectors.reshape(len(ids), dimensions), dimensions)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        return self._vectors[: len(self.ids)]
+
+    def vector(self, id: str) -> np.ndarray | None:
+        row = self.rows.get(id)
+        return None if row is None else self._vectors[row]
+
+    def upsert(self, ids: list[str], vectors: np.ndarray) -> None:
+        """Replace the vectors of known ids and append the others."""
+        for id, vector in zip(ids, vectors):
+            row = self.rows.get(id)
+            if row is None:
+                row = len(self.ids)
+                if row == len(self._vectors):
+                    self._vectors = np.concatenate(
+                        [self._vectors, np.zeros_like(self._vectors)]
+                    )
+                self.ids.append(id)
+                self.rows[id] = row
+            self._vectors[row] = vector
+
+    def top_k(
+        self, query: np.ndarray, k: int, exclude: str | None = None
+    ) -> list[tuple[str, float]]:
+        """Return the ``k`` ids most cosine-similar to ``query``, best first.
+
+        Rows and ``query`` are unit vectors, so one matrix-vector product gives
+        every cosine similarity; ``argpartition`` then finds the top ``k``
+        without sorting the rest.
+        """
+        scores = self.matrix @ query.astype(VECTOR_DTYPE, copy=False)
+        if exclude in self.rows:
+            scores[self.rows[exclude]] = -np.inf
+        k = min(k, len(self.ids) - (exclude in self.rows))
+        if k <= 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.ids[row], float(scores[row])) for row in best]
+
+
+class EmbeddingIndex(VersionedCache[UserMatrix]):
+    """LRU cache of ``UserMatrix`` by user."""
+
+    def __init__(self, max_users: int = EMBEDDING_INDEX_MAX_USERS) -> None:
+        super().__init__(max_users)
+
+    def apply(
+        self, user_id: str, version: int, ids: list[str], vectors: np.ndarray
+    ) -> None:
+        """Record vectors written as ``version``, the one after the cached matrix's.
+
+        A matrix that missed a version is dropped and reloaded when next used.
+        """
+        self.advance(user_id, version, lambda matrix: matrix.upsert(ids, vectors))
+
+
+# Shared by the requests and the job workers of this process
+embedding_index = EmbeddingIndex()
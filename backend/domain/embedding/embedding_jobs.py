@@ -0,0 +1,15 @@
+"""Job handler embedding journal entries in the background (see domain/job)."""
+
+from typing import Any
+
+from database.models import Job
+from domain.embedding.embedder import get_embedder
+from domain.embedding.embedding_repo import EmbeddingRepo
+from domain.embedding.embedding_service import EmbeddingService
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+async def sync_embeddings(session: AsyncSession, job: Job) -> dict[str, Any]:
+    """Embed the user's entries that have no current vector."""
+    service = EmbeddingService(EmbeddingRepo(session), get_embedder())
+    return {"embedded": await service.sync(job.user_id)}
@@ -0,0 +1,169 @@
+from database.collection_versions import (
+    Collection,
+    bump_collection_versions,
+    get_collection_version,
+)
+from database.models import JournalEntry, JournalEntryEmbedding
+from database.session import SessionDep
+from domain.embedding.embedding_exceptions import EmbeddingDatabaseError
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+
+
+class EmbeddingRepo:
+    def __init__(self, session: SessionDep):
+        """Initialize the Embedding repository.
+
+        Args:
+            session (SessionDep): Database session dependency
+        """
+        self.session = session
+
+    async def get_version(self, user_id: str) -> int:
+        """Get the version of a user's vectors, bumped by every write.
+
+        Raises:
+            EmbeddingDatabaseError: If database operation fails
+        """
+        try:
+            return await get_collection_version(
+                self.session, user_id, Collection.EMBEDDINGS
+            )
+        except SQLAlchemyError as e:
+            raise EmbeddingDatabaseError(
+                message=f"Failed to fetch embedding version: {str(e)}"
+            )
+
+    async def get_vectors(
+        self, user_id: str, embedder: str
+    ) -> tuple[list[str], list[bytes]]:
+        """Get the entry ids and encoded vectors ``embedder`` wrote for a user.
+
+        Raises:
+            EmbeddingDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(
+                    JournalEntryEmbedding.journal_entry_id,
+                    JournalEntryEmbedding.vector,
+                ).where(
+                    JournalEntryEmbedding.user_id == user_id,
+                    JournalEntryEmbedding.embedder == embedder,
+                )
+            )
+            rows = results.all()
+        except SQLAlchemyError as e:
+            raise EmbeddingDatabaseError(message=f"Failed to fetch vectors: {str(e)}")
+        return [id for id, _ in rows], [vector for _, vector in rows]
+
+    async def get_unembedded_entries(
+        self, user_id: str, embedder: str, limit: int
+    ) -> list[tuple[str, str]]:
+        """Get ``(id, content)`` of a user's entries without a vector from
+        ``embedder``, at most ``limit`` of them.
+
+        Raises:
+            EmbeddingDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(JournalEntry.id, JournalEntry.content)
+                .outerjoin(
+                    JournalEntryEmbedding,
+                    (JournalEntryEmbedding.journal_entry_id == JournalEntry.id)
+                    & (JournalEntryEmbedding.embedder == embedder),
+                )
+                .where(
+                    JournalEntry.user_id == user_id,
+                    JournalEntryEmbedding.journal_entry_id.is_(None),
+                )
+                .limit(limit)
+            )
+            return results.all()
+        except SQLAlchemyError as e:
+            raise EmbeddingDatabaseError(
+                message=f"Failed to fetch journal entries: {str(e)}"
+            )
+
+    async def save_vectors(
+        self, user_id: str, embedder: str, vectors: dict[str, bytes]
+    ) -> int:
+        """Upsert encoded vectors by entry id and bump the user's version.
+
+        Returns:
+            int: The version the vectors were written as
+
+        Raises:
+            EmbeddingDatabaseError: If database operation fails
+        """
+        dialect_insert = (
+            postgresql.insert
+            if self.session.bind.dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        statement = dialect_insert(JournalEntryEmbedding).values(
+            [
+                JournalEntryEmbedding(
+                    journal_entry_id=id,
+                    user_id=user_id,
+                    embedder=embedder,
+                    vector=vector,
+                ).model_dump()
+                for id, vector in vectors.items()
+            ]
+        )
+        try:
+            await self.session.exec(
+                statement.on_conflict_do_update(
+                    index_elements=["journal_entry_id"],
+                    set_={
+                        column: statement.excluded[column]
+                        for column in ("embedder", "vector", "updated_at")
+                    },
+                )
+            )
+            await bump_collection_versions(self.session, user_id, Collection.EMBEDDINGS)
+            # The bump holds the version row's lock until the commit, so no
+            # other write can land in between
+            version = await get_collection_version(
+                self.session, user_id, Collection.EMBEDDINGS
+            )
+            await self.session.commit()
+            return version
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise EmbeddingDatabaseError(message=f"Failed to save vectors: {str(e)}")
+
+    async def get_journal_entries(self, ids: list[str]) -> dict[str, JournalEntry]:
+        """Get journal entries with their technologies and project by id.
+
+        Raises:
+            EmbeddingDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(JournalEntry)
+                .where(JournalEntry.id.in_(ids))
+                .options(selectinload(JournalEntry.technologies))
+                .options(selectinload(JournalEntry.project))
+            )
+            return {entry.id: entry for entry in results.all()}
+        except SQLAlchemyError as e:
+            raise EmbeddingDatabaseError(
+                message=f"Failed to fetch journal entries: {str(e)}"
+            )
+
+    async def get_user_ids_with_entries(self) -> list[str]:
+        """Get the ids of the users that have journal entries.
+
+        Raises:
+            EmbeddingDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(select(JournalEntry.user_id).distinct())
+            return results.all()
+        except SQLAlchemyError as e:
+            raise EmbeddingDatabaseError(message=f"Failed to fetch users: {str(e)}")
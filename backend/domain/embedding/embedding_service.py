@@ -0,0 +1,119 @@
+"""Embeddings of journal entries and the "similar entries" search over them.
+
+Entries are embedded in the background: a write queues an
+``embeddings.sync`` job for its user, which embeds the entries that have no
+vector from the current embedder (new ones, and edited ones whose vector the
+write deleted) in batches. Searches run against the user's in-memory matrix
+(see ``embedding_index.py``).
+"""
+
+from domain.embedding.embedder import Embedder
+from domain.embedding.embedding_config import EMBEDDING_BATCH_SIZE
+from domain.embedding.embedding_index import (
+    EmbeddingIndex,
+    UserMatrix,
+    embedding_index,
+    encode_vector,
+)
+from domain.embedding.embedding_repo import EmbeddingRepo
+from domain.journal_entry.journal_entry_exceptions import JournalEntryNotFoundError
+from domain.journal_entry.journal_entry_schema import (
+    JournalEntryRead,
+    JournalEntrySimilar,
+)
+
+# Job kind handled in domain/embedding/embedding_jobs.py
+EMBEDDINGS_SYNC = "embeddings.sync"
+
+
+class EmbeddingService:
+    def __init__(
+        self,
+        repo: EmbeddingRepo,
+        embedder: Embedder,
+        index: EmbeddingIndex = embedding_index,
+    ) -> None:
+        """Initialize EmbeddingService with dependencies.
+
+        Args:
+            repo: Embedding repository instance
+            embedder: Embeds entry contents
+            index: In-memory matrices to search and keep up to date
+        """
+        self.repo = repo
+        self.embedder = embedder
+        self.index = index
+
+    async def sync(self, user_id: str, batch_size: int = EMBEDDING_BATCH_SIZE) -> int:
+        """Embed every entry of a user that has no vector from the embedder.
+
+        Returns:
+            int: Number of entries embedded
+
+        Raises:
+            EmbeddingDatabaseError: If database operation fails
+        """
+        embedded = 0
+        while entries := await self.repo.get_unembedded_entries(
+            user_id, self.embedder.name, batch_size
+        ):
+            ids = [id for id, _ in entries]
+            vectors = await self.embedder.embed([content for _, content in entries])
+            version = await self.repo.save_vectors(
+                user_id,
+                self.embedder.name,
+                {id: encode_vector(vector) for id, vector in zip(ids, vectors)},
+            )
+            self.index.apply(user_id, version, ids, vectors)
+            embedded += len(entries)
+        return embedded
+
+    async def find_similar(
+        self, user_id: str, id: str, limit: int
+    ) -> list[JournalEntrySimilar]:
+        """Find a user's entries most similar to one of their entries.
+
+        An entry not embedded yet is embedded on the fly for the query; the
+        other entries not embedded yet are not found until the sync job ran.
+
+        Args:
+            user_id: ID of the user owning the entries
+            id: ID of the entry to compare with
+            limit: Maximum number of entries to return
+
+        Returns:
+            list[JournalEntrySimilar]: Entries by decreasing similarity, the
+                entry itself excluded
+
+        Raises:
+            JournalEntryNotFoundError: If the user has no entry with that ID
+            EmbeddingDatabaseError: If database operation fails
+        """
+        entry = (await self.repo.get_journal_entries([id])).get(id)
+        if entry is None or entry.user_id != user_id:
+            raise JournalEntryNotFoundError(
+                message=f"Journal entry with ID '{id}' not found"
+            )
+        matrix = await self._get_matrix(user_id)
+        query = matrix.vector(entry.id)
+        if query is None:
+            query = (await self.embedder.embed([entry.content]))[0]
+        hits = matrix.top_k(query, limit, exclude=entry.id)
+        entries = await self.repo.get_journal_entries([id for id, _ in hits])
+        # The entry is validated once; its fields are reused as is
+        return [
+            JournalEntrySimilar.model_construct(
+                **dict(JournalEntryRead.model_validate(entries[id])), score=score
+            )
+            for id, score in hits
+            if id in entries
+        ]
+
+    async def _get_matrix(self, user_id: str) -> UserMatrix:
+        version = await self.repo.get_version(user_id)
+        matrix = self.index.get(user_id, version)
+        if matrix is None:
+            ids, blobs = await self.repo.get_vectors(user_id, self.embedder.name)
+            matrix = UserMatrix.from_blobs(ids, blobs, self.embedder.dimensions)
+            self.index.put(user_id, version, matrix)
+        return matrix
@@ -0,0 +1,31 @@
+import pytest
+from domain.embedding.embedder import HashingEmbedder
+from domain.embedding.embedding_index import EmbeddingIndex
+from domain.embedding.embedding_repo import EmbeddingRepo
+from domain.embedding.embedding_service import EmbeddingService
+
+# flake8: noqa: F401
+from tests.conftest import *
+
+
+@pytest.fixture
+def embedder() -> HashingEmbedder:
+    return HashingEmbedder(dimensions=64)
+
+
+@pytest.fixture
+def embedding_index() -> EmbeddingIndex:
+    """An index of its own, so tests do not share cached matrices."""
+    return EmbeddingIndex(max_users=4)
+
+
+@pytest.fixture
+def embedding_repo(db_session) -> EmbeddingRepo:
+    """Create an EmbeddingRepo instance for testing."""
+    return EmbeddingRepo(db_session)
+
+
+@pytest.fixture
+def embedding_service(embedding_repo, embedder, embedding_index) -> EmbeddingService:
+    """Create an EmbeddingService with the hashing embedder."""
+    return EmbeddingService(embedding_repo, embedder, embedding_index)
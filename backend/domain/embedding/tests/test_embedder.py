@@ -0,0 +1,46 @@
+"""Tests for the embedder backends."""
+
+import numpy as np
+import pytest
+from domain.embedding.embedder import HashingEmbedder, get_embedder
+
+
+@pytest.mark.asyncio
+async def test_hashing_embedder_returns_unit_vectors():
+    """Test the shape, dtype and norms of the vectors."""
+    embedder = HashingEmbedder(dimensions=32)
+
+    vectors = await embedder.embed(["Tuned the SQLite indexes.", "", "the and of"])
+
+    assert embedder.name == "hashing-32"
+    assert vectors.shape == (3, 32)
+    assert vectors.dtype == np.float32
+    assert np.linalg.norm(vectors[0]) == pytest.approx(1)
+    # Empty and stopword-only texts have no features
+    assert not vectors[1].any() and not vectors[2].any()
+
+
+@pytest.mark.asyncio
+async def test_hashing_embedder_ranks_shared_vocabulary_higher():
+    """Test that texts about the same thing are closer than unrelated ones."""
+    embedder = HashingEmbedder(dimensions=256)
+    query, related, unrelated = await embedder.embed(
+        [
+            "Added a covering index to speed up the SQLite query planner.",
+            "The SQLite query planner now uses the new covering index.",
+            "Designed the onboarding screens in Figma with the product team.",
+        ]
+    )
+
+    assert query @ related > query @ unrelated
+    again = await embedder.embed(
+        ["Added a covering index to speed up the SQLite query planner."]
+    )
+    assert np.array_equal(again[0], query)
+
+
+def test_get_embedder_loads_import_paths():
+    """Test that an embedder can be named by its import path."""
+    embedder = get_embedder("domain.embedding.embedder:HashingEmbedder")
+
+    assert isinstance(embedder, HashingEmbedder)
@@ -0,0 +1,57 @@
+"""Tests for the in-memory vector matrices."""
+
+import numpy as np
+from domain.embedding.embedder import normalize_rows
+from domain.embedding.embedding_index import (
+    EmbeddingIndex,
+    UserMatrix,
+    encode_vector,
+)
+
+
+def unit(*values: float) -> np.ndarray:
+    return normalize_rows(np.array([values], dtype=np.float32))[0]
+
+
+def test_top_k_orders_by_cosine_similarity_and_excludes():
+    """Test the ranking, the excluded id and a k above the row count."""
+    ids = ["x", "xy", "y", "-x"]
+    vectors = np.stack([unit(1, 0), unit(1, 1), unit(0, 1), unit(-1, 0)])
+    matrix = UserMatrix.from_blobs(
+        ids, [encode_vector(v) for v in vectors], dimensions=2
+    )
+
+    hits = matrix.top_k(unit(1, 0), k=10, exclude="x")
+
+    assert [id for id, _ in hits] == ["xy", "y", "-x"]
+    assert hits[0][1] == np.float32(unit(1, 1)[0])
+    assert matrix.top_k(unit(1, 0), k=1) == [("x", 1.0)]
+
+
+def test_upsert_replaces_and_appends_past_capacity():
+    """Test that vectors are replaced by id and appended as the matrix grows."""
+    matrix = UserMatrix(["a"], np.stack([unit(1, 0)]), dimensions=2)
+
+    matrix.upsert(["a"], [unit(0, 1)])
+    new_ids = [f"n{i}" for i in range(40)]
+    matrix.upsert(new_ids, [unit(1, 0)] * 40)
+
+    assert matrix.matrix.shape == (41, 2)
+    assert np.array_equal(matrix.vector("a"), unit(0, 1))
+    assert matrix.top_k(unit(0, 1), k=1) == [("a", 1.0)]
+
+
+def test_index_applies_only_the_next_version():
+    """Test that a matrix that missed a write is dropped instead of patched."""
+    index = EmbeddingIndex(max_users=1)
+    index.put("u1", 3, UserMatrix(["a"], np.stack([unit(1, 0)]), dimensions=2))
+
+    index.apply("u1", 4, ["b"], [unit(0, 1)])
+    assert index.get("u1", 4).ids == ["a", "b"]
+
+    index.apply("u1", 6, ["c"], [unit(0, 1)])
+    assert index.get("u1", 6) is None
+
+    index.put("u1", 6, UserMatrix([], np.zeros((0, 2)), dimensions=2))
+    index.put("u2", 1, UserMatrix([], np.zeros((0, 2)), dimensions=2))
+    assert index.get("u1", 6) is None  # evicted, least recently used
@@ -0,0 +1,105 @@
+"""Tests for embedding journal entries and finding similar ones."""
+
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from database.models import JournalEntry, JournalEntryEmbedding, Project
+from domain.journal_entry.journal_entry_exceptions import JournalEntryNotFoundError
+from domain.journal_entry.journal_entry_repo import JournalEntryRepo
+from domain.journal_entry.journal_entry_schema import JournalEntryUpdate
+from sqlmodel import select
+
+mock_user_id = "123"
+
+
+@pytest_asyncio.fixture
+async def entries(db_session) -> list[JournalEntry]:
+    """Entries about databases, frontend work and one of another user."""
+    db_session.add(Project(id="db", name="Database tuning", user_id=mock_user_id))
+    entries = [
+        JournalEntry(
+            id="index",
+            content="Added a covering index so the SQLite query planner skips the scan.",
+            date=datetime(2024, 3, 4, 9),
+            user_id=mock_user_id,
+        ),
+        JournalEntry(
+            id="planner",
+            content="Read the SQLite query planner docs about covering index use.",
+            date=datetime(2024, 3, 5, 9),
+            user_id=mock_user_id,
+            project_id="db",
+        ),
+        JournalEntry(
+            id="figma",
+            content="Designed onboarding screens in Figma with the product team.",
+            date=datetime(2024, 3, 6, 9),
+            user_id=mock_user_id,
+        ),
+        JournalEntry(
+            id="other",
+            content="Added a covering index so the SQLite query planner skips the scan.",
+            date=datetime(2024, 3, 4, 9),
+            user_id="456",
+        ),
+    ]
+    db_session.add_all(entries)
+    await db_session.commit()
+    return entries
+
+
+@pytest.mark.asyncio
+async def test_sync_embeds_missing_entries_once(embedding_service, entries, db_session):
+    """Test that a sync embeds the user's entries in batches, then nothing."""
+    assert await embedding_service.sync(mock_user_id, batch_size=2) == 3
+    assert await embedding_service.sync(mock_user_id) == 0
+
+    results = await db_session.exec(select(JournalEntryEmbedding.journal_entry_id))
+    assert sorted(results.all()) == ["figma", "index", "planner"]
+
+
+@pytest.mark.asyncio
+async def test_find_similar_ranks_the_users_entries(embedding_service, entries):
+    """Test that the most similar entries come first, excluding the entry."""
+    await embedding_service.sync(mock_user_id)
+
+    similar = await embedding_service.find_similar(mock_user_id, "index", 10)
+
+    assert [entry.id for entry in similar] == ["planner", "figma"]
+    assert similar[0].score > similar[1].score
+    assert similar[0].content.startswith("Read the SQLite")
+    assert similar[0].project.name == "Database tuning"
+
+
+@pytest.mark.asyncio
+async def test_find_similar_rejects_other_users_entries(embedding_service, entries):
+    """Test that an entry of another user is not found."""
+    with pytest.raises(JournalEntryNotFoundError):
+        await embedding_service.find_similar(mock_user_id, "other", 10)
+
+
+@pytest.mark.asyncio
+async def test_edits_are_reembedded_into_the_cached_matrix(
+    embedding_service, embedding_index, entries, db_session
+):
+    """Test that an edit drops the vector at once and the next sync patches the
+    index."""
+    await embedding_service.sync(mock_user_id)
+    await embedding_service.find_similar(mock_user_id, "index", 10)
+    version = await embedding_service.repo.get_version(mock_user_id)
+
+    await JournalEntryRepo(db_session).update_journal_entry(
+        "figma",
+        JournalEntryUpdate(content="Dropped a redundant SQLite covering index."),
+        None,
+    )
+    # The old vector is not served while the entry waits for the sync
+    similar = await embedding_service.find_similar(mock_user_id, "index", 10)
+    assert [entry.id for entry in similar] == ["planner"]
+    assert await embedding_service.sync(mock_user_id) == 1
+
+    cached = embedding_index.get(mock_user_id, version + 2)
+    assert cached is not None and len(cached.ids) == 3
+    similar = await embedding_service.find_similar(mock_user_id, "figma", 1)
+    assert [entry.id for entry in similar] == ["index"]
@@ -0,0 +1,19 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Backend that writes the summaries: "extractive" (deterministic, local, no
+# model), "chat" (an OpenAI-compatible chat completions API) or the import
+# path of a Summarizer class, e.g. "my_package.summarizers:MySummarizer"
+INSIGHTS_SUMMARIZER = os.getenv("INSIGHTS_SUMMARIZER", "extractive")
+INSIGHTS_LLM_BASE_URL = os.getenv("INSIGHTS_LLM_BASE_URL", "https://api.openai.com/v1")
+INSIGHTS_LLM_API_KEY = os.getenv("INSIGHTS_LLM_API_KEY")
+INSIGHTS_LLM_MODEL = os.getenv("INSIGHTS_LLM_MODEL", "gpt-4o-mini")
+INSIGHTS_LLM_TIMEOUT = float(os.getenv("INSIGHTS_LLM_TIMEOUT", "60"))  # seconds
+# Summaries generated at the same time by one refresh, e.g. the days of a month
+INSIGHTS_MAX_CONCURRENCY = int(os.getenv("INSIGHTS_MAX_CONCURRENCY", "4"))
+# Seconds a summary refresh queued by a journal entry write waits, so a burst
+# of writes is summarized once
+INSIGHTS_REFRESH_DELAY = float(os.getenv("INSIGHTS_REFRESH_DELAY", "30"))
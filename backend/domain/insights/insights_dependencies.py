@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from database.session import SessionDep
+from domain.insights.insights_repo import InsightsRepo
+from domain.insights.insights_service import InsightsService
+from domain.insights.summarizer import get_summarizer
+from domain.job.job_dependencies import get_job_service
+from domain.job.job_service import JobService
+from fastapi import Depends
+
+
+def get_insights_repo(session: SessionDep) -> InsightsRepo:
+    return InsightsRepo(session=session)
+
+
+def get_insights_service(
+    repo: InsightsRepo = Depends(get_insights_repo),
+    job_service: JobService = Depends(get_job_service),
+) -> InsightsService:
+    return InsightsService(
+        repo=repo, summarizer=get_summarizer(), job_service=job_service
+    )
+
+
+InsightsServiceDep = Annotated[InsightsService, Depends(get_insights_service)]
@@ -0,0 +1,36 @@
+"""Domain-specific exceptions for the insights module."""
+
+from enum import Enum
+
+from core.domain_exceptions import create_domain_exception, create_domain_exceptions
+from fastapi import status
+
+
+class InsightsErrorCode(str, Enum):
+    """Enumeration of possible error codes for better error handling."""
+
+    SUMMARY_NOT_FOUND = "insights.not_found"
+    DATABASE_ERROR = "insights.database_error"
+    GENERATION_ERROR = "insights.generation_error"
+
+
+# Create standard domain exceptions
+exceptions = create_domain_exceptions(
+    domain_name="Summary",
+    error_codes={
+        "not_found": InsightsErrorCode.SUMMARY_NOT_FOUND,
+        "database_error": InsightsErrorCode.DATABASE_ERROR,
+    },
+)
+
+# Extract exceptions for easier imports
+SummaryNotFoundError = exceptions["not_found"]
+SummaryDatabaseError = exceptions["database_error"]
+
+
+SummaryGenerationError = create_domain_exception(
+    name="SummaryGenerationError",
+    code=InsightsErrorCode.GENERATION_ERROR,
+    message="The summarizer failed to produce a summary",
+    status_code=status.HTTP_502_BAD_GATEWAY,
+)
@@ -0,0 +1,37 @@
+"""Job handlers generating summaries in the background (see domain/job)."""
+
+from datetime import date
+from typing import Any
+
+from database.models import Job
+from database.summaries import Period
+from domain.insights.insights_repo import InsightsRepo
+from domain.insights.insights_service import InsightsService
+from domain.insights.summarizer import get_summarizer
+from domain.job.job_repo import JobRepo
+from domain.job.job_service import JobService
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+def _insights_service(session: AsyncSession) -> InsightsService:
+    return InsightsService(
+        repo=InsightsRepo(session),
+        summarizer=get_summarizer(),
+        job_service=JobService(JobRepo(session)),
+    )
+
+
+async def refresh_summary(session: AsyncSession, job: Job) -> dict[str, Any]:
+    """Refresh one period; the payload holds its ``period`` and ``start``."""
+    summary = await _insights_service(session).refresh_summary(
+        job.user_id,
+        Period(job.payload["period"]),
+        date.fromisoformat(job.payload["start"]),
+    )
+    return {"entryCount": summary.entry_count if summary else 0}
+
+
+async def refresh_stale_summaries(session: AsyncSession, job: Job) -> dict[str, Any]:
+    """Refresh every stale summary of the user."""
+    refreshed = await _insights_service(session).refresh_stale(job.user_id)
+    return {"refreshed": refreshed}
@@ -0,0 +1,162 @@
+from datetime import date, datetime, time
+
+from database.models import JournalEntry, Summary
+from database.session import SessionDep
+from database.summaries import Period
+from domain.insights.insights_exceptions import SummaryDatabaseError
+from sqlalchemy import and_, delete, exists, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+
+
+class InsightsRepo:
+    def __init__(self, session: SessionDep):
+        self.session = session
+
+    async def get_summaries(
+        self, user_id: str, period: Period, start: date, end: date
+    ) -> dict[date, Summary]:
+        """Get a user's summaries of ``period`` starting in ``[start, end)``.
+
+        Returns:
+            dict[date, Summary]: Summaries keyed by their ``period_start``
+
+        Raises:
+            SummaryDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(Summary).where(
+                    Summary.user_id == user_id,
+                    Summary.period == period.value,
+                    Summary.period_start >= start,
+                    Summary.period_start < end,
+                )
+            )
+            return {summary.period_start: summary for summary in results.all()}
+        except SQLAlchemyError as e:
+            raise SummaryDatabaseError(message=f"Failed to fetch summaries: {str(e)}")
+
+    async def get_stale_summaries(self, user_id: str) -> list[tuple[Period, date]]:
+        """Get the ``(period, period_start)`` keys of a user's stale summaries.
+
+        Raises:
+            SummaryDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(Summary.period, Summary.period_start).where(
+                    Summary.user_id == user_id, Summary.stale
+                )
+            )
+            return [(Period(period), start) for period, start in results.all()]
+        except SQLAlchemyError as e:
+            raise SummaryDatabaseError(message=f"Failed to fetch summaries: {str(e)}")
+
+    async def has_journal_entries(self, user_id: str, start: date, end: date) -> bool:
+        """Check whether a user has journal entries dated in ``[start, end)``.
+
+        Raises:
+            SummaryDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(
+                    exists().where(
+                        JournalEntry.user_id == user_id,
+                        JournalEntry.date >= datetime.combine(start, time()),
+                        JournalEntry.date < datetime.combine(end, time()),
+                    )
+                )
+            )
+            return results.one()
+        except SQLAlchemyError as e:
+            raise SummaryDatabaseError(
+                message=f"Failed to fetch journal entries: {str(e)}"
+            )
+
+    async def get_journal_entries(
+        self, user_id: str, start: date, end: date
+    ) -> list[JournalEntry]:
+        """Get a user's journal entries dated in ``[start, end)``, oldest first.
+
+        Raises:
+            SummaryDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(JournalEntry)
+                .where(
+                    JournalEntry.user_id == user_id,
+                    JournalEntry.date >= datetime.combine(start, time()),
+                    JournalEntry.date < datetime.combine(end, time()),
+                )
+                .options(selectinload(JournalEntry.technologies))
+                .order_by(JournalEntry.date, JournalEntry.id)
+            )
+            return results.all()
+        except SQLAlchemyError as e:
+            raise SummaryDatabaseError(
+                message=f"Failed to fetch journal entries: {str(e)}"
+            )
+
+    async def save_summaries(
+        self,
+        user_id: str,
+        saved: list[Summary],
+        deleted: list[tuple[Period, date]],
+    ) -> None:
+        """Upsert ``saved`` and delete the ``(period, period_start)`` keys in one
+        transaction. Concurrent refreshes of the same period both succeed; the
+        last write wins.
+
+        Raises:
+            SummaryDatabaseError: If database operation fails
+        """
+        try:
+            if saved:
+                dialect_insert = (
+                    postgresql.insert
+                    if self.session.bind.dialect.name == "postgresql"
+                    else sqlite.insert
+                )
+                statement = dialect_insert(Summary).values(
+                    [summary.model_dump() for summary in saved]
+                )
+                await self.session.exec(
+                    statement.on_conflict_do_update(
+                        index_elements=["user_id", "period", "period_start"],
+                        set_={
+                            column: statement.excluded[column]
+                            for column in (
+                                "content",
+                                "input_hash",
+                                "entry_count",
+                                "stale",
+                                "model",
+                                "generated_at",
+                            )
+                        },
+                    )
+                )
+            if deleted:
+                await self.session.exec(
+                    delete(Summary).where(
+                        Summary.user_id == user_id,
+                        or_(
+                            *(
+                                and_(
+                                    Summary.period == period.value,
+                                    Summary.period_start == start,
+                                )
+                                for period, start in deleted
+                            )
+                        ),
+                    )
+                )
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise SummaryDatabaseError(message=f"Failed to save summaries: {str(e)}")
@@ -0,0 +1,47 @@
+from datetime import date
+
+from authx import TokenPayload
+from database.summaries import Period
+from domain.auth.auth_config import security
+from domain.insights.insights_dependencies import InsightsServiceDep
+from domain.insights.insights_schema import SummaryRead
+from domain.job.job_schema import JobRead
+from fastapi import APIRouter, Depends, Query, Response, status
+
+router = APIRouter()
+
+
+@router.get(
+    "/{period}",
+    response_model=SummaryRead | JobRead,
+    responses={status.HTTP_202_ACCEPTED: {"model": JobRead}},
+)
+async def get_summary(
+    period: Period,
+    service: InsightsServiceDep,
+    response: Response,
+    day: date | None = Query(None, alias="date"),
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Get the summary of the current user's journal over a period.
+
+    Summaries are generated in the background, on first request and after
+    journal entries in the period changed.
+
+    Args:
+        period: ``day``, ``week``, ``month`` or ``year``
+        day: Any date in the period; defaults to today
+
+    Returns:
+        SummaryRead: The summary and the bounds of the period; if ``stale``,
+            ``refreshJobId`` is updating it
+        JobRead: 202 with the job generating a summary that does not exist yet;
+            poll it at ``/api/jobs/{id}``
+
+    Raises:
+        SummaryNotFoundError: 404 if the period has no journal entries
+    """
+    result = await service.get_summary(payload.user_id, period, day or date.today())
+    if isinstance(result, JobRead):
+        response.status_code = status.HTTP_202_ACCEPTED
+    return result
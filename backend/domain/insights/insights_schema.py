@@ -0,0 +1,19 @@
+from datetime import date, datetime
+
+from core.schema.base import BaseSchema
+from database.summaries import Period
+
+
+class SummaryRead(BaseSchema):
+    """Output model for a period's summary."""
+
+    period: Period
+    period_start: date
+    period_end: date  # exclusive
+    content: str
+    entry_count: int
+    model: str
+    generated_at: datetime
+    # Entries in the period changed since; ``refresh_job_id`` updates it
+    stale: bool = False
+    refresh_job_id: str | None = None
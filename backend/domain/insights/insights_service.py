@@ -0,0 +1,265 @@
+"""Incremental, hierarchical summaries of a user's journal.
+
+Summaries are generated by background jobs (see ``domain/insights/
+insights_jobs.py``), never while a request waits: a journal entry write marks
+the periods containing it stale and queues a refresh, and reading a period
+that was never summarized queues one and returns the job.
+
+Refreshing a stale period first refreshes its children: a week or month
+reloads its entries and regroups them by day, a year revisits its months, and
+untouched (not stale) months are reused as they are. Each summary stores a
+hash of its inputs, and the summarizer is only called when that hash changed.
+An edit to one entry therefore regenerates its day and then each enclosing
+period on the way up, and nothing else.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from database.models import JournalEntry, Summary
+from database.summaries import Period, period_end, period_start
+from domain.insights.insights_config import INSIGHTS_MAX_CONCURRENCY
+from domain.insights.insights_exceptions import SummaryNotFoundError
+from domain.insights.insights_repo import InsightsRepo
+from domain.insights.insights_schema import SummaryRead
+from domain.insights.summarizer import Summarizer
+from domain.job.job_schema import JobRead
+from domain.job.job_service import JobService
+from fastapi import status
+
+# Job kinds handled in domain/insights/insights_jobs.py
+INSIGHTS_REFRESH = "insights.refresh"
+INSIGHTS_REFRESH_STALE = "insights.refresh_stale"
+
+# Refreshing the longest periods first refreshes the others on the way down
+_REFRESH_ORDER = [Period.YEAR, Period.MONTH, Period.WEEK, Period.DAY]
+
+
+def content_hash(texts: list[str], entry_count: int) -> str:
+    payload = json.dumps([entry_count, texts], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def format_entry(entry: JournalEntry) -> str:
+    """Render an entry as the summarizer sees it: time, technologies, content."""
+    technologies = ", ".join(sorted(tech.name for tech in entry.technologies))
+    prefix = f"{entry.date:%H:%M}" + (f" [{technologies}]" if technologies else "")
+    return f"{prefix} {entry.content}"
+
+
+@dataclass
+class _Changes:
+    """Rows a refresh writes back in one transaction."""
+
+    saved: list[Summary] = field(default_factory=list)
+    deleted: list[tuple[Period, date]] = field(default_factory=list)
+
+
+class InsightsService:
+    def __init__(
+        self,
+        repo: InsightsRepo,
+        summarizer: Summarizer,
+        job_service: JobService,
+        max_concurrency: int = INSIGHTS_MAX_CONCURRENCY,
+    ) -> None:
+        self.repo = repo
+        self.summarizer = summarizer
+        self.job_service = job_service
+        # Bounds summarizer calls only; the session is still used sequentially
+        self._limit = asyncio.Semaphore(max_concurrency)
+
+    async def get_summary(
+        self, user_id: str, period: Period, day: date
+    ) -> SummaryRead | JobRead:
+        """Get the stored summary of the ``period`` containing ``day``.
+
+        A stale summary is returned as it is, with the job refreshing it. A
+        period that was never summarized returns the job summarizing it.
+
+        Raises:
+            SummaryNotFoundError: If the period has no journal entries
+            SummaryDatabaseError: If database operation fails
+            JobDatabaseError: If the refresh could not be queued
+        """
+        start = period_start(period, day)
+        end = period_end(period, start)
+        existing = await self.repo.get_summaries(
+            user_id, period, start, start + timedelta(days=1)
+        )
+        summary = existing.get(start)
+        if summary is None and not await self.repo.has_journal_entries(
+            user_id, start, end
+        ):
+            raise SummaryNotFoundError(
+                message=f"No journal entries in the {period.value} of {start}",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        job = None
+        if summary is None or summary.stale:
+            job = await self.job_service.enqueue(
+                INSIGHTS_REFRESH,
+                user_id,
+                {"period": period.value, "start": start.isoformat()},
+            )
+            if summary is None:
+                return job
+        return SummaryRead(
+            period=period,
+            period_start=start,
+            period_end=end,
+            content=summary.content,
+            entry_count=summary.entry_count,
+            model=summary.model,
+            generated_at=summary.generated_at,
+            stale=summary.stale,
+            refresh_job_id=job.id if job else None,
+        )
+
+    async def refresh_summary(
+        self, user_id: str, period: Period, start: date
+    ) -> Summary | None:
+        """Bring the summary of the ``period`` starting on ``start`` up to date.
+
+        Returns:
+            Summary | None: The summary, ``None`` if the period has no entries
+
+        Raises:
+            SummaryGenerationError: If the summarizer fails
+            SummaryDatabaseError: If database operation fails
+        """
+        existing = await self.repo.get_summaries(
+            user_id, period, start, start + timedelta(days=1)
+        )
+        changes = _Changes()
+        summary = await self._refresh(
+            user_id, period, start, existing.get(start), changes
+        )
+        if changes.saved or changes.deleted:
+            await self.repo.save_summaries(user_id, changes.saved, changes.deleted)
+        return summary
+
+    async def refresh_stale(self, user_id: str) -> int:
+        """Bring every stale summary of a user up to date.
+
+        Returns:
+            int: Number of summaries that were stale
+
+        Raises:
+            SummaryGenerationError: If the summarizer fails
+            SummaryDatabaseError: If database operation fails
+        """
+        stale = await self.repo.get_stale_summaries(user_id)
+        stale.sort(key=lambda key: (_REFRESH_ORDER.index(key[0]), key[1]))
+        # A period refreshed as the child of an earlier one is fresh by now and
+        # returns straight away
+        for period, start in stale:
+            await self.refresh_summary(user_id, period, start)
+        return len(stale)
+
+    async def _refresh(
+        self,
+        user_id: str,
+        period: Period,
+        start: date,
+        summary: Summary | None,
+        changes: _Changes,
+    ) -> Summary | None:
+        """Return an up-to-date summary of a period, ``None`` if it is empty."""
+        if summary is not None and not summary.stale:
+            return summary
+        end = period_end(period, start)
+        if period is Period.DAY:
+            days = await self._refresh_days(user_id, start, end, changes)
+            return days[0] if days else None
+
+        if period is Period.YEAR:
+            months = await self.repo.get_summaries(user_id, Period.MONTH, start, end)
+            children = []
+            for month in range(1, 13):
+                month_start = start.replace(month=month)
+                child = await self._refresh(
+                    user_id, Period.MONTH, month_start, months.get(month_start), changes
+                )
+                if child is not None:
+                    children.append(child)
+        else:
+            children = await self._refresh_days(user_id, start, end, changes)
+        return await self._summarize(
+            user_id,
+            period,
+            start,
+            [
+                f"{child.period_start.isoformat()}: {child.content}"
+                for child in children
+            ],
+            sum(child.entry_count for child in children),
+            summary,
+            changes,
+        )
+
+    async def _refresh_days(
+        self, user_id: str, start: date, end: date, changes: _Changes
+    ) -> list[Summary]:
+        """Return up-to-date summaries of the days in ``[start, end)`` with entries."""
+        existing = await self.repo.get_summaries(user_id, Period.DAY, start, end)
+        days: dict[date, list[str]] = {}
+        for entry in await self.repo.get_journal_entries(user_id, start, end):
+            days.setdefault(entry.date.date(), []).append(format_entry(entry))
+        # Days that no longer have entries
+        changes.deleted.extend((Period.DAY, day) for day in existing.keys() - days)
+        # Only the summarizer calls run concurrently; the session is not touched
+        return await asyncio.gather(
+            *(
+                self._summarize(
+                    user_id,
+                    Period.DAY,
+                    day,
+                    texts,
+                    len(texts),
+                    existing.get(day),
+                    changes,
+                )
+                for day, texts in days.items()
+            )
+        )
+
+    async def _summarize(
+        self,
+        user_id: str,
+        period: Period,
+        start: date,
+        texts: list[str],
+        entry_count: int,
+        existing: Summary | None,
+        changes: _Changes,
+    ) -> Summary | None:
+        """Reuse ``existing`` if its inputs are unchanged, else summarize ``texts``."""
+        if not texts:
+            if existing is not None:
+                changes.deleted.append((period, start))
+            return None
+        input_hash = content_hash(texts, entry_count)
+        if existing is not None and existing.input_hash == input_hash:
+            if existing.stale:
+                changes.saved.append(
+                    Summary(**{**existing.model_dump(), "stale": False})
+                )
+            return existing
+
+        async with self._limit:
+            content = await self.summarizer.summarize(period, start, texts)
+        summary = Summary(
+            user_id=user_id,
+            period=period.value,
+            period_start=start,
+            content=content,
+            input_hash=input_hash,
+            entry_count=entry_count,
+            model=self.summarizer.name,
+        )
+        changes.saved.append(summary)
+        return summary
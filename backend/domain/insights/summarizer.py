@@ -0,0 +1,141 @@
+"""Backends that turn a period's texts into a summary.
+
+``InsightsService`` only talks to the ``Summarizer`` protocol. A day is
+summarized from its journal entries and every longer period from the summaries
+of its children, so a backend sees one call per period. ``get_summarizer``
+builds the backend named by ``INSIGHTS_SUMMARIZER``:
+
+- ``extractive``: deterministic and local, keeps the opening sentence of each
+  text; the default, and what the tests use
+- ``chat``: an OpenAI-compatible ``/chat/completions`` API
+- ``package.module:Class``: any class implementing the protocol
+"""
+
+import importlib
+import re
+from datetime import date
+from functools import cache
+from typing import Protocol
+
+import httpx
+from database.summaries import Period
+from domain.insights.insights_config import (
+    INSIGHTS_LLM_API_KEY,
+    INSIGHTS_LLM_BASE_URL,
+    INSIGHTS_LLM_MODEL,
+    INSIGHTS_LLM_TIMEOUT,
+    INSIGHTS_SUMMARIZER,
+)
+from domain.insights.insights_exceptions import SummaryGenerationError
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+class Summarizer(Protocol):
+    # Stored with every summary it writes
+    name: str
+
+    async def summarize(
+        self, period: Period, period_start: date, texts: list[str]
+    ) -> str:
+        """Summarize ``texts``, oldest first, into one summary of the period.
+
+        Raises:
+            SummaryGenerationError: If no summary could be produced
+        """
+        ...
+
+
+class ExtractiveSummarizer:
+    """Joins the lead sentence of every text, each cut to ``max_chars``."""
+
+    name = "extractive"
+
+    def __init__(self, max_chars: int = 160) -> None:
+        self.max_chars = max_chars
+
+    async def summarize(
+        self, period: Period, period_start: date, texts: list[str]
+    ) -> str:
+        leads = []
+        for text in texts:
+            lead = _SENTENCE_END.split(text.strip(), maxsplit=1)[0]
+            if len(lead) > self.max_chars:
+                lead = lead[: self.max_chars - 1].rstrip() + "…"
+            leads.append(lead)
+        return " ".join(leads)
+
+
+PROMPTS = {
+    Period.DAY: (
+        "Summarize this developer's journal entries for one day in 2-3 sentences: "
+        "what they worked on, the technologies involved and anything they learned."
+    ),
+    Period.WEEK: (
+        "Summarize these daily summaries of a developer's week in one paragraph, "
+        "highlighting progress, recurring themes and skills practised."
+    ),
+    Period.MONTH: (
+        "Summarize these daily summaries of a developer's month in one or two "
+        "paragraphs: main projects, technologies, accomplishments and growth areas."
+    ),
+    Period.YEAR: (
+        "Write a yearly career review from these monthly summaries: major "
+        "accomplishments, how the developer's skills evolved, and recommendations "
+        "for the next year."
+    ),
+}
+
+
+class ChatCompletionsSummarizer:
+    """Summarizes through an OpenAI-compatible chat completions API."""
+
+    def __init__(
+        self,
+        base_url: str = INSIGHTS_LLM_BASE_URL,
+        api_key: str | None = INSIGHTS_LLM_API_KEY,
+        model: str = INSIGHTS_LLM_MODEL,
+        timeout: float = INSIGHTS_LLM_TIMEOUT,
+    ) -> None:
+        self.name = f"chat:{model}"
+        self.model = model
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self.client = httpx.AsyncClient(
+            base_url=base_url, headers=headers, timeout=timeout
+        )
+
+    async def summarize(
+        self, period: Period, period_start: date, texts: list[str]
+    ) -> str:
+        body = {
+            "model": self.model,
+            "temperature": 0,
+            "messages": [
+                {"role": "system", "content": PROMPTS[period]},
+                {
+                    "role": "user",
+                    "content": f"{period.value} starting {period_start.isoformat()}"
+                    + "\n\n"
+                    + "\n\n".join(texts),
+                },
+            ],
+        }
+        try:
+            response = await self.client.post("/chat/completions", json=body)
+            response.raise_for_status()
+            return response.json()["choices"][0]["message"]["content"].strip()
+        except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+            raise SummaryGenerationError(
+                message=f"Failed to generate {period.value} summary: {str(e)}"
+            )
+
+
+@cache
+def get_summarizer(name: str = INSIGHTS_SUMMARIZER) -> Summarizer:
+    """Return the process-wide summarizer named by ``INSIGHTS_SUMMARIZER``."""
+    if name == "extractive":
+        return ExtractiveSummarizer()
+    if name == "chat":
+        return ChatCompletionsSummarizer()
+    module_name, _, class_name = name.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)()
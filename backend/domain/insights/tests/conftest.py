@@ -0,0 +1,44 @@
+import pytest
+from domain.insights.insights_repo import InsightsRepo
+from domain.insights.insights_service import InsightsService
+from domain.insights.summarizer import ExtractiveSummarizer
+from domain.job.job_repo import JobRepo
+from domain.job.job_service import JobService
+
+# flake8: noqa: F401
+from tests.conftest import *
+
+
+class RecordingSummarizer(ExtractiveSummarizer):
+    """The extractive summarizer, recording the periods it was asked for."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = []
+
+    async def summarize(self, period, period_start, texts):
+        self.calls.append((period.value, period_start.isoformat()))
+        return await super().summarize(period, period_start, texts)
+
+
+@pytest.fixture
+def summarizer() -> RecordingSummarizer:
+    return RecordingSummarizer()
+
+
+@pytest.fixture
+def insights_repo(db_session) -> InsightsRepo:
+    """Create an InsightsRepo instance for testing."""
+    return InsightsRepo(db_session)
+
+
+@pytest.fixture
+def job_service(db_session) -> JobService:
+    """Create a JobService queueing into the test database."""
+    return JobService(JobRepo(db_session))
+
+
+@pytest.fixture
+def insights_service(insights_repo, summarizer, job_service) -> InsightsService:
+    """Create an InsightsService with the recording summarizer."""
+    return InsightsService(insights_repo, summarizer, job_service)
@@ -0,0 +1,89 @@
+"""Tests for the insights router endpoints."""
+
+from datetime import date, datetime
+
+import pytest
+from database.summaries import Period
+from domain.insights.insights_dependencies import get_insights_service
+from domain.insights.insights_exceptions import SummaryNotFoundError
+from domain.insights.insights_router import router
+from domain.insights.insights_schema import SummaryRead
+from domain.insights.insights_service import InsightsService
+from domain.job.job_schema import JobRead, JobStatus
+from fastapi import FastAPI, status
+from tests.conftest import authed_client
+
+mock_user_id = "123"
+
+
+@pytest.fixture
+def mock_insights_service(mocker):
+    """Create a mock insights service."""
+    return mocker.Mock(spec=InsightsService)
+
+
+@pytest.fixture
+def client(mock_insights_service):
+    """Create a test client with the service overridden and a logged-in user."""
+    app = FastAPI()
+    app.include_router(router, prefix="/api/insights")
+    app.dependency_overrides[get_insights_service] = lambda: mock_insights_service
+    return authed_client(app, mock_user_id)
+
+
+def test_get_summary(client, mock_insights_service):
+    """Test fetching the summary of the month containing a date."""
+    mock_insights_service.get_summary.return_value = SummaryRead(
+        period=Period.MONTH,
+        period_start=date(2024, 3, 1),
+        period_end=date(2024, 4, 1),
+        content="A busy month.",
+        entry_count=3,
+        model="extractive",
+        generated_at=datetime(2024, 4, 1, 8),
+    )
+
+    response = client.get("/api/insights/month?date=2024-03-15")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["periodStart"] == "2024-03-01"
+    assert response.json()["content"] == "A busy month."
+    mock_insights_service.get_summary.assert_called_once_with(
+        mock_user_id, Period.MONTH, date(2024, 3, 15)
+    )
+
+
+def test_get_summary_queued(client, mock_insights_service):
+    """Test that a summary still being generated returns its job with 202."""
+    mock_insights_service.get_summary.return_value = JobRead(
+        id="job-1",
+        kind="insights.refresh",
+        status=JobStatus.PENDING,
+        payload={"period": "day", "start": "2024-03-15"},
+        attempts=0,
+        max_attempts=5,
+        run_after=datetime(2024, 3, 15, 8),
+        created_at=datetime(2024, 3, 15, 8),
+    )
+
+    response = client.get("/api/insights/day?date=2024-03-15")
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["id"] == "job-1"
+    assert response.json()["status"] == "pending"
+
+
+def test_get_summary_not_found(client, mock_insights_service):
+    """Test that a period without entries returns 404."""
+    mock_insights_service.get_summary.side_effect = SummaryNotFoundError()
+
+    response = client.get("/api/insights/day?date=2024-03-15")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_get_summary_unknown_period(client):
+    """Test that only day, week, month and year are accepted."""
+    response = client.get("/api/insights/decade")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,227 @@
+"""Tests for reading summaries and their incremental refresh."""
+
+from datetime import date, datetime
+
+import pytest
+import pytest_asyncio
+from database.models import JournalEntry, Summary
+from database.summaries import Period
+from domain.insights.insights_exceptions import SummaryNotFoundError
+from domain.insights.insights_schema import SummaryRead
+from domain.insights.insights_service import INSIGHTS_REFRESH
+from domain.job.job_handlers import JOB_HANDLERS
+from domain.job.job_schema import JobRead, JobStatus
+from domain.job.job_worker import JobWorkerPool
+from domain.journal_entry.journal_entry_repo import JournalEntryRepo
+from domain.journal_entry.journal_entry_schema import JournalEntryUpdate
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+mock_user_id = "123"
+
+
+@pytest_asyncio.fixture
+async def entries(db_session) -> list[JournalEntry]:
+    """Three entries on two days of March 2024 and one in May 2024."""
+    entries = [
+        JournalEntry(
+            id="e1",
+            content="Wrote the pagination cursor. Then lunch.",
+            date=datetime(2024, 3, 4, 9),
+            user_id=mock_user_id,
+        ),
+        JournalEntry(
+            id="e2",
+            content="Reviewed a caching PR.",
+            date=datetime(2024, 3, 4, 15),
+            user_id=mock_user_id,
+        ),
+        JournalEntry(
+            id="e3",
+            content="Profiled slow endpoints.",
+            date=datetime(2024, 3, 20, 10),
+            user_id=mock_user_id,
+        ),
+        JournalEntry(
+            id="e4",
+            content="Migrated the database.",
+            date=datetime(2024, 5, 2, 11),
+            user_id=mock_user_id,
+        ),
+        JournalEntry(
+            id="other",
+            content="Someone else's entry.",
+            date=datetime(2024, 3, 4, 12),
+            user_id="456",
+        ),
+    ]
+    db_session.add_all(entries)
+    await db_session.commit()
+    return entries
+
+
+@pytest.mark.asyncio
+async def test_month_summary_rolls_up_days(insights_service, summarizer, entries):
+    """Test that a month is summarized from one summary per day with entries."""
+    summary = await insights_service.refresh_summary(
+        mock_user_id, Period.MONTH, date(2024, 3, 1)
+    )
+
+    assert summary.entry_count == 3
+    assert summary.model == "extractive"
+    assert sorted(summarizer.calls) == [
+        ("day", "2024-03-04"),
+        ("day", "2024-03-20"),
+        ("month", "2024-03-01"),
+    ]
+    assert "Wrote the pagination cursor." in summary.content
+    assert "Someone else" not in summary.content
+
+
+@pytest.mark.asyncio
+async def test_summaries_are_reused_until_an_entry_changes(
+    insights_service, summarizer, entries, db_session
+):
+    """Test that an edit regenerates only its day and the periods containing it."""
+    await insights_service.refresh_summary(mock_user_id, Period.YEAR, date(2024, 1, 1))
+    assert len(summarizer.calls) == 6  # 3 days, 2 months, 1 year
+
+    summarizer.calls.clear()
+    await insights_service.refresh_summary(mock_user_id, Period.YEAR, date(2024, 1, 1))
+    assert summarizer.calls == []
+
+    await JournalEntryRepo(db_session).update_journal_entry(
+        "e3", JournalEntryUpdate(content="Profiled and fixed slow endpoints."), None
+    )
+    await insights_service.refresh_summary(mock_user_id, Period.YEAR, date(2024, 1, 1))
+
+    assert summarizer.calls == [
+        ("day", "2024-03-20"),
+        ("month", "2024-03-01"),
+        ("year", "2024-01-01"),
+    ]
+    month = await insights_service.get_summary(
+        mock_user_id, Period.MONTH, date(2024, 3, 15)
+    )
+    assert not month.stale
+    assert "Profiled and fixed slow endpoints." in month.content
+
+
+@pytest.mark.asyncio
+async def test_unchanged_inputs_clear_stale_without_summarizing(
+    insights_service, summarizer, entries, db_session
+):
+    """Test that a write not visible to the summarizer costs no summarizer call."""
+    await insights_service.refresh_summary(mock_user_id, Period.WEEK, date(2024, 3, 4))
+    await JournalEntryRepo(db_session).update_journal_entry(
+        "e1", JournalEntryUpdate(is_private=True), None
+    )
+    summarizer.calls.clear()
+
+    await insights_service.refresh_summary(mock_user_id, Period.WEEK, date(2024, 3, 4))
+
+    assert summarizer.calls == []
+    results = await db_session.exec(select(Summary.stale))
+    assert not any(results.all())
+
+
+@pytest.mark.asyncio
+async def test_period_without_entries_is_not_found(insights_service, entries):
+    """Test that an empty period raises SummaryNotFoundError."""
+    with pytest.raises(SummaryNotFoundError):
+        await insights_service.get_summary(mock_user_id, Period.MONTH, date(2024, 4, 1))
+
+
+@pytest.mark.asyncio
+async def test_missing_summary_is_queued(insights_service, summarizer, entries):
+    """Test that reading a period never summarized queues its refresh."""
+    job = await insights_service.get_summary(
+        mock_user_id, Period.MONTH, date(2024, 3, 15)
+    )
+    again = await insights_service.get_summary(
+        mock_user_id, Period.MONTH, date(2024, 3, 31)
+    )
+
+    assert isinstance(job, JobRead)
+    assert job.kind == INSIGHTS_REFRESH
+    assert job.status == JobStatus.PENDING
+    assert job.payload == {"period": "month", "start": "2024-03-01"}
+    assert again.id == job.id
+    assert summarizer.calls == []
+
+
+@pytest.mark.asyncio
+async def test_stale_summary_is_served_while_refreshing(
+    insights_service, summarizer, entries, db_session
+):
+    """Test that a stale summary is returned as is, with the job refreshing it."""
+    await insights_service.refresh_summary(mock_user_id, Period.DAY, date(2024, 3, 20))
+    fresh = await insights_service.get_summary(
+        mock_user_id, Period.DAY, date(2024, 3, 20)
+    )
+    await JournalEntryRepo(db_session).update_journal_entry(
+        "e3", JournalEntryUpdate(content="Profiled and fixed slow endpoints."), None
+    )
+
+    stale = await insights_service.get_summary(
+        mock_user_id, Period.DAY, date(2024, 3, 20)
+    )
+
+    assert isinstance(fresh, SummaryRead)
+    assert not fresh.stale and fresh.refresh_job_id is None
+    assert stale.stale
+    assert stale.content == fresh.content
+    assert stale.refresh_job_id is not None
+
+
+@pytest.mark.asyncio
+async def test_refresh_stale_refreshes_each_summary_once(
+    insights_service, summarizer, entries, db_session
+):
+    """Test that refreshing a user's stale summaries starts from the year."""
+    await insights_service.refresh_summary(mock_user_id, Period.YEAR, date(2024, 1, 1))
+    await insights_service.refresh_summary(mock_user_id, Period.WEEK, date(2024, 3, 4))
+    await JournalEntryRepo(db_session).update_journal_entry(
+        "e1", JournalEntryUpdate(content="Wrote the pagination cursor tests."), None
+    )
+    summarizer.calls.clear()
+
+    refreshed = await insights_service.refresh_stale(mock_user_id)
+
+    assert refreshed == 4
+    assert summarizer.calls == [
+        ("day", "2024-03-04"),
+        ("month", "2024-03-01"),
+        ("year", "2024-01-01"),
+        ("week", "2024-03-04"),
+    ]
+    results = await db_session.exec(select(Summary.stale))
+    assert not any(results.all())
+
+
+@pytest.mark.asyncio
+async def test_queued_summary_is_generated_by_a_worker(
+    insights_service, entries, engine, job_service
+):
+    """Test the round trip: 202 with a job, the worker runs it, then 200."""
+    job = await insights_service.get_summary(
+        mock_user_id, Period.MONTH, date(2024, 3, 15)
+    )
+    workers = JobWorkerPool(
+        JOB_HANDLERS,
+        session_factory=async_sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False
+        ),
+    )
+
+    assert await workers.run_next()
+
+    finished = await job_service.get_job(mock_user_id, job.id)
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.result == {"entryCount": 3}
+    summary = await insights_service.get_summary(
+        mock_user_id, Period.MONTH, date(2024, 3, 15)
+    )
+    assert isinstance(summary, SummaryRead)
+    assert summary.entry_count == 3
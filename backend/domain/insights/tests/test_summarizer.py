@@ -0,0 +1,84 @@
+"""Tests for the summarizer backends."""
+
+import json
+from datetime import date
+
+import httpx
+import pytest
+from database.summaries import Period
+from domain.insights.insights_exceptions import SummaryGenerationError
+from domain.insights.summarizer import (
+    ChatCompletionsSummarizer,
+    ExtractiveSummarizer,
+    get_summarizer,
+)
+
+
+@pytest.mark.asyncio
+async def test_extractive_summarizer_keeps_lead_sentences():
+    """Test that each text contributes its first sentence, cut to max_chars."""
+    summarizer = ExtractiveSummarizer(max_chars=20)
+
+    summary = await summarizer.summarize(
+        Period.DAY,
+        date(2024, 3, 4),
+        ["Fixed the cursor. Then lunch.", "A very long sentence without an end"],
+    )
+
+    assert summary == "Fixed the cursor. A very long sentenc…"
+
+
+def chat_summarizer(handler) -> ChatCompletionsSummarizer:
+    summarizer = ChatCompletionsSummarizer(
+        base_url="https://llm.test/v1", api_key="key", model="test-model"
+    )
+    summarizer.client = httpx.AsyncClient(
+        base_url="https://llm.test/v1",
+        headers=summarizer.client.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return summarizer
+
+
+@pytest.mark.asyncio
+async def test_chat_summarizer_posts_prompt_and_texts():
+    """Test the chat completions request and reading the reply."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": " A busy month. "}}]}
+        )
+
+    summarizer = chat_summarizer(handler)
+    summary = await summarizer.summarize(
+        Period.MONTH, date(2024, 3, 1), ["2024-03-04: one", "2024-03-20: two"]
+    )
+
+    assert summary == "A busy month."
+    assert summarizer.name == "chat:test-model"
+    (request,) = requests
+    assert request.url == "https://llm.test/v1/chat/completions"
+    assert request.headers["Authorization"] == "Bearer key"
+    body = json.loads(request.content)
+    assert body["model"] == "test-model"
+    assert body["messages"][1]["content"].endswith("2024-03-04: one\n\n2024-03-20: two")
+
+
+@pytest.mark.asyncio
+async def test_chat_summarizer_failure_raises_generation_error():
+    """Test that an API error surfaces as SummaryGenerationError (502)."""
+    summarizer = chat_summarizer(lambda request: httpx.Response(500))
+
+    with pytest.raises(SummaryGenerationError) as exc_info:
+        await summarizer.summarize(Period.DAY, date(2024, 3, 4), ["text"])
+
+    assert exc_info.value.status_code == 502
+
+
+def test_get_summarizer_loads_import_paths():
+    """Test that a summarizer can be named by its import path."""
+    summarizer = get_summarizer("domain.insights.summarizer:ExtractiveSummarizer")
+
+    assert isinstance(summarizer, ExtractiveSummarizer)
@@ -0,0 +1,24 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Worker tasks started by the API process; 0 leaves the queue to a separate
+# `python manage.py run-worker` process
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# How long an idle worker sleeps before polling again; enqueueing in the same
+# process wakes it earlier
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "2"))  # seconds
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+# A failed attempt is retried after JOB_RETRY_BACKOFF * 2 ** (attempts - 1)
+# seconds, capped at JOB_RETRY_BACKOFF_MAX
+JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", "5"))  # seconds
+JOB_RETRY_BACKOFF_MAX = float(os.getenv("JOB_RETRY_BACKOFF_MAX", "600"))  # seconds
+# Jobs running longer than this are presumed lost (e.g. the worker process was
+# killed) and handed to another worker
+JOB_LEASE_TIMEOUT = float(os.getenv("JOB_LEASE_TIMEOUT", "600"))  # seconds
+# Jobs of one user running at the same time, across all workers
+JOB_MAX_RUNNING_PER_USER = int(os.getenv("JOB_MAX_RUNNING_PER_USER", "1"))
+# Finished jobs are deleted after this many days
+JOB_RETENTION_DAYS = int(os.getenv("JOB_RETENTION_DAYS", "7"))
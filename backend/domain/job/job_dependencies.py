@@ -0,0 +1,17 @@
+from typing import Annotated
+
+from database.session import SessionDep
+from domain.job.job_repo import JobRepo
+from domain.job.job_service import JobService
+from fastapi import Depends
+
+
+def get_job_repo(session: SessionDep) -> JobRepo:
+    return JobRepo(session=session)
+
+
+def get_job_service(repo: JobRepo = Depends(get_job_repo)) -> JobService:
+    return JobService(repo=repo)
+
+
+JobServiceDep = Annotated[JobService, Depends(get_job_service)]
@@ -0,0 +1,26 @@
+"""Domain-specific exceptions for the job module."""
+
+from enum import Enum
+
+from core.domain_exceptions import create_domain_exceptions
+
+
+class JobErrorCode(str, Enum):
+    """Enumeration of possible error codes for better error handling."""
+
+    JOB_NOT_FOUND = "job.not_found"
+    DATABASE_ERROR = "job.database_error"
+
+
+# Create standard domain exceptions
+exceptions = create_domain_exceptions(
+    domain_name="Job",
+    error_codes={
+        "not_found": JobErrorCode.JOB_NOT_FOUND,
+        "database_error": JobErrorCode.DATABASE_ERROR,
+    },
+)
+
+# Extract exceptions for easier imports
+JobNotFoundError = exceptions["not_found"]
+JobDatabaseError = exceptions["database_error"]
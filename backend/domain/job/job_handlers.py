@@ -0,0 +1,18 @@
+"""The handler run for each kind of job.
+
+A handler is called with a session of its own and the claimed job, and
+returns a JSON-serializable result stored on the job (or ``None``). Raising
+fails the attempt; it is retried with backoff while attempts remain.
+"""
+
+from domain.embedding.embedding_jobs import sync_embeddings
+from domain.embedding.embedding_service import EMBEDDINGS_SYNC
+from domain.insights.insights_jobs import refresh_stale_summaries, refresh_summary
+from domain.insights.insights_service import INSIGHTS_REFRESH, INSIGHTS_REFRESH_STALE
+from domain.job.job_worker import JobHandler
+
+JOB_HANDLERS: dict[str, JobHandler] = {
+    EMBEDDINGS_SYNC: sync_embeddings,
+    INSIGHTS_REFRESH: refresh_summary,
+    INSIGHTS_REFRESH_STALE: refresh_stale_summaries,
+}
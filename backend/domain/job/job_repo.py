@@ -0,0 +1,296 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from database.models import Job
+from database.session import SessionDep
+from domain.job.job_exceptions import JobDatabaseError, JobNotFoundError
+from domain.job.job_schema import JobStatus
+from fastapi import status
+from sqlalchemy import delete, exists, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import aliased
+from sqlmodel import select, update
+
+
+class JobRepo:
+    def __init__(self, session: SessionDep):
+        """Initialize the Job repository.
+
+        Args:
+            session (SessionDep): Database session dependency
+        """
+        self.session = session
+
+    async def enqueue(self, job: Job) -> Job:
+        """Insert ``job`` unless a pending job with its ``dedup_key`` exists.
+
+        Returns:
+            Job: The pending job with that key, ``job`` itself or the older one
+
+        Raises:
+            JobDatabaseError: If database operation fails
+        """
+        dialect_insert = (
+            postgresql.insert
+            if self.session.bind.dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        statement = (
+            dialect_insert(Job)
+            .values(**job.model_dump())
+            .on_conflict_do_nothing(
+                index_elements=["dedup_key"],
+                index_where=Job.status == JobStatus.PENDING.value,
+            )
+        )
+        try:
+            # The pending job found on conflict may be claimed before it is read
+            # back; inserting again then succeeds.
+            for _ in range(3):
+                await self.session.exec(statement)
+                results = await self.session.exec(
+                    select(Job).where(
+                        Job.dedup_key == job.dedup_key,
+                        Job.status == JobStatus.PENDING.value,
+                    )
+                )
+                pending = results.first()
+                if pending is not None:
+                    await self.session.commit()
+                    return pending
+            raise JobDatabaseError(message="Failed to enqueue job: lost to workers")
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise JobDatabaseError(message=f"Failed to enqueue job: {str(e)}")
+
+    async def get_job(self, user_id: str, id: str) -> Job:
+        """Get one of a user's jobs by ID.
+
+        Raises:
+            JobNotFoundError: If the user has no job with that ID
+            JobDatabaseError: If database operation fails
+        """
+        try:
+            # Workers update jobs behind the session's back
+            job = await self.session.get(Job, id, populate_existing=True)
+        except SQLAlchemyError as e:
+            raise JobDatabaseError(message=f"Failed to fetch job: {str(e)}")
+        if job is None or job.user_id != user_id:
+            raise JobNotFoundError(
+                message=f"Job with ID '{id}' not found",
+                status_code=status.HTTP_404_NOT_FOUND,
+            )
+        return job
+
+    async def get_jobs(
+        self, user_id: str, job_status: JobStatus | None, limit: int
+    ) -> list[Job]:
+        """Get a user's most recent jobs, optionally only those in one status.
+
+        Raises:
+            JobDatabaseError: If database operation fails
+        """
+        statement = select(Job).where(Job.user_id == user_id)
+        if job_status is not None:
+            statement = statement.where(Job.status == job_status.value)
+        try:
+            results = await self.session.exec(
+                statement.order_by(Job.created_at.desc(), Job.id).limit(limit)
+            )
+            return results.all()
+        except SQLAlchemyError as e:
+            raise JobDatabaseError(message=f"Failed to fetch jobs: {str(e)}")
+
+    async def claim_next(self, worker_id: str, max_running_per_user: int) -> Job | None:
+        """Mark the oldest due pending job running, skipping users that already
+        run ``max_running_per_user`` jobs.
+
+        The job is picked and claimed by one ``UPDATE ... RETURNING``, so two
+        workers never claim the same job: SQLite serializes the statements and
+        PostgreSQL skips rows another transaction has locked.
+
+        Returns:
+            Job | None: The claimed job, or ``None`` if no job is due
+
+        Raises:
+            JobDatabaseError: If database operation fails
+        """
+        candidate = aliased(Job)
+        running = aliased(Job)
+        running_for_user = (
+            select(func.count())
+            .select_from(running)
+            .where(
+                running.user_id == candidate.user_id,
+                running.status == JobStatus.RUNNING.value,
+            )
+            .scalar_subquery()
+        )
+        next_id = (
+            select(candidate.id)
+            .where(
+                candidate.status == JobStatus.PENDING.value,
+                candidate.run_after <= datetime.now(),
+                running_for_user < max_running_per_user,
+            )
+            .order_by(candidate.run_after, candidate.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        now = datetime.now()
+        try:
+            results = await self.session.exec(
+                update(Job)
+                .where(Job.id == next_id, Job.status == JobStatus.PENDING.value)
+                .values(
+                    status=JobStatus.RUNNING.value,
+                    attempts=Job.attempts + 1,
+                    locked_by=worker_id,
+                    locked_at=now,
+                )
+                .returning(Job)
+                # Updates the session's copy if the job was loaded before
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            job = results.scalars().first()
+            await self.session.commit()
+            return job
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise JobDatabaseError(message=f"Failed to claim job: {str(e)}")
+
+    async def complete(self, job: Job, result: dict[str, Any] | None) -> None:
+        """Mark a running job succeeded.
+
+        Raises:
+            JobDatabaseError: If database operation fails
+        """
+        await self._finish(
+            job,
+            status=JobStatus.SUCCEEDED.value,
+            result=result,
+            last_error=None,
+        )
+
+    async def fail(self, job: Job, error: str, retry_after: float | None) -> None:
+        """Put a running job back in the queue ``retry_after`` seconds from now,
+        or mark it failed if ``retry_after`` is ``None``.
+
+        A job is not retried while an identical job is pending; that job does
+        the same work.
+
+        Raises:
+            JobDatabaseError: If database operation fails
+        """
+        try:
+            if retry_after is not None:
+                results = await self.session.exec(
+                    update(Job)
+                    .where(
+                        Job.id == job.id,
+                        Job.status == JobStatus.RUNNING.value,
+                        ~self._pending_duplicate_exists(),
+                    )
+                    .values(
+                        status=JobStatus.PENDING.value,
+                        run_after=datetime.now() + timedelta(seconds=retry_after),
+                        locked_by=None,
+                        locked_at=None,
+                        last_error=error,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+                if results.rowcount:
+                    await self.session.commit()
+                    return
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise JobDatabaseError(message=f"Failed to update job: {str(e)}")
+        await self._finish(job, status=JobStatus.FAILED.value, last_error=error)
+
+    async def requeue_expired(self, lease_timeout: float) -> int:
+        """Hand jobs running for longer than ``lease_timeout`` seconds back to
+        the queue, or fail them if they are out of attempts or duplicated by a
+        pending job.
+
+        Returns:
+            int: Number of expired jobs
+
+        Raises:
+            JobDatabaseError: If database operation fails
+        """
+        expired = (
+            Job.status == JobStatus.RUNNING.value,
+            Job.locked_at < datetime.now() - timedelta(seconds=lease_timeout),
+        )
+        try:
+            requeued = await self.session.exec(
+                update(Job)
+                .where(
+                    *expired,
+                    Job.attempts < Job.max_attempts,
+                    ~self._pending_duplicate_exists(),
+                )
+                .values(status=JobStatus.PENDING.value, locked_by=None, locked_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            failed = await self.session.exec(
+                update(Job)
+                .where(*expired)
+                .values(
+                    status=JobStatus.FAILED.value,
+                    last_error="Lease expired",
+                    finished_at=datetime.now(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+            return requeued.rowcount + failed.rowcount
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise JobDatabaseError(message=f"Failed to requeue jobs: {str(e)}")
+
+    async def delete_finished(self, before: datetime) -> int:
+        """Delete succeeded and failed jobs that finished before ``before``.
+
+        Returns:
+            int: Number of deleted jobs
+
+        Raises:
+            JobDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                delete(Job).where(
+                    Job.status.in_([JobStatus.SUCCEEDED.value, JobStatus.FAILED.value]),
+                    Job.finished_at < before,
+                )
+            )
+            await self.session.commit()
+            return results.rowcount
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise JobDatabaseError(message=f"Failed to delete jobs: {str(e)}")
+
+    def _pending_duplicate_exists(self):
+        other = aliased(Job)
+        return exists().where(
+            other.dedup_key == Job.dedup_key,
+            other.status == JobStatus.PENDING.value,
+            other.id != Job.id,
+        )
+
+    async def _finish(self, job: Job, **values: Any) -> None:
+        try:
+            await self.session.exec(
+                update(Job)
+                .where(Job.id == job.id)
+                .values(**values, finished_at=datetime.now())
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise JobDatabaseError(message=f"Failed to update job: {str(e)}")
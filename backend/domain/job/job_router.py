@@ -0,0 +1,45 @@
+from authx import TokenPayload
+from domain.auth.auth_config import security
+from domain.job.job_dependencies import JobServiceDep
+from domain.job.job_schema import (
+    DEFAULT_JOB_PAGE_SIZE,
+    MAX_JOB_PAGE_SIZE,
+    JobRead,
+    JobStatus,
+)
+from fastapi import APIRouter, Depends, Query
+
+router = APIRouter()
+
+
+@router.get("/", response_model=list[JobRead])
+async def get_jobs(
+    service: JobServiceDep,
+    status: JobStatus | None = None,
+    limit: int = Query(DEFAULT_JOB_PAGE_SIZE, ge=1, le=MAX_JOB_PAGE_SIZE),
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Get the current user's most recent background jobs.
+
+    Args:
+        status: Only return jobs in this status
+        limit: Maximum number of jobs to return
+
+    Returns:
+        list[JobRead]: Jobs, newest first
+    """
+    return await service.get_jobs(payload.user_id, status, limit)
+
+
+@router.get("/{id}", response_model=JobRead)
+async def get_job(
+    id: str,
+    service: JobServiceDep,
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Get one of the current user's background jobs, e.g. to poll its status.
+
+    Raises:
+        JobNotFoundError: 404 if the user has no job with that ID
+    """
+    return await service.get_job(payload.user_id, id)
@@ -0,0 +1,31 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from core.schema.base import BaseSchema
+
+DEFAULT_JOB_PAGE_SIZE = 20
+MAX_JOB_PAGE_SIZE = 100
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class JobRead(BaseSchema):
+    """Output model for a background job."""
+
+    id: str
+    kind: str
+    status: JobStatus
+    payload: dict[str, Any]
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    last_error: str | None = None
+    result: dict[str, Any] | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
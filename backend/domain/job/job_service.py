@@ -0,0 +1,80 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any
+
+from database.models import Job
+from domain.job.job_config import JOB_MAX_ATTEMPTS
+from domain.job.job_repo import JobRepo
+from domain.job.job_schema import JobRead, JobStatus
+from domain.job.job_worker import notify_workers
+
+
+def dedup_key(kind: str, user_id: str, payload: dict[str, Any]) -> str:
+    """Identify the work a job does: its kind, user and (canonical) payload."""
+    canonical = json.dumps([kind, user_id, payload], sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class JobService:
+    def __init__(self, repo: JobRepo, max_attempts: int = JOB_MAX_ATTEMPTS) -> None:
+        """Initialize JobService with dependencies.
+
+        Args:
+            repo: Job repository instance
+            max_attempts: Attempts a job gets before it is marked failed
+        """
+        self.repo = repo
+        self.max_attempts = max_attempts
+
+    async def enqueue(
+        self,
+        kind: str,
+        user_id: str,
+        payload: dict[str, Any] | None = None,
+        delay: float = 0,
+    ) -> JobRead:
+        """Queue a job for the workers, unless an identical one is pending.
+
+        Args:
+            kind: Handler to run, see ``domain/job/job_handlers.py``
+            user_id: ID of the user the job works for
+            payload: JSON arguments of the handler
+            delay: Seconds before the job may run; jobs enqueued meanwhile
+                with the same arguments are merged into it
+
+        Returns:
+            JobRead: The pending job
+
+        Raises:
+            JobDatabaseError: If database operation fails
+        """
+        payload = payload or {}
+        job = await self.repo.enqueue(
+            Job(
+                kind=kind,
+                user_id=user_id,
+                payload=payload,
+                dedup_key=dedup_key(kind, user_id, payload),
+                max_attempts=self.max_attempts,
+                run_after=datetime.now() + timedelta(seconds=delay),
+            )
+        )
+        if not delay:
+            notify_workers()
+        return JobRead.model_validate(job)
+
+    async def get_job(self, user_id: str, id: str) -> JobRead:
+        """Get one of a user's jobs.
+
+        Raises:
+            JobNotFoundError: If the user has no job with that ID
+        """
+        return JobRead.model_validate(await self.repo.get_job(user_id, id))
+
+    async def get_jobs(
+        self, user_id: str, job_status: JobStatus | None, limit: int
+    ) -> list[JobRead]:
+        """Get a user's most recent jobs, newest first."""
+        jobs = await self.repo.get_jobs(user_id, job_status, limit)
+        return [JobRead.model_validate(job) for job in jobs]
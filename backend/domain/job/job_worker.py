@@ -0,0 +1,185 @@
+"""Asyncio workers draining the ``job`` table.
+
+The table is the queue, so jobs survive restarts and no broker is needed:
+workers poll it, claiming one due job at a time (see ``JobRepo.claim_next``).
+A failed job is retried with exponential backoff until it runs out of
+attempts, and a job whose worker died is handed to another once its lease
+expires. Workers run inside the API process (``JOB_WORKERS``) or in their own
+with ``python manage.py run-worker``; both can share a database.
+
+Handlers are looked up by ``Job.kind`` (see ``domain/job/job_handlers.py``).
+They get a session of their own, so their work commits or rolls back
+independently of the job's bookkeeping.
+"""
+
+import asyncio
+import contextlib
+import os
+import socket
+from datetime import datetime, timedelta
+from logging import getLogger
+from typing import Any, Awaitable, Callable, Mapping
+
+from database.models import Job
+from database.session import async_session_factory
+from domain.job.job_config import (
+    JOB_LEASE_TIMEOUT,
+    JOB_MAX_RUNNING_PER_USER,
+    JOB_POLL_INTERVAL,
+    JOB_RETENTION_DAYS,
+    JOB_RETRY_BACKOFF,
+    JOB_RETRY_BACKOFF_MAX,
+    JOB_WORKERS,
+)
+from domain.job.job_repo import JobRepo
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+logger = getLogger(__name__)
+
+JobHandler = Callable[[AsyncSession, Job], Awaitable[dict[str, Any] | None]]
+
+# Pools running in this process, woken up when a job is enqueued
+_running_pools: set["JobWorkerPool"] = set()
+
+
+def notify_workers() -> None:
+    """Wake the idle workers of this process to pick up a new job."""
+    for pool in _running_pools:
+        pool.wake()
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds to wait before retrying a job that failed ``attempts`` times."""
+    return min(JOB_RETRY_BACKOFF * 2 ** (attempts - 1), JOB_RETRY_BACKOFF_MAX)
+
+
+class JobWorkerPool:
+    # Seconds between requeueing expired jobs and deleting old finished ones
+    maintenance_interval = 60
+
+    def __init__(
+        self,
+        handlers: Mapping[str, JobHandler],
+        concurrency: int = JOB_WORKERS,
+        session_factory: async_sessionmaker = async_session_factory,
+        poll_interval: float = JOB_POLL_INTERVAL,
+        max_running_per_user: int = JOB_MAX_RUNNING_PER_USER,
+        lease_timeout: float = JOB_LEASE_TIMEOUT,
+        retention_days: int = JOB_RETENTION_DAYS,
+    ) -> None:
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self.max_running_per_user = max_running_per_user
+        self.lease_timeout = lease_timeout
+        self.retention_days = retention_days
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._tasks: list[asyncio.Task] = []
+        self._maintenance: asyncio.Task | None = None
+
+    async def __aenter__(self) -> "JobWorkerPool":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Start ``concurrency`` workers; does nothing if it is 0."""
+        if self.concurrency <= 0:
+            return
+        self._stopping = False
+        _running_pools.add(self)
+        self._tasks = [
+            asyncio.create_task(self._work(f"{self.worker_id}:{n}"))
+            for n in range(self.concurrency)
+        ]
+        self._maintenance = asyncio.create_task(self._maintain())
+
+    async def stop(self, grace_period: float = 10) -> None:
+        """Let running jobs finish for up to ``grace_period`` seconds, then
+        cancel them; their leases expire and they run again elsewhere."""
+        _running_pools.discard(self)
+        if not self._tasks:
+            return
+        self._stopping = True
+        self.wake()
+        self._maintenance.cancel()
+        await asyncio.wait(self._tasks, timeout=grace_period)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, self._maintenance, return_exceptions=True)
+        self._tasks = []
+        self._maintenance = None
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    async def run_next(self, worker_id: str | None = None) -> bool:
+        """Claim and run one due job.
+
+        Returns:
+            bool: ``False`` if no job was due
+        """
+        async with self.session_factory() as session:
+            repo = JobRepo(session)
+            job = await repo.claim_next(
+                worker_id or self.worker_id, self.max_running_per_user
+            )
+            if job is None:
+                return False
+
+            handler = self.handlers.get(job.kind)
+            try:
+                if handler is None:
+                    raise LookupError(f"No handler for jobs of kind '{job.kind}'")
+                async with self.session_factory() as work_session:
+                    result = await handler(work_session, job)
+            except Exception as e:
+                error = f"{type(e).__name__}: {getattr(e, 'message', None) or e}"
+                logger.warning(
+                    f"Job {job.id} ({job.kind}) failed attempt {job.attempts}: "
+                    f"{error}"
+                )
+                retry = handler is not None and job.attempts < job.max_attempts
+                await repo.fail(
+                    job, error, retry_delay(job.attempts) if retry else None
+                )
+            else:
+                await repo.complete(job, result)
+            return True
+
+    async def maintain(self) -> None:
+        """Requeue jobs whose lease expired and delete old finished jobs."""
+        async with self.session_factory() as session:
+            repo = JobRepo(session)
+            expired = await repo.requeue_expired(self.lease_timeout)
+            if expired:
+                logger.warning(f"Recovered {expired} jobs whose lease expired")
+            await repo.delete_finished(
+                datetime.now() - timedelta(days=self.retention_days)
+            )
+
+    async def _work(self, worker_id: str) -> None:
+        while not self._stopping:
+            # Cleared before polling so an enqueue during the poll is not missed
+            self._wakeup.clear()
+            try:
+                if await self.run_next(worker_id):
+                    continue
+            except Exception as e:
+                logger.warning(f"Job worker {worker_id} failed to poll: {str(e)}")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+    async def _maintain(self) -> None:
+        while True:
+            try:
+                await self.maintain()
+            except Exception as e:
+                logger.warning(f"Job maintenance failed: {str(e)}")
+            await asyncio.sleep(self.maintenance_interval)
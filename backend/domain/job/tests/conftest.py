@@ -0,0 +1,26 @@
+import pytest
+from domain.job.job_repo import JobRepo
+from domain.job.job_service import JobService
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+# flake8: noqa: F401
+from tests.conftest import *
+
+
+@pytest.fixture
+def job_repo(db_session) -> JobRepo:
+    """Create a JobRepo instance for testing."""
+    return JobRepo(db_session)
+
+
+@pytest.fixture
+def job_service(job_repo) -> JobService:
+    """Create a JobService instance for testing."""
+    return JobService(job_repo, max_attempts=2)
+
+
+@pytest.fixture
+def session_factory(engine, db_session) -> async_sessionmaker:
+    """Sessions on the test database, for the workers."""
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
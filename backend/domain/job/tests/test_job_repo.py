@@ -0,0 +1,105 @@
+"""Tests for queueing and claiming jobs."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from database.models import Job
+from domain.job.job_exceptions import JobNotFoundError
+from domain.job.job_schema import JobStatus
+
+mock_user_id = "123"
+
+
+@pytest.mark.asyncio
+async def test_identical_pending_jobs_are_merged(job_service, job_repo):
+    """Test that enqueueing the same work twice returns the pending job."""
+    first = await job_service.enqueue("kind", mock_user_id, {"a": 1, "b": 2})
+    second = await job_service.enqueue("kind", mock_user_id, {"b": 2, "a": 1})
+    other_payload = await job_service.enqueue("kind", mock_user_id, {"a": 2})
+    other_user = await job_service.enqueue("kind", "456", {"a": 1, "b": 2})
+
+    assert second.id == first.id
+    assert len({first.id, other_payload.id, other_user.id}) == 3
+
+
+@pytest.mark.asyncio
+async def test_running_job_does_not_absorb_new_work(job_service, job_repo):
+    """Test that work queued while an identical job runs gets its own job."""
+    first = await job_service.enqueue("kind", mock_user_id)
+    claimed = await job_repo.claim_next("worker", max_running_per_user=1)
+
+    second = await job_service.enqueue("kind", mock_user_id)
+
+    assert claimed.id == first.id
+    assert claimed.status == JobStatus.RUNNING
+    assert claimed.attempts == 1
+    assert second.id != first.id
+
+
+@pytest.mark.asyncio
+async def test_claim_respects_run_after_and_per_user_limit(job_service, job_repo):
+    """Test that jobs are claimed when due, oldest first, one per user."""
+    await job_service.enqueue("later", mock_user_id, delay=60)
+    a1 = await job_service.enqueue("a1", mock_user_id)
+    a2 = await job_service.enqueue("a2", mock_user_id)
+    b1 = await job_service.enqueue("b1", "456")
+
+    claimed = [await job_repo.claim_next("worker", max_running_per_user=1)]
+    claimed.append(await job_repo.claim_next("worker", max_running_per_user=1))
+
+    assert [job.id for job in claimed] == [a1.id, b1.id]
+    assert await job_repo.claim_next("worker", max_running_per_user=1) is None
+
+    await job_repo.complete(claimed[0], {"ok": True})
+    next_job = await job_repo.claim_next("worker", max_running_per_user=1)
+    assert next_job.id == a2.id
+
+
+@pytest.mark.asyncio
+async def test_fail_retries_with_delay_then_gives_up(job_service, job_repo):
+    """Test that a failed attempt is requeued for later, the last one fails."""
+    job = await job_service.enqueue("kind", mock_user_id)
+    claimed = await job_repo.claim_next("worker", max_running_per_user=1)
+
+    await job_repo.fail(claimed, "boom", retry_after=60)
+
+    retried = await job_repo.get_job(mock_user_id, job.id)
+    assert retried.status == JobStatus.PENDING
+    assert retried.last_error == "boom"
+    assert retried.run_after > datetime.now() + timedelta(seconds=50)
+    assert await job_repo.claim_next("worker", max_running_per_user=1) is None
+
+    await job_repo.fail(retried, "boom again", retry_after=None)
+    failed = await job_repo.get_job(mock_user_id, job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_expired_leases_are_requeued(job_service, job_repo, db_session):
+    """Test that a job whose worker disappeared runs again."""
+    job = await job_service.enqueue("kind", mock_user_id)
+    await job_repo.claim_next("worker", max_running_per_user=1)
+    stuck = await db_session.get(Job, job.id)
+    stuck.locked_at = datetime.now() - timedelta(hours=1)
+    db_session.add(stuck)
+    await db_session.commit()
+
+    assert await job_repo.requeue_expired(lease_timeout=600) == 1
+
+    reclaimed = await job_repo.claim_next("other", max_running_per_user=1)
+    assert reclaimed.id == job.id
+    assert reclaimed.attempts == 2
+    assert reclaimed.locked_by == "other"
+
+
+@pytest.mark.asyncio
+async def test_jobs_are_private(job_service, job_repo):
+    """Test that a user cannot read another user's job."""
+    job = await job_service.enqueue("kind", mock_user_id)
+
+    with pytest.raises(JobNotFoundError):
+        await job_service.get_job("456", job.id)
+    assert [job.id for job in await job_service.get_jobs(mock_user_id, None, 10)] == [
+        job.id
+    ]
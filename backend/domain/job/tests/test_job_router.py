@@ -0,0 +1,79 @@
+"""Tests for the job router endpoints."""
+
+from datetime import datetime
+
+import pytest
+from domain.job.job_dependencies import get_job_service
+from domain.job.job_exceptions import JobNotFoundError
+from domain.job.job_router import router
+from domain.job.job_schema import JobRead, JobStatus
+from domain.job.job_service import JobService
+from fastapi import FastAPI, status
+from tests.conftest import authed_client
+
+mock_user_id = "123"
+
+
+@pytest.fixture
+def mock_job_service(mocker):
+    """Create a mock job service."""
+    return mocker.Mock(spec=JobService)
+
+
+@pytest.fixture
+def client(mock_job_service):
+    """Create a test client with the service overridden and a logged-in user."""
+    app = FastAPI()
+    app.include_router(router, prefix="/api/jobs")
+    app.dependency_overrides[get_job_service] = lambda: mock_job_service
+    return authed_client(app, mock_user_id)
+
+
+@pytest.fixture
+def job():
+    return JobRead(
+        id="job-1",
+        kind="insights.refresh",
+        status=JobStatus.SUCCEEDED,
+        payload={"period": "day", "start": "2024-03-15"},
+        attempts=1,
+        max_attempts=5,
+        run_after=datetime(2024, 3, 15, 8),
+        result={"entryCount": 2},
+        created_at=datetime(2024, 3, 15, 8),
+        finished_at=datetime(2024, 3, 15, 8, 1),
+    )
+
+
+def test_get_job(client, mock_job_service, job):
+    """Test polling a job's status."""
+    mock_job_service.get_job.return_value = job
+
+    response = client.get("/api/jobs/job-1")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "succeeded"
+    assert response.json()["result"] == {"entryCount": 2}
+    mock_job_service.get_job.assert_called_once_with(mock_user_id, "job-1")
+
+
+def test_get_job_not_found(client, mock_job_service):
+    """Test that another user's or an unknown job returns 404."""
+    mock_job_service.get_job.side_effect = JobNotFoundError()
+
+    response = client.get("/api/jobs/job-2")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_get_jobs_filters_by_status(client, mock_job_service, job):
+    """Test listing the user's jobs in one status."""
+    mock_job_service.get_jobs.return_value = [job]
+
+    response = client.get("/api/jobs/?status=succeeded&limit=5")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.json()] == ["job-1"]
+    mock_job_service.get_jobs.assert_called_once_with(
+        mock_user_id, JobStatus.SUCCEEDED, 5
+    )
@@ -0,0 +1,98 @@
+"""Tests for running jobs with the worker pool."""
+
+import asyncio
+
+import pytest
+from domain.job.job_repo import JobRepo
+from domain.job.job_schema import JobStatus
+from domain.job.job_service import JobService
+from domain.job.job_worker import JobWorkerPool
+
+mock_user_id = "123"
+
+
+def pool(session_factory, handlers) -> JobWorkerPool:
+    return JobWorkerPool(handlers, concurrency=1, session_factory=session_factory)
+
+
+async def get_job(session_factory, id):
+    async with session_factory() as session:
+        return await JobRepo(session).get_job(mock_user_id, id)
+
+
+@pytest.mark.asyncio
+async def test_run_next_stores_the_result(job_service, session_factory):
+    """Test that a handler gets the job and its result is stored."""
+    seen = []
+
+    async def handler(session, job):
+        seen.append((job.user_id, job.payload))
+        return {"done": 1}
+
+    job = await job_service.enqueue("echo", mock_user_id, {"x": 1})
+    workers = pool(session_factory, {"echo": handler})
+
+    assert await workers.run_next()
+    assert not await workers.run_next()
+
+    finished = await get_job(session_factory, job.id)
+    assert seen == [(mock_user_id, {"x": 1})]
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.result == {"done": 1}
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_is_retried_until_out_of_attempts(
+    job_service, session_factory, monkeypatch
+):
+    """Test that a failure is retried while attempts remain, then fails."""
+    monkeypatch.setattr("domain.job.job_worker.retry_delay", lambda attempts: 0)
+
+    async def handler(session, job):
+        raise ValueError("boom")
+
+    job = await job_service.enqueue("flaky", mock_user_id)  # max_attempts=2
+    workers = pool(session_factory, {"flaky": handler})
+
+    assert await workers.run_next()
+    retried = await get_job(session_factory, job.id)
+    assert retried.status == JobStatus.PENDING
+    assert retried.last_error == "ValueError: boom"
+
+    assert await workers.run_next()
+    failed = await get_job(session_factory, job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_kind_fails_without_retry(job_service, session_factory):
+    """Test that a job nobody handles fails on its first attempt."""
+    job = await job_service.enqueue("unknown", mock_user_id)
+
+    assert await pool(session_factory, {}).run_next()
+
+    failed = await get_job(session_factory, job.id)
+    assert failed.status == JobStatus.FAILED
+    assert "unknown" in failed.last_error
+
+
+@pytest.mark.asyncio
+async def test_started_pool_picks_up_enqueued_jobs(session_factory):
+    """Test that running workers are woken up by an enqueue."""
+    done = asyncio.Event()
+
+    async def handler(session, job):
+        done.set()
+
+    workers = JobWorkerPool(
+        {"wake": handler},
+        concurrency=1,
+        session_factory=session_factory,
+        poll_interval=60,
+    )
+    async with workers:
+        await asyncio.sleep(0.05)  # let the worker go idle
+        async with session_factory() as session:
+            await JobService(JobRepo(session)).enqueue("wake", mock_user_id)
+        await asyncio.wait_for(done.wait(), timeout=5)
@@ -1,9 +1,11 @@
 from typing import Annotated
 
-from database.session import SessionDep
+from database.session import SessionDep, new_session
 from domain.journal_entry.journal_entry_repo import JournalEntryRepo
 from domain.journal_entry.journal_entry_service import JournalEntryService
 from fastapi import Depends
+from domain.job.job_dependencies import get_job_service
+from domain.job.job_service import JobService
 from domain.technology.technology_dependencies import get_technology_service
 from domain.technology.technology_service import TechnologyService
 
@@ -15,10 +17,25 @@ def get_journal_entry_repo(session: SessionDep) -> JournalEntryRepo:
 def get_journal_entry_service(
     repo: JournalEntryRepo = Depends(get_journal_entry_repo),
     technology_service: TechnologyService = Depends(get_technology_service),
+    job_service: JobService = Depends(get_job_service),
 ) -> JournalEntryService:
+    return JournalEntryService(
+        repo=repo, technology_service=technology_service, job_service=job_service
+    )
+
+
+def get_journal_entry_export_service(
+    technology_service: TechnologyService = Depends(get_technology_service),
+) -> JournalEntryService:
+    # FastAPI closes yield dependencies before a StreamingResponse body is sent,
+    # so the export repo owns a session that it closes when the stream ends.
+    repo = JournalEntryRepo(session=new_session())
     return JournalEntryService(repo=repo, technology_service=technology_service)
 
 
 JournalEntryServiceDep = Annotated[
     JournalEntryService, Depends(get_journal_entry_service)
 ]
+JournalEntryExportServiceDep = Annotated[
+    JournalEntryService, Depends(get_journal_entry_export_service)
+]
@@ -57,3 +57,25 @@ class JournalEntryDatabaseError(BaseDomainError):
             params=kwargs.get("params"),
             status_code=kwargs.get("status_code", self.status_code),
         )
+
+
+@dataclass
+class JournalEntryValidationError(BaseDomainError):
+    """Raised when a journal entry request carries invalid input."""
+
+    code: ErrorCode = ErrorCode.VALIDATION_ERROR
+    message: str = "Validation failed"
+    status_code: int = status.HTTP_400_BAD_REQUEST
+
+    def __init__(self, **kwargs):
+        """Initialize with optional custom message and parameters.
+
+        Args:
+            **kwargs: Arguments passed to parent (e.g., message, params)
+        """
+        super().__init__(
+            code=self.code,
+            message=kwargs.get("message", self.message),
+            params=kwargs.get("params"),
+            status_code=kwargs.get("status_code", self.status_code),
+        )
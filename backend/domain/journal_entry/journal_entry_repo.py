@@ -1,29 +1,101 @@
-from database.models import JournalEntry, Technology
+import base64
+import binascii
+from datetime import datetime
+from typing import AsyncIterator, Collection
+
+from database.activity import EntryActivity, record_activity
+from database.collection_versions import Collection as VersionedCollection
+from database.collection_versions import bump_collection_versions
+from database.embeddings import forget_embeddings
+from database.full_text_search import (
+    FTS_TABLE,
+    HIGHLIGHT_END,
+    HIGHLIGHT_START,
+    build_fts5_query,
+)
+from database.models import (
+    JournalEntry,
+    JournalEntryTechnologyLink,
+    Project,
+    Technology,
+)
 from database.session import SessionDep
+from database.summaries import mark_summaries_stale
 from domain.journal_entry.journal_entry_exceptions import (
     JournalEntryDatabaseError,
     JournalEntryNotFoundError,
+    JournalEntryValidationError,
 )
 from domain.journal_entry.journal_entry_schema import (
+    DEFAULT_PAGE_SIZE,
+    EXPORT_BATCH_SIZE,
     JournalEntryCreate,
     JournalEntryUpdate,
 )
+from sqlalchemy import and_, case, delete, func, or_, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import select, update
+
+
+SEARCH_SNIPPET_TOKENS = 16
+
+_SQLITE_SEARCH_QUERY = text(
+    f"""
+    SELECT journal_entry.id AS id,
+           -bm25({FTS_TABLE}) AS rank,
+           snippet({FTS_TABLE}, 0, :mark_start, :mark_end, '…', :snippet_tokens)
+               AS snippet
+    FROM {FTS_TABLE}
+    JOIN journal_entry ON journal_entry.rowid = {FTS_TABLE}.rowid
+    WHERE {FTS_TABLE} MATCH :query AND journal_entry.user_id = :user_id
+    ORDER BY bm25({FTS_TABLE})
+    LIMIT :limit OFFSET :offset
+    """
+)
+
+_POSTGRES_SEARCH_QUERY = text(
+    """
+    SELECT journal_entry.id AS id,
+           ts_rank(journal_entry.content_tsv, q.query) AS rank,
+           ts_headline('english', journal_entry.content, q.query, :headline_options)
+               AS snippet
+    FROM journal_entry, websearch_to_tsquery('english', :query) AS q(query)
+    WHERE journal_entry.content_tsv @@ q.query
+      AND journal_entry.user_id = :user_id
+    ORDER BY rank DESC
+    LIMIT :limit OFFSET :offset
+    """
+)
 
 
 class JournalEntryRepo:
     def __init__(self, session: SessionDep):
         self.session = session
 
-    async def get_journal_entries(self) -> list[JournalEntry]:
-        """Get all journal entries sorted by date and name.
+    async def get_journal_entries(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[JournalEntry], str | None]:
+        """Get one page of a user's journal entries, newest first.
+
+        Pages are keyed on ``(date, id)`` so each page is a bounded range scan
+        of ``ix_journal_entry_user_id_date_id`` no matter how deep the cursor is.
+
+        Args:
+            user_id: ID of the user owning the entries
+            limit: Maximum number of entries to return
+            cursor: Opaque cursor returned by the previous page, if any
 
         Returns:
-            list[JournalEntry]: List of all journal entries
+            tuple[list[JournalEntry], str | None]: The page of entries and the
+                cursor for the next page, or None when this is the last page
 
         Raises:
+            JournalEntryValidationError: If the cursor cannot be decoded
             JournalEntryDatabaseError: If database operation fails
         """
 
@@ -32,16 +104,152 @@ class JournalEntryRepo:
                 select(JournalEntry)
                 .options(selectinload(JournalEntry.technologies))
                 .options(selectinload(JournalEntry.project))
-                .order_by(JournalEntry.date.desc())
+                .where(JournalEntry.user_id == user_id)
+                .order_by(JournalEntry.date.desc(), JournalEntry.id)
+                .limit(limit + 1)
             )
+            if cursor is not None:
+                cursor_date, cursor_id = self._decode_cursor(cursor)
+                statement = statement.where(
+                    or_(
+                        JournalEntry.date < cursor_date,
+                        and_(
+                            JournalEntry.date == cursor_date,
+                            JournalEntry.id > cursor_id,
+                        ),
+                    )
+                )
             results = await self.session.exec(statement)
-            return results.all()
+            entries = list(results.all())
 
         except SQLAlchemyError as e:
             raise JournalEntryDatabaseError(
                 message=f"Failed to fetch journal entries: {str(e)}"
             )
 
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = self._encode_cursor(entries[-1])
+        return entries, next_cursor
+
+    async def stream_journal_entries(
+        self, user_id: str, batch_size: int = EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[JournalEntry]:
+        """Stream every journal entry of a user, oldest first.
+
+        Rows are fetched from the database in batches of ``batch_size`` with their
+        technologies and project loaded per batch, so memory use stays constant
+        regardless of how many entries the user has. The session is closed once
+        the stream is exhausted or abandoned.
+
+        Args:
+            user_id: ID of the user owning the entries
+            batch_size: Number of rows fetched per round-trip
+
+        Yields:
+            JournalEntry: Entries with technologies and project loaded
+
+        Raises:
+            JournalEntryDatabaseError: If database operation fails
+        """
+        statement = (
+            select(JournalEntry)
+            .options(selectinload(JournalEntry.technologies))
+            .options(selectinload(JournalEntry.project))
+            .where(JournalEntry.user_id == user_id)
+            .order_by(JournalEntry.date, JournalEntry.id)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            results = await self.session.stream_scalars(statement)
+            async for entry in results:
+                yield entry
+
+        except SQLAlchemyError as e:
+            raise JournalEntryDatabaseError(
+                message=f"Failed to export journal entries: {str(e)}"
+            )
+        finally:
+            await self.session.close()
+
+    async def search_journal_entries(
+        self, user_id: str, query: str, limit: int, offset: int = 0
+    ) -> tuple[list[tuple[JournalEntry, str, float]], int | None]:
+        """Full-text search a user's journal entries, best matches first.
+
+        Uses the FTS5 index with bm25 ranking on SQLite and the ``tsvector`` GIN
+        index with ``ts_rank`` on Postgres. Snippets contain ``HIGHLIGHT_START``
+        and ``HIGHLIGHT_END`` around matched terms.
+
+        Args:
+            user_id: ID of the user owning the entries
+            query: Free-text search query
+            limit: Maximum number of hits to return
+            offset: Number of hits to skip
+
+        Returns:
+            tuple[list[tuple[JournalEntry, str, float]], int | None]: The
+                ``(entry, snippet, rank)`` hits and the offset of the next page,
+                or None when this is the last page
+
+        Raises:
+            JournalEntryDatabaseError: If database operation fails
+        """
+        params = {
+            "user_id": user_id,
+            "limit": limit + 1,
+            "offset": offset,
+        }
+        if self.session.bind.dialect.name == "postgresql":
+            statement = _POSTGRES_SEARCH_QUERY
+            params["query"] = query
+            params["headline_options"] = (
+                f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, "
+                "MaxWords=24, MinWords=8"
+            )
+        else:
+            match = build_fts5_query(query)
+            if match is None:
+                return [], None
+            statement = _SQLITE_SEARCH_QUERY
+            params.update(
+                query=match,
+                mark_start=HIGHLIGHT_START,
+                mark_end=HIGHLIGHT_END,
+                snippet_tokens=SEARCH_SNIPPET_TOKENS,
+            )
+
+        try:
+            results = await self.session.exec(statement, params=params)
+            rows = results.all()
+            next_offset = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_offset = offset + limit
+            if not rows:
+                return [], None
+
+            entries = await self.session.exec(
+                select(JournalEntry)
+                .options(selectinload(JournalEntry.technologies))
+                .options(selectinload(JournalEntry.project))
+                .where(JournalEntry.id.in_([row.id for row in rows]))
+            )
+            entries_by_id = {entry.id: entry for entry in entries.all()}
+
+        except SQLAlchemyError as e:
+            raise JournalEntryDatabaseError(
+                message=f"Failed to search journal entries: {str(e)}"
+            )
+
+        hits = [
+            (entries_by_id[row.id], row.snippet, row.rank)
+            for row in rows
+            if row.id in entries_by_id
+        ]
+        return hits, next_offset
+
     async def get_journal_entry(self, id: str) -> JournalEntry:
         """Get a single journal entry by ID.
 
@@ -55,7 +263,12 @@ class JournalEntryRepo:
             JournalEntryNotFoundError: If journal entry not found or database operation fails
         """
         try:
-            found_entry = await self.session.get(JournalEntry, id)
+            found_entry = await self.session.get(
+                JournalEntry,
+                id,
+                options=[selectinload(JournalEntry.technologies)],
+                populate_existing=True,
+            )
             if not found_entry:
                 raise JournalEntryNotFoundError(
                     message=f"Journal entry with ID '{id}' not found",
@@ -73,18 +286,63 @@ class JournalEntryRepo:
         technologies: list[Technology],
         user_id: str,
     ):
+        """Create a journal entry and bump its technologies' usage counts.
+
+        Raises:
+            JournalEntryDatabaseError: If database operation fails
+        """
         new_journal_entry = JournalEntry(
             **journal_entry_create.model_dump(),
-            technologies=technologies,
             user_id=user_id,
         )
-        return await self._save_journal_entry(new_journal_entry)
+        try:
+            self.session.add(new_journal_entry)
+            self._link_technologies(
+                new_journal_entry, {tech.id for tech in technologies}
+            )
+            await self._adjust_usage_counts(added={tech.id for tech in technologies})
+            await self._add_to_project(
+                new_journal_entry.project_id, new_journal_entry.date
+            )
+            await bump_collection_versions(
+                self.session,
+                user_id,
+                VersionedCollection.JOURNAL_ENTRIES,
+                *([VersionedCollection.TECHNOLOGIES] if technologies else []),
+                *(
+                    [VersionedCollection.PROJECTS]
+                    if new_journal_entry.project_id
+                    else []
+                ),
+            )
+            await mark_summaries_stale(self.session, user_id, new_journal_entry.date)
+            await record_activity(
+                self.session,
+                user_id,
+                added=[
+                    EntryActivity.of(
+                        new_journal_entry, [tech.id for tech in technologies]
+                    )
+                ],
+            )
+            saved_entry = await self._save_journal_entry(new_journal_entry)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise JournalEntryDatabaseError(
+                message=f"Failed to add journal entry: {str(e)}"
+            )
+        set_committed_value(saved_entry, "technologies", technologies)
+        return saved_entry
 
     async def update_journal_entry(
         self, id: str, entry: JournalEntryUpdate, technologies: list[Technology] | None
     ):
         """Update an existing journal entry.
 
+        When ``technologies`` is given, only the links that changed are written
+        and the usage counts of the added or removed technologies are adjusted
+        in the same transaction.
+
         Args:
             id: The ID of the journal entry to update.
             entry: The update data.
@@ -95,15 +353,179 @@ class JournalEntryRepo:
 
         Raises:
             JournalEntryNotFoundError: If the journal entry does not exist.
+            JournalEntryDatabaseError: If database operation fails
         """
-        db_journal_entry = await self.get_journal_entry(id)
-        journal_entry_data = entry.model_dump(exclude_unset=True)
-        for key, value in journal_entry_data.items():
-            if key != "technologyIds":
-                setattr(db_journal_entry, key, value)
+        try:
+            db_journal_entry = await self.get_journal_entry(id)
+            old_project_id, old_date, old_content = (
+                db_journal_entry.project_id,
+                db_journal_entry.date,
+                db_journal_entry.content,
+            )
+            old_ids = {tech.id for tech in db_journal_entry.technologies}
+            old_activity = EntryActivity.of(db_journal_entry, old_ids)
+            journal_entry_data = entry.model_dump(exclude_unset=True)
+            for key, value in journal_entry_data.items():
+                if key != "technologyIds":
+                    setattr(db_journal_entry, key, value)
+            changed = [VersionedCollection.JOURNAL_ENTRIES]
+            if await self._move_between_projects(
+                db_journal_entry, old_project_id, old_date
+            ):
+                changed.append(VersionedCollection.PROJECTS)
+            new_ids = old_ids
+            if technologies is not None:
+                new_ids = {tech.id for tech in technologies}
+                await self._unlink_technologies(db_journal_entry, old_ids - new_ids)
+                self._link_technologies(db_journal_entry, new_ids - old_ids)
+                await self._adjust_usage_counts(
+                    added=new_ids - old_ids, removed=old_ids - new_ids
+                )
+                if old_ids != new_ids:
+                    changed.append(VersionedCollection.TECHNOLOGIES)
+            await bump_collection_versions(
+                self.session, db_journal_entry.user_id, *changed
+            )
+            await mark_summaries_stale(
+                self.session, db_journal_entry.user_id, old_date, db_journal_entry.date
+            )
+            if db_journal_entry.content != old_content:
+                await forget_embeddings(
+                    self.session, db_journal_entry.user_id, db_journal_entry.id
+                )
+            await record_activity(
+                self.session,
+                db_journal_entry.user_id,
+                added=[EntryActivity.of(db_journal_entry, new_ids)],
+                removed=[old_activity],
+            )
+            saved_entry = await self._save_journal_entry(db_journal_entry)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise JournalEntryDatabaseError(
+                message=f"Failed to update journal entry: {str(e)}"
+            )
         if technologies is not None:
-            db_journal_entry.technologies = technologies
-        return await self._save_journal_entry(db_journal_entry)
+            set_committed_value(saved_entry, "technologies", technologies)
+        return saved_entry
+
+    def _link_technologies(
+        self, journal_entry: JournalEntry, technology_ids: Collection[str]
+    ) -> None:
+        """Stage link rows, stamped with the entry's owner, without committing."""
+        self.session.add_all(
+            JournalEntryTechnologyLink(
+                journal_entry_id=journal_entry.id,
+                technology_id=technology_id,
+                user_id=journal_entry.user_id,
+            )
+            for technology_id in technology_ids
+        )
+
+    async def _unlink_technologies(
+        self, journal_entry: JournalEntry, technology_ids: Collection[str]
+    ) -> None:
+        """Delete link rows without committing."""
+        if technology_ids:
+            await self.session.exec(
+                delete(JournalEntryTechnologyLink).where(
+                    JournalEntryTechnologyLink.journal_entry_id == journal_entry.id,
+                    JournalEntryTechnologyLink.technology_id.in_(technology_ids),
+                )
+            )
+
+    async def _adjust_usage_counts(
+        self, added: Collection[str] = (), removed: Collection[str] = ()
+    ) -> None:
+        """Increment/decrement ``Technology.usage_count`` without committing."""
+        for ids, delta in ((added, 1), (removed, -1)):
+            if ids:
+                await self.session.exec(
+                    update(Technology)
+                    .where(Technology.id.in_(ids))
+                    .values(usage_count=Technology.usage_count + delta)
+                )
+
+    async def _add_to_project(self, project_id: str | None, date: datetime) -> None:
+        """Count an entry in its project and advance ``last_entry_date``."""
+        if project_id is None:
+            return
+        await self.session.exec(
+            update(Project)
+            .where(Project.id == project_id)
+            .values(
+                entry_count=Project.entry_count + 1,
+                last_entry_date=self._later_of_last_entry_date(date),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _move_between_projects(
+        self,
+        journal_entry: JournalEntry,
+        old_project_id: str | None,
+        old_date: datetime,
+    ) -> bool:
+        """Update project stats after an entry's ``project_id`` or ``date`` changed.
+
+        Moving forward in time is a comparison; leaving a project or moving back
+        in time recomputes ``last_entry_date`` as an indexed ``MAX`` over
+        ``ix_journal_entry_project_id_date``. Runs after the entry change is
+        flushed, without committing.
+
+        Returns:
+            bool: Whether any project's stats were touched
+        """
+        new_project_id, new_date = journal_entry.project_id, journal_entry.date
+        if old_project_id == new_project_id:
+            if new_project_id is None or new_date == old_date:
+                return False
+            if new_date > old_date:
+                last_entry_date = self._later_of_last_entry_date(new_date)
+            else:
+                await self.session.flush()
+                last_entry_date = self._latest_entry_date()
+            await self.session.exec(
+                update(Project)
+                .where(Project.id == new_project_id)
+                .values(last_entry_date=last_entry_date)
+                .execution_options(synchronize_session=False)
+            )
+            return True
+
+        if old_project_id is not None:
+            await self.session.flush()
+            await self.session.exec(
+                update(Project)
+                .where(Project.id == old_project_id)
+                .values(
+                    entry_count=Project.entry_count - 1,
+                    last_entry_date=self._latest_entry_date(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+        await self._add_to_project(new_project_id, new_date)
+        return True
+
+    @staticmethod
+    def _later_of_last_entry_date(date: datetime):
+        """SQL for the later of ``Project.last_entry_date`` and ``date``."""
+        return case(
+            (
+                or_(Project.last_entry_date.is_(None), Project.last_entry_date < date),
+                date,
+            ),
+            else_=Project.last_entry_date,
+        )
+
+    @staticmethod
+    def _latest_entry_date():
+        """SQL for the date of the newest entry of the project being updated."""
+        return (
+            select(func.max(JournalEntry.date))
+            .where(JournalEntry.project_id == Project.id)
+            .scalar_subquery()
+        )
 
     async def _save_journal_entry(self, journal_entry: JournalEntry) -> JournalEntry:
         """Save journal entry to database and refresh.
@@ -122,3 +544,26 @@ class JournalEntryRepo:
         await self.session.commit()
         await self.session.refresh(journal_entry)
         return journal_entry
+
+    @staticmethod
+    def _encode_cursor(entry: JournalEntry) -> str:
+        """Encode the keyset position of an entry as an opaque cursor."""
+        raw = f"{entry.date.isoformat()}|{entry.id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        """Decode a cursor produced by ``_encode_cursor``.
+
+        Raises:
+            JournalEntryValidationError: If the cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            date, id = raw.split("|", 1)
+            return datetime.fromisoformat(date), id
+        except (binascii.Error, UnicodeError, ValueError):
+            raise JournalEntryValidationError(
+                message="Invalid pagination cursor",
+                params={"cursor": cursor},
+            )
@@ -1,26 +1,62 @@
-from domain.journal_entry.journal_entry_dependencies import JournalEntryServiceDep
+import zlib
+from typing import AsyncIterator
+
+from core.conditional_get import conditional_list
+from core.responses import ModelResponse
+from database.collection_versions import Collection
+from domain.embedding.embedding_dependencies import EmbeddingServiceDep
+from domain.journal_entry.journal_entry_dependencies import (
+    JournalEntryExportServiceDep,
+    JournalEntryServiceDep,
+)
 from domain.journal_entry.journal_entry_schema import (
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_SIMILAR_LIMIT,
+    MAX_PAGE_SIZE,
+    MAX_SIMILAR_LIMIT,
     JournalEntryCreate,
+    JournalEntryDraft,
+    JournalEntryPage,
     JournalEntryRead,
+    JournalEntrySearchPage,
+    JournalEntrySimilar,
     JournalEntryUpdate,
 )
-from fastapi import APIRouter, HTTPException, status, Depends
+from domain.technology.technology_dependencies import TechnologyServiceDep
+from domain.technology.technology_schema import TechnologyRead
+from fastapi import APIRouter, HTTPException, Query, Response, status, Depends
+from fastapi.responses import StreamingResponse
 from domain.auth.auth_config import security
 from authx import TokenPayload
 
 router = APIRouter()
 
 
-@router.get("/", response_model=list[JournalEntryRead])
+@router.get(
+    "/",
+    response_model=JournalEntryPage,
+    dependencies=[Depends(conditional_list(Collection.JOURNAL_ENTRIES))],
+)
 async def get_journal_entries(
     service: JournalEntryServiceDep,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    payload: TokenPayload = Depends(security.access_token_required),
 ):
-    """Get all journal entries.
+    """Get a page of the current user's journal entries.
+
+    Args:
+        limit: Maximum number of entries to return
+        cursor: ``nextCursor`` from the previous page; omit for the first page
 
     Returns:
-        list[JournalEntryRead]: List of journal entries sorted by date (descending)
+        JournalEntryPage: Entries sorted by date (descending) and the next cursor
     """
-    return await service.get_journal_entries()
+    page = await service.get_journal_entries(
+        payload.user_id, limit=limit, cursor=cursor
+    )
+    return ModelResponse(page, headers=response.headers)
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=JournalEntryRead)
@@ -40,6 +76,105 @@ async def add_journal_entry(
     return await service.add_journal_entry(journal_entry_create, payload.user_id)
 
 
+@router.post("/suggest-technologies", response_model=list[TechnologyRead])
+async def suggest_technologies(
+    service: TechnologyServiceDep,
+    draft: JournalEntryDraft,
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Suggest technologies to tag a journal entry being written with.
+
+    Args:
+        draft (JournalEntryDraft): The entry's content so far
+
+    Returns:
+        list[TechnologyRead]: The current user's technologies named in the
+            content, in order of first mention
+    """
+    suggestions = await service.suggest_technologies(payload.user_id, draft.content)
+    return ModelResponse(suggestions, list[TechnologyRead])
+
+
+@router.get("/search", response_model=JournalEntrySearchPage)
+async def search_journal_entries(
+    service: JournalEntryServiceDep,
+    q: str = Query(min_length=1, max_length=256),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Full-text search the current user's journal entries.
+
+    Args:
+        q: Search text; the last word is matched as a prefix
+        limit: Maximum number of hits to return
+        offset: ``nextOffset`` from the previous page; omit for the first page
+
+    Returns:
+        JournalEntrySearchPage: Hits ranked by relevance with ``<mark>``-highlighted
+            snippets
+    """
+    page = await service.search_journal_entries(
+        payload.user_id, q, limit=limit, offset=offset
+    )
+    return ModelResponse(page)
+
+
+@router.get("/export")
+async def export_journal_entries(
+    service: JournalEntryExportServiceDep,
+    gzip: bool = False,
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Export all of the current user's journal entries.
+
+    The response is streamed as newline-delimited JSON with technologies and
+    project inlined, one entry per line, oldest first.
+
+    Args:
+        gzip: Compress the stream on the fly and send it as a ``.gz`` file
+
+    Returns:
+        StreamingResponse: The NDJSON (or gzipped NDJSON) export
+    """
+    body = service.export_journal_entries(payload.user_id)
+    filename = "journal-entries.ndjson"
+    media_type = "application/x-ndjson"
+    if gzip:
+        body = _gzip_chunks(body)
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/{id}/similar", response_model=list[JournalEntrySimilar])
+async def get_similar_journal_entries(
+    id: str,
+    service: EmbeddingServiceDep,
+    limit: int = Query(DEFAULT_SIMILAR_LIMIT, ge=1, le=MAX_SIMILAR_LIMIT),
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Get the current user's journal entries most similar to one of theirs.
+
+    Args:
+        id (str): Journal entry ID
+        limit: Maximum number of entries to return
+
+    Returns:
+        list[JournalEntrySimilar]: Entries by decreasing ``score`` (cosine
+            similarity), the entry itself excluded
+
+    Raises:
+        HTTPException: 404 if the user has no journal entry with that ID
+    """
+    similar = await service.find_similar(payload.user_id, id, limit)
+    return ModelResponse(similar, list[JournalEntrySimilar])
+
+
 @router.get("/{id}")
 async def get_journal_entry(
     id: str,
@@ -96,3 +231,13 @@ async def delete_journal_entry(
         status_code=status.HTTP_501_NOT_IMPLEMENTED,
         detail={"message": "Journal entry deletion is not yet implemented"},
     )
+
+
+async def _gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip a byte stream incrementally without buffering it."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -4,6 +4,12 @@ from typing import Optional
 from core.schema.base import BaseSchema
 from database.models import Project, Technology
 
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+EXPORT_BATCH_SIZE = 500
+DEFAULT_SIMILAR_LIMIT = 10
+MAX_SIMILAR_LIMIT = 50
+
 
 class JournalEntryBase(BaseSchema):
     content: str
@@ -18,8 +24,44 @@ class JournalEntryRead(JournalEntryBase):
     project: Project | None = None
 
 
+class JournalEntryPage(BaseSchema):
+    """A single keyset page of journal entries."""
+
+    items: list[JournalEntryRead]
+    next_cursor: str | None = None
+
+
+class JournalEntrySearchHit(JournalEntryRead):
+    """A journal entry matching a search query."""
+
+    snippet: str
+    rank: float
+
+
+class JournalEntrySimilar(JournalEntryRead):
+    """A journal entry similar to another one."""
+
+    # Cosine similarity of the two entries' vectors, 1 for identical wording
+    score: float
+
+
+class JournalEntrySearchPage(BaseSchema):
+    """A page of search hits ordered by relevance."""
+
+    items: list[JournalEntrySearchHit]
+    next_offset: int | None = None
+
+
 class JournalEntryCreate(JournalEntryBase):
     technologyIds: list[str]
+    # Also tag the user's technologies named in the content
+    auto_tag: bool = False
+
+
+class JournalEntryDraft(BaseSchema):
+    """The content of a journal entry being written."""
+
+    content: str
 
 
 class JournalEntryUpdate(BaseSchema):
@@ -1,32 +1,123 @@
+from logging import getLogger
+from typing import AsyncIterator
+
+from database.full_text_search import highlight_snippet
+from domain.embedding.embedding_service import EMBEDDINGS_SYNC
+from domain.insights.insights_config import INSIGHTS_REFRESH_DELAY
+from domain.insights.insights_service import INSIGHTS_REFRESH_STALE
+from domain.job.job_exceptions import JobDatabaseError
+from domain.job.job_service import JobService
 from domain.journal_entry.journal_entry_repo import JournalEntryRepo
 from domain.journal_entry.journal_entry_schema import (
+    DEFAULT_PAGE_SIZE,
+    EXPORT_BATCH_SIZE,
     JournalEntryCreate,
+    JournalEntryPage,
     JournalEntryRead,
+    JournalEntrySearchHit,
+    JournalEntrySearchPage,
     JournalEntryUpdate,
 )
 from domain.technology.technology_service import TechnologyService
 
+logger = getLogger(__name__)
+
 
 class JournalEntryService:
     def __init__(
-        self, repo: JournalEntryRepo, technology_service: TechnologyService
+        self,
+        repo: JournalEntryRepo,
+        technology_service: TechnologyService,
+        job_service: JobService | None = None,
     ) -> None:
         """Initialize JournalEntryService with dependencies.
 
         Args:
             repo: Journal entry repository instance
             technology_service: Technology service instance
+            job_service: Queues the background work entry writes cause: summary
+                refreshes and embedding updates; without it, stale summaries
+                are refreshed when next read and entries embedded by the next
+                sync that runs
         """
         self.repo = repo
         self.technology_service = technology_service
+        self.job_service = job_service
+
+    async def get_journal_entries(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> JournalEntryPage:
+        """Get one page of a user's journal entries.
+
+        Args:
+            user_id: ID of the user owning the entries
+            limit: Maximum number of entries to return
+            cursor: Cursor returned by the previous page, if any
+
+        Returns:
+            JournalEntryPage: Entries sorted by date (descending) and the next cursor
 
-    async def get_journal_entries(self):
-        """Get all journal entries.
+        Raises:
+            JournalEntryValidationError: If the cursor is invalid
+        """
+        entries, next_cursor = await self.repo.get_journal_entries(
+            user_id, limit=limit, cursor=cursor
+        )
+        return JournalEntryPage(items=entries, next_cursor=next_cursor)
+
+    async def search_journal_entries(
+        self,
+        user_id: str,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> JournalEntrySearchPage:
+        """Search a user's journal entries by content.
+
+        Args:
+            user_id: ID of the user owning the entries
+            query: Free-text search query
+            limit: Maximum number of hits to return
+            offset: Number of hits to skip
 
         Returns:
-            list[JournalEntry]: List of all journal entries sorted by date (descending)
+            JournalEntrySearchPage: Hits ranked by relevance with highlighted snippets
         """
-        return await self.repo.get_journal_entries()
+        hits, next_offset = await self.repo.search_journal_entries(
+            user_id, query, limit=limit, offset=offset
+        )
+        # The entry is validated once; its fields are reused as is
+        items = [
+            JournalEntrySearchHit.model_construct(
+                **dict(JournalEntryRead.model_validate(entry)),
+                snippet=highlight_snippet(snippet),
+                rank=float(rank),
+            )
+            for entry, snippet, rank in hits
+        ]
+        return JournalEntrySearchPage(items=items, next_offset=next_offset)
+
+    async def export_journal_entries(self, user_id: str) -> AsyncIterator[bytes]:
+        """Export every journal entry of a user as newline-delimited JSON.
+
+        Args:
+            user_id: ID of the user owning the entries
+
+        Yields:
+            bytes: Chunks of NDJSON, one ``JournalEntryRead`` object per line
+        """
+        lines = []
+        async for entry in self.repo.stream_journal_entries(user_id):
+            entry_read = JournalEntryRead.model_validate(entry)
+            lines.append(entry_read.model_dump_json(by_alias=True))
+            if len(lines) >= EXPORT_BATCH_SIZE:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines = []
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
 
     async def get_journal_entry(self, id: str):
         """Get a specific journal entry by ID.
@@ -48,8 +139,9 @@ class JournalEntryService:
         """Create a new journal entry.
 
         Args:
-            journal_entry_create: Journal entry creation data
-            technologies: List of technologies associated with the journal entry
+            journal_entry_create: Journal entry creation data; with ``auto_tag``,
+                the user's technologies named in the content are linked too
+            user_id: ID of the user creating the entry
 
         Returns:
             JournalEntryRead: The created journal entry with associated technologies
@@ -58,12 +150,25 @@ class JournalEntryService:
             TechnologyNotFoundError: If any technology ID is invalid
             JournalEntryDatabaseError: If database operation fails
         """
+        technology_ids = journal_entry_create.technologyIds
+        if journal_entry_create.auto_tag:
+            suggested_ids = await self.technology_service.suggest_technology_ids(
+                user_id, journal_entry_create.content
+            )
+            technology_ids = list(dict.fromkeys([*technology_ids, *suggested_ids]))
         technologies = await self.technology_service.get_technologies_by_ids(
-            journal_entry_create.technologyIds
+            technology_ids
         )
+        if technologies:
+            links_version = await self.technology_service.get_links_version(user_id)
         journal_entry = await self.repo.add_journal_entry(
             journal_entry_create, technologies, user_id
         )
+        if technologies:
+            await self.technology_service.record_new_entry(
+                user_id, links_version, [tech.id for tech in technologies]
+            )
+        await self._queue_background_work(user_id)
         return JournalEntryRead(**journal_entry.model_dump(), technologies=technologies)
 
     async def update_journal_entry(self, id: str, entry: JournalEntryUpdate):
@@ -89,7 +194,25 @@ class JournalEntryService:
         updated_journal_entry = await self.repo.update_journal_entry(
             id, entry, technologies
         )
+        await self._queue_background_work(updated_journal_entry.user_id)
         return JournalEntryRead(
             **updated_journal_entry.model_dump(),
             technologies=technologies if technologies is not None else [],
         )
+
+    async def _queue_background_work(self, user_id: str) -> None:
+        """Queue the embedding of the written entry and a refresh of the
+        summaries the write marked stale."""
+        if self.job_service is None:
+            return
+        try:
+            await self.job_service.enqueue(EMBEDDINGS_SYNC, user_id)
+            await self.job_service.enqueue(
+                INSIGHTS_REFRESH_STALE, user_id, delay=INSIGHTS_REFRESH_DELAY
+            )
+        except JobDatabaseError as e:
+            # The entry is saved and its summaries marked stale; reading them
+            # queues the refresh instead, and the next sync embeds the entry
+            logger.warning(
+                f"Background work not queued for user {user_id}: {e.message}"
+            )
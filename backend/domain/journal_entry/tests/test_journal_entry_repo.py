@@ -4,10 +4,18 @@ from datetime import datetime
 
 import pytest
 import pytest_asyncio
-from database.models import JournalEntry, Technology
+from database.collection_versions import Collection, get_collection_version
+from database.full_text_search import HIGHLIGHT_END, HIGHLIGHT_START
+from database.models import (
+    JournalEntry,
+    JournalEntryTechnologyLink,
+    Project,
+    Technology,
+)
 from domain.journal_entry.journal_entry_exceptions import (
     JournalEntryDatabaseError,
     JournalEntryNotFoundError,
+    JournalEntryValidationError,
 )
 from domain.journal_entry.journal_entry_repo import JournalEntryRepo
 from domain.journal_entry.journal_entry_schema import (
@@ -17,6 +25,7 @@ from domain.journal_entry.journal_entry_schema import (
 from fastapi import status
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session as SessionDep
+from sqlmodel import select
 
 mock_user_id = "123"
 
@@ -24,6 +33,8 @@ mock_user_id = "123"
 @pytest_asyncio.fixture
 async def sample_journal_entries(db_session: SessionDep) -> list[JournalEntry]:
     """Create sample journal entries for testing."""
+    db_session.add(Project(id="project1", name="Project 1", user_id=mock_user_id))
+    await db_session.commit()
     entries = [
         JournalEntry(
             id="entry1",
@@ -54,11 +65,13 @@ async def sample_technologies(db_session: SessionDep) -> list[Technology]:
             id="tech1",
             name="Python",
             description="Programming language",
+            user_id=mock_user_id,
         ),
         Technology(
             id="tech2",
             name="JavaScript",
             description="Web language",
+            user_id=mock_user_id,
         ),
     ]
     for tech in technologies:
@@ -72,17 +85,79 @@ async def test_get_journal_entries_success(
     journal_entry_repo: JournalEntryRepo, sample_journal_entries
 ):
     """Test that get_journal_entries returns all entries sorted by date."""
-    entries = await journal_entry_repo.get_journal_entries()
+    entries, next_cursor = await journal_entry_repo.get_journal_entries(mock_user_id)
     assert len(entries) == 2
     assert entries[0].date > entries[1].date  # Verify sorting
+    assert next_cursor is None
 
 
 @pytest.mark.asyncio
 async def test_get_journal_entries_empty_database(journal_entry_repo: JournalEntryRepo):
     """Test that get_journal_entries returns empty list for empty database."""
-    entries = await journal_entry_repo.get_journal_entries()
+    entries, next_cursor = await journal_entry_repo.get_journal_entries(mock_user_id)
     assert isinstance(entries, list)
     assert len(entries) == 0
+    assert next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_get_journal_entries_scoped_to_user(
+    journal_entry_repo: JournalEntryRepo, sample_journal_entries
+):
+    """Test that get_journal_entries only returns the given user's entries."""
+    entries, _ = await journal_entry_repo.get_journal_entries("another-user")
+    assert entries == []
+
+
+@pytest.mark.asyncio
+async def test_get_journal_entries_paginates_with_cursor(
+    journal_entry_repo: JournalEntryRepo, db_session: SessionDep
+):
+    """Test that following next_cursor walks every entry exactly once."""
+    same_day = datetime(2025, 2, 1)
+    for i in range(5):
+        db_session.add(
+            JournalEntry(
+                id=f"page-entry-{i}",
+                content=f"Entry {i}",
+                # Two entries share a date to exercise the id tie-breaker
+                date=same_day if i < 2 else datetime(2025, 1, i),
+                user_id=mock_user_id,
+            )
+        )
+    await db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        entries, cursor = await journal_entry_repo.get_journal_entries(
+            mock_user_id, limit=2, cursor=cursor
+        )
+        assert len(entries) <= 2
+        seen.extend(entry.id for entry in entries)
+        if cursor is None:
+            break
+
+    assert seen == [
+        "page-entry-0",
+        "page-entry-1",
+        "page-entry-4",
+        "page-entry-3",
+        "page-entry-2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_journal_entries_invalid_cursor(
+    journal_entry_repo: JournalEntryRepo,
+):
+    """Test that a malformed cursor raises a validation error."""
+    with pytest.raises(JournalEntryValidationError) as exc_info:
+        await journal_entry_repo.get_journal_entries(
+            mock_user_id, cursor="not-a-cursor"
+        )
+
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.asyncio
@@ -96,7 +171,121 @@ async def test_get_journal_entries_database_error(
         side_effect=SQLAlchemyError("Database error"),
     )
     with pytest.raises(JournalEntryDatabaseError):
-        await journal_entry_repo.get_journal_entries()
+        await journal_entry_repo.get_journal_entries(mock_user_id)
+
+
+@pytest.mark.asyncio
+async def test_stream_journal_entries_yields_all_user_entries(
+    journal_entry_repo: JournalEntryRepo, sample_journal_entries, db_session
+):
+    """Test that stream_journal_entries yields every entry oldest first."""
+    db_session.add(JournalEntry(id="other", content="Not mine", user_id="another-user"))
+    await db_session.commit()
+
+    streamed = [
+        entry
+        async for entry in journal_entry_repo.stream_journal_entries(
+            mock_user_id, batch_size=1
+        )
+    ]
+
+    assert [entry.id for entry in streamed] == ["entry1", "entry2"]
+    assert all(entry.technologies == [] for entry in streamed)
+
+
+@pytest_asyncio.fixture
+async def searchable_journal_entries(db_session: SessionDep) -> list[JournalEntry]:
+    """Create journal entries with distinct content for search tests."""
+    entries = [
+        JournalEntry(
+            id="search1",
+            content="Migrated the <api> to FastAPI and async SQLAlchemy",
+            user_id=mock_user_id,
+        ),
+        JournalEntry(
+            id="search2",
+            content="Tuned SQLite pragmas; SQLite is fast with WAL and SQLite FTS",
+            user_id=mock_user_id,
+        ),
+        JournalEntry(
+            id="search3",
+            content="SQLite notes from someone else",
+            user_id="another-user",
+        ),
+    ]
+    db_session.add_all(entries)
+    await db_session.commit()
+    return entries
+
+
+@pytest.mark.asyncio
+async def test_search_journal_entries_ranks_and_scopes_hits(
+    journal_entry_repo: JournalEntryRepo, searchable_journal_entries
+):
+    """Test that search only returns the user's matching entries."""
+    hits, next_offset = await journal_entry_repo.search_journal_entries(
+        mock_user_id, "sqlite", limit=10
+    )
+
+    assert [entry.id for entry, _, _ in hits] == ["search2"]
+    _, snippet, rank = hits[0]
+    assert f"{HIGHLIGHT_START}SQLite{HIGHLIGHT_END}" in snippet
+    assert rank > 0
+    assert next_offset is None
+
+
+@pytest.mark.asyncio
+async def test_search_journal_entries_prefix_and_pagination(
+    journal_entry_repo: JournalEntryRepo, searchable_journal_entries
+):
+    """Test that the last word matches as a prefix and pages are offset based."""
+    hits, next_offset = await journal_entry_repo.search_journal_entries(
+        mock_user_id, "fast", limit=1
+    )
+    assert len(hits) == 1
+    assert next_offset == 1
+
+    hits, next_offset = await journal_entry_repo.search_journal_entries(
+        mock_user_id, "fast", limit=1, offset=next_offset
+    )
+    assert len(hits) == 1
+    assert next_offset is None
+
+
+@pytest.mark.asyncio
+async def test_search_journal_entries_tracks_content_updates(
+    journal_entry_repo: JournalEntryRepo, searchable_journal_entries, db_session
+):
+    """Test that the index follows content changes."""
+    entry = searchable_journal_entries[0]
+    entry.content = "Rewrote everything in Rust"
+    db_session.add(entry)
+    await db_session.commit()
+
+    hits, _ = await journal_entry_repo.search_journal_entries(
+        mock_user_id, "fastapi", limit=10
+    )
+    assert hits == []
+    hits, _ = await journal_entry_repo.search_journal_entries(
+        mock_user_id, "rust", limit=10
+    )
+    assert [entry.id for entry, _, _ in hits] == ["search1"]
+
+
+@pytest.mark.asyncio
+async def test_search_journal_entries_ignores_query_syntax(
+    journal_entry_repo: JournalEntryRepo, searchable_journal_entries
+):
+    """Test that FTS operators in user input do not raise."""
+    hits, _ = await journal_entry_repo.search_journal_entries(
+        mock_user_id, 'sqlite" OR (NEAR', limit=10
+    )
+    assert hits == []
+
+    hits, _ = await journal_entry_repo.search_journal_entries(
+        mock_user_id, "***", limit=10
+    )
+    assert hits == []
 
 
 @pytest.mark.asyncio
@@ -127,7 +316,7 @@ async def test_get_journal_entry_not_found(
 
 @pytest.mark.asyncio
 async def test_add_journal_entry_success(
-    journal_entry_repo: JournalEntryRepo, sample_technologies
+    journal_entry_repo: JournalEntryRepo, sample_technologies, sample_journal_entries
 ):
     """Test successfully adding a new journal entry with technologies."""
     new_entry = JournalEntryCreate(
@@ -138,11 +327,200 @@ async def test_add_journal_entry_success(
         is_private=True,
         user_id=mock_user_id,
     )
-    result = await journal_entry_repo.add_journal_entry(new_entry, [])
+    result = await journal_entry_repo.add_journal_entry(new_entry, [], mock_user_id)
     assert result.content == new_entry.content
     assert result.project_id == new_entry.project_id
 
 
+@pytest_asyncio.fixture
+async def user_technologies(db_session: SessionDep) -> list[Technology]:
+    """Create technologies owned by the mock user with no usages."""
+    technologies = [
+        Technology(id="py", name="Python", user_id=mock_user_id),
+        Technology(id="js", name="JavaScript", user_id=mock_user_id),
+        Technology(id="go", name="Go", user_id=mock_user_id),
+    ]
+    db_session.add_all(technologies)
+    await db_session.commit()
+    return technologies
+
+
+async def usage_counts(session) -> dict[str, int]:
+    results = await session.exec(select(Technology.id, Technology.usage_count))
+    return dict(results.all())
+
+
+@pytest.mark.asyncio
+async def test_add_journal_entry_increments_usage_counts(
+    journal_entry_repo: JournalEntryRepo, user_technologies
+):
+    """Test that adding an entry counts one usage per linked technology."""
+    new_entry = JournalEntryCreate(
+        content="Entry", is_private=False, technologyIds=["py", "js"]
+    )
+
+    await journal_entry_repo.add_journal_entry(
+        new_entry, user_technologies[:2], mock_user_id
+    )
+
+    counts = await usage_counts(journal_entry_repo.session)
+    assert counts == {"py": 1, "js": 1, "go": 0}
+
+
+@pytest.mark.asyncio
+async def test_add_journal_entry_links_carry_owner(
+    journal_entry_repo: JournalEntryRepo, user_technologies
+):
+    """Test that link rows are stamped with the entry owner's user_id."""
+    entry = await journal_entry_repo.add_journal_entry(
+        JournalEntryCreate(content="Entry", is_private=False, technologyIds=["py"]),
+        user_technologies[:1],
+        mock_user_id,
+    )
+
+    results = await journal_entry_repo.session.exec(
+        select(JournalEntryTechnologyLink).where(
+            JournalEntryTechnologyLink.journal_entry_id == entry.id
+        )
+    )
+    links = results.all()
+    assert [(link.technology_id, link.user_id) for link in links] == [
+        ("py", mock_user_id)
+    ]
+    assert entry.technologies == user_technologies[:1]
+
+
+@pytest.mark.asyncio
+async def test_update_journal_entry_adjusts_usage_counts(
+    journal_entry_repo: JournalEntryRepo, user_technologies
+):
+    """Test that only added and removed technologies change their counts."""
+    py, js, go = user_technologies
+    entry = await journal_entry_repo.add_journal_entry(
+        JournalEntryCreate(
+            content="Entry", is_private=False, technologyIds=["py", "js"]
+        ),
+        [py, js],
+        mock_user_id,
+    )
+
+    await journal_entry_repo.update_journal_entry(
+        entry.id, JournalEntryUpdate(technologyIds=["js", "go"]), [js, go]
+    )
+
+    counts = await usage_counts(journal_entry_repo.session)
+    assert counts == {"py": 0, "js": 1, "go": 1}
+
+
+async def collection_versions(session) -> dict[Collection, int]:
+    return {
+        collection: await get_collection_version(session, mock_user_id, collection)
+        for collection in Collection
+    }
+
+
+@pytest.mark.asyncio
+async def test_journal_entry_writes_bump_collection_versions(
+    journal_entry_repo: JournalEntryRepo, user_technologies
+):
+    """Test that only the list endpoints a write changed get a new version."""
+    py, js, _ = user_technologies
+    entry = await journal_entry_repo.add_journal_entry(
+        JournalEntryCreate(content="Entry", is_private=False, technologyIds=["py"]),
+        [py],
+        mock_user_id,
+    )
+    assert await collection_versions(journal_entry_repo.session) == {
+        Collection.JOURNAL_ENTRIES: 1,
+        Collection.TECHNOLOGIES: 1,
+        Collection.PROJECTS: 0,
+        Collection.EMBEDDINGS: 0,
+        Collection.TECHNOLOGY_NAMES: 0,
+    }
+
+    await journal_entry_repo.update_journal_entry(
+        entry.id, JournalEntryUpdate(content="Edited", technologyIds=["py"]), [py]
+    )
+    assert await collection_versions(journal_entry_repo.session) == {
+        Collection.JOURNAL_ENTRIES: 2,
+        Collection.TECHNOLOGIES: 1,
+        Collection.PROJECTS: 0,
+        Collection.EMBEDDINGS: 1,
+        Collection.TECHNOLOGY_NAMES: 0,
+    }
+
+    await journal_entry_repo.update_journal_entry(
+        entry.id, JournalEntryUpdate(technologyIds=["js"]), [js]
+    )
+    assert await collection_versions(journal_entry_repo.session) == {
+        Collection.JOURNAL_ENTRIES: 3,
+        Collection.TECHNOLOGIES: 2,
+        Collection.PROJECTS: 0,
+        Collection.EMBEDDINGS: 1,
+        Collection.TECHNOLOGY_NAMES: 0,
+    }
+
+
+@pytest_asyncio.fixture
+async def user_projects(db_session: SessionDep) -> list[Project]:
+    """Create two empty projects owned by the mock user."""
+    projects = [
+        Project(id="p1", name="Project 1", user_id=mock_user_id),
+        Project(id="p2", name="Project 2", user_id=mock_user_id),
+    ]
+    db_session.add_all(projects)
+    await db_session.commit()
+    return projects
+
+
+async def project_stats(session) -> dict[str, tuple[int, datetime | None]]:
+    results = await session.exec(
+        select(Project.id, Project.entry_count, Project.last_entry_date)
+    )
+    return {id: (count, last) for id, count, last in results.all()}
+
+
+@pytest.mark.asyncio
+async def test_add_journal_entry_updates_project_stats(
+    journal_entry_repo: JournalEntryRepo, user_projects
+):
+    """Test that adding entries counts them and tracks the latest date."""
+    for _ in range(2):
+        entry = await journal_entry_repo.add_journal_entry(
+            JournalEntryCreate(
+                content="Entry", is_private=False, project_id="p1", technologyIds=[]
+            ),
+            [],
+            mock_user_id,
+        )
+
+    stats = await project_stats(journal_entry_repo.session)
+    assert stats["p1"] == (2, entry.date)
+    assert stats["p2"] == (0, None)
+
+
+@pytest.mark.asyncio
+async def test_update_journal_entry_moves_project_stats(
+    journal_entry_repo: JournalEntryRepo, user_projects
+):
+    """Test that moving an entry updates both projects in one transaction."""
+    entry = await journal_entry_repo.add_journal_entry(
+        JournalEntryCreate(
+            content="Entry", is_private=False, project_id="p1", technologyIds=[]
+        ),
+        [],
+        mock_user_id,
+    )
+
+    await journal_entry_repo.update_journal_entry(
+        entry.id, JournalEntryUpdate(project_id="p2"), None
+    )
+
+    stats = await project_stats(journal_entry_repo.session)
+    assert stats["p1"] == (0, None)
+    assert stats["p2"] == (1, entry.date)
+
+
 @pytest.mark.asyncio
 async def test_update_journal_entry_not_found(
     journal_entry_repo: JournalEntryRepo, sample_technologies
@@ -160,13 +538,17 @@ async def test_update_journal_entry_not_found(
 
 @pytest.mark.asyncio
 async def test_update_journal_entry_success(
-    journal_entry_repo: JournalEntryRepo, mocker
+    journal_entry_repo: JournalEntryRepo, db_session: SessionDep, mocker
 ):
     """Test successful journal entry update with technologies."""
     # Arrange
     test_id = "test-id"
     original_entry = JournalEntry(
-        id=test_id, content="Original content", is_private=False, technologies=[]
+        id=test_id,
+        content="Original content",
+        is_private=False,
+        technologies=[],
+        user_id=mock_user_id,
     )
 
     update_data = JournalEntryUpdate(
@@ -174,9 +556,11 @@ async def test_update_journal_entry_success(
     )
 
     new_technologies = [
-        Technology(id="tech-1", name="Python"),
-        Technology(id="tech-2", name="React"),
+        Technology(id="tech-1", name="Python", user_id=mock_user_id),
+        Technology(id="tech-2", name="React", user_id=mock_user_id),
     ]
+    db_session.add_all([original_entry, *new_technologies])
+    await db_session.commit()
 
     mock_get = mocker.patch.object(
         journal_entry_repo, "get_journal_entry", return_value=original_entry
@@ -185,6 +569,7 @@ async def test_update_journal_entry_success(
     mock_save = mocker.patch.object(
         journal_entry_repo, "_save_journal_entry", return_value=original_entry
     )
+    mock_adjust = mocker.patch.object(journal_entry_repo, "_adjust_usage_counts")
 
     # Act
     result = await journal_entry_repo.update_journal_entry(
@@ -194,6 +579,7 @@ async def test_update_journal_entry_success(
     # Assert
     mock_get.assert_called_once_with(test_id)
     mock_save.assert_called_once()
+    mock_adjust.assert_called_once_with(added={"tech-1", "tech-2"}, removed=set())
     assert result.content == "Updated content"
     assert result.is_private is True
     assert result.technologies == new_technologies
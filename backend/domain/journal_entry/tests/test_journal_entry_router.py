@@ -1,15 +1,30 @@
+import gzip
+import json
+
 import pytest
+from database.session import get_session
 from database.models import JournalEntry
-from domain.journal_entry.journal_entry_dependencies import get_journal_entry_service
+from domain.embedding.embedding_dependencies import get_embedding_service
+from domain.embedding.embedding_service import EmbeddingService
+from domain.journal_entry.journal_entry_dependencies import (
+    get_journal_entry_export_service,
+    get_journal_entry_service,
+)
 from domain.journal_entry.journal_entry_exceptions import JournalEntryNotFoundError
 from domain.journal_entry.journal_entry_router import router
 from domain.journal_entry.journal_entry_schema import (
     JournalEntryCreate,
+    JournalEntryPage,
+    JournalEntrySearchPage,
+    JournalEntrySimilar,
     JournalEntryUpdate,
 )
 from domain.journal_entry.journal_entry_service import JournalEntryService
+from domain.technology.technology_dependencies import get_technology_service
+from domain.technology.technology_schema import TechnologyRead
+from domain.technology.technology_service import TechnologyService
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
+from tests.conftest import authed_client
 
 mock_user_id = "123"
 mock_journal_entry = [
@@ -35,54 +50,232 @@ def mock_service(mocker):
     """Fixture for mocked JournalEntryService."""
     mock = mocker.Mock(spec=JournalEntryService)
     mock.add_journal_entry = mocker.AsyncMock()
+    mock.get_journal_entries = mocker.AsyncMock()
+    mock.search_journal_entries = mocker.AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def mock_embedding_service(mocker):
+    """Fixture for mocked EmbeddingService."""
+    mock = mocker.Mock(spec=EmbeddingService)
+    mock.find_similar = mocker.AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def mock_technology_service(mocker):
+    """Fixture for mocked TechnologyService."""
+    mock = mocker.Mock(spec=TechnologyService)
+    mock.suggest_technologies = mocker.AsyncMock()
     return mock
 
 
 @pytest.fixture
-def app(mock_service):
+def app(mock_service, mock_embedding_service, mock_technology_service, mock_session):
     """Fixture for FastAPI test app."""
     app = FastAPI()
     app.include_router(router)
+    app.dependency_overrides[get_embedding_service] = lambda: mock_embedding_service
+    app.dependency_overrides[get_technology_service] = lambda: mock_technology_service
 
     app.dependency_overrides[get_journal_entry_service] = lambda: mock_service
+    app.dependency_overrides[get_journal_entry_export_service] = lambda: mock_service
 
+    app.dependency_overrides[get_session] = lambda: mock_session
     return app
 
 
 @pytest.fixture
 def client(app):
     """Fixture for FastAPI test client."""
-    return TestClient(app)
+    return authed_client(app, mock_user_id)
 
 
 class TestGetJournalEntries:
     def test_get_journal_entries_success(self, client, mock_service):
-        """Test successful retrieval of all journal entries."""
+        """Test successful retrieval of a page of journal entries."""
         # Arrange
-        mock_service.get_journal_entries.return_value = mock_journal_entry
+        mock_service.get_journal_entries.return_value = JournalEntryPage(
+            items=mock_journal_entry, next_cursor="next-page"
+        )
 
         # Act
-        response = client.get("/journal-entries/")
+        response = client.get("/")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 2
-        assert data[0]["id"] == mock_journal_entry[0].id
-        assert data[0]["content"] == mock_journal_entry[0].content
-        mock_service.get_journal_entries.assert_called_once()
+        assert len(data["items"]) == 2
+        assert data["items"][0]["id"] == mock_journal_entry[0].id
+        assert data["items"][0]["content"] == mock_journal_entry[0].content
+        assert data["nextCursor"] == "next-page"
+        mock_service.get_journal_entries.assert_called_once_with(
+            mock_user_id, limit=20, cursor=None
+        )
+
+    def test_get_journal_entries_forwards_cursor(self, client, mock_service):
+        """Test that limit and cursor are passed through to the service."""
+        # Arrange
+        mock_service.get_journal_entries.return_value = JournalEntryPage(items=[])
+
+        # Act
+        response = client.get("/?limit=5&cursor=abc")
+
+        # Assert
+        assert response.status_code == 200
+        mock_service.get_journal_entries.assert_called_once_with(
+            mock_user_id, limit=5, cursor="abc"
+        )
+
+    def test_get_journal_entries_limit_out_of_range(self, client):
+        """Test that an oversized page is rejected."""
+        response = client.get("/?limit=1000")
+
+        assert response.status_code == 422
 
     def test_get_journal_entries_empty(self, client, mock_service):
         """Test retrieval of empty journal entries list."""
         # Arrange
-        mock_service.get_journal_entries.return_value = []
+        mock_service.get_journal_entries.return_value = JournalEntryPage(items=[])
+
+        # Act
+        response = client.get("/")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "nextCursor": None}
+
+
+class TestSearchJournalEntries:
+    def test_search_journal_entries_success(self, client, mock_service):
+        """Test searching passes the query and paging through."""
+        # Arrange
+        mock_service.search_journal_entries.return_value = JournalEntrySearchPage(
+            items=[], next_offset=10
+        )
+
+        # Act
+        response = client.get("/search?q=fastapi&limit=10&offset=0")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "nextOffset": 10}
+        mock_service.search_journal_entries.assert_called_once_with(
+            mock_user_id, "fastapi", limit=10, offset=0
+        )
+
+    def test_search_journal_entries_requires_query(self, client):
+        """Test that an empty query is rejected."""
+        response = client.get("/search?q=")
+
+        assert response.status_code == 422
+
+
+class TestSimilarJournalEntries:
+    def test_similar_journal_entries_success(self, client, mock_embedding_service):
+        """Test that similar entries are returned with their scores."""
+        # Arrange
+        mock_embedding_service.find_similar.return_value = [
+            JournalEntrySimilar(
+                id="old-id",
+                content="old content",
+                is_private=True,
+                date="2024-03-04T09:00:00",
+                technologies=[],
+                score=0.5,
+            )
+        ]
+
+        # Act
+        response = client.get("/new-id/similar?limit=5")
+
+        # Assert
+        assert response.status_code == 200
+        assert [(hit["id"], hit["score"]) for hit in response.json()] == [
+            ("old-id", 0.5)
+        ]
+        mock_embedding_service.find_similar.assert_called_once_with(
+            mock_user_id, "new-id", 5
+        )
+
+    def test_similar_journal_entries_not_found(self, client, mock_embedding_service):
+        """Test that another user's or an unknown entry returns 404."""
+        mock_embedding_service.find_similar.side_effect = JournalEntryNotFoundError()
+
+        response = client.get("/missing/similar")
+
+        assert response.status_code == 404
+
+    def test_similar_journal_entries_limit_out_of_range(self, client):
+        """Test that the limit is bounded."""
+        response = client.get("/new-id/similar?limit=500")
+
+        assert response.status_code == 422
+
+
+class TestSuggestTechnologies:
+    def test_suggest_technologies_success(self, client, mock_technology_service):
+        """Test that the technologies named in the content are returned."""
+        mock_technology_service.suggest_technologies.return_value = [
+            TechnologyRead(id="tech-1", name="Python")
+        ]
+
+        response = client.post("/suggest-technologies", json={"content": "Some python"})
+
+        assert response.status_code == 200
+        assert [technology["id"] for technology in response.json()] == ["tech-1"]
+        mock_technology_service.suggest_technologies.assert_called_once_with(
+            mock_user_id, "Some python"
+        )
+
+    def test_suggest_technologies_requires_content(self, client):
+        """Test that the content is required."""
+        response = client.post("/suggest-technologies", json={})
+
+        assert response.status_code == 422
+
+
+class TestExportJournalEntries:
+    @staticmethod
+    def _export(*chunks: bytes):
+        async def stream(user_id):
+            for chunk in chunks:
+                yield chunk
+
+        return stream
+
+    def test_export_journal_entries_ndjson(self, client, mock_service):
+        """Test streaming export as plain NDJSON."""
+        # Arrange
+        mock_service.export_journal_entries = self._export(
+            b'{"id": "a"}\n', b'{"id": "b"}\n'
+        )
+
+        # Act
+        response = client.get("/export")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["id"] for line in response.text.splitlines()] == [
+            "a",
+            "b",
+        ]
+
+    def test_export_journal_entries_gzip(self, client, mock_service):
+        """Test streaming export compressed on the fly."""
+        # Arrange
+        mock_service.export_journal_entries = self._export(b'{"id": "a"}\n')
 
         # Act
-        response = client.get("/journal-entries/")
+        response = client.get("/export?gzip=true")
 
         # Assert
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.headers["content-type"] == "application/gzip"
+        assert "journal-entries.ndjson.gz" in response.headers["content-disposition"]
+        assert gzip.decompress(response.content) == b'{"id": "a"}\n'
 
 
 class TestGetJournalEntry:
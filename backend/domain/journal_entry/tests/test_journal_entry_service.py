@@ -1,13 +1,19 @@
 """Tests for the journal entry service layer."""
 
+import json
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 from database.models import JournalEntry, Technology
+from domain.embedding.embedding_service import EMBEDDINGS_SYNC
+from domain.insights.insights_service import INSIGHTS_REFRESH_STALE
+from domain.job.job_exceptions import JobDatabaseError
 from domain.journal_entry.journal_entry_exceptions import JournalEntryNotFoundError
 from domain.journal_entry.journal_entry_schema import (
     JournalEntryCreate,
+    JournalEntryPage,
     JournalEntryRead,
+    JournalEntrySearchPage,
     JournalEntryUpdate,
 )
 from domain.journal_entry.journal_entry_service import JournalEntryService
@@ -30,7 +36,12 @@ def mock_repo():
 @pytest.fixture
 def mock_tech_service():
     """Fixture for mocked TechnologyService."""
-    return Mock(get_technologies_by_ids=AsyncMock())
+    return Mock(
+        get_technologies_by_ids=AsyncMock(),
+        suggest_technology_ids=AsyncMock(),
+        get_links_version=AsyncMock(return_value=7),
+        record_new_entry=AsyncMock(),
+    )
 
 
 @pytest.fixture
@@ -60,16 +71,75 @@ def sample_journal_entry():
 async def test_get_journal_entries(
     journal_entry_service, mock_repo, sample_journal_entry
 ):
-    """Test getting all journal entries."""
+    """Test getting a page of journal entries."""
     # Arrange
-    mock_repo.get_journal_entries.return_value = [sample_journal_entry]
+    mock_repo.get_journal_entries.return_value = ([sample_journal_entry], "cursor")
 
     # Act
-    result = await journal_entry_service.get_journal_entries()
+    result = await journal_entry_service.get_journal_entries(
+        mock_user_id, limit=1, cursor=None
+    )
 
     # Assert
-    assert result == [sample_journal_entry]
-    mock_repo.get_journal_entries.assert_called_once()
+    assert isinstance(result, JournalEntryPage)
+    assert [entry.id for entry in result.items] == [sample_journal_entry.id]
+    assert result.next_cursor == "cursor"
+    mock_repo.get_journal_entries.assert_called_once_with(
+        mock_user_id, limit=1, cursor=None
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_journal_entries(
+    journal_entry_service, mock_repo, sample_journal_entry
+):
+    """Test searching escapes snippets and highlights matches."""
+    # Arrange
+    mock_repo.search_journal_entries = AsyncMock(
+        return_value=(
+            [(sample_journal_entry, "<b>\ue000Test\ue001 content", 1.5)],
+            None,
+        )
+    )
+
+    # Act
+    result = await journal_entry_service.search_journal_entries(
+        mock_user_id, "test", limit=10, offset=0
+    )
+
+    # Assert
+    assert isinstance(result, JournalEntrySearchPage)
+    assert result.items[0].id == sample_journal_entry.id
+    assert result.items[0].snippet == "&lt;b&gt;<mark>Test</mark> content"
+    assert result.items[0].rank == 1.5
+    mock_repo.search_journal_entries.assert_called_once_with(
+        mock_user_id, "test", limit=10, offset=0
+    )
+
+
+@pytest.mark.asyncio
+async def test_export_journal_entries(
+    journal_entry_service, mock_repo, sample_journal_entry
+):
+    """Test exporting journal entries as NDJSON."""
+
+    # Arrange
+    async def stream(user_id):
+        for _ in range(3):
+            yield sample_journal_entry
+
+    mock_repo.stream_journal_entries = stream
+
+    # Act
+    chunks = [
+        chunk async for chunk in journal_entry_service.export_journal_entries("123")
+    ]
+
+    # Assert
+    lines = b"".join(chunks).decode("utf-8").splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])["id"] == sample_journal_entry.id
+    assert json.loads(lines[0])["isPrivate"] is False
 
 
 @pytest.mark.asyncio
@@ -134,6 +204,42 @@ async def test_add_journal_entry_success(
     )
 
 
+@pytest.mark.asyncio
+async def test_add_journal_entry_auto_tag(
+    journal_entry_service,
+    mock_repo,
+    mock_tech_service,
+    sample_technologies,
+    sample_journal_entry,
+):
+    """Test that auto-tagging adds the technologies named in the content."""
+    create_data = JournalEntryCreate(
+        content="Python and React",
+        is_private=False,
+        technologyIds=["tech-2"],
+        auto_tag=True,
+    )
+    mock_tech_service.suggest_technology_ids.return_value = ["tech-1", "tech-2"]
+    mock_tech_service.get_technologies_by_ids.return_value = sample_technologies
+    mock_repo.add_journal_entry.return_value = sample_journal_entry
+
+    result = await journal_entry_service.add_journal_entry(create_data, mock_user_id)
+
+    assert result.technologies == sample_technologies
+    mock_tech_service.suggest_technology_ids.assert_awaited_once_with(
+        mock_user_id, "Python and React"
+    )
+    mock_tech_service.get_technologies_by_ids.assert_awaited_once_with(
+        ["tech-2", "tech-1"]
+    )
+    mock_repo.add_journal_entry.assert_awaited_once_with(
+        create_data, sample_technologies, mock_user_id
+    )
+    mock_tech_service.record_new_entry.assert_awaited_once_with(
+        mock_user_id, 7, [tech.id for tech in sample_technologies]
+    )
+
+
 @pytest.mark.asyncio
 async def test_add_journal_entry_tech_not_found(
     journal_entry_service, mock_tech_service
@@ -223,3 +329,45 @@ async def test_update_journal_entry_tech_not_found(
     # Act & Assert
     with pytest.raises(TechnologyNotFoundError):
         await journal_entry_service.update_journal_entry("test-id", update_data)
+
+
+@pytest.mark.asyncio
+async def test_update_journal_entry_queues_background_work(
+    mock_repo, mock_tech_service, sample_journal_entry
+):
+    """Test that a write queues its embedding and a summary refresh."""
+    # Arrange
+    mock_job_service = Mock(enqueue=AsyncMock())
+    service = JournalEntryService(mock_repo, mock_tech_service, mock_job_service)
+    sample_journal_entry.user_id = mock_user_id
+    mock_repo.update_journal_entry.return_value = sample_journal_entry
+
+    # Act
+    await service.update_journal_entry("test-id", JournalEntryUpdate(content="New"))
+
+    # Assert
+    assert [call.args for call in mock_job_service.enqueue.call_args_list] == [
+        (EMBEDDINGS_SYNC, mock_user_id),
+        (INSIGHTS_REFRESH_STALE, mock_user_id),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_journal_entry_survives_queue_failure(
+    mock_repo, mock_tech_service, sample_journal_entry
+):
+    """Test that the saved entry is returned even if the refresh is not queued."""
+    # Arrange
+    mock_job_service = Mock(
+        enqueue=AsyncMock(side_effect=JobDatabaseError(message="locked"))
+    )
+    service = JournalEntryService(mock_repo, mock_tech_service, mock_job_service)
+    mock_repo.update_journal_entry.return_value = sample_journal_entry
+
+    # Act
+    result = await service.update_journal_entry(
+        "test-id", JournalEntryUpdate(content="New")
+    )
+
+    # Assert
+    assert isinstance(result, JournalEntryRead)
@@ -1,10 +1,21 @@
-from database.models import Project
+from database.activity import forget_project_activity
+from database.collection_versions import (
+    Collection,
+    bump_collection_for_all_users,
+    bump_collection_versions,
+)
+from database.models import JournalEntry, Project
 from database.session import SessionDep
 from domain.project.project_exceptions import ProjectDatabaseError, ProjectNotFoundError
-from domain.project.project_schema import ProjectCreate, ProjectUpdate
+from domain.project.project_schema import (
+    ProjectCreate,
+    ProjectStatsMismatch,
+    ProjectUpdate,
+)
 from fastapi import status
+from sqlalchemy import delete, exists, func, or_
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlmodel import select
+from sqlmodel import select, update
 
 
 class ProjectRepo:
@@ -16,18 +27,23 @@ class ProjectRepo:
         """
         self.session = session
 
-    async def get_projects(self) -> list[Project]:
-        """Get all projects sorted by last entry date and name.
+    async def get_projects(self, user_id: str) -> list[Project]:
+        """Get a user's projects sorted by last entry date and name.
+
+        Args:
+            user_id (str): ID of the user owning the projects
 
         Returns:
-            list[Project]: List of all projects
+            list[Project]: List of the user's projects
 
         Raises:
             ProjectDatabaseError: If database operation fails
         """
         try:
-            statement = select(Project).order_by(
-                Project.last_entry_date.desc().nulls_last(), Project.name
+            statement = (
+                select(Project)
+                .where(Project.user_id == user_id)
+                .order_by(Project.last_entry_date.desc().nulls_last(), Project.name)
             )
             results = await self.session.exec(statement)
             return results.all()
@@ -110,31 +126,211 @@ class ProjectRepo:
             await self.session.rollback()
             raise ProjectDatabaseError(message=f"Failed to update project: {str(e)}")
 
-    async def delete_project(self, id: str):
+    async def delete_project(self, id: str, detach_entries: bool = False):
         """Delete a project by ID.
 
+        Whether journal entries still reference the project is answered by an
+        ``EXISTS`` probe fetched together with the project; entries are never
+        loaded.
+
         Args:
             id (str): Project ID
+            detach_entries (bool): Clear the project of its journal entries in
+                the same transaction instead of refusing the delete
 
         Raises:
+            ProjectNotFoundError: If project not found
             ProjectDatabaseError: If project has associated journal entries or database operation fails
         """
         try:
             async with self.session.begin():
-                project = await self.get_project(id)
-                has_journal_entries = len(project.journal_entries) > 0
-                if has_journal_entries:
+                in_use = (
+                    exists()
+                    .where(JournalEntry.project_id == Project.id)
+                    .label("in_use")
+                )
+                result = await self.session.exec(
+                    select(Project.name, Project.user_id, in_use).where(
+                        Project.id == id
+                    )
+                )
+                row = result.first()
+                if not row:
+                    raise ProjectNotFoundError(
+                        message=f"Project with ID '{id}' not found",
+                        status_code=status.HTTP_404_NOT_FOUND,
+                    )
+                name, user_id, has_journal_entries = row
+                if has_journal_entries and not detach_entries:
                     raise ProjectDatabaseError(
-                        message=f"Project '{project.name}' cannot be deleted because it is used in journal entries",
+                        message=f"Project '{name}' cannot be deleted because it is used in journal entries",
                         status_code=status.HTTP_400_BAD_REQUEST,
                     )
-                await self.session.delete(project)
+                if has_journal_entries:
+                    await self._detach_entries([id])
+                    await forget_project_activity(self.session, [id])
+                await self.session.exec(delete(Project).where(Project.id == id))
+                await bump_collection_versions(
+                    self.session,
+                    user_id,
+                    Collection.PROJECTS,
+                    *([Collection.JOURNAL_ENTRIES] if has_journal_entries else []),
+                )
         except SQLAlchemyError as e:
             raise ProjectDatabaseError(
                 message=f"Failed to delete project: {str(e)}",
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    async def delete_projects(
+        self, ids: list[str], user_id: str, detach_entries: bool = False
+    ) -> int:
+        """Delete several projects of a user at once.
+
+        IDs that do not exist or belong to another user are skipped.
+
+        Args:
+            ids (list[str]): Project IDs
+            user_id (str): ID of the user owning the projects
+            detach_entries (bool): Clear the projects of their journal entries in
+                the same transaction instead of refusing the delete
+
+        Returns:
+            int: Number of deleted projects
+
+        Raises:
+            ProjectDatabaseError: If any project has associated journal entries and
+                ``detach_entries`` is not set, or database operation fails
+        """
+        owned = Project.id.in_(ids) & (Project.user_id == user_id)
+        try:
+            async with self.session.begin():
+                if detach_entries:
+                    await self._detach_entries(select(Project.id).where(owned))
+                    await forget_project_activity(
+                        self.session, select(Project.id).where(owned)
+                    )
+                else:
+                    result = await self.session.exec(
+                        select(Project.id).where(
+                            owned,
+                            exists().where(JournalEntry.project_id == Project.id),
+                        )
+                    )
+                    in_use = result.all()
+                    if in_use:
+                        raise ProjectDatabaseError(
+                            message="Projects cannot be deleted because they are used in journal entries",
+                            params={"ids": list(in_use)},
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                        )
+                result = await self.session.exec(delete(Project).where(owned))
+                if result.rowcount:
+                    await bump_collection_versions(
+                        self.session,
+                        user_id,
+                        Collection.PROJECTS,
+                        *([Collection.JOURNAL_ENTRIES] if detach_entries else []),
+                    )
+                return result.rowcount
+        except SQLAlchemyError as e:
+            raise ProjectDatabaseError(
+                message=f"Failed to delete projects: {str(e)}",
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    async def _detach_entries(self, project_ids) -> None:
+        """Null ``project_id`` on every entry of the projects in one UPDATE."""
+        await self.session.exec(
+            update(JournalEntry)
+            .where(JournalEntry.project_id.in_(project_ids))
+            .values(project_id=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def find_stale_stats(self) -> list[ProjectStatsMismatch]:
+        """Compare each project's stored stats with its journal entries.
+
+        Returns:
+            list[ProjectStatsMismatch]: Projects whose ``entry_count`` or
+                ``last_entry_date`` disagree with their entries
+
+        Raises:
+            ProjectDatabaseError: If database operation fails
+        """
+        entry_count, last_entry_date = self._actual_stats()
+        statement = (
+            select(
+                Project.id,
+                Project.entry_count,
+                entry_count.label("actual_entry_count"),
+                Project.last_entry_date,
+                last_entry_date.label("actual_last_entry_date"),
+            )
+            .where(
+                or_(
+                    Project.entry_count != entry_count,
+                    Project.last_entry_date.is_distinct_from(last_entry_date),
+                )
+            )
+            .order_by(Project.id)
+        )
+        try:
+            results = await self.session.exec(statement)
+            return [ProjectStatsMismatch(*row) for row in results.all()]
+        except SQLAlchemyError as e:
+            raise ProjectDatabaseError(
+                message=f"Failed to check project stats: {str(e)}"
+            )
+
+    async def recompute_stats(self) -> int:
+        """Recompute ``entry_count`` and ``last_entry_date`` of drifted projects.
+
+        Returns:
+            int: Number of projects corrected
+
+        Raises:
+            ProjectDatabaseError: If database operation fails
+        """
+        entry_count, last_entry_date = self._actual_stats()
+        try:
+            result = await self.session.exec(
+                update(Project)
+                .where(
+                    or_(
+                        Project.entry_count != entry_count,
+                        Project.last_entry_date.is_distinct_from(last_entry_date),
+                    )
+                )
+                .values(entry_count=entry_count, last_entry_date=last_entry_date)
+                .execution_options(synchronize_session=False)
+            )
+            await bump_collection_for_all_users(self.session, Collection.PROJECTS)
+            await self.session.commit()
+            self.session.expire_all()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise ProjectDatabaseError(
+                message=f"Failed to recompute project stats: {str(e)}"
+            )
+
+    @staticmethod
+    def _actual_stats():
+        """Correlated subqueries for a project's real entry count and last date."""
+        entry_count = (
+            select(func.count())
+            .select_from(JournalEntry)
+            .where(JournalEntry.project_id == Project.id)
+            .scalar_subquery()
+        )
+        last_entry_date = (
+            select(func.max(JournalEntry.date))
+            .where(JournalEntry.project_id == Project.id)
+            .scalar_subquery()
+        )
+        return entry_count, last_entry_date
+
     async def _save_project(self, project: Project) -> Project:
         """Save project to database and refresh.
 
@@ -148,6 +344,13 @@ class ProjectRepo:
             SQLAlchemyError: If database operation fails
         """
         self.session.add(project)
+        # Entries embed their project, so their listing changes too
+        await bump_collection_versions(
+            self.session,
+            project.user_id,
+            Collection.PROJECTS,
+            Collection.JOURNAL_ENTRIES,
+        )
         await self.session.commit()
         await self.session.refresh(project)
         return project
@@ -1,26 +1,44 @@
+from authx import TokenPayload
+from core.conditional_get import conditional_list
 from core.exceptions import BaseDomainError
+from core.responses import ModelResponse
+from database.collection_versions import Collection
 from database.models import Project
+from domain.auth.auth_config import security
 from domain.project.project_dependencies import ProjectServiceDep
-from domain.project.project_schema import ProjectCreate, ProjectUpdate, ProjectRead
-from fastapi import APIRouter, status
+from domain.project.project_schema import (
+    MAX_BULK_DELETE,
+    ProjectBulkDeleteResult,
+    ProjectCreate,
+    ProjectRead,
+    ProjectUpdate,
+)
+from fastapi import APIRouter, Depends, Query, Response, status
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[ProjectRead])
+@router.get(
+    "",
+    response_model=list[ProjectRead],
+    dependencies=[Depends(conditional_list(Collection.PROJECTS))],
+)
 async def get_projects(
     service: ProjectServiceDep,
+    response: Response,
+    payload: TokenPayload = Depends(security.access_token_required),
 ):
-    """Get all projects sorted by last entry date and name.
+    """Get the current user's projects sorted by last entry date and name.
 
     Returns:
-        list[Project]: List of all projects
+        list[Project]: List of the user's projects
 
     Raises:
         ProjectDatabaseError: If database operation fails
     """
     try:
-        return await service.get_projects()
+        projects = await service.get_projects(payload.user_id)
+        return ModelResponse(projects, list[ProjectRead], headers=response.headers)
     except BaseDomainError as e:
         raise e
 
@@ -45,6 +63,33 @@ async def add_project(
         raise e
 
 
+@router.delete("", response_model=ProjectBulkDeleteResult)
+async def delete_projects(
+    service: ProjectServiceDep,
+    ids: list[str] = Query(..., min_length=1, max_length=MAX_BULK_DELETE),
+    detach_entries: bool = False,
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Delete several of the user's projects at once.
+
+    Args:
+        ids: IDs of the projects to delete; unknown or foreign IDs are skipped
+        detach_entries: Remove the projects from their journal entries instead
+            of refusing to delete projects that are in use
+        service: Project service instance
+        payload: Authentication payload
+
+    Returns:
+        ProjectBulkDeleteResult: Number of deleted projects
+    """
+    try:
+        return await service.delete_projects(
+            ids, payload.user_id, detach_entries=detach_entries
+        )
+    except BaseDomainError as e:
+        raise e
+
+
 @router.get("/{id}")
 async def get_project(
     id: str,
@@ -91,17 +136,20 @@ async def update_project(
 async def delete_project(
     id: str,
     service: ProjectServiceDep,
+    detach_entries: bool = False,
 ) -> None:
     """Delete a project from the database by its ID.
 
     Args:
         id: Unique identifier of the project to delete
         service: Project service instance
+        detach_entries: Remove the project from its journal entries instead of
+            refusing to delete a project that is in use
 
     Raises:
         HTTPException: If the request fails
     """
     try:
-        await service.delete_project(id)
+        await service.delete_project(id, detach_entries=detach_entries)
     except BaseDomainError as e:
         raise e
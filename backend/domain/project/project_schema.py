@@ -1,7 +1,11 @@
 from datetime import datetime
+from typing import NamedTuple
 
 from core.schema.base import BaseSchema
 
+# Upper bound on the ids of one bulk delete, keeping the IN list reasonable
+MAX_BULK_DELETE = 500
+
 
 class ProjectBase(BaseSchema):
     """Base model for project data transfer."""
@@ -23,6 +27,7 @@ class ProjectRead(ProjectBase):
 
     id: str
     last_entry_date: datetime | None = None
+    entry_count: int = 0
     technologies: list[str] = []
 
 
@@ -30,3 +35,19 @@ class ProjectUpdate(ProjectBase):
     """Input model for updating an existing project."""
 
     pass
+
+
+class ProjectBulkDeleteResult(BaseSchema):
+    """Output model for bulk project deletion."""
+
+    deleted_count: int
+
+
+class ProjectStatsMismatch(NamedTuple):
+    """A project whose stored stats disagree with its journal entries."""
+
+    id: str
+    entry_count: int
+    actual_entry_count: int
+    last_entry_date: datetime | None
+    actual_last_entry_date: datetime | None
@@ -1,16 +1,22 @@
+from core.responses import type_adapter
 from database.models import Project
 from domain.project.project_repo import ProjectRepo
-from domain.project.project_schema import ProjectCreate, ProjectUpdate
+from domain.project.project_schema import (
+    ProjectBulkDeleteResult,
+    ProjectCreate,
+    ProjectRead,
+    ProjectUpdate,
+)
 
 
 class ProjectService:
     def __init__(self, repo: ProjectRepo) -> None:
         self.repo = repo
 
-    async def get_projects(self) -> list[Project]:
-        """Get all projects and convert to DTOs."""
-        projects = await self.repo.get_projects()
-        return projects
+    async def get_projects(self, user_id: str) -> list[ProjectRead]:
+        """Get a user's projects and convert to DTOs."""
+        projects = await self.repo.get_projects(user_id)
+        return type_adapter(list[ProjectRead]).validate_python(projects)
 
     async def get_project(self, id: str) -> Project:
         """Get a single project and convert to DTO."""
@@ -20,9 +26,18 @@ class ProjectService:
         """Add a project and convert result to DTO."""
         return await self.repo.add_project(project)
 
-    async def delete_project(self, id: str) -> None:
-        """Delete a project."""
-        await self.repo.delete_project(id)
+    async def delete_project(self, id: str, detach_entries: bool = False) -> None:
+        """Delete a project, optionally detaching its journal entries."""
+        await self.repo.delete_project(id, detach_entries=detach_entries)
+
+    async def delete_projects(
+        self, ids: list[str], user_id: str, detach_entries: bool = False
+    ) -> ProjectBulkDeleteResult:
+        """Delete several projects of a user in one statement."""
+        deleted_count = await self.repo.delete_projects(
+            ids, user_id, detach_entries=detach_entries
+        )
+        return ProjectBulkDeleteResult(deleted_count=deleted_count)
 
     async def update_project(self, id: str, project: ProjectUpdate) -> Project:
         """Update an existing project and convert result to DTO."""
@@ -2,13 +2,14 @@
 
 import pytest
 import pytest_asyncio
-from database.models import Project
+from database.models import JournalEntry, Project
 from domain.project.project_exceptions import ProjectDatabaseError, ProjectNotFoundError
 from domain.project.project_repo import ProjectRepo
 from domain.project.project_schema import ProjectCreate, ProjectUpdate
 from fastapi import status
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session as SessionDep
+from sqlmodel import select
 
 mock_user_id = "123"
 
@@ -118,3 +119,96 @@ async def test_delete_project_database_error(
     with pytest.raises(ProjectDatabaseError) as exc_info:
         await project_repo.delete_project(sample_projects[0].id)
     assert "Failed to delete project" in str(exc_info.value)
+
+
+@pytest_asyncio.fixture
+async def projects_with_entries(db_session: SessionDep, sample_projects):
+    """Attach a journal entry to the first sample project."""
+    db_session.add(
+        JournalEntry(id="entry1", content="Entry", project_id="1", user_id=mock_user_id)
+    )
+    await db_session.commit()
+    return sample_projects
+
+
+async def project_ids(session) -> list[str]:
+    results = await session.exec(select(Project.id).order_by(Project.id))
+    return results.all()
+
+
+@pytest.mark.asyncio
+async def test_delete_project_in_use(project_repo: ProjectRepo, projects_with_entries):
+    """Test that a project used by journal entries is refused."""
+    with pytest.raises(ProjectDatabaseError) as exc_info:
+        await project_repo.delete_project("1")
+
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert await project_ids(project_repo.session) == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_delete_project_detach_entries(
+    project_repo: ProjectRepo, projects_with_entries
+):
+    """Test that detach_entries clears the entries and deletes the project."""
+    await project_repo.delete_project("1", detach_entries=True)
+
+    assert await project_ids(project_repo.session) == ["2"]
+    results = await project_repo.session.exec(
+        select(JournalEntry.project_id).where(JournalEntry.id == "entry1")
+    )
+    assert results.one() is None
+
+
+@pytest.mark.asyncio
+async def test_delete_projects_scoped_to_user(
+    project_repo: ProjectRepo, sample_projects, db_session: SessionDep
+):
+    """Test that bulk deletion only removes the user's own projects."""
+    db_session.add(Project(id="3", name="Foreign", user_id="another-user"))
+    await db_session.commit()
+
+    deleted = await project_repo.delete_projects(["1", "2", "3"], mock_user_id)
+
+    assert deleted == 2
+    assert await project_ids(project_repo.session) == ["3"]
+
+
+@pytest.mark.asyncio
+async def test_delete_projects_in_use(project_repo: ProjectRepo, projects_with_entries):
+    """Test that bulk deletion reports in-use projects and deletes nothing."""
+    with pytest.raises(ProjectDatabaseError) as exc_info:
+        await project_repo.delete_projects(["1", "2"], mock_user_id)
+
+    assert exc_info.value.params == {"ids": ["1"]}
+    assert await project_ids(project_repo.session) == ["1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_delete_projects_detach_entries(
+    project_repo: ProjectRepo, projects_with_entries
+):
+    """Test that bulk deletion can detach entries in the same transaction."""
+    deleted = await project_repo.delete_projects(
+        ["1", "2"], mock_user_id, detach_entries=True
+    )
+
+    assert deleted == 2
+    assert await project_ids(project_repo.session) == []
+
+
+@pytest.mark.asyncio
+async def test_find_stale_stats_and_recompute(
+    project_repo: ProjectRepo, projects_with_entries
+):
+    """Test that drifted stats are reported and then repaired."""
+    mismatches = await project_repo.find_stale_stats()
+    assert [(m.id, m.entry_count, m.actual_entry_count) for m in mismatches] == [
+        ("1", 0, 1)
+    ]
+
+    assert await project_repo.recompute_stats() == 1
+    assert await project_repo.find_stale_stats() == []
+    project = await project_repo.get_project("1")
+    assert project.entry_count == 1
+    assert project.last_entry_date is not None
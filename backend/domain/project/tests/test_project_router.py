@@ -1,12 +1,15 @@
 """Tests for the project router endpoints."""
 
 import pytest
+from database.session import get_session
 from domain.project.project_dependencies import get_project_service
 from domain.project.project_exceptions import ProjectDatabaseError, ProjectNotFoundError
 from domain.project.project_router import router
+from domain.project.project_schema import ProjectBulkDeleteResult, ProjectRead
 from domain.project.project_service import ProjectService
 from fastapi import FastAPI, status
 from fastapi.testclient import TestClient
+from tests.conftest import authenticate
 
 mock_user_id = "123"
 # Prepare mock data
@@ -17,6 +20,7 @@ mock_projects = [
         "description": "Building an AI assistant",
         "is_private": True,
         "last_entry_date": None,
+        "entry_count": 0,
         "link": None,
     },
     {
@@ -25,6 +29,7 @@ mock_projects = [
         "description": "Developing an online store",
         "is_private": True,
         "last_entry_date": None,
+        "entry_count": 0,
         "link": None,
     },
 ]
@@ -37,13 +42,14 @@ def mock_project_service(mocker):
 
 
 @pytest.fixture
-def app(mock_project_service):
+def app(mock_project_service, mock_session):
     """Create a FastAPI test application."""
     app = FastAPI()
     app.include_router(router, prefix="/api/projects")
 
     # Override the service dependency
     app.dependency_overrides[get_project_service] = lambda: mock_project_service
+    app.dependency_overrides[get_session] = lambda: mock_session
     return app
 
 
@@ -56,15 +62,22 @@ def client(app):
 def test_get_projects_success(client, mock_project_service):
     """Test successful retrieval of all projects."""
     # Setup mock behavior
-    mock_project_service.get_projects.return_value = mock_projects
+    mock_project_service.get_projects.return_value = [
+        ProjectRead.model_validate(project) for project in mock_projects
+    ]
+
+    authenticate(client, mock_user_id)
 
     # Execute request
     response = client.get("/api/projects")
 
     # Verify response
     assert response.status_code == status.HTTP_200_OK
-    assert response.json() == mock_projects
-    mock_project_service.get_projects.assert_called_once()
+    assert response.json() == [
+        ProjectRead.model_validate(project).model_dump(mode="json", by_alias=True)
+        for project in mock_projects
+    ]
+    mock_project_service.get_projects.assert_called_once_with(mock_user_id)
 
 
 def test_get_projects_handles_error(client, mock_project_service):
@@ -72,12 +85,33 @@ def test_get_projects_handles_error(client, mock_project_service):
     # Setup mock behavior
     mock_project_service.get_projects.side_effect = ProjectDatabaseError()
 
+    authenticate(client, mock_user_id)
+
     # Execute request
     response = client.get("/api/projects")
 
     # Verify response
     assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-    mock_project_service.get_projects.assert_called_once()
+    mock_project_service.get_projects.assert_called_once_with(mock_user_id)
+
+
+def test_get_projects_not_modified(client, mock_project_service, mock_session):
+    """Test that a matching If-None-Match skips the projects query."""
+    authenticate(client, mock_user_id)
+    mock_project_service.get_projects.return_value = []
+    etag = client.get("/api/projects").headers["ETag"]
+
+    response = client.get("/api/projects", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    mock_project_service.get_projects.assert_called_once_with(mock_user_id)
+
+    mock_session.exec.return_value.first.return_value = 1
+    response = client.get("/api/projects", headers={"If-None-Match": etag})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
 
 
 def test_add_project_success(client, mock_project_service):
@@ -93,6 +127,7 @@ def test_add_project_success(client, mock_project_service):
         "id": "3",
         "is_private": False,
         "last_entry_date": None,
+        "entry_count": 0,
         "link": None,
     }
 
@@ -173,6 +208,7 @@ def test_update_project_success(client, mock_project_service):
         "id": "1",
         "is_private": False,
         "last_entry_date": None,
+        "entry_count": 0,
         "link": None,
     }
 
@@ -214,7 +250,9 @@ def test_delete_project_success(client, mock_project_service):
 
     # Verify response
     assert response.status_code == status.HTTP_204_NO_CONTENT
-    mock_project_service.delete_project.assert_called_once_with("1")
+    mock_project_service.delete_project.assert_called_once_with(
+        "1", detach_entries=False
+    )
 
 
 def test_delete_project_not_found(client, mock_project_service):
@@ -227,4 +265,31 @@ def test_delete_project_not_found(client, mock_project_service):
 
     # Verify response
     assert response.status_code == status.HTTP_404_NOT_FOUND
-    mock_project_service.delete_project.assert_called_once_with("999")
+    mock_project_service.delete_project.assert_called_once_with(
+        "999", detach_entries=False
+    )
+
+
+def test_delete_projects_bulk(client, mock_project_service):
+    """Test bulk deletion of the current user's projects."""
+    authenticate(client, mock_user_id)
+    mock_project_service.delete_projects.return_value = ProjectBulkDeleteResult(
+        deleted_count=2
+    )
+
+    response = client.delete("/api/projects?ids=1&ids=2&detach_entries=true")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"deletedCount": 2}
+    mock_project_service.delete_projects.assert_called_once_with(
+        ["1", "2"], mock_user_id, detach_entries=True
+    )
+
+
+def test_delete_projects_requires_ids(client):
+    """Test that bulk deletion without ids is rejected."""
+    authenticate(client, mock_user_id)
+
+    response = client.delete("/api/projects")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
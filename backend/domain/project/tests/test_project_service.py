@@ -140,4 +140,4 @@ async def test_delete_project_success(project_service, mock_project_repo):
     await project_service.delete_project("1")
 
     # Verify results
-    mock_project_repo.delete_project.assert_called_once_with("1")
+    mock_project_repo.delete_project.assert_called_once_with("1", detach_entries=False)
@@ -0,0 +1,15 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Users whose technology name matcher is kept in memory, least recently used
+# evicted; a matcher holds one node per character of the user's names
+TECHNOLOGY_MATCHER_MAX_USERS = int(os.getenv("TECHNOLOGY_MATCHER_MAX_USERS", "256"))
+
+# Users whose technology co-occurrence matrix is kept in memory, least recently
+# used evicted; a matrix holds 8 bytes per pair of the user's technologies
+TECHNOLOGY_COOCCURRENCE_MAX_USERS = int(
+    os.getenv("TECHNOLOGY_COOCCURRENCE_MAX_USERS", "256")
+)
@@ -0,0 +1,165 @@
+"""Which of a user's technologies are used together, and how usage trends.
+
+A user's journal entry links are integer-coded and turned into a technology by
+technology count matrix with NumPy: entry ``n`` links technologies ``T_n``, so
+cell ``(a, b)`` counts the entries linking both ``a`` and ``b`` and the
+diagonal counts each technology's entries. The matrix is dense because a user
+has tens to hundreds of technologies, which makes a dense matrix smaller and
+faster to slice than a sparse one. Lift compares a pair's count to what
+independent use would give, over the entries that have technologies.
+
+Matrices are cached per user and tagged with the user's ``TECHNOLOGIES``
+collection version, which every link change bumps. A new entry written by
+this process is added to the cached matrix in place (see ``apply_entry``);
+any other change, in this process or another, is picked up by rebuilding the
+matrix on next use.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+from core.versioned_cache import VersionedCache
+from domain.technology.technology_config import TECHNOLOGY_COOCCURRENCE_MAX_USERS
+
+
+class PairCount(NamedTuple):
+    first_id: str
+    second_id: str
+    # Entries linking both technologies
+    count: int
+    # count / expected count if the two were used independently
+    lift: float
+
+
+def _group_pairs(entry_codes: np.ndarray, technology_codes: np.ndarray):
+    """Pair every link with every link of the same entry, itself included.
+
+    Returns the two technology codes of each pair, without a Python loop: an
+    entry with ``n`` links yields ``n * n`` pairs.
+    """
+    order = np.argsort(entry_codes, kind="stable")
+    entry_codes, technology_codes = entry_codes[order], technology_codes[order]
+    starts = np.flatnonzero(np.r_[True, entry_codes[1:] != entry_codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(entry_codes)])
+    # Per link: the size and first link of its entry
+    link_sizes = np.repeat(sizes, sizes)
+    link_starts = np.repeat(starts, sizes)
+    left = np.repeat(np.arange(len(entry_codes)), link_sizes)
+    # Position of each pair within its left link's run, 0..size-1
+    offsets = np.arange(len(left)) - np.repeat(
+        np.cumsum(link_sizes) - link_sizes, link_sizes
+    )
+    right = np.repeat(link_starts, link_sizes) + offsets
+    return technology_codes[left], technology_codes[right]
+
+
+class CooccurrenceMatrix:
+    """Entry counts of every pair of a user's linked technologies."""
+
+    def __init__(self, ids: list[str], counts: np.ndarray, entry_count: int) -> None:
+        self.ids = list(ids)
+        self.codes = {id: code for code, id in enumerate(self.ids)}
+        self.counts = counts
+        # Entries with at least one technology
+        self.entry_count = entry_count
+
+    @classmethod
+    def from_links(
+        cls, entry_ids: list[str], technology_ids: list[str]
+    ) -> "CooccurrenceMatrix":
+        """Build the matrix from ``(entry_id, technology_id)`` link columns."""
+        if not entry_ids:
+            return cls([], np.zeros((0, 0), dtype=np.int64), 0)
+        entries, entry_codes = np.unique(np.asarray(entry_ids), return_inverse=True)
+        ids, technology_codes = np.unique(
+            np.asarray(technology_ids), return_inverse=True
+        )
+        size = len(ids)
+        first, second = _group_pairs(entry_codes, technology_codes)
+        counts = np.bincount(first * size + second, minlength=size * size)
+        return cls(ids.tolist(), counts.reshape(size, size), len(entries))
+
+    def add_entry(self, technology_ids: list[str]) -> None:
+        """Count one more entry linking ``technology_ids``."""
+        new_ids = [id for id in dict.fromkeys(technology_ids) if id not in self.codes]
+        if new_ids:
+            for id in new_ids:
+                self.codes[id] = len(self.ids)
+                self.ids.append(id)
+            grow = len(new_ids)
+            self.counts = np.pad(self.counts, ((0, grow), (0, grow)))
+        codes = np.array(sorted({self.codes[id] for id in technology_ids}))
+        if len(codes):
+            self.counts[np.ix_(codes, codes)] += 1
+            self.entry_count += 1
+
+    def top_pairs(
+        self, limit: int, min_count: int = 1, by_lift: bool = False
+    ) -> list[PairCount]:
+        """Return the ``limit`` pairs used together most often, or with the
+        highest lift, among those used together ``min_count`` times or more."""
+        first, second = np.triu_indices(len(self.ids), k=1)
+        counts = self.counts[first, second]
+        keep = counts >= max(min_count, 1)
+        first, second, counts = first[keep], second[keep], counts[keep]
+        usage = np.diag(self.counts)
+        lift = counts * self.entry_count / (usage[first] * usage[second])
+        primary, secondary = (lift, counts) if by_lift else (counts, lift)
+        # lexsort sorts by its last key first
+        best = np.lexsort((-secondary, -primary))[:limit]
+        return [
+            PairCount(
+                self.ids[first[n]], self.ids[second[n]], int(counts[n]), float(lift[n])
+            )
+            for n in best
+        ]
+
+
+def usage_trends(
+    series: np.ndarray, totals: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fit a line to each technology's monthly share of entries.
+
+    Args:
+        series: Entry counts, technologies by months
+        totals: Entries per month
+
+    Returns:
+        The share of each technology and month, and the least-squares slope
+        of each technology's share, as a fraction of entries per month
+    """
+    shares = np.divide(series, totals, out=np.zeros(series.shape), where=totals > 0)
+    months = np.arange(series.shape[1]) - (series.shape[1] - 1) / 2
+    denominator = months @ months
+    slopes = shares @ months / denominator if denominator else np.zeros(len(series))
+    return shares, slopes
+
+
+class CooccurrenceCache(VersionedCache[CooccurrenceMatrix]):
+    """LRU cache of ``CooccurrenceMatrix`` by user."""
+
+    def __init__(self, max_users: int = TECHNOLOGY_COOCCURRENCE_MAX_USERS) -> None:
+        super().__init__(max_users)
+
+    def apply_entry(
+        self,
+        user_id: str,
+        previous_version: int,
+        version: int,
+        technology_ids: list[str],
+    ) -> None:
+        """Count a new entry, given the versions read before and after it was
+        written.
+
+        The entry is counted only if its write is the one bump in between and
+        the cached matrix is at ``previous_version``; otherwise the matrix is
+        dropped and rebuilt when next used.
+        """
+        if version != previous_version + 1:
+            self.discard(user_id)
+            return
+        self.advance(user_id, version, lambda matrix: matrix.add_entry(technology_ids))
+
+
+# Shared by the requests of this process
+technology_cooccurrences = CooccurrenceCache()
@@ -0,0 +1,143 @@
+"""Find a user's technologies mentioned in a text, for tag suggestions.
+
+All of a user's technology names are compiled into one Aho-Corasick automaton,
+so a text is scanned once whatever the number of technologies: the cost is
+linear in the text's length plus the number of raw matches. Names and text are
+compared case-insensitively with runs of whitespace collapsed, and a name must
+not start or end inside a word: "Go" is not found in "good", while "C++",
+which ends in a symbol, is found in "C++20". A name is not followed by "#" or
+"+" either, which would make it another language: "C" is not found in "C#" or
+"C++".
+
+Automatons are cached per user and tagged with the user's ``TECHNOLOGY_NAMES``
+collection version, which ``TechnologyRepo`` bumps whenever a technology is
+added, renamed or deleted; a stale automaton is rebuilt on next use, in every
+process sharing the database.
+"""
+
+from collections import deque
+from typing import Iterable
+
+from core.versioned_cache import VersionedCache
+from domain.technology.technology_config import TECHNOLOGY_MATCHER_MAX_USERS
+
+
+def normalize(text: str) -> str:
+    """Fold case and collapse whitespace, the same way for names and texts."""
+    return " ".join(text.casefold().split())
+
+
+def _is_word(character: str) -> bool:
+    return character.isalnum() or character == "_"
+
+
+def _continues_name(character: str) -> bool:
+    """Whether ``character`` extends a name ending in a word character."""
+    return _is_word(character) or character in "#+"
+
+
+class TechnologyMatcher:
+    """Aho-Corasick automaton over technology names."""
+
+    def __init__(self, technologies: Iterable[tuple[str, str]]) -> None:
+        """Compile ``(id, name)`` pairs; names differing only in case or
+        spacing share one pattern and match together."""
+        # Node 0 is the root; a node is the pattern prefix spelled to reach it
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # The pattern ending at a node, if any: its length, edge word-ness and ids
+        self._pattern: list[tuple[int, bool, bool, list[str]] | None] = [None]
+        # Nearest node on the failure chain that ends a pattern, 0 for none
+        self._dictionary_link: list[int] = [0]
+
+        for id, name in technologies:
+            pattern = normalize(name)
+            if pattern:
+                self._add(id, pattern)
+        self._link()
+
+    def _add(self, id: str, pattern: str) -> None:
+        node = 0
+        for character in pattern:
+            next_node = self._goto[node].get(character)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][character] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._pattern.append(None)
+                self._dictionary_link.append(0)
+            node = next_node
+        if self._pattern[node] is None:
+            self._pattern[node] = (
+                len(pattern),
+                _is_word(pattern[0]),
+                _is_word(pattern[-1]),
+                [],
+            )
+        self._pattern[node][3].append(id)
+
+    def _link(self) -> None:
+        """Compute failure and dictionary links breadth first."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for character, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and character not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(character, 0)
+                suffix = self._fail[child]
+                self._dictionary_link[child] = (
+                    suffix
+                    if self._pattern[suffix] is not None
+                    else self._dictionary_link[suffix]
+                )
+                queue.append(child)
+
+    def find(self, text: str) -> list[str]:
+        """Return the ids of the technologies named in ``text``, in order of
+        first mention.
+
+        Overlapping mentions resolve leftmost-longest, so "React Native" tags
+        "React Native" and not also "React".
+        """
+        text = normalize(text)
+        matches: list[tuple[int, int, list[str]]] = []
+        node = 0
+        for end, character in enumerate(text, start=1):
+            while node and character not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(character, 0)
+            found = (
+                node if self._pattern[node] is not None else self._dictionary_link[node]
+            )
+            while found:
+                length, word_start, word_end, ids = self._pattern[found]
+                start = end - length
+                if not (
+                    (word_start and start > 0 and _is_word(text[start - 1]))
+                    or (word_end and end < len(text) and _continues_name(text[end]))
+                ):
+                    matches.append((start, end, ids))
+                found = self._dictionary_link[found]
+
+        matches.sort(key=lambda match: (match[0], -match[1]))
+        found_ids: dict[str, None] = {}
+        covered = 0
+        for start, end, ids in matches:
+            if start >= covered:
+                found_ids.update(dict.fromkeys(ids))
+                covered = end
+        return list(found_ids)
+
+
+class TechnologyMatcherCache(VersionedCache[TechnologyMatcher]):
+    """LRU cache of ``TechnologyMatcher`` by user."""
+
+    def __init__(self, max_users: int = TECHNOLOGY_MATCHER_MAX_USERS) -> None:
+        super().__init__(max_users)
+
+
+# Shared by the requests of this process
+technology_matchers = TechnologyMatcherCache()
@@ -1,12 +1,25 @@
 import asyncio
+from datetime import date
 from logging import getLogger
 
-from database.models import JournalEntryTechnologyLink, Technology
+from database.activity import ALL, recount_technology_activity
+from database.collection_versions import (
+    Collection,
+    bump_collection_for_all_users,
+    bump_collection_versions,
+    get_collection_version,
+)
+from database.models import (
+    JournalEntryTechnologyLink,
+    MonthlyActivity,
+    Technology,
+)
 from database.session import SessionDep
 from domain.technology.technology_exceptions import (
     ErrorCode,
     TechnologyDatabaseError,
     TechnologyNotFoundError,
+    TechnologyValidationError,
 )
 from domain.technology.technology_schema import (
     TechnologyCreate,
@@ -16,10 +29,10 @@ from domain.technology.technology_schema import (
 
 from enums import Language
 from fastapi import status
-from sqlalchemy import func, label, text
+from sqlalchemy import delete, exists, func, insert, literal
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import select, update
 
 logger = getLogger(__name__)
 
@@ -28,27 +41,14 @@ class TechnologyRepo:
     def __init__(self, session: SessionDep):
         self.session = session
 
-    @staticmethod
-    def _build_base_query(usage_count, user_id: str):
-        """Build the base query for retrieving technologies with usage counts."""
-        return (
-            select(
-                Technology,
-                label("usage_count", func.coalesce(usage_count.c.usage_count, 0)),
-            )
-            .where(Technology.user_id == user_id)
-            .outerjoin(
-                usage_count,
-                Technology.id == usage_count.c.technology_id,
-            )
-            .order_by(text("usage_count DESC"), Technology.name)
-        )
-
     async def get_technologies(
         self, user_id: str, language: Language | None = None
     ) -> list[TechnologyWithCount]:
         """Get all technologies from the database with their usage counts.
 
+        Reads the materialized ``usage_count`` column in the order of
+        ``ix_technology_user_id_usage_count_name``; no link rows are counted.
+
         Args:
             language: Optional filter by programming language
 
@@ -59,8 +59,11 @@ class TechnologyRepo:
             TechnologyDatabaseError: If database operation fails
         """
         try:
-            usage_count = self._build_usage_count_subquery()
-            query = self._build_base_query(usage_count, user_id)
+            query = (
+                select(Technology)
+                .where(Technology.user_id == user_id)
+                .order_by(Technology.usage_count.desc(), Technology.name)
+            )
             query = self._apply_filters(query, language)
 
             results = await self.session.exec(query)
@@ -133,6 +136,122 @@ class TechnologyRepo:
                 params={"error": str(e)},
             )
 
+    async def get_technology_names(self, user_id: str) -> list[tuple[str, str]]:
+        """Get the ``(id, name)`` of every technology of a user.
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(Technology.id, Technology.name).where(
+                    Technology.user_id == user_id
+                )
+            )
+            return results.all()
+
+        except SQLAlchemyError as e:
+            raise TechnologyDatabaseError(
+                code=ErrorCode.DATABASE_ERROR,
+                message="Failed to fetch technologies",
+                params={"error": str(e)},
+            )
+
+    async def get_names_version(self, user_id: str) -> int:
+        """Get the version of a user's technology names, bumped by every add,
+        rename and delete.
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        try:
+            return await get_collection_version(
+                self.session, user_id, Collection.TECHNOLOGY_NAMES
+            )
+
+        except SQLAlchemyError as e:
+            raise TechnologyDatabaseError(
+                code=ErrorCode.DATABASE_ERROR,
+                message="Failed to fetch technology names version",
+                params={"error": str(e)},
+            )
+
+    async def get_links_version(self, user_id: str) -> int:
+        """Get the version of a user's technologies, bumped by every change to
+        their journal entry links among others.
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        try:
+            return await get_collection_version(
+                self.session, user_id, Collection.TECHNOLOGIES
+            )
+
+        except SQLAlchemyError as e:
+            raise TechnologyDatabaseError(
+                code=ErrorCode.DATABASE_ERROR,
+                message="Failed to fetch technologies version",
+                params={"error": str(e)},
+            )
+
+    async def get_links(self, user_id: str) -> tuple[list[str], list[str]]:
+        """Get a user's journal entry links as entry ID and technology ID
+        columns.
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(
+                    JournalEntryTechnologyLink.journal_entry_id,
+                    JournalEntryTechnologyLink.technology_id,
+                ).where(JournalEntryTechnologyLink.user_id == user_id)
+            )
+            links = results.all()
+            return [link[0] for link in links], [link[1] for link in links]
+
+        except SQLAlchemyError as e:
+            raise TechnologyDatabaseError(
+                code=ErrorCode.DATABASE_ERROR,
+                message="Failed to fetch technology links",
+                params={"error": str(e)},
+            )
+
+    async def get_monthly_usage(
+        self, user_id: str, start: date, end: date
+    ) -> list[tuple[date, str, int]]:
+        """Get a user's ``(month, technology_id, entry_count)`` for the months
+        starting in ``[start, end]``, from the activity rollups.
+
+        Rows with ``technology_id`` ``ALL`` count all of the month's entries.
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        try:
+            results = await self.session.exec(
+                select(
+                    MonthlyActivity.month,
+                    MonthlyActivity.technology_id,
+                    MonthlyActivity.entry_count,
+                ).where(
+                    MonthlyActivity.user_id == user_id,
+                    MonthlyActivity.project_id == ALL,
+                    MonthlyActivity.month >= start,
+                    MonthlyActivity.month <= end,
+                )
+            )
+            return results.all()
+
+        except SQLAlchemyError as e:
+            raise TechnologyDatabaseError(
+                code=ErrorCode.DATABASE_ERROR,
+                message="Failed to fetch technology usage",
+                params={"error": str(e)},
+            )
+
     async def add_technology(
         self, technology: TechnologyCreate, user_id: str
     ) -> Technology:
@@ -156,6 +275,12 @@ class TechnologyRepo:
                 user_id=user_id,
             )
             self.session.add(new_technology)
+            await bump_collection_versions(
+                self.session,
+                user_id,
+                Collection.TECHNOLOGIES,
+                Collection.TECHNOLOGY_NAMES,
+            )
             await self.session.commit()
             await self.session.refresh(new_technology)
             return new_technology
@@ -183,31 +308,65 @@ class TechnologyRepo:
                 params={"error": str(e)},
             )
 
-    async def delete_technology(self, tech_id: str) -> None:
+    async def delete_technology(
+        self, tech_id: str, force: bool = False, reassign_to: str | None = None
+    ) -> None:
         """Delete a technology from the database.
 
+        Whether the technology is still linked to journal entries is answered by
+        a single ``EXISTS`` query; the entries themselves are never loaded.
+
         Args:
             tech_id: Unique identifier of the technology to delete
+            force: Delete the technology's journal entry links along with it
+            reassign_to: Move the technology's journal entry links to this
+                technology of the same user before deleting it
 
         Raises:
             TechnologyNotFoundError: If technology with given ID does not exist
+            TechnologyValidationError: If ``reassign_to`` is not another
+                technology of the same user
             TechnologyDatabaseError: If database operation fails or technology has journal entries
         """
         try:
-            technology = await self.get_technology(tech_id)
-            has_journal_entries = len(technology.journal_entries) > 0
-            if has_journal_entries:
+            technology, in_use = await self._get_technology_in_use(tech_id)
+            if in_use and reassign_to is not None:
+                await self._reassign_links(technology, reassign_to)
+                await recount_technology_activity(
+                    self.session, technology.user_id, tech_id, reassign_to
+                )
+            elif in_use and force:
+                await self.session.exec(
+                    delete(JournalEntryTechnologyLink).where(
+                        JournalEntryTechnologyLink.technology_id == tech_id
+                    )
+                )
+                await recount_technology_activity(
+                    self.session, technology.user_id, tech_id
+                )
+            elif in_use:
                 raise TechnologyDatabaseError(
                     code=ErrorCode.INVALID_OPERATION,
                     message="Cannot delete technology that is referenced by journal entries",
                     params={
                         "id": tech_id,
-                        "usage_count": len(technology.journal_entries),
+                        "usage_count": technology.usage_count,
                     },
                     status_code=status.HTTP_409_CONFLICT,
                 )
 
-            await asyncio.shield(self.session.delete(technology))
+            await bump_collection_versions(
+                self.session,
+                technology.user_id,
+                Collection.TECHNOLOGIES,
+                Collection.TECHNOLOGY_NAMES,
+                *([Collection.JOURNAL_ENTRIES] if in_use else []),
+            )
+            # A core DELETE; session.delete would load the many-to-many
+            # collection to clean up link rows that are already gone
+            await asyncio.shield(
+                self.session.exec(delete(Technology).where(Technology.id == tech_id))
+            )
             await asyncio.shield(self.session.commit())
             logger.info(f"Deleted technology with id {tech_id}")
 
@@ -220,6 +379,80 @@ class TechnologyRepo:
                 params={"error": str(e)},
             )
 
+    async def _get_technology_in_use(self, tech_id: str) -> tuple[Technology, bool]:
+        """Fetch a technology and whether any link references it in one query.
+
+        Raises:
+            TechnologyNotFoundError: If technology with given ID does not exist
+        """
+        in_use = (
+            exists()
+            .where(JournalEntryTechnologyLink.technology_id == Technology.id)
+            .label("in_use")
+        )
+        result = await self.session.exec(
+            select(Technology, in_use).where(Technology.id == tech_id)
+        )
+        row = result.first()
+        if not row:
+            raise TechnologyNotFoundError(
+                code=ErrorCode.TECHNOLOGY_NOT_FOUND,
+                message="Technology not found",
+                params={"id": tech_id},
+            )
+        return row[0], bool(row[1])
+
+    async def _reassign_links(self, technology: Technology, target_id: str) -> None:
+        """Move all links of ``technology`` to ``target_id`` without committing.
+
+        Entries already linked to the target keep their single link. Runs as one
+        ``INSERT ... SELECT`` and one ``DELETE`` regardless of the link count.
+
+        Raises:
+            TechnologyValidationError: If the target is not another technology
+                of the same user
+        """
+        target = await self.session.get(Technology, target_id)
+        if (
+            target is None
+            or target.id == technology.id
+            or target.user_id != technology.user_id
+        ):
+            raise TechnologyValidationError(
+                code=ErrorCode.VALIDATION_ERROR,
+                message="Technology to reassign entries to must be another technology of the same user",
+                params={"id": technology.id, "reassign_to": target_id},
+            )
+
+        source = JournalEntryTechnologyLink.__table__.alias("source")
+        existing = JournalEntryTechnologyLink.__table__.alias("existing")
+        moved = await self.session.exec(
+            insert(JournalEntryTechnologyLink).from_select(
+                ["journal_entry_id", "technology_id", "user_id"],
+                select(
+                    source.c.journal_entry_id,
+                    literal(target_id),
+                    source.c.user_id,
+                ).where(
+                    source.c.technology_id == technology.id,
+                    ~exists().where(
+                        existing.c.journal_entry_id == source.c.journal_entry_id,
+                        existing.c.technology_id == target_id,
+                    ),
+                ),
+            )
+        )
+        await self.session.exec(
+            delete(JournalEntryTechnologyLink).where(
+                JournalEntryTechnologyLink.technology_id == technology.id
+            )
+        )
+        await self.session.exec(
+            update(Technology)
+            .where(Technology.id == target_id)
+            .values(usage_count=Technology.usage_count + moved.rowcount)
+        )
+
     async def update_technology(
         self, tech_id: str, technology_data: TechnologyUpdate
     ) -> Technology:
@@ -245,6 +478,7 @@ class TechnologyRepo:
 
             # Update only the provided fields
             updated = False
+            renamed = update_data.get("name", technology.name) != technology.name
             for key, value in update_data.items():
                 if getattr(technology, key) != value:
                     setattr(technology, key, value)  # Update attributes dynamically
@@ -255,6 +489,14 @@ class TechnologyRepo:
                 self.session.add(
                     technology
                 )  # Add the modified object back to the session context
+                # Entries embed their technologies, so their listing changes too
+                await bump_collection_versions(
+                    self.session,
+                    technology.user_id,
+                    Collection.TECHNOLOGIES,
+                    Collection.JOURNAL_ENTRIES,
+                    *([Collection.TECHNOLOGY_NAMES] if renamed else []),
+                )
                 await self.session.commit()
                 await self.session.refresh(technology)
                 logger.info(f"Updated technology with id {tech_id}")
@@ -289,19 +531,44 @@ class TechnologyRepo:
                 params={"error": str(e)},
             )
 
-    @staticmethod
-    def _build_usage_count_subquery():
-        """Build a subquery to count technology usage in journal entries."""
-        return (
-            select(
-                JournalEntryTechnologyLink.technology_id,
-                func.count(JournalEntryTechnologyLink.journal_entry_id).label(
-                    "usage_count"
-                ),
-            )
-            .group_by(JournalEntryTechnologyLink.technology_id)
-            .subquery()
+    async def recount_usage(self) -> int:
+        """Recompute every technology's ``usage_count`` from the link table.
+
+        Repairs counters that drifted, e.g. after links were written outside
+        ``JournalEntryRepo``.
+
+        Returns:
+            int: Number of technologies whose count was corrected
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        actual_count = (
+            select(func.count())
+            .select_from(JournalEntryTechnologyLink)
+            .where(JournalEntryTechnologyLink.technology_id == Technology.id)
+            .scalar_subquery()
         )
+        try:
+            result = await self.session.exec(
+                update(Technology)
+                .where(Technology.usage_count != actual_count)
+                .values(usage_count=actual_count)
+                .execution_options(synchronize_session=False)
+            )
+            await bump_collection_for_all_users(self.session, Collection.TECHNOLOGIES)
+            await self.session.commit()
+            # Loaded technologies may hold the counts that were just corrected
+            self.session.expire_all()
+            return result.rowcount
+
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise TechnologyDatabaseError(
+                code=ErrorCode.DATABASE_ERROR,
+                message="Failed to recount technology usage",
+                params={"error": str(e)},
+            )
 
     @staticmethod
     def _apply_filters(query, language: Language | None):
@@ -319,7 +586,7 @@ class TechnologyRepo:
                 name=tech.name,
                 description=tech.description,
                 language=tech.language,
-                usage_count=count,
+                usage_count=tech.usage_count,
             )
-            for tech, count in results
+            for tech in results
         ]
@@ -1,24 +1,43 @@
+from datetime import date
+
 from authx import TokenPayload
 
+from core.conditional_get import conditional_list
 from core.exceptions import BaseDomainError
+from core.responses import ModelResponse
+from database.collection_versions import Collection
 from database.models import Technology
 from domain.technology.technology_dependencies import TechnologyServiceDep
 from domain.technology.technology_schema import (
+    DEFAULT_PAIR_LIMIT,
+    DEFAULT_TREND_LIMIT,
+    DEFAULT_TREND_MONTHS,
+    MAX_PAIR_LIMIT,
+    MAX_TREND_LIMIT,
+    MAX_TREND_MONTHS,
+    PairOrder,
     TechnologyCreate,
+    TechnologyPair,
+    TechnologyTrends,
     TechnologyWithCount,
     TechnologyUpdate,
 )
 from enums import Language
-from fastapi import APIRouter, status, Depends
+from fastapi import APIRouter, Query, Response, status, Depends
 from domain.auth.auth_config import security
 
 
 router = APIRouter()
 
 
-@router.get("", response_model=list[TechnologyWithCount])
+@router.get(
+    "",
+    response_model=list[TechnologyWithCount],
+    dependencies=[Depends(conditional_list(Collection.TECHNOLOGIES))],
+)
 async def get_technologies(
     service: TechnologyServiceDep,
+    response: Response,
     language: Language | None = None,
     payload: TokenPayload = Depends(security.access_token_required),
 ):
@@ -36,13 +55,72 @@ async def get_technologies(
         technologies = await service.get_technologies(
             user_id=payload.user_id, language=language
         )
-        print(technologies)
-        return technologies
+        return ModelResponse(
+            technologies, list[TechnologyWithCount], headers=response.headers
+        )
     except BaseDomainError as e:
         # Domain exceptions are already properly formatted with status code and detail
         raise e
 
 
+@router.get(
+    "/cooccurrence",
+    response_model=list[TechnologyPair],
+    dependencies=[Depends(conditional_list(Collection.TECHNOLOGIES))],
+)
+async def get_technology_pairs(
+    service: TechnologyServiceDep,
+    response: Response,
+    limit: int = Query(DEFAULT_PAIR_LIMIT, ge=1, le=MAX_PAIR_LIMIT),
+    by: PairOrder = PairOrder.COUNT,
+    min_count: int = Query(1, ge=1),
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Get the pairs of technologies most used in the same journal entries.
+
+    Args:
+        limit: Number of pairs
+        by: Rank by shared entry ``count`` or by ``lift``
+        min_count: Leave out pairs sharing fewer entries
+
+    Returns:
+        list[TechnologyPair]: Best ranked first
+    """
+    try:
+        pairs = await service.get_pairs(payload.user_id, limit, by, min_count)
+        return ModelResponse(pairs, list[TechnologyPair], headers=response.headers)
+    except BaseDomainError as e:
+        raise e
+
+
+@router.get("/trends", response_model=TechnologyTrends)
+async def get_technology_trends(
+    service: TechnologyServiceDep,
+    end: date | None = None,
+    months: int = Query(DEFAULT_TREND_MONTHS, ge=2, le=MAX_TREND_MONTHS),
+    limit: int = Query(DEFAULT_TREND_LIMIT, ge=1, le=MAX_TREND_LIMIT),
+    payload: TokenPayload = Depends(security.access_token_required),
+):
+    """Get the technologies whose share of journal entries rose or declined
+    the most, with their entry counts per month.
+
+    Args:
+        end: Any day of the last month; defaults to today
+        months: Number of months, the one of ``end`` included
+        limit: Number of rising and of declining technologies
+
+    Returns:
+        TechnologyTrends: Monthly counts, steepest trends first
+    """
+    try:
+        trends = await service.get_trends(
+            payload.user_id, end or date.today(), months, limit
+        )
+        return ModelResponse(trends)
+    except BaseDomainError as e:
+        raise e
+
+
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=Technology)
 async def add_technology(
     technology: TechnologyCreate,
@@ -93,17 +171,24 @@ async def update_technology(
 async def delete_technology(
     tech_id: str,
     service: TechnologyServiceDep,
+    force: bool = False,
+    reassign_to: str | None = None,
 ) -> None:
     """Delete a technology from the database by its ID.
 
+    A technology used by journal entries is only deleted with ``force`` (the
+    entries lose it) or ``reassign_to`` (the entries get that technology instead).
+
     Args:
         tech_id: Unique identifier of the technology to delete
         service: Technology service instance
+        force: Remove the technology from its journal entries
+        reassign_to: ID of the technology to move its journal entries to
 
     Raises:
         HTTPException: If the request fails
     """
     try:
-        await service.delete_technology(tech_id)
+        await service.delete_technology(tech_id, force=force, reassign_to=reassign_to)
     except BaseDomainError as e:
         raise e
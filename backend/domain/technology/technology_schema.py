@@ -1,7 +1,18 @@
+from datetime import date
+from enum import Enum
+
 from core.schema.base import BaseSchema
 from enums import Language
 from typing import Optional
 
+# Bounds of the co-occurrence and trend queries
+DEFAULT_PAIR_LIMIT = 20
+MAX_PAIR_LIMIT = 100
+DEFAULT_TREND_MONTHS = 6
+MAX_TREND_MONTHS = 60
+DEFAULT_TREND_LIMIT = 5
+MAX_TREND_LIMIT = 50
+
 
 class TechnologyBase(BaseSchema):
     name: str
@@ -29,3 +40,41 @@ class TechnologyUpdate(BaseSchema):
     name: Optional[str] = None
     description: Optional[str] = None
     language: Optional[str] = None
+
+
+class PairOrder(str, Enum):
+    """How technology pairs are ranked."""
+
+    COUNT = "count"
+    LIFT = "lift"
+
+
+class TechnologyPair(BaseSchema):
+    """Two technologies used in the same journal entries."""
+
+    technologies: list[TechnologyRead]
+    # Entries linking both
+    count: int
+    # Above 1 when used together more often than if used independently
+    lift: float
+
+
+class TechnologyTrend(BaseSchema):
+    id: str
+    name: str
+    # Entries per month of ``TechnologyTrends.months``
+    counts: list[int]
+    # Change of the technology's share of the month's entries per month,
+    # fitted over the range; 0.05 gains 5 points a month
+    slope: float
+
+
+class TechnologyTrends(BaseSchema):
+    """How a user's technologies' share of their entries changes by month."""
+
+    months: list[date]  # first days, in order
+    # All entries per month
+    totals: list[int]
+    # Steepest first
+    rising: list[TechnologyTrend]
+    declining: list[TechnologyTrend]
@@ -1,18 +1,64 @@
+from datetime import date
+
+import numpy as np
 from core.exceptions import BaseDomainError
+from core.responses import type_adapter
+from database.activity import ALL
 from database.models import Technology
-from domain.technology.technology_exceptions import TechnologyNotFoundError
+from domain.technology.technology_cooccurrence import (
+    CooccurrenceCache,
+    CooccurrenceMatrix,
+    technology_cooccurrences,
+    usage_trends,
+)
+from domain.technology.technology_exceptions import (
+    TechnologyDatabaseError,
+    TechnologyNotFoundError,
+)
+from domain.technology.technology_matcher import (
+    TechnologyMatcher,
+    TechnologyMatcherCache,
+    technology_matchers,
+)
 from domain.technology.technology_repo import TechnologyRepo
 from domain.technology.technology_schema import (
+    DEFAULT_PAIR_LIMIT,
+    DEFAULT_TREND_LIMIT,
+    DEFAULT_TREND_MONTHS,
+    PairOrder,
     TechnologyCreate,
+    TechnologyPair,
+    TechnologyRead,
+    TechnologyTrend,
+    TechnologyTrends,
     TechnologyWithCount,
     TechnologyUpdate,
 )
 from enums import Language
 
+# Slopes closer to 0 than this are flat, not rising or declining
+_FLAT_SLOPE = 1e-9
+
+
+def _month_starts(end: date, count: int) -> list[date]:
+    """First days of the ``count`` months up to the one of ``end``."""
+    last = end.year * 12 + end.month - 1
+    return [
+        date(month // 12, month % 12 + 1, 1)
+        for month in range(last - count + 1, last + 1)
+    ]
+
 
 class TechnologyService:
-    def __init__(self, repo: TechnologyRepo) -> None:
+    def __init__(
+        self,
+        repo: TechnologyRepo,
+        matchers: TechnologyMatcherCache = technology_matchers,
+        cooccurrences: CooccurrenceCache = technology_cooccurrences,
+    ) -> None:
         self.repo = repo
+        self.matchers = matchers
+        self.cooccurrences = cooccurrences
 
     async def get_technologies(
         self, user_id: str, language: Language | None = None
@@ -29,7 +75,10 @@ class TechnologyService:
         Raises:
             TechnologyError: If database operation fails
         """
-        return await self.repo.get_technologies(language=language, user_id=user_id)
+        technologies = await self.repo.get_technologies(
+            language=language, user_id=user_id
+        )
+        return type_adapter(list[TechnologyWithCount]).validate_python(technologies)
 
     async def get_technologies_by_ids(self, ids: list[str]) -> list[Technology]:
         """Get technologies by their IDs.
@@ -50,6 +99,210 @@ class TechnologyService:
 
         return technologies
 
+    async def suggest_technology_ids(self, user_id: str, content: str) -> list[str]:
+        """Find the user's technologies named in ``content``.
+
+        Args:
+            user_id: Unique identifier of the user
+            content: Text to scan, e.g. a journal entry being written
+
+        Returns:
+            list[str]: IDs of the technologies, in order of first mention
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        # Read before the names, so names changed in between are cached under
+        # the older version and rebuilt next time rather than missed
+        version = await self.repo.get_names_version(user_id)
+        matcher = self.matchers.get(user_id, version)
+        if matcher is None:
+            matcher = TechnologyMatcher(await self.repo.get_technology_names(user_id))
+            self.matchers.put(user_id, version, matcher)
+        return matcher.find(content)
+
+    async def suggest_technologies(
+        self, user_id: str, content: str
+    ) -> list[TechnologyRead]:
+        """Suggest tags for a text: the user's technologies it names.
+
+        Args:
+            user_id: Unique identifier of the user
+            content: Text to scan, e.g. a journal entry being written
+
+        Returns:
+            list[TechnologyRead]: The technologies, in order of first mention
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        ids = await self.suggest_technology_ids(user_id, content)
+        if not ids:
+            return []
+        technologies = {
+            technology.id: technology
+            for technology in await self.repo.get_technologies_by_ids(ids)
+        }
+        return type_adapter(list[TechnologyRead]).validate_python(
+            [technologies[id] for id in ids if id in technologies]
+        )
+
+    async def get_links_version(self, user_id: str) -> int:
+        """Get the version of a user's journal entry links, to pass to
+        ``record_new_entry``.
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        return await self.repo.get_links_version(user_id)
+
+    async def record_new_entry(
+        self, user_id: str, previous_version: int, technology_ids: list[str]
+    ) -> None:
+        """Count a journal entry just written in the user's cached
+        co-occurrence matrix, instead of rebuilding it on next use.
+
+        Args:
+            user_id: ID of the user owning the entry
+            previous_version: ``get_links_version`` read before the entry was
+                written
+            technology_ids: IDs of the technologies linked to the entry
+        """
+        try:
+            version = await self.repo.get_links_version(user_id)
+        except TechnologyDatabaseError:
+            # The entry is saved either way; rebuild the matrix on next use
+            self.cooccurrences.discard(user_id)
+            return
+        self.cooccurrences.apply_entry(
+            user_id, previous_version, version, technology_ids
+        )
+
+    async def _cooccurrence_matrix(self, user_id: str) -> CooccurrenceMatrix:
+        version = await self.repo.get_links_version(user_id)
+        matrix = self.cooccurrences.get(user_id, version)
+        if matrix is None:
+            entry_ids, technology_ids = await self.repo.get_links(user_id)
+            matrix = CooccurrenceMatrix.from_links(entry_ids, technology_ids)
+            # A link written while the links were read would be in a matrix
+            # tagged with the version before it, and counted again by
+            # ``apply_entry``; such a matrix serves this request only
+            if await self.repo.get_links_version(user_id) == version:
+                self.cooccurrences.put(user_id, version, matrix)
+        return matrix
+
+    async def get_pairs(
+        self,
+        user_id: str,
+        limit: int = DEFAULT_PAIR_LIMIT,
+        order: PairOrder = PairOrder.COUNT,
+        min_count: int = 1,
+    ) -> list[TechnologyPair]:
+        """Get the pairs of technologies a user links to the same journal
+        entries.
+
+        Args:
+            user_id: ID of the user owning the technologies
+            limit: Number of pairs to return
+            order: Rank by the number of shared entries or by lift, ties
+                broken by the other
+            min_count: Leave out pairs sharing fewer entries, e.g. to keep
+                rare pairs from topping the lift ranking
+
+        Returns:
+            list[TechnologyPair]: Best ranked first
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        matrix = await self._cooccurrence_matrix(user_id)
+        pairs = matrix.top_pairs(limit, min_count, by_lift=order is PairOrder.LIFT)
+        if not pairs:
+            return []
+        technologies = {
+            technology.id: TechnologyRead.model_validate(technology)
+            for technology in await self.repo.get_technologies_by_ids(
+                list({id for pair in pairs for id in pair[:2]})
+            )
+        }
+        return [
+            TechnologyPair(
+                technologies=[
+                    technologies[pair.first_id],
+                    technologies[pair.second_id],
+                ],
+                count=pair.count,
+                lift=pair.lift,
+            )
+            for pair in pairs
+            if pair.first_id in technologies and pair.second_id in technologies
+        ]
+
+    async def get_trends(
+        self,
+        user_id: str,
+        end: date,
+        months: int = DEFAULT_TREND_MONTHS,
+        limit: int = DEFAULT_TREND_LIMIT,
+    ) -> TechnologyTrends:
+        """Get a user's technologies whose share of journal entries rose or
+        declined the most over the months up to ``end``.
+
+        Args:
+            user_id: ID of the user owning the technologies
+            end: Any day of the last month
+            months: Number of months, the one of ``end`` included
+            limit: Number of rising and of declining technologies
+
+        Returns:
+            TechnologyTrends: Monthly counts, steepest trends first
+
+        Raises:
+            TechnologyDatabaseError: If database operation fails
+        """
+        month_starts = _month_starts(end, months)
+        rows = await self.repo.get_monthly_usage(user_id, month_starts[0], end)
+        if not rows:
+            return TechnologyTrends(
+                months=month_starts, totals=[0] * months, rising=[], declining=[]
+            )
+
+        first_month = month_starts[0].year * 12 + month_starts[0].month
+        row_months, row_ids, row_counts = zip(*rows)
+        columns = np.array(
+            [month.year * 12 + month.month - first_month for month in row_months]
+        )
+        ids, codes = np.unique(np.asarray(row_ids), return_inverse=True)
+        series = np.zeros((len(ids), months), dtype=np.int64)
+        np.add.at(series, (codes, columns), row_counts)
+        is_total = ids == ALL
+        totals = series[is_total].sum(axis=0)
+        ids, series = ids[~is_total], series[~is_total]
+        _, slopes = usage_trends(series, totals)
+
+        names = dict(await self.repo.get_technology_names(user_id))
+
+        def trends(order: np.ndarray) -> list[TechnologyTrend]:
+            return [
+                TechnologyTrend(
+                    id=ids[n],
+                    name=names[ids[n]],
+                    counts=series[n].tolist(),
+                    slope=float(slopes[n]),
+                )
+                for n in order
+                if ids[n] in names
+            ][:limit]
+
+        rising = np.argsort(-slopes, kind="stable")
+        declining = np.argsort(slopes, kind="stable")
+        return TechnologyTrends(
+            months=month_starts,
+            totals=totals.tolist(),
+            rising=trends(rising[slopes[rising] > _FLAT_SLOPE]),
+            declining=trends(declining[slopes[declining] < -_FLAT_SLOPE]),
+        )
+
     async def update_technology(
         self, technology: TechnologyUpdate, tech_id: str
     ) -> Technology:
@@ -88,19 +341,26 @@ class TechnologyService:
         except Exception as e:
             raise Exception(f"Unexpected error in technology service: {str(e)}")
 
-    async def delete_technology(self, tech_id: str):
+    async def delete_technology(
+        self, tech_id: str, force: bool = False, reassign_to: str | None = None
+    ):
         """Delete a technology from the database by its ID.
 
         Args:
             tech_id: Unique identifier of the technology to delete
+            force: Also remove the technology from its journal entries
+            reassign_to: Move the technology's journal entries to this technology
 
         Raises:
             TechnologyNotFoundError: If technology with given ID does not exist
+            TechnologyValidationError: If ``reassign_to`` is not a valid target
             TechnologyDatabaseError: If technology is referenced by journal entries
                 or if database operation fails
         """
         try:
-            await self.repo.delete_technology(tech_id)
+            await self.repo.delete_technology(
+                tech_id, force=force, reassign_to=reassign_to
+            )
         except BaseDomainError as e:
             raise e
         except Exception as e:
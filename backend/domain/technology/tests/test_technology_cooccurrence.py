@@ -0,0 +1,117 @@
+"""Tests for the technology co-occurrence matrix and usage trends."""
+
+from itertools import product
+
+import numpy as np
+import pytest
+from domain.technology.technology_cooccurrence import (
+    CooccurrenceCache,
+    CooccurrenceMatrix,
+    usage_trends,
+)
+
+# Entry -> linked technologies
+entries = {
+    "e1": ["py", "js", "go"],
+    "e2": ["py", "js"],
+    "e3": ["py"],
+    "e4": ["rs", "go"],
+    "e5": ["js", "py"],
+}
+
+
+def build(entries: dict[str, list[str]]) -> CooccurrenceMatrix:
+    links = [(entry, id) for entry, ids in entries.items() for id in ids]
+    return CooccurrenceMatrix.from_links(
+        [entry for entry, _ in links], [id for _, id in links]
+    )
+
+
+def as_dict(matrix: CooccurrenceMatrix) -> dict[tuple[str, str], int]:
+    return {
+        (first, second): int(matrix.counts[matrix.codes[first], matrix.codes[second]])
+        for first, second in product(matrix.ids, repeat=2)
+    }
+
+
+def test_from_links_counts_shared_entries():
+    matrix = build(entries)
+
+    expected = {
+        (first, second): sum(first in ids and second in ids for ids in entries.values())
+        for first, second in product(matrix.ids, repeat=2)
+    }
+    assert as_dict(matrix) == expected
+    assert sorted(matrix.ids) == ["go", "js", "py", "rs"]
+    assert matrix.entry_count == 5
+
+
+def test_from_links_handles_unordered_links_and_no_links():
+    links = [("e2", "a"), ("e1", "b"), ("e2", "b"), ("e1", "a"), ("e3", "a")]
+    matrix = CooccurrenceMatrix.from_links(
+        [entry for entry, _ in links], [id for _, id in links]
+    )
+    assert as_dict(matrix) == {
+        ("a", "a"): 3,
+        ("a", "b"): 2,
+        ("b", "a"): 2,
+        ("b", "b"): 2,
+    }
+
+    empty = CooccurrenceMatrix.from_links([], [])
+    assert empty.top_pairs(10) == []
+
+
+def test_add_entry_matches_a_rebuild():
+    matrix = build(dict(list(entries.items())[:2]))
+    for ids in list(entries.values())[2:]:
+        matrix.add_entry(ids)
+
+    assert as_dict(matrix) == as_dict(build(entries))
+    assert matrix.entry_count == 5
+
+
+def test_top_pairs_rank_by_count_or_lift():
+    matrix = build(entries)
+
+    by_count = matrix.top_pairs(2)
+    assert [(pair.first_id, pair.second_id, pair.count) for pair in by_count] == [
+        ("js", "py", 3),
+        # Ties ranked by lift: go is in 2 entries of 5, rs and js in 1 and 3
+        ("go", "rs", 1),
+    ]
+    # 3 shared of 5 entries, py in 4 and js in 3
+    assert by_count[0].lift == pytest.approx(3 * 5 / (4 * 3))
+
+    by_lift = matrix.top_pairs(10, by_lift=True)
+    assert (by_lift[0].first_id, by_lift[0].second_id) == ("go", "rs")
+    assert by_lift[0].lift == pytest.approx(1 * 5 / (2 * 1))
+    assert [pair.count for pair in matrix.top_pairs(10, min_count=2)] == [3]
+
+
+def test_usage_trends_fit_the_monthly_share():
+    series = np.array([[1, 2, 3, 4], [4, 3, 2, 1], [0, 0, 0, 0]])
+    totals = np.array([10, 10, 10, 0])
+
+    shares, slopes = usage_trends(series, totals)
+
+    assert shares[:, 3].tolist() == [0, 0, 0]
+    assert slopes == pytest.approx([np.polyfit(range(4), row, 1)[0] for row in shares])
+
+
+def test_cache_applies_entries_one_version_after_its_matrix_only():
+    cache = CooccurrenceCache(max_users=2)
+    cache.put("u1", 3, build({"e1": ["a", "b"]}))
+
+    cache.apply_entry("u1", 3, 4, ["b", "c"])
+    matrix = cache.get("u1", 4)
+    assert as_dict(matrix) == as_dict(build({"e1": ["a", "b"], "e2": ["b", "c"]}))
+
+    # Another write came in between
+    cache.apply_entry("u1", 4, 6, ["a"])
+    assert cache.get("u1", 6) is None
+
+    cache.put("u1", 6, build({"e1": ["a"]}))
+    # The cached matrix is not the one the entry was written on
+    cache.apply_entry("u1", 5, 6, ["a"])
+    assert cache.get("u1", 6) is None
@@ -0,0 +1,78 @@
+"""Tests for the technology name matcher."""
+
+from domain.technology.technology_matcher import (
+    TechnologyMatcher,
+    TechnologyMatcherCache,
+)
+
+
+def matcher(*names: str) -> TechnologyMatcher:
+    return TechnologyMatcher([(name, name) for name in names])
+
+
+def test_finds_names_in_order_of_first_mention():
+    found = matcher("Python", "FastAPI", "Docker").find(
+        "Deployed the FastAPI app with Docker, then fixed Python typing. FastAPI!"
+    )
+    assert found == ["FastAPI", "Docker", "Python"]
+
+
+def test_matches_case_insensitively_and_across_whitespace():
+    found = matcher("PostgreSQL", "Visual Studio Code").find(
+        "postgresql tuning in visual\n  studio   CODE"
+    )
+    assert found == ["PostgreSQL", "Visual Studio Code"]
+
+
+def test_names_match_whole_words_only():
+    technologies = matcher("Go", "Rust", "C++", ".NET")
+    assert technologies.find("A good trust exercise") == []
+    assert technologies.find("Go, then Rust.") == ["Go", "Rust"]
+    # Edges that are symbols need no boundary
+    assert technologies.find("C++20 and ASP.NET") == ["C++", ".NET"]
+
+
+def test_names_are_not_found_in_longer_language_names():
+    technologies = matcher("C", "F", "Notepad")
+    assert technologies.find("C# and F#, edited in Notepad++") == []
+    assert technologies.find("Wrote C++, then C.") == ["C"]
+    assert matcher("C", "C++").find("C/C++") == ["C", "C++"]
+
+
+def test_overlapping_names_resolve_leftmost_longest():
+    technologies = matcher("React", "React Native", "Native", "C", "C++")
+    assert technologies.find("React Native and C++, later React") == [
+        "React Native",
+        "C++",
+        "React",
+    ]
+
+
+def test_names_that_are_suffixes_of_others_are_found():
+    technologies = matcher("JavaScript", "Script", "TypeScript")
+    assert technologies.find("TypeScript over JavaScript, not Script") == [
+        "TypeScript",
+        "JavaScript",
+        "Script",
+    ]
+
+
+def test_names_differing_in_case_share_a_pattern():
+    technologies = TechnologyMatcher([("1", "Go"), ("2", "go"), ("3", " ")])
+    assert technologies.find("go") == ["1", "2"]
+    assert technologies.find("") == []
+
+
+def test_cache_returns_matchers_of_the_current_version_only():
+    cache = TechnologyMatcherCache(max_users=2)
+    first, second, third = matcher("a"), matcher("b"), matcher("c")
+    cache.put("u1", 1, first)
+    cache.put("u2", 1, second)
+
+    assert cache.get("u1", 1) is first
+    assert cache.get("u1", 2) is None
+
+    # u2 is the least recently used
+    cache.put("u3", 1, third)
+    assert cache.get("u2", 1) is None
+    assert cache.get("u1", 1) is first
@@ -7,6 +7,7 @@ from domain.technology.technology_exceptions import (
     ErrorCode,
     TechnologyDatabaseError,
     TechnologyNotFoundError,
+    TechnologyValidationError,
 )
 from domain.technology.technology_repo import TechnologyRepo
 from domain.technology.technology_schema import TechnologyCreate, TechnologyWithCount
@@ -14,6 +15,7 @@ from enums import Language
 from fastapi import status
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session as SessionDep
+from sqlmodel import select
 
 mock_user_id = "123"
 
@@ -74,19 +76,23 @@ async def sample_tech_usage(db_session, sample_technologies, sample_journal_entr
         JournalEntryTechnologyLink(
             journal_entry_id=sample_journal_entries[0].id,
             technology_id=sample_technologies[0].id,
+            user_id=mock_user_id,
         ),
         JournalEntryTechnologyLink(
             journal_entry_id=sample_journal_entries[1].id,
             technology_id=sample_technologies[0].id,
+            user_id=mock_user_id,
         ),
         JournalEntryTechnologyLink(
             journal_entry_id=sample_journal_entries[0].id,
             technology_id=sample_technologies[1].id,
+            user_id=mock_user_id,
         ),
     ]
     for usage in usages:
         db_session.add(usage)
     await db_session.commit()
+    await TechnologyRepo(db_session).recount_usage()
     return usages
 
 
@@ -323,10 +329,10 @@ async def test_delete_technology_database_error(
     technology_repo: TechnologyRepo, sample_technologies, mocker
 ):
     """Test handling of database errors when deleting technology."""
-    # Mock the session delete to raise an error
+    # Mock the session commit to raise an error
     mocker.patch.object(
         technology_repo.session,
-        "delete",
+        "commit",
         side_effect=SQLAlchemyError("Database error"),
     )
 
@@ -336,3 +342,88 @@ async def test_delete_technology_database_error(
         )  # React technology
 
     assert "Failed to delete technology" in str(exc_info.value)
+
+
+@pytest_asyncio.fixture
+async def owned_tech_usage(db_session: SessionDep) -> list[Technology]:
+    """Create user-owned technologies where Python is used by two entries."""
+    technologies = [
+        Technology(id="py", name="Python", user_id=mock_user_id),
+        Technology(id="js", name="JavaScript", user_id=mock_user_id),
+        Technology(id="other", name="Go", user_id="another-user"),
+    ]
+    entries = [
+        JournalEntry(id="e1", content="Entry 1", user_id=mock_user_id),
+        JournalEntry(id="e2", content="Entry 2", user_id=mock_user_id),
+    ]
+    links = [
+        JournalEntryTechnologyLink(
+            journal_entry_id=entry_id, technology_id=tech_id, user_id=mock_user_id
+        )
+        for entry_id, tech_id in (("e1", "py"), ("e1", "js"), ("e2", "py"))
+    ]
+    db_session.add_all([*technologies, *entries])
+    await db_session.commit()
+    db_session.add_all(links)
+    await db_session.commit()
+    await TechnologyRepo(db_session).recount_usage()
+    return technologies
+
+
+async def links_of(session, tech_id: str) -> list[str]:
+    results = await session.exec(
+        select(JournalEntryTechnologyLink.journal_entry_id)
+        .where(JournalEntryTechnologyLink.technology_id == tech_id)
+        .order_by(JournalEntryTechnologyLink.journal_entry_id)
+    )
+    return results.all()
+
+
+@pytest.mark.asyncio
+async def test_delete_technology_in_use_conflict(
+    technology_repo: TechnologyRepo, owned_tech_usage
+):
+    """Test that a used technology is refused without force or reassign_to."""
+    with pytest.raises(TechnologyDatabaseError) as exc_info:
+        await technology_repo.delete_technology("py")
+
+    assert exc_info.value.status_code == status.HTTP_409_CONFLICT
+    assert exc_info.value.params == {"id": "py", "usage_count": 2}
+
+
+@pytest.mark.asyncio
+async def test_delete_technology_force_removes_links(
+    technology_repo: TechnologyRepo, owned_tech_usage
+):
+    """Test that force deletes the technology together with its links."""
+    await technology_repo.delete_technology("py", force=True)
+
+    assert await links_of(technology_repo.session, "py") == []
+    with pytest.raises(TechnologyNotFoundError):
+        await technology_repo.get_technology("py")
+
+
+@pytest.mark.asyncio
+async def test_delete_technology_reassigns_links(
+    technology_repo: TechnologyRepo, owned_tech_usage
+):
+    """Test that links move to the target without duplicating existing ones."""
+    await technology_repo.delete_technology("py", reassign_to="js")
+
+    assert await links_of(technology_repo.session, "py") == []
+    assert await links_of(technology_repo.session, "js") == ["e1", "e2"]
+    target = await technology_repo.session.get(Technology, "js")
+    await technology_repo.session.refresh(target)
+    assert target.usage_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_technology_reassign_to_other_user_rejected(
+    technology_repo: TechnologyRepo, owned_tech_usage
+):
+    """Test that links cannot be moved to another user's technology."""
+    with pytest.raises(TechnologyValidationError) as exc_info:
+        await technology_repo.delete_technology("py", reassign_to="other")
+
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+    assert await links_of(technology_repo.session, "py") == ["e1", "e2"]
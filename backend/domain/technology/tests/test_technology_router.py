@@ -1,6 +1,9 @@
 """Tests for the technology router endpoints."""
 
+from datetime import date
+
 import pytest
+from database.session import get_session
 from database.models import Technology
 from domain.technology.technology_dependencies import get_technology_service
 from domain.technology.technology_exceptions import (
@@ -8,11 +11,21 @@ from domain.technology.technology_exceptions import (
     TechnologyNotFoundError,
 )
 from domain.technology.technology_router import router
-from domain.technology.technology_schema import TechnologyCreate, TechnologyWithCount
+from domain.technology.technology_schema import (
+    PairOrder,
+    TechnologyCreate,
+    TechnologyPair,
+    TechnologyRead,
+    TechnologyTrend,
+    TechnologyTrends,
+    TechnologyWithCount,
+)
 from domain.technology.technology_service import TechnologyService
 from enums import Language
 from fastapi import FastAPI, status
-from fastapi.testclient import TestClient
+from tests.conftest import authed_client
+
+mock_user_id = "user-1"
 
 # Prepare mock data
 mock_technologies = [
@@ -40,20 +53,21 @@ def mock_technology_service(mocker):
 
 
 @pytest.fixture
-def app(mock_technology_service):
+def app(mock_technology_service, mock_session):
     """Create a FastAPI test application."""
     app = FastAPI()
     app.include_router(router, prefix="/api/technologies")
 
     # Override the service dependency
     app.dependency_overrides[get_technology_service] = lambda: mock_technology_service
+    app.dependency_overrides[get_session] = lambda: mock_session
     return app
 
 
 @pytest.fixture
 def client(app):
-    """Create a test client."""
-    return TestClient(app)
+    """Create a test client signed in as ``mock_user_id``."""
+    return authed_client(app, mock_user_id)
 
 
 def test_get_technologies_success(client, mock_technology_service):
@@ -171,7 +185,19 @@ def test_delete_technology_success(client, mock_technology_service):
     # Verify response
     assert response.status_code == status.HTTP_204_NO_CONTENT
     assert response.content == b""  # No content for successful delete
-    mock_technology_service.delete_technology.assert_called_once_with("1")
+    mock_technology_service.delete_technology.assert_called_once_with(
+        "1", force=False, reassign_to=None
+    )
+
+
+def test_delete_technology_reassign(client, mock_technology_service):
+    """Test DELETE /api/technologies/{id} forwards the reassign target."""
+    response = client.delete("/api/technologies/1?reassign_to=2")
+
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    mock_technology_service.delete_technology.assert_called_once_with(
+        "1", force=False, reassign_to="2"
+    )
 
 
 def test_delete_technology_not_found(client, mock_technology_service):
@@ -201,3 +227,71 @@ def test_delete_technology_with_entries(client, mock_technology_service):
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     error_detail = response.json()["detail"]
     assert error_detail["message"] == "Cannot delete: has entries"
+
+
+def test_get_technology_pairs(client, mock_technology_service):
+    """Test GET /api/technologies/cooccurrence."""
+    python, javascript = (
+        TechnologyRead(id=technology.id, name=technology.name)
+        for technology in mock_technologies
+    )
+    mock_technology_service.get_pairs.return_value = [
+        TechnologyPair(technologies=[python, javascript], count=3, lift=1.25)
+    ]
+
+    response = client.get(
+        "/api/technologies/cooccurrence",
+        params={"limit": 5, "by": "lift", "min_count": 2},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"]
+    assert response.json() == [
+        {
+            "technologies": [
+                {"name": "Python", "description": None, "language": None, "id": "1"},
+                {
+                    "name": "JavaScript",
+                    "description": None,
+                    "language": None,
+                    "id": "2",
+                },
+            ],
+            "count": 3,
+            "lift": 1.25,
+        }
+    ]
+    mock_technology_service.get_pairs.assert_called_once_with(
+        mock_user_id, 5, PairOrder.LIFT, 2
+    )
+
+
+def test_get_technology_pairs_rejects_invalid_limit(client):
+    """Test that the number of pairs is bounded."""
+    response = client.get("/api/technologies/cooccurrence", params={"limit": 0})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_get_technology_trends(client, mock_technology_service):
+    """Test GET /api/technologies/trends."""
+    mock_technology_service.get_trends.return_value = TechnologyTrends(
+        months=[date(2024, 3, 1), date(2024, 4, 1)],
+        totals=[2, 4],
+        rising=[TechnologyTrend(id="1", name="Python", counts=[1, 4], slope=0.5)],
+        declining=[],
+    )
+
+    response = client.get(
+        "/api/technologies/trends", params={"end": "2024-04-15", "months": 2}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "months": ["2024-03-01", "2024-04-01"],
+        "totals": [2, 4],
+        "rising": [{"id": "1", "name": "Python", "counts": [1, 4], "slope": 0.5}],
+        "declining": [],
+    }
+    mock_technology_service.get_trends.assert_called_once_with(
+        mock_user_id, date(2024, 4, 15), 2, 5
+    )
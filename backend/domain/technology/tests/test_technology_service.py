@@ -1,14 +1,31 @@
 """Tests for the technology service."""
 
+from datetime import date, datetime
+
 import pytest
+from database.activity import EntryActivity, record_activity
 from database.models import Technology
+from domain.journal_entry.journal_entry_repo import JournalEntryRepo
+from domain.journal_entry.journal_entry_schema import (
+    JournalEntryCreate,
+    JournalEntryUpdate,
+)
+from domain.technology.technology_cooccurrence import CooccurrenceCache
 from domain.technology.technology_exceptions import (
     ErrorCode,
     TechnologyDatabaseError,
     TechnologyNotFoundError,
 )
+from domain.technology.technology_matcher import TechnologyMatcherCache
 from domain.technology.technology_repo import TechnologyRepo
-from domain.technology.technology_schema import TechnologyCreate, TechnologyWithCount
+from domain.technology.technology_schema import (
+    PairOrder,
+    TechnologyCreate,
+    TechnologyPair,
+    TechnologyRead,
+    TechnologyUpdate,
+    TechnologyWithCount,
+)
 from domain.technology.technology_service import TechnologyService
 from enums import Language
 from fastapi import status
@@ -131,7 +148,9 @@ async def test_delete_technology_success(technology_service, mock_technology_rep
     await technology_service.delete_technology("1")
 
     # Verify repository was called
-    mock_technology_repo.delete_technology.assert_called_once_with("1")
+    mock_technology_repo.delete_technology.assert_called_once_with(
+        "1", force=False, reassign_to=None
+    )
 
 
 @pytest.mark.asyncio
@@ -173,3 +192,176 @@ async def test_delete_technology_with_entries(technology_service, mock_technolog
     assert "Cannot delete technology that is referenced by journal entries" in str(
         exc_info.value
     )
+
+
+@pytest.fixture
+def matching_service(technology_repo: TechnologyRepo) -> TechnologyService:
+    """Create a TechnologyService on the test database with its own caches."""
+    return TechnologyService(
+        technology_repo,
+        matchers=TechnologyMatcherCache(),
+        cooccurrences=CooccurrenceCache(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_suggest_technologies_finds_named_technologies(
+    matching_service: TechnologyService,
+):
+    """Test that suggestions are the user's technologies named in the text."""
+    python = await matching_service.add_technology(
+        TechnologyCreate(name="Python", language=Language.PYTHON), "u1"
+    )
+    fastapi = await matching_service.add_technology(
+        TechnologyCreate(name="FastAPI"), "u1"
+    )
+    await matching_service.add_technology(TechnologyCreate(name="Docker"), "u1")
+    await matching_service.add_technology(TechnologyCreate(name="Rust"), "u2")
+
+    result = await matching_service.suggest_technologies(
+        "u1", "A FastAPI endpoint in python, not in rust"
+    )
+
+    assert [technology.id for technology in result] == [fastapi.id, python.id]
+    assert result[1] == TechnologyRead(
+        id=python.id, name="Python", language=Language.PYTHON
+    )
+
+
+@pytest.mark.asyncio
+async def test_suggest_technologies_rebuilds_matcher_when_names_change(
+    matching_service: TechnologyService,
+):
+    """Test that adding, renaming and deleting technologies invalidates the
+    cached matcher, while other edits keep it."""
+    go = await matching_service.add_technology(TechnologyCreate(name="Go"), "u1")
+    assert await matching_service.suggest_technology_ids("u1", "Go and Zig") == [go.id]
+    matcher = matching_service.matchers.get(
+        "u1", await matching_service.repo.get_names_version("u1")
+    )
+
+    await matching_service.update_technology(
+        TechnologyUpdate(description="Gopher"), go.id
+    )
+    assert await matching_service.suggest_technology_ids("u1", "Go and Zig") == [go.id]
+    assert matcher is matching_service.matchers.get(
+        "u1", await matching_service.repo.get_names_version("u1")
+    )
+
+    zig = await matching_service.add_technology(TechnologyCreate(name="Zig"), "u1")
+    assert await matching_service.suggest_technology_ids("u1", "Go and Zig") == [
+        go.id,
+        zig.id,
+    ]
+
+    await matching_service.update_technology(TechnologyUpdate(name="Golang"), go.id)
+    assert await matching_service.suggest_technology_ids("u1", "Go and Zig") == [zig.id]
+
+    await matching_service.delete_technology(zig.id)
+    assert await matching_service.suggest_technology_ids("u1", "Go and Zig") == []
+
+
+@pytest.mark.asyncio
+async def test_get_pairs_keeps_cached_matrix_up_to_date(
+    matching_service: TechnologyService, db_session
+):
+    """Test that new entries update the cached matrix in place, and that
+    other link changes rebuild it."""
+    py, js, go = [
+        await matching_service.add_technology(TechnologyCreate(name=name), "u1")
+        for name in ("Python", "JavaScript", "Go")
+    ]
+    entries = JournalEntryRepo(db_session)
+
+    async def add_entry(*technologies: Technology):
+        version = await matching_service.get_links_version("u1")
+        entry = await entries.add_journal_entry(
+            JournalEntryCreate(content="Entry", is_private=False, technologyIds=[]),
+            list(technologies),
+            "u1",
+        )
+        await matching_service.record_new_entry(
+            "u1", version, [technology.id for technology in technologies]
+        )
+        return entry
+
+    first = await add_entry(py, js)
+    assert await matching_service.get_pairs("u1") == [
+        TechnologyPair(
+            technologies=[
+                TechnologyRead.model_validate(technology)
+                for technology in sorted([py, js], key=lambda tech: tech.id)
+            ],
+            count=1,
+            lift=1.0,
+        )
+    ]
+    matrix = matching_service.cooccurrences.get(
+        "u1", await matching_service.get_links_version("u1")
+    )
+
+    await add_entry(py, js, go)
+    await add_entry(py)
+    pairs = await matching_service.get_pairs("u1", order=PairOrder.LIFT)
+    assert matrix is matching_service.cooccurrences.get(
+        "u1", await matching_service.get_links_version("u1")
+    )
+    assert [{technology.id for technology in pair.technologies} for pair in pairs] == [
+        {go.id, js.id},
+        {py.id, js.id},
+        {go.id, py.id},
+    ]
+    assert [pair.count for pair in pairs] == [1, 2, 1]
+    assert pairs[0].lift == pytest.approx(3 / (1 * 2))
+
+    await entries.update_journal_entry(
+        first.id, JournalEntryUpdate(content="Entry"), [go, js]
+    )
+    pairs = await matching_service.get_pairs("u1", limit=1)
+    assert {technology.id for technology in pairs[0].technologies} == {go.id, js.id}
+    assert pairs[0].count == 2
+    assert await matching_service.get_pairs("u2") == []
+
+
+@pytest.mark.asyncio
+async def test_get_trends_ranks_technologies_by_share_slope(
+    matching_service: TechnologyService, db_session
+):
+    """Test that trends compare each technology's share of monthly entries."""
+    py, js = [
+        await matching_service.add_technology(TechnologyCreate(name=name), "u1")
+        for name in ("Python", "JavaScript")
+    ]
+    # Python in 1 of 2, 1 of 1 and 2 of 2 entries; JavaScript in 1, 0 and 0
+    entries = [
+        (datetime(2024, 1, 5), [py.id]),
+        (datetime(2024, 1, 6), [js.id]),
+        (datetime(2024, 3, 1), [py.id]),
+        (datetime(2024, 4, 30), [py.id]),
+        (datetime(2024, 4, 30), [py.id]),
+    ]
+    await record_activity(
+        db_session,
+        "u1",
+        added=[
+            EntryActivity(moment, None, frozenset(ids), 1) for moment, ids in entries
+        ],
+    )
+    await db_session.commit()
+
+    trends = await matching_service.get_trends("u1", date(2024, 4, 15), months=4)
+
+    assert trends.months == [date(2024, month, 1) for month in (1, 2, 3, 4)]
+    assert trends.totals == [2, 0, 1, 2]
+    assert [(trend.name, trend.counts) for trend in trends.rising] == [
+        ("Python", [1, 0, 1, 2])
+    ]
+    assert [(trend.name, trend.counts) for trend in trends.declining] == [
+        ("JavaScript", [1, 0, 0, 0])
+    ]
+    # Shares 0.5, 0, 1, 1 over x = -1.5, -0.5, 0.5, 1.5
+    assert trends.rising[0].slope == pytest.approx(1.25 / 5)
+
+    empty = await matching_service.get_trends("u2", date(2024, 4, 15), months=2)
+    assert empty.totals == [0, 0]
+    assert empty.rising == empty.declining == []
@@ -0,0 +1,89 @@
+"""bcrypt hashing off the event loop.
+
+A bcrypt call at cost 12 takes a few hundred milliseconds of CPU. Running it
+inline in an ``async def`` path stalls every other request on the worker, so
+the calls go to a small dedicated thread pool (bcrypt releases the GIL while
+hashing). The number of running plus queued operations is capped; beyond that
+callers get ``PasswordHasherBusyError`` (503) instead of an ever-growing queue.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+from domain.auth.auth_config import (
+    BCRYPT_ROUNDS,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_WORKERS,
+)
+from domain.user.user_exceptions import PasswordHasherBusyError
+
+
+class PasswordHasher:
+    def __init__(
+        self,
+        rounds: int = BCRYPT_ROUNDS,
+        workers: int = PASSWORD_HASH_WORKERS,
+        max_pending: int = PASSWORD_HASH_MAX_PENDING,
+    ) -> None:
+        self.rounds = rounds
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="bcrypt"
+        )
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of operations currently running or queued."""
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        """Hash ``password`` with the configured cost factor.
+
+        Raises:
+            PasswordHasherBusyError: If too many operations are pending
+        """
+        hashed = await self._run(
+            bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt(self.rounds)
+        )
+        return hashed.decode("utf-8")
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Check ``password`` against a stored bcrypt hash.
+
+        Raises:
+            PasswordHasherBusyError: If too many operations are pending
+        """
+        return await self._run(
+            bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Return True if ``hashed_password`` was not made with the current cost.
+
+        Hashes are ``$2b$<cost>$<salt+digest>``; anything unparsable is
+        treated as needing a rehash.
+        """
+        try:
+            return int(hashed_password.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return True
+
+    async def _run(self, func, *args):
+        # Checked and incremented without an await in between, so no lock needed
+        if self._pending >= self.max_pending:
+            raise PasswordHasherBusyError()
+        self._pending += 1
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(func, *args)
+        # Released when the thread finishes, not when the caller stops waiting, so
+        # cancelled requests still count against the limit while bcrypt runs
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+
+password_hasher = PasswordHasher()
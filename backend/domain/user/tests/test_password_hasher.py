@@ -0,0 +1,78 @@
+"""Tests for the thread-pool password hasher."""
+
+import asyncio
+import threading
+
+import bcrypt
+import pytest
+from domain.user.password_hasher import PasswordHasher
+from domain.user.user_exceptions import PasswordHasherBusyError
+from fastapi import status
+
+
+@pytest.fixture
+def hasher():
+    """Create a hasher with the cheapest bcrypt cost."""
+    return PasswordHasher(rounds=4, workers=1, max_pending=2)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify(hasher):
+    """Test that a hash verifies against its password only."""
+    hashed = await hasher.hash("password123")
+
+    assert hashed.startswith("$2b$04$")
+    assert await hasher.verify("password123", hashed) is True
+    assert await hasher.verify("wrong", hashed) is False
+    assert hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_runs_off_the_event_loop_thread(hasher, mocker):
+    """Test that bcrypt is called from a worker thread."""
+    threads = []
+
+    def fake_checkpw(password, hashed):
+        threads.append(threading.current_thread())
+        return True
+
+    mocker.patch("domain.user.password_hasher.bcrypt.checkpw", fake_checkpw)
+
+    await hasher.verify("password123", "$2b$04$x")
+
+    assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_saturated(hasher, mocker):
+    """Test that operations beyond max_pending fail fast with 503."""
+    release = threading.Event()
+
+    def blocking_checkpw(password, hashed):
+        release.wait(timeout=5)
+        return True
+
+    mocker.patch("domain.user.password_hasher.bcrypt.checkpw", blocking_checkpw)
+
+    running = [
+        asyncio.create_task(hasher.verify("password123", "$2b$04$x")) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    assert hasher.pending == 2
+
+    with pytest.raises(PasswordHasherBusyError) as exc_info:
+        await hasher.verify("password123", "$2b$04$x")
+    assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+    release.set()
+    assert await asyncio.gather(*running) == [True, True]
+    assert hasher.pending == 0
+
+
+def test_needs_rehash(hasher):
+    """Test that only hashes made with another cost need a rehash."""
+    assert (
+        hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(4)).decode()) is False
+    )
+    assert hasher.needs_rehash(bcrypt.hashpw(b"pw", bcrypt.gensalt(5)).decode()) is True
+    assert hasher.needs_rehash("not-a-bcrypt-hash") is True
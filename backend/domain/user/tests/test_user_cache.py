@@ -0,0 +1,81 @@
+"""Tests for the user principal cache."""
+
+import pytest
+from domain.user.user_cache import LocalInvalidationBus, UserCache, UserPrincipal
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def principal(id: str) -> UserPrincipal:
+    return UserPrincipal(
+        id=id, email=f"{id}@example.com", first_name="First", last_name="Last"
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return UserCache(ttl=10, max_size=2, clock=clock)
+
+
+def test_get_counts_hits_and_misses(cache):
+    """Test that lookups are counted."""
+    assert cache.get("1") is None
+    cache.set(principal("1"))
+    assert cache.get("1") == principal("1")
+
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    """Test that entries are dropped once their TTL passes."""
+    cache.set(principal("1"))
+    clock.now = 10
+
+    assert cache.get("1") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted(cache):
+    """Test that the LRU entry goes first when the cache is full."""
+    cache.set(principal("1"))
+    cache.set(principal("2"))
+    cache.get("1")
+    cache.set(principal("3"))
+
+    assert cache.get("2") is None
+    assert cache.get("1") is not None
+    assert cache.get("3") is not None
+
+
+def test_zero_ttl_disables_cache(clock):
+    """Test that a 0 TTL caches nothing."""
+    cache = UserCache(ttl=0, clock=clock)
+    cache.set(principal("1"))
+
+    assert cache.get("1") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_every_subscribed_cache(clock):
+    """Test that a published invalidation clears all caches on the bus."""
+    bus = LocalInvalidationBus()
+    first = UserCache(ttl=10, bus=bus, clock=clock)
+    second = UserCache(ttl=10, bus=bus, clock=clock)
+    first.set(principal("1"))
+    second.set(principal("1"))
+
+    await first.publish_invalidation("1")
+
+    assert first.get("1") is None
+    assert second.get("1") is None
@@ -3,6 +3,7 @@
 import pytest
 import pytest_asyncio
 from database.models import User
+from domain.user.user_cache import UserPrincipal, user_cache
 from domain.user.user_exceptions import (
     DuplicateUserError,
     UserDatabaseError,
@@ -136,6 +137,33 @@ async def test_update_user_success(user_repo: UserRepo, db_sample_users):
     assert result.password == db_sample_users[0].password
 
 
+@pytest.mark.asyncio
+async def test_update_user_invalidates_cache(user_repo: UserRepo, db_sample_users):
+    """Test that updating a user drops its cached principal."""
+    user_cache.set(UserPrincipal.from_user(db_sample_users[0]))
+
+    await user_repo.update_user(
+        db_sample_users[0].id,
+        UserUpdate(
+            email=db_sample_users[0].email,
+            first_name="Renamed",
+            last_name=db_sample_users[0].last_name,
+        ),
+    )
+
+    assert user_cache.get(db_sample_users[0].id) is None
+
+
+@pytest.mark.asyncio
+async def test_update_password(user_repo: UserRepo, db_sample_users):
+    """Test storing a new password hash."""
+    await user_repo.update_password(db_sample_users[0].id, "$2b$12$rehashed")
+
+    result = await user_repo.get_user(db_sample_users[0].id)
+    await user_repo.session.refresh(result)
+    assert result.password == "$2b$12$rehashed"
+
+
 @pytest.mark.asyncio
 async def test_update_user_not_found(user_repo: UserRepo):
     """Test updating a non-existent user raises correct error."""
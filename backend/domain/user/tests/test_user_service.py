@@ -2,12 +2,14 @@
 
 import pytest
 from database.models import User
+from domain.user.user_cache import UserCache, UserPrincipal
 from domain.user.user_exceptions import (
     DuplicateUserError,
     UserDatabaseError,
     UserNotFoundError,
 )
 from domain.user.user_schema import UserCreate, UserUpdate
+from domain.user.user_service import UserService
 from fastapi import status
 
 
@@ -265,3 +267,33 @@ async def test_delete_user_not_found(user_service, mocker, sample_users):
     error = exc_info.value
     assert error.status_code == status.HTTP_404_NOT_FOUND
     assert f"User with ID '{user_id}' not found" in error.message
+
+
+@pytest.mark.asyncio
+async def test_rehash_password(user_service, mocker, sample_users):
+    """Test that a rehash stores a freshly made hash."""
+    mocker.patch.object(user_service, "hash_password", return_value="$2b$12$new")
+    mocker.patch.object(user_service.user_repo, "update_password", return_value=None)
+
+    await user_service.rehash_password(sample_users[0], "password123")
+
+    user_service.hash_password.assert_called_once_with("password123")
+    user_service.user_repo.update_password.assert_called_once_with(
+        sample_users[0].id, "$2b$12$new"
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_principal_cached(user_repo, mocker, sample_users):
+    """Test that repeated principal lookups only read the user once."""
+    user_service = UserService(user_repo=user_repo, cache=UserCache(ttl=60))
+    mocker.patch.object(
+        user_service.user_repo, "get_user", return_value=sample_users[0]
+    )
+
+    first = await user_service.get_principal(sample_users[0].id)
+    second = await user_service.get_principal(sample_users[0].id)
+
+    assert first == second == UserPrincipal.from_user(sample_users[0])
+    user_service.user_repo.get_user.assert_called_once_with(sample_users[0].id)
+    assert user_service.cache.stats()["hits"] == 1
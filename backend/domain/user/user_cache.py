@@ -0,0 +1,119 @@
+"""In-process TTL + LRU cache of authenticated user principals.
+
+Token refresh only needs the identity claims of a user, not the full row, so
+they are cached per ``user_id`` for a short TTL. Writes to a user invalidate
+the entry through an ``InvalidationBus``; the default ``LocalInvalidationBus``
+only reaches the current process, and a shared implementation (e.g. Redis
+pub/sub) can be plugged in so every worker drops its copy.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Protocol
+
+from database.models import User
+from domain.auth.auth_config import USER_CACHE_MAX_SIZE, USER_CACHE_TTL
+
+
+@dataclass(frozen=True)
+class UserPrincipal:
+    """The identity claims carried in a user's tokens."""
+
+    id: str
+    email: str
+    first_name: str
+    last_name: str
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+        )
+
+
+class InvalidationBus(Protocol):
+    """Broadcasts user invalidations to every subscribed cache."""
+
+    async def publish(self, user_id: str) -> None: ...
+
+    def subscribe(self, callback: Callable[[str], None]) -> None: ...
+
+
+class LocalInvalidationBus:
+    """Single-process ``InvalidationBus``."""
+
+    def __init__(self) -> None:
+        self._subscribers: list[Callable[[str], None]] = []
+
+    async def publish(self, user_id: str) -> None:
+        for callback in self._subscribers:
+            callback(user_id)
+
+    def subscribe(self, callback: Callable[[str], None]) -> None:
+        self._subscribers.append(callback)
+
+
+class UserCache:
+    def __init__(
+        self,
+        ttl: float = USER_CACHE_TTL,
+        max_size: int = USER_CACHE_MAX_SIZE,
+        bus: InvalidationBus | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self.bus = bus or LocalInvalidationBus()
+        self.bus.subscribe(self.invalidate)
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, UserPrincipal]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+
+    def get(self, user_id: str) -> UserPrincipal | None:
+        """Return the cached principal, or None if missing or expired."""
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, principal: UserPrincipal) -> None:
+        """Cache ``principal``, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        self._entries[principal.id] = (self._clock() + self.ttl, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop ``user_id`` from this process's cache only."""
+        self._entries.pop(user_id, None)
+
+    async def publish_invalidation(self, user_id: str) -> None:
+        """Drop ``user_id`` from every cache subscribed to the bus."""
+        await self.bus.publish(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+user_cache = UserCache()
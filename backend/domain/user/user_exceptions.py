@@ -2,7 +2,8 @@
 
 from enum import Enum
 
-from core.domain_exceptions import create_domain_exceptions
+from core.domain_exceptions import create_domain_exception, create_domain_exceptions
+from fastapi import status
 
 
 class UserErrorCode(str, Enum):
@@ -12,6 +13,7 @@ class UserErrorCode(str, Enum):
     DATABASE_ERROR = "user.database_error"
     VALIDATION_ERROR = "user.validation_error"
     DUPLICATE_USER = "user.duplicate"
+    PASSWORD_HASHER_BUSY = "user.password_hasher_busy"
 
 
 # Create all domain exceptions at once
@@ -29,3 +31,10 @@ UserNotFoundError = exceptions["not_found"]
 UserDatabaseError = exceptions["database_error"]
 UserValidationError = exceptions["validation_error"]
 DuplicateUserError = exceptions["duplicate"]
+
+PasswordHasherBusyError = create_domain_exception(
+    name="PasswordHasherBusyError",
+    code=UserErrorCode.PASSWORD_HASHER_BUSY,
+    message="Too many password operations in progress, please retry shortly",
+    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+)
@@ -1,5 +1,6 @@
 from database.models import User
 from database.session import SessionDep
+from domain.user.user_cache import user_cache
 from domain.user.user_exceptions import (
     DuplicateUserError,
     UserDatabaseError,
@@ -7,7 +8,7 @@ from domain.user.user_exceptions import (
 )
 from domain.user.user_schema import UserCreate, UserUpdate
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlmodel import select
+from sqlmodel import select, update
 
 
 class UserRepo:
@@ -125,13 +126,35 @@ class UserRepo:
             for key, value in user_data.items():
                 setattr(db_user, key, value)
 
-            return await self._save_user(db_user)
+            saved_user = await self._save_user(db_user)
+            await user_cache.publish_invalidation(id)
+            return saved_user
         except UserDatabaseError as e:
             raise e
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise UserDatabaseError(message=f"Failed to update user: {str(e)}")
 
+    async def update_password(self, id: str, hashed_password: str) -> None:
+        """Store a new password hash for a user.
+
+        Args:
+            id (str): User ID
+            hashed_password (str): bcrypt hash to store
+
+        Raises:
+            UserDatabaseError: If database operation fails
+        """
+        try:
+            statement = (
+                update(User).where(User.id == id).values(password=hashed_password)
+            )
+            await self.session.exec(statement)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise UserDatabaseError(message=f"Failed to update password: {str(e)}")
+
     async def delete_user(self, id: str):
         """Delete a user by ID.
 
@@ -150,6 +173,7 @@ class UserRepo:
             raise UserDatabaseError(
                 message=f"Failed to delete user: {str(e)}",
             )
+        await user_cache.publish_invalidation(id)
 
     async def _save_user(self, user: User) -> User:
         """Save user to database and refresh.
@@ -1,20 +1,26 @@
-import bcrypt
 from database.models import User
+from domain.user.password_hasher import password_hasher
+from domain.user.user_cache import UserCache, UserPrincipal, user_cache
 from domain.user.user_repo import UserRepo
 from domain.user.user_schema import UserCreate, UserUpdate
 
 
 class UserService:
-    def __init__(self, user_repo: UserRepo) -> None:
+    def __init__(self, user_repo: UserRepo, cache: UserCache = user_cache) -> None:
         self.user_repo = user_repo
+        self.cache = cache
 
     @staticmethod
-    def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    async def hash_password(password: str) -> str:
+        return await password_hasher.hash(password)
 
     @staticmethod
-    def check_password(password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+    async def check_password(password: str, hashed_password: str) -> bool:
+        return await password_hasher.verify(password, hashed_password)
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        return password_hasher.needs_rehash(hashed_password)
 
     async def get_users(self) -> list[User]:
         """Get all users sorted by email.
@@ -42,6 +48,30 @@ class UserService:
         """
         return await self.user_repo.get_user(id)
 
+    async def get_principal(self, id: str) -> UserPrincipal:
+        """Get a user's identity claims, from the cache when possible.
+
+        Args:
+            id (str): User ID
+
+        Returns:
+            UserPrincipal: The user's id, email and name
+
+        Raises:
+            UserDatabaseError: If database operation fails
+            UserNotFoundError: If user not found
+        """
+        principal = self.cache.get(id)
+        if principal is None:
+            principal = self.cache_principal(await self.user_repo.get_user(id))
+        return principal
+
+    def cache_principal(self, user: User) -> UserPrincipal:
+        """Cache the identity claims of a user that was just loaded."""
+        principal = UserPrincipal.from_user(user)
+        self.cache.set(principal)
+        return principal
+
     async def get_user_by_email(self, email: str) -> User | None:
         """Get a single user by email.
 
@@ -65,8 +95,9 @@ class UserService:
         Raises:
             UserDatabaseError: If database operation fails or user with
             DuplicateUserError: If user with email already exists
+            PasswordHasherBusyError: If the password hasher is saturated
         """
-        user.password = self.hash_password(user.password)
+        user.password = await self.hash_password(user.password)
         return await self.user_repo.add_user(user)
 
     async def update_user(self, id: str, user: UserUpdate) -> User:
@@ -97,3 +128,17 @@ class UserService:
             UserNotFoundError: If user not found
         """
         return await self.user_repo.delete_user(id)
+
+    async def rehash_password(self, user: User, password: str) -> None:
+        """Replace the stored hash with one made at the current cost factor.
+
+        Args:
+            user (User): User whose password was just verified
+            password (str): The verified plain-text password
+
+        Raises:
+            UserDatabaseError: If database operation fails
+            PasswordHasherBusyError: If the password hasher is saturated
+        """
+        hashed_password = await self.hash_password(password)
+        await self.user_repo.update_password(user.id, hashed_password)
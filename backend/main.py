@@ -1,11 +1,24 @@
 import contextlib
 
 from core.admin.admin_portal import admin
+from core.compression import CompressionMiddleware
 from core.exceptions import add_exception_handlers
-from database.db import create_db_and_tables
+from core.http_config import METRICS_ENABLED
+from core.metrics import RequestMetricsMiddleware
+from core.metrics import router as metrics_router
+from core.responses import ORJSONResponse
+from database.db import engine
+from database.migrations import prepare_database
+from database.sqlite_tuning import sqlite_maintenance
+from domain.analytics.analytics_router import router as analytics_router
 from domain.auth.auth_config import security
 from domain.auth.auth_dependencies import AuthDeps
 from domain.auth.auth_router import router as auth_router
+from domain.insights.insights_router import router as insights_router
+from domain.job.job_config import JOB_WORKERS
+from domain.job.job_handlers import JOB_HANDLERS
+from domain.job.job_router import router as job_router
+from domain.job.job_worker import JobWorkerPool
 from domain.journal_entry.journal_entry_router import router as journal_entry_router
 from domain.project.project_router import router as project_router
 from domain.technology.technology_router import router as technology_router
@@ -16,8 +29,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI):
-    await create_db_and_tables()
-    yield
+    await prepare_database(engine)
+    async with sqlite_maintenance(engine), JobWorkerPool(JOB_HANDLERS, JOB_WORKERS):
+        yield
 
 
 app = FastAPI(
@@ -25,6 +39,7 @@ app = FastAPI(
     description="API for managing career journal",
     lifespan=lifespan,
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 app.add_middleware(
     CORSMiddleware,
@@ -33,6 +48,10 @@ app.add_middleware(
     allow_methods=["POST", "GET", "PATCH", "DELETE"],
     allow_headers=["X-CSRF-Token"],
 )
+app.add_middleware(CompressionMiddleware)
+if METRICS_ENABLED:
+    # Added last so it is the outermost middleware and times the whole stack
+    app.add_middleware(RequestMetricsMiddleware)
 admin.mount_to(app)
 security.handle_errors(app)
 
@@ -55,10 +74,27 @@ app.include_router(
     tags=["journal-entries"],
     dependencies=[*AuthDeps],
 )
+app.include_router(
+    insights_router,
+    prefix="/api/insights",
+    tags=["insights"],
+    dependencies=[*AuthDeps],
+)
+app.include_router(
+    analytics_router,
+    prefix="/api/analytics",
+    tags=["analytics"],
+    dependencies=[*AuthDeps],
+)
+app.include_router(
+    job_router, prefix="/api/jobs", tags=["jobs"], dependencies=[*AuthDeps]
+)
 app.include_router(
     user_router, prefix="/api/users", tags=["users"], dependencies=[*AuthDeps]
 )
 app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
+if METRICS_ENABLED:
+    app.include_router(metrics_router, prefix="/api/metrics")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,224 @@
+"""Operational commands run outside the API workers.
+
+Usage:
+    python manage.py migrate             Apply pending migrations
+    python manage.py vacuum              Compact a SQLite database
+    python manage.py check-migrations    Exit non-zero if the database is not at head
+    python manage.py recount-technology-usage
+                                         Recompute technology usage counts
+    python manage.py check-project-stats [--repair]
+                                         Report (or fix) drifted project stats
+    python manage.py embed-journal-entries
+                                         Embed the entries that have no current vector
+    python manage.py rebuild-activity [--user USER_ID]
+                                         Recompute the activity rollups
+    python manage.py run-worker [--concurrency N]
+                                         Run background job workers until stopped
+"""
+
+import argparse
+import asyncio
+import signal
+import sys
+
+from database.db import engine
+from database.full_text_search import rebuild_search_index
+from database.migrations import check_migration_state, upgrade_to_head
+from database.session import new_session
+from database.sqlite_tuning import vacuum_sqlite
+from domain.analytics.analytics_repo import AnalyticsRepo
+from domain.embedding.embedder import get_embedder
+from domain.embedding.embedding_repo import EmbeddingRepo
+from domain.embedding.embedding_service import EmbeddingService
+from domain.job.job_config import JOB_WORKERS
+from domain.job.job_handlers import JOB_HANDLERS
+from domain.job.job_worker import JobWorkerPool
+from domain.project.project_repo import ProjectRepo
+from domain.technology.technology_repo import TechnologyRepo
+
+
+def migrate(args: argparse.Namespace) -> int:
+    upgrade_to_head()
+
+    # Migrations that copy journal_entry on SQLite renumber its rowids
+    async def rebuild() -> None:
+        try:
+            await rebuild_search_index(engine)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(rebuild())
+    return 0
+
+
+def vacuum(args: argparse.Namespace) -> int:
+    if engine.dialect.name != "sqlite":
+        print("Only SQLite databases are vacuumed.")
+        return 1
+
+    async def run() -> None:
+        try:
+            await vacuum_sqlite(engine)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+    return 0
+
+
+def check_migrations(args: argparse.Namespace) -> int:
+    async def check() -> bool:
+        try:
+            return await check_migration_state(engine)
+        finally:
+            await engine.dispose()
+
+    if asyncio.run(check()):
+        print("Database is at the migration head.")
+        return 0
+    return 1
+
+
+async def with_session(work):
+    """Run ``work(session)`` with a fresh session, then release the engine."""
+    session = new_session()
+    try:
+        return await work(session)
+    finally:
+        await session.close()
+        await engine.dispose()
+
+
+def recount_technology_usage(args: argparse.Namespace) -> int:
+    corrected = asyncio.run(
+        with_session(lambda session: TechnologyRepo(session).recount_usage())
+    )
+    print(f"Corrected the usage count of {corrected} technologies.")
+    return 0
+
+
+def check_project_stats(args: argparse.Namespace) -> int:
+    async def check(session) -> list:
+        repo = ProjectRepo(session)
+        mismatches = await repo.find_stale_stats()
+        if mismatches and args.repair:
+            await repo.recompute_stats()
+        return mismatches
+
+    mismatches = asyncio.run(with_session(check))
+    for mismatch in mismatches:
+        print(
+            f"{mismatch.id}: entry_count {mismatch.entry_count} "
+            f"(actual {mismatch.actual_entry_count}), last_entry_date "
+            f"{mismatch.last_entry_date} (actual {mismatch.actual_last_entry_date})"
+        )
+    if not mismatches:
+        print("Project stats are consistent.")
+        return 0
+    if args.repair:
+        print(f"Repaired {len(mismatches)} projects.")
+        return 0
+    return 1
+
+
+def embed_journal_entries(args: argparse.Namespace) -> int:
+    async def embed(session) -> int:
+        repo = EmbeddingRepo(session)
+        service = EmbeddingService(repo, get_embedder())
+        embedded = 0
+        for user_id in await repo.get_user_ids_with_entries():
+            embedded += await service.sync(user_id)
+        return embedded
+
+    embedded = asyncio.run(with_session(embed))
+    print(f"Embedded {embedded} journal entries with {get_embedder().name}.")
+    return 0
+
+
+def rebuild_activity(args: argparse.Namespace) -> int:
+    async def rebuild(session) -> tuple[int, int]:
+        repo = AnalyticsRepo(session)
+        user_ids = [args.user] if args.user else await repo.get_user_ids()
+        counted = 0
+        for user_id in user_ids:
+            counted += await repo.rebuild(user_id)
+        return len(user_ids), counted
+
+    users, counted = asyncio.run(with_session(rebuild))
+    print(f"Rebuilt the activity of {users} users from {counted} journal entries.")
+    return 0
+
+
+def run_worker(args: argparse.Namespace) -> int:
+    async def run() -> None:
+        stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stopped.set)
+        try:
+            async with JobWorkerPool(JOB_HANDLERS, args.concurrency):
+                await stopped.wait()
+        finally:
+            await engine.dispose()
+
+    print(f"Running {args.concurrency} job workers; stop with Ctrl+C.")
+    asyncio.run(run())
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("migrate", help="apply pending migrations").set_defaults(
+        handler=migrate
+    )
+    commands.add_parser(
+        "vacuum", help="compact a SQLite database and rebuild its search index"
+    ).set_defaults(handler=vacuum)
+    commands.add_parser(
+        "check-migrations", help="check the database is at the migration head"
+    ).set_defaults(handler=check_migrations)
+    commands.add_parser(
+        "recount-technology-usage",
+        help="recompute technology usage counts from journal entry links",
+    ).set_defaults(handler=recount_technology_usage)
+    project_stats = commands.add_parser(
+        "check-project-stats",
+        help="compare project entry counts and last entry dates with the entries",
+    )
+    project_stats.add_argument(
+        "--repair", action="store_true", help="recompute the stats that drifted"
+    )
+    project_stats.set_defaults(handler=check_project_stats)
+    commands.add_parser(
+        "embed-journal-entries",
+        help="embed the journal entries that have no vector from the embedder",
+    ).set_defaults(handler=embed_journal_entries)
+    activity = commands.add_parser(
+        "rebuild-activity",
+        help="recompute the daily and monthly activity rollups from the journal",
+    )
+    activity.add_argument("--user", help="only rebuild this user's rollups")
+    activity.set_defaults(handler=rebuild_activity)
+    worker = commands.add_parser(
+        "run-worker", help="run background job workers until interrupted"
+    )
+    worker.add_argument(
+        "--concurrency",
+        type=int,
+        default=max(JOB_WORKERS, 1),
+        help="number of workers (default: JOB_WORKERS, at least 1)",
+    )
+    worker.set_defaults(handler=run_worker)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,29 @@
 """Global test fixtures for all domains."""
 
+import httpx
+import jwt
+import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlalchemy.orm import sessionmaker
-from sqlmodel import SQLModel, create_engine
+from database.models import User
+from database.sqlite_tuning import register_sqlite_pragmas
+from domain.auth.auth_config import security
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+# Owners of the rows the domain tests write, seeded in every test database so
+# the foreign keys to ``user`` hold
+TEST_USER_IDS = ("123", "456", "another-user", "u1", "u2", "u3")
+
 
 @pytest_asyncio.fixture(name="engine")
 async def engine_fixture():
-    """Create a new database engine for testing."""
-    engine = AsyncEngine(
-        create_engine(
-            "sqlite+aiosqlite:///:memory:",
-            echo=False,
-            future=True,
-        )
-    )
+    """Create a new database engine for testing, with the production PRAGMAs
+    (foreign keys enforced)."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    register_sqlite_pragmas(engine)
     return engine
 
 
@@ -25,11 +32,55 @@ async def db_session_fixture(engine):
     """Create a new database session for testing."""
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
+        await conn.execute(
+            User.__table__.insert(),
+            [
+                {
+                    "id": user_id,
+                    "email": f"{user_id}@example.com",
+                    "first_name": "Test",
+                    "last_name": user_id,
+                    "password": "",
+                }
+                for user_id in TEST_USER_IDS
+            ],
+        )
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async_session = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
     async with async_session() as session:
         yield session
         await session.rollback()
 
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.drop_all)
+
+
+@pytest.fixture
+def mock_session(mocker):
+    """Session answering the list endpoints' collection version lookup, for
+    router tests that override ``get_session``."""
+    session = mocker.AsyncMock()
+    session.exec.return_value.first = mocker.Mock(return_value=None)
+    return session
+
+
+def send_csrf_header(client: httpx.Client | httpx.AsyncClient, token: str) -> None:
+    """Send the CSRF token of an access token with every request of ``client``."""
+    csrf = jwt.decode(token, options={"verify_signature": False})["csrf"]
+    client.headers[security.config.JWT_ACCESS_CSRF_HEADER_NAME] = csrf
+
+
+def authenticate(client: httpx.Client | httpx.AsyncClient, user_id: str) -> None:
+    """Log ``client`` in as ``user_id`` with an access cookie and its CSRF header."""
+    token = security.create_access_token(user_id, data={"user_id": user_id})
+    client.cookies.set(security.config.JWT_ACCESS_COOKIE_NAME, token)
+    send_csrf_header(client, token)
+
+
+def authed_client(app: FastAPI, user_id: str) -> TestClient:
+    """Create a test client of ``app`` logged in as ``user_id``."""
+    client = TestClient(app)
+    authenticate(client, user_id)
+    return client
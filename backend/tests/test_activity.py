@@ -0,0 +1,127 @@
+"""Tests for the activity rollups and their maintenance on writes."""
+
+from datetime import date, datetime
+
+import pytest
+from database.activity import EntryActivity, rebuild_activity, record_activity
+from database.models import DailyActivity, MonthlyActivity, Project, Technology
+from domain.journal_entry.journal_entry_repo import JournalEntryRepo
+from domain.journal_entry.journal_entry_schema import (
+    JournalEntryCreate,
+    JournalEntryUpdate,
+)
+from domain.project.project_repo import ProjectRepo
+from domain.technology.technology_repo import TechnologyRepo
+from sqlmodel import select
+
+user_id = "123"
+
+
+async def rollups(session) -> dict[tuple, tuple[int, int]]:
+    rows = {}
+    for table, period in ((DailyActivity, "day"), (MonthlyActivity, "month")):
+        results = await session.exec(select(table).where(table.user_id == user_id))
+        for row in results.all():
+            key = (period, getattr(row, period), row.project_id, row.technology_id)
+            rows[key] = (row.entry_count, row.chars)
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_record_activity_counts_entry_once_per_dimension(db_session):
+    """Test that an entry counts in the totals, its project and each technology."""
+    entry = EntryActivity(datetime(2024, 2, 29, 23, 59), "p", frozenset("ab"), 10)
+    await record_activity(db_session, user_id, added=[entry, entry._replace(chars=5)])
+    await db_session.commit()
+
+    assert await rollups(db_session) == {
+        ("day", date(2024, 2, 29), "", ""): (2, 15),
+        ("day", date(2024, 2, 29), "p", ""): (2, 15),
+        ("day", date(2024, 2, 29), "", "a"): (2, 15),
+        ("day", date(2024, 2, 29), "", "b"): (2, 15),
+        ("month", date(2024, 2, 1), "", ""): (2, 15),
+        ("month", date(2024, 2, 1), "p", ""): (2, 15),
+        ("month", date(2024, 2, 1), "", "a"): (2, 15),
+        ("month", date(2024, 2, 1), "", "b"): (2, 15),
+    }
+
+
+@pytest.mark.asyncio
+async def test_record_activity_moves_updated_entry(db_session):
+    """Test that an update moves the counts and drops rows left empty."""
+    before = EntryActivity(datetime(2024, 3, 31), "p", frozenset("a"), 10)
+    after = EntryActivity(datetime(2024, 4, 1), None, frozenset("ab"), 4)
+    await record_activity(db_session, user_id, added=[before])
+    await record_activity(db_session, user_id, added=[after], removed=[before])
+    await db_session.commit()
+
+    assert await rollups(db_session) == {
+        ("day", date(2024, 4, 1), "", ""): (1, 4),
+        ("day", date(2024, 4, 1), "", "a"): (1, 4),
+        ("day", date(2024, 4, 1), "", "b"): (1, 4),
+        ("month", date(2024, 4, 1), "", ""): (1, 4),
+        ("month", date(2024, 4, 1), "", "a"): (1, 4),
+        ("month", date(2024, 4, 1), "", "b"): (1, 4),
+    }
+
+
+@pytest.mark.asyncio
+async def test_writes_keep_rollups_equal_to_a_rebuild(db_session):
+    """Test that every write path leaves the rollups a rebuild would produce."""
+    db_session.add_all(
+        [
+            Project(id="p1", name="Project 1", user_id=user_id),
+            Project(id="p2", name="Project 2", user_id=user_id),
+            *(Technology(id=id, name=id, user_id=user_id) for id in ("py", "js", "go")),
+        ]
+    )
+    await db_session.commit()
+    technologies = {
+        technology.id: technology
+        for technology in (await db_session.exec(select(Technology))).all()
+    }
+    entries = JournalEntryRepo(db_session)
+
+    async def assert_consistent():
+        incremental = await rollups(db_session)
+        await rebuild_activity(db_session, user_id)
+        await db_session.commit()
+        assert incremental == await rollups(db_session)
+        # ProjectRepo opens its own transactions
+        await db_session.commit()
+
+    first = await entries.add_journal_entry(
+        JournalEntryCreate(
+            content="Python", is_private=False, project_id="p1", technologyIds=[]
+        ),
+        [technologies["py"], technologies["js"]],
+        user_id,
+    )
+    await entries.add_journal_entry(
+        JournalEntryCreate(content="Go", is_private=False, technologyIds=[]),
+        [technologies["go"]],
+        user_id,
+    )
+    await assert_consistent()
+    day = first.date.date()
+    assert (await rollups(db_session))[("day", day, "", "")] == (2, 8)
+
+    await entries.update_journal_entry(
+        first.id,
+        JournalEntryUpdate(content="Python 3", project_id="p2"),
+        [technologies["py"], technologies["go"]],
+    )
+    await assert_consistent()
+    assert (await rollups(db_session))[("day", day, "", "go")] == (2, 10)
+
+    await TechnologyRepo(db_session).delete_technology("go", reassign_to="py")
+    await assert_consistent()
+    await TechnologyRepo(db_session).delete_technology("py", force=True)
+    await assert_consistent()
+    await ProjectRepo(db_session).delete_project("p2", detach_entries=True)
+    await assert_consistent()
+
+    assert await rollups(db_session) == {
+        ("day", day, "", ""): (2, 10),
+        ("month", day.replace(day=1), "", ""): (2, 10),
+    }
@@ -0,0 +1,59 @@
+"""Tests for the synthetic dataset generator."""
+
+import pytest
+from benchmarks.dataset import DatasetGenerator, DatasetSpec, generate_dataset
+from database.activity import ALL
+from database.models import (
+    DailyActivity,
+    JournalEntry,
+    JournalEntryTechnologyLink,
+    MonthlyActivity,
+    Project,
+    Technology,
+)
+from sqlalchemy import func, select
+
+spec = DatasetSpec(users=2, projects=3, technologies=5, entries=50, batch_size=20)
+
+
+def test_generator_is_deterministic():
+    """Test that the same seed yields the same rows, ids included."""
+    first, second = DatasetGenerator(spec), DatasetGenerator(spec)
+
+    technology_ids = [f"t{t}" for t in range(spec.technologies)]
+    project_ids = [f"p{p}" for p in range(spec.projects)]
+
+    assert first.technologies("u1") == second.technologies("u1")
+    assert [
+        first.journal_entry("u1", technology_ids, project_ids) for _ in range(20)
+    ] == [second.journal_entry("u1", technology_ids, project_ids) for _ in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_generate_dataset_writes_rows_and_counters(engine):
+    """Test that every row is written and the derived counters match the links."""
+    stats = await generate_dataset(engine, spec, password_hash="hash")
+
+    assert (stats.users, stats.projects, stats.technologies) == (2, 6, 10)
+    assert stats.journal_entries == 100
+    async with engine.connect() as conn:
+        assert await conn.scalar(select(func.count()).select_from(JournalEntry)) == 100
+        links = await conn.scalar(
+            select(func.count()).select_from(JournalEntryTechnologyLink)
+        )
+        assert links == stats.links
+        assert await conn.scalar(select(func.sum(Technology.usage_count))) == links
+        projectless = await conn.scalar(
+            select(func.count())
+            .select_from(JournalEntry)
+            .where(JournalEntry.project_id.is_(None))
+        )
+        assert (
+            await conn.scalar(select(func.sum(Project.entry_count)))
+            == 100 - projectless
+        )
+        for rollup in (DailyActivity, MonthlyActivity):
+            totals = select(func.sum(rollup.entry_count)).where(
+                rollup.project_id == ALL, rollup.technology_id == ALL
+            )
+            assert await conn.scalar(totals) == 100
@@ -0,0 +1,133 @@
+"""Tests for the collection version counters and the conditional GET."""
+
+import pytest
+from core.conditional_get import (
+    CACHE_CONTROL,
+    collection_etag,
+    conditional_list,
+    etag_matches,
+)
+from database.collection_versions import (
+    Collection,
+    bump_collection_for_all_users,
+    bump_collection_versions,
+    get_collection_version,
+)
+from database.session import get_session
+from domain.auth.auth_config import security
+from fastapi import Depends, FastAPI, status
+from fastapi.testclient import TestClient
+
+mock_user_id = "123"
+
+
+@pytest.mark.asyncio
+async def test_bump_collection_versions_counts_per_user_and_collection(db_session):
+    """Test that bumps start at 1 and only touch the named collections."""
+    assert (
+        await get_collection_version(db_session, mock_user_id, Collection.PROJECTS) == 0
+    )
+
+    await bump_collection_versions(
+        db_session, mock_user_id, Collection.PROJECTS, Collection.PROJECTS
+    )
+    await bump_collection_versions(
+        db_session, mock_user_id, Collection.PROJECTS, Collection.TECHNOLOGIES
+    )
+    await bump_collection_versions(db_session, "other", Collection.PROJECTS)
+    await db_session.commit()
+
+    assert (
+        await get_collection_version(db_session, mock_user_id, Collection.PROJECTS) == 2
+    )
+    assert (
+        await get_collection_version(db_session, mock_user_id, Collection.TECHNOLOGIES)
+        == 1
+    )
+    assert (
+        await get_collection_version(
+            db_session, mock_user_id, Collection.JOURNAL_ENTRIES
+        )
+        == 0
+    )
+    assert await get_collection_version(db_session, "other", Collection.PROJECTS) == 1
+
+
+@pytest.mark.asyncio
+async def test_bump_collection_for_all_users(db_session):
+    """Test that a repair invalidates the collection of every user."""
+    await bump_collection_versions(db_session, mock_user_id, Collection.PROJECTS)
+    await bump_collection_versions(db_session, "other", Collection.PROJECTS)
+
+    await bump_collection_for_all_users(db_session, Collection.PROJECTS)
+    await db_session.commit()
+
+    assert (
+        await get_collection_version(db_session, mock_user_id, Collection.PROJECTS) == 2
+    )
+    assert await get_collection_version(db_session, "other", Collection.PROJECTS) == 2
+
+
+def test_collection_etag_depends_on_user_collection_query_and_version():
+    """Test that every part of a list response's identity changes the ETag."""
+    etag = collection_etag(Collection.PROJECTS, mock_user_id, 1, "")
+
+    assert etag.startswith('W/"') and etag.endswith('-1"')
+    assert etag != collection_etag(Collection.PROJECTS, "other", 1, "")
+    assert etag != collection_etag(Collection.TECHNOLOGIES, mock_user_id, 1, "")
+    assert etag != collection_etag(Collection.PROJECTS, mock_user_id, 1, "limit=5")
+    assert etag != collection_etag(Collection.PROJECTS, mock_user_id, 2, "")
+
+
+def test_etag_matches():
+    """Test weak comparison against If-None-Match lists and wildcards."""
+    etag = 'W/"abc-1"'
+
+    assert etag_matches('W/"abc-1"', etag)
+    assert etag_matches('"abc-1"', etag)
+    assert etag_matches('W/"xyz-1", W/"abc-1"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"abc-2"', etag)
+    assert not etag_matches(None, etag)
+
+
+@pytest.fixture
+def client(db_session):
+    """Create a client for an app with one conditional list endpoint."""
+    app = FastAPI()
+    calls = []
+
+    @app.get("/items", dependencies=[Depends(conditional_list(Collection.PROJECTS))])
+    async def items():
+        calls.append(1)
+        return ["item"]
+
+    app.dependency_overrides[get_session] = lambda: db_session
+    client = TestClient(app)
+    client.calls = calls
+    token = security.create_access_token(mock_user_id, data={"user_id": mock_user_id})
+    client.cookies.set(security.config.JWT_ACCESS_COOKIE_NAME, token)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_conditional_list_answers_304_until_a_bump(client, db_session):
+    """Test that a matching If-None-Match skips the endpoint until a write."""
+    response = client.get("/items")
+    etag = response.headers["ETag"]
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Cache-Control"] == CACHE_CONTROL
+
+    response = client.get("/items", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    assert len(client.calls) == 1
+
+    await bump_collection_versions(db_session, mock_user_id, Collection.PROJECTS)
+    await db_session.commit()
+
+    response = client.get("/items", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert len(client.calls) == 2
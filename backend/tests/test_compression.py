@@ -0,0 +1,130 @@
+"""Tests for the response compression middleware."""
+
+import gzip
+import json
+import zlib
+
+import pytest
+from core.compression import CompressionMiddleware, negotiate_encoding
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+ROWS = [{"id": i, "content": f"journal entry number {i} " * 10} for i in range(50)]
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return ROWS
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/stream")
+    async def stream():
+        async def rows():
+            for row in ROWS:
+                yield json.dumps(row) + "\n"
+
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    @app.get("/archive")
+    async def archive():
+        return Response(gzip.compress(b"x" * 4096), media_type="application/gzip")
+
+    return app
+
+
+def make_client(app, encodings=("gzip",), minimum_size=500):
+    return TestClient(
+        CompressionMiddleware(app, encodings=list(encodings), minimum_size=minimum_size)
+    )
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("gzip, br;q=0.5", "gzip"),
+        ("br;q=0.9, gzip;q=0.9", "br"),
+        ("zstd;q=0, gzip", "gzip"),
+        ("*", "zstd"),
+        ("*;q=0.1, gzip;q=0.5", "gzip"),
+        ("identity", None),
+        ("", None),
+        ("gzip;q=abc", None),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    """Test that the highest q wins and ties follow the server's order."""
+    assert negotiate_encoding(header, ["zstd", "br", "gzip"]) == expected
+
+
+def test_large_json_is_compressed(app):
+    """Test that a JSON body above the threshold is gzipped."""
+    response = make_client(app).get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(json.dumps(ROWS)) / 5
+    assert response.json() == ROWS
+
+
+def test_uncompressed_without_accept_encoding(app):
+    """Test that clients not asking for compression get the plain body."""
+    response = make_client(app).get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.json() == ROWS
+
+
+def test_small_body_is_not_compressed(app):
+    """Test that bodies below the threshold are sent as is."""
+    response = make_client(app).get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.text == "ok"
+
+
+def test_non_text_content_type_passes_through(app):
+    """Test that an already compressed download is not compressed again."""
+    response = make_client(app).get("/archive", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert "Vary" not in response.headers
+    assert gzip.decompress(response.content) == b"x" * 4096
+
+
+def test_streaming_response_is_compressed_per_chunk(app):
+    """Test that every streamed chunk is flushed and decodable on arrival."""
+    client = make_client(app)
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    lines = []
+    with client.stream(
+        "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        for chunk in response.iter_raw():
+            lines.extend(decompressor.decompress(chunk).splitlines())
+
+    assert [json.loads(line) for line in lines] == ROWS
+
+
+@pytest.mark.parametrize("coding, module", [("br", "brotli"), ("zstd", "zstandard")])
+def test_optional_encodings(app, coding, module):
+    """Test brotli and zstd when their libraries are installed."""
+    pytest.importorskip(module)
+    client = make_client(app, encodings=(coding, "gzip"))
+
+    response = client.get("/large", headers={"Accept-Encoding": f"gzip, {coding}"})
+
+    assert response.headers["Content-Encoding"] == coding
+    # httpx decodes both codings when the same libraries are installed
+    assert response.json() == ROWS
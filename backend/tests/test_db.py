@@ -0,0 +1,42 @@
+"""Tests for the database engine factory."""
+
+from database.db import create_engine_from_settings, to_async_url
+from sqlalchemy.pool import StaticPool
+
+
+def test_to_async_url_adds_async_drivers():
+    """Test that driverless URLs are upgraded to async drivers."""
+    assert to_async_url("sqlite:///database.db").drivername == "sqlite+aiosqlite"
+    assert (
+        to_async_url("postgresql://user:pw@localhost/journal").drivername
+        == "postgresql+asyncpg"
+    )
+    assert (
+        to_async_url("postgres://user:pw@localhost/journal").drivername
+        == "postgresql+asyncpg"
+    )
+
+
+def test_to_async_url_keeps_explicit_driver():
+    """Test that an explicitly chosen driver is left alone."""
+    url = to_async_url("sqlite+aiosqlite:///database.db")
+    assert url.drivername == "sqlite+aiosqlite"
+
+
+def test_create_engine_from_settings_applies_pool_settings(mocker, tmp_path):
+    """Test that file databases get the configured pool."""
+    mocker.patch("database.db.DB_POOL_SIZE", 7)
+    mocker.patch("database.db.DB_MAX_OVERFLOW", 3)
+
+    engine = create_engine_from_settings(f"sqlite:///{tmp_path / 'test.db'}")
+
+    assert engine.pool.size() == 7
+    assert engine.pool._max_overflow == 3
+    assert engine.echo is False
+
+
+def test_create_engine_from_settings_memory_database():
+    """Test that in-memory SQLite skips pool sizing."""
+    engine = create_engine_from_settings("sqlite+aiosqlite:///:memory:")
+
+    assert isinstance(engine.pool, StaticPool)
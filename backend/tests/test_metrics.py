@@ -0,0 +1,113 @@
+"""Tests for the request metrics middleware and Prometheus rendering."""
+
+import logging
+
+import pytest
+from core.metrics import (
+    Histogram,
+    MetricsRegistry,
+    RequestMetricsMiddleware,
+    UNMATCHED_ROUTE,
+    router,
+)
+from database.query_stats import register_query_stats
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test that values land in the first bucket whose bound is not below them."""
+    histogram = Histogram((1, 5))
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.samples() == [("1", 2), ("5", 3), ("+Inf", 4)]
+    assert histogram.sum == 14.5
+    assert histogram.count == 4
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def client(registry):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    register_query_stats(engine)
+    app = FastAPI()
+
+    @app.get("/items/{id}")
+    async def get_item(id: str, queries: int = 1):
+        async with engine.connect() as conn:
+            for _ in range(queries):
+                await conn.execute(text("SELECT 1"))
+        return {"id": id}
+
+    return TestClient(
+        RequestMetricsMiddleware(app, registry=registry, query_alarm_threshold=3)
+    )
+
+
+def test_requests_are_recorded_by_route_template(client, registry):
+    """Test that observations use the template, not the concrete path."""
+    response = client.get("/items/1", params={"queries": 2})
+    client.get("/items/2")
+    client.get("/missing")
+
+    assert response.status_code == 200
+    server_timing = response.headers["Server-Timing"]
+    assert server_timing.startswith("app;dur=")
+    assert 'desc="2 queries"' in server_timing
+
+    assert registry.durations[("GET", "/items/{id}", "200")].count == 2
+    assert registry.statements[("GET", "/items/{id}")].sum == 3
+    assert registry.durations[("GET", UNMATCHED_ROUTE, "404")].count == 1
+
+
+def test_query_alarm_fires_above_threshold(client, registry, caplog):
+    """Test that a request over the statement threshold is logged and counted."""
+    with caplog.at_level(logging.WARNING, logger="core.metrics"):
+        client.get("/items/1", params={"queries": 3})
+        client.get("/items/1", params={"queries": 4})
+
+    assert registry.query_alarms == {("GET", "/items/{id}"): 1}
+    assert "Suspected N+1: GET /items/{id} ran 4 SQL statements" in caplog.text
+
+
+def test_render_prometheus_text(client, registry):
+    """Test the exposition format of the recorded histograms."""
+    client.get("/items/1", params={"queries": 4})
+
+    body = registry.render()
+
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert (
+        'http_request_db_statements_bucket{method="GET",route="/items/{id}",le="5"} 1'
+        in body
+    )
+    assert 'http_request_db_statements_sum{method="GET",route="/items/{id}"} 4' in body
+    assert 'http_request_query_alarms_total{method="GET",route="/items/{id}"} 1' in body
+    assert body.endswith("\n")
+
+
+def test_metrics_endpoint_requires_the_token(monkeypatch):
+    """Test that only requests with the configured bearer token are answered."""
+    app = FastAPI()
+    app.include_router(router, prefix="/metrics")
+    client = TestClient(app)
+
+    monkeypatch.setattr("core.metrics.METRICS_TOKEN", "")
+    assert (
+        client.get("/metrics", headers={"Authorization": "Bearer "}).status_code == 401
+    )
+
+    monkeypatch.setattr("core.metrics.METRICS_TOKEN", "scrape")
+    assert client.get("/metrics").status_code == 401
+    wrong = client.get("/metrics", headers={"Authorization": "Bearer other"})
+    assert wrong.status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape"})
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
@@ -0,0 +1,97 @@
+"""Tests for the startup migration-state check."""
+
+import database.db_config
+import pytest
+import pytest_asyncio
+from alembic import command
+from database.db import create_engine_from_settings
+from database.migrations import (
+    MigrationStateError,
+    alembic_config,
+    check_migration_state,
+    current_revisions,
+    head_revisions,
+    prepare_database,
+)
+from sqlalchemy import inspect
+
+
+@pytest_asyncio.fixture
+async def file_engine(tmp_path):
+    """Create an engine on an empty SQLite file."""
+    engine = create_engine_from_settings(f"sqlite:///{tmp_path / 'startup.db'}")
+    yield engine
+    await engine.dispose()
+
+
+async def stamp(engine, revision: str) -> None:
+    """Record ``revision`` in alembic_version without running migrations."""
+    async with engine.begin() as conn:
+        await conn.exec_driver_sql(
+            "CREATE TABLE alembic_version (version_num VARCHAR(32) NOT NULL)"
+        )
+        await conn.exec_driver_sql(f"INSERT INTO alembic_version VALUES ('{revision}')")
+
+
+def test_head_revisions_single_head():
+    """Test that the migration scripts have exactly one head."""
+    assert len(head_revisions()) == 1
+
+
+@pytest.mark.asyncio
+async def test_check_migration_state_unmigrated_database(file_engine, caplog):
+    """Test that an unmigrated database is reported, not failed, by default."""
+    assert await current_revisions(file_engine) == set()
+    assert await check_migration_state(file_engine) is False
+    assert "manage.py migrate" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_check_migration_state_strict_raises(file_engine):
+    """Test that strict mode refuses a database behind head."""
+    await stamp(file_engine, "b101d0fa4705")
+
+    with pytest.raises(MigrationStateError):
+        await check_migration_state(file_engine, strict=True)
+
+
+@pytest.mark.asyncio
+async def test_check_migration_state_at_head(file_engine):
+    """Test that a database stamped at head passes."""
+    (head,) = head_revisions()
+    await stamp(file_engine, head)
+
+    assert await check_migration_state(file_engine, strict=True) is True
+
+
+@pytest.mark.asyncio
+async def test_prepare_database_create_all(file_engine):
+    """Test that create_all mode builds the tables."""
+    await prepare_database(file_engine, mode="create_all")
+
+    async with file_engine.connect() as conn:
+        tables = await conn.run_sync(lambda c: inspect(c).get_table_names())
+    assert "journal_entry" in tables
+
+
+@pytest.mark.asyncio
+async def test_prepare_database_off(file_engine):
+    """Test that off mode does not touch the database."""
+    await prepare_database(file_engine, mode="off")
+
+    async with file_engine.connect() as conn:
+        tables = await conn.run_sync(lambda c: inspect(c).get_table_names())
+    assert tables == []
+
+
+def test_models_match_migrations_at_head(tmp_path, monkeypatch):
+    """Test that autogenerate finds nothing to change on a database at head,
+    the full-text search index included."""
+    monkeypatch.setattr(
+        database.db_config, "DATABASE_URL", f"sqlite:///{tmp_path / 'head.db'}"
+    )
+    config = alembic_config()
+    command.upgrade(config, "head")
+
+    # Raises if the models and the migrated schema differ
+    command.check(config)
@@ -0,0 +1,47 @@
+"""Tests for per-request SQL statement counting."""
+
+import pytest
+from database.query_stats import (
+    current_query_stats,
+    register_query_stats,
+    track_queries,
+)
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_statements_in_context():
+    """Test that statements inside the block are counted and timed."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    register_query_stats(engine)
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))  # outside any block
+        with track_queries() as stats:
+            assert current_query_stats() is stats
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+    await engine.dispose()
+
+    assert current_query_stats() is None
+    assert stats.statements == 2
+    assert stats.duration > 0
+
+
+@pytest.mark.asyncio
+async def test_track_queries_survives_failed_statements():
+    """Test that a failing statement does not break later timings."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    register_query_stats(engine)
+
+    async with engine.connect() as conn:
+        with track_queries() as stats:
+            with pytest.raises(OperationalError):
+                await conn.execute(text("SELECT * FROM missing_table"))
+            await conn.execute(text("SELECT 1"))
+        assert conn.sync_connection.info["query_started"] == []
+    await engine.dispose()
+
+    assert stats.statements == 1
@@ -0,0 +1,75 @@
+"""Tests for the JSON response helpers."""
+
+import json
+from datetime import datetime
+
+from core.responses import ModelResponse, type_adapter
+from database.models import JournalEntry, Project, Technology
+from domain.journal_entry.journal_entry_schema import JournalEntryPage
+from domain.technology.technology_schema import TechnologyWithCount
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def make_page() -> JournalEntryPage:
+    technology = Technology(id="py", name="Python", user_id="123", usage_count=1)
+    project = Project(id="p1", name="Project", user_id="123")
+    entry = JournalEntry(
+        id="e1",
+        content="Entry",
+        date=datetime(2025, 1, 1, 12, 30),
+        project_id="p1",
+        user_id="123",
+    )
+    entry.technologies = [technology]
+    entry.project = project
+    return JournalEntryPage(items=[entry], next_cursor="next")
+
+
+def test_type_adapter_is_cached():
+    """Test that one adapter is built per annotation."""
+    assert type_adapter(list[TechnologyWithCount]) is type_adapter(
+        list[TechnologyWithCount]
+    )
+
+
+def test_model_response_matches_response_model_serialization():
+    """Test that the fast path renders what response_model validation would."""
+    app = FastAPI()
+
+    @app.get("/default", response_model=JournalEntryPage)
+    async def default():
+        return make_page()
+
+    @app.get("/fast", response_model=JournalEntryPage)
+    async def fast():
+        return ModelResponse(make_page(), headers={"ETag": 'W/"x-1"'})
+
+    client = TestClient(app)
+    expected = client.get("/default").json()
+    response = client.get("/fast")
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["ETag"] == 'W/"x-1"'
+    assert response.json() == expected
+    assert expected["items"][0]["isPrivate"] is False
+    assert expected["nextCursor"] == "next"
+
+
+def test_model_response_serializes_lists():
+    """Test that list responses are serialized with the given annotation."""
+    technologies = [
+        TechnologyWithCount(id="py", name="Python", usage_count=2),
+    ]
+
+    response = ModelResponse(technologies, list[TechnologyWithCount])
+
+    assert json.loads(response.body) == [
+        {
+            "id": "py",
+            "name": "Python",
+            "description": None,
+            "language": None,
+            "usageCount": 2,
+        }
+    ]
@@ -0,0 +1,134 @@
+"""Tests for the slow-query log."""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+from database.models import SQLModel
+from database.slow_queries import (
+    SlowQueryLog,
+    explain,
+    has_full_scan,
+    normalize_sql,
+    redact_parameters,
+    register_slow_query_log,
+)
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+
+def test_normalize_sql_replaces_literals_and_parameters():
+    """Test that statements differing only in values share a fingerprint."""
+    assert (
+        normalize_sql(
+            "SELECT *  FROM technology\n WHERE user_id = ? AND name = 'Py''thon' "
+            "AND id IN (?, ?, ?) LIMIT 20"
+        )
+        == "SELECT * FROM technology WHERE user_id = ? AND name = ? "
+        "AND id IN (?, ...) LIMIT ?"
+    )
+    assert normalize_sql("SELECT $1::text, :name, %(id)s") == "SELECT ?::text, ?, ?"
+
+
+def test_redact_parameters_keeps_only_types():
+    """Test that parameter values never reach the log."""
+    assert redact_parameters(("secret", 3, None)) == "['<str>', '<int>', 'NULL']"
+    assert redact_parameters({"email": "a@b.c"}) == "{'email': '<str>'}"
+    assert redact_parameters([("a",), ("b",)], executemany=True) == (
+        "<2 parameter sets>"
+    )
+
+
+def test_has_full_scan():
+    """Test full scan detection in SQLite and Postgres plans."""
+    assert has_full_scan("SCAN journal_entry")
+    assert not has_full_scan("SEARCH journal_entry USING INDEX ix (user_id=?)")
+    assert not has_full_scan("SCAN technology USING COVERING INDEX ix_technology")
+    assert has_full_scan('[{"Plan": {"Node Type": "Seq Scan"}}]')
+    assert not has_full_scan(None)
+
+
+@pytest.mark.asyncio
+async def test_slow_statements_are_logged_once_with_plan(caplog):
+    """Test aggregation by fingerprint and a single log line with the plan."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    log = SlowQueryLog(threshold_ms=1e-6)
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    register_slow_query_log(engine, log)
+
+    with caplog.at_level(logging.WARNING, logger="database.slow_queries"):
+        async with engine.connect() as conn:
+            for content in ("first", "second"):
+                await conn.execute(
+                    text("SELECT id FROM journal_entry WHERE content = :content"),
+                    {"content": content},
+                )
+            await conn.execute(
+                text("SELECT id FROM journal_entry WHERE user_id = :user_id"),
+                {"user_id": "123"},
+            )
+    await engine.dispose()
+
+    by_sql = {query.sql: query for query in log.top()}
+    scan = by_sql["SELECT id FROM journal_entry WHERE content = ?"]
+    search = by_sql["SELECT id FROM journal_entry WHERE user_id = ?"]
+    assert scan.count == 2
+    assert scan.full_scan
+    assert scan.parameters == "['<str>']"
+    assert search.count == 1
+    assert not search.full_scan
+    assert search.plan.startswith("SEARCH journal_entry USING")
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert sum("WHERE content = ?" in message for message in messages) == 1
+    assert not any("first" in message for message in messages)
+
+
+def test_log_evicts_cheapest_fingerprint():
+    """Test that the log stays bounded."""
+    log = SlowQueryLog(threshold_ms=1, explain=False, max_fingerprints=2)
+    log.record(None, "SELECT 1 FROM a", (), False, 0.5)
+    log.record(None, "SELECT 1 FROM b", (), False, 0.01)
+    log.record(None, "SELECT 1 FROM c", (), False, 0.2)
+
+    assert [query.sql for query in log.top()] == [
+        "SELECT ? FROM a",
+        "SELECT ? FROM c",
+    ]
+    assert log.top(sort="count")[0].count == 1
+
+
+class FailingExplainCursor:
+    """A DBAPI cursor recording its statements, on which EXPLAIN fails."""
+
+    def __init__(self, executed: list[str]) -> None:
+        self.executed = executed
+
+    def execute(self, statement, parameters=None):
+        self.executed.append(statement)
+        if statement.startswith("EXPLAIN"):
+            raise RuntimeError("syntax error")
+
+    def close(self):
+        pass
+
+
+def test_failed_postgres_explain_is_rolled_back_to_a_savepoint():
+    """Test that a failed EXPLAIN does not abort the caller's transaction."""
+    executed = []
+    dbapi_connection = SimpleNamespace(cursor=lambda: FailingExplainCursor(executed))
+    conn = SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql"),
+        connection=SimpleNamespace(dbapi_connection=dbapi_connection),
+    )
+
+    plan = explain(conn, "SELECT * FROM t WHERE id = $1", ("1",))
+
+    assert plan == "EXPLAIN failed: syntax error"
+    assert executed == [
+        "SAVEPOINT slow_query_explain",
+        "EXPLAIN (FORMAT JSON) SELECT * FROM t WHERE id = $1",
+        "ROLLBACK TO SAVEPOINT slow_query_explain",
+        "RELEASE SAVEPOINT slow_query_explain",
+    ]
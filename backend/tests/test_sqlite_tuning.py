@@ -0,0 +1,106 @@
+"""Tests for the SQLite connection PRAGMAs and maintenance task."""
+
+import asyncio
+
+import pytest
+from database.db import create_engine_from_settings
+from database.full_text_search import FTS_TABLE, rebuild_search_index
+from database.models import SQLModel
+from database.sqlite_tuning import (
+    run_sqlite_maintenance,
+    sqlite_maintenance,
+    vacuum_sqlite,
+)
+
+
+@pytest.mark.asyncio
+async def test_pragmas_applied_on_connect(tmp_path):
+    """Test that every new connection gets the configured PRAGMAs."""
+    engine = create_engine_from_settings(f"sqlite:///{tmp_path / 'tuned.db'}")
+    try:
+        async with engine.connect() as conn:
+            journal_mode = await conn.exec_driver_sql("PRAGMA journal_mode")
+            synchronous = await conn.exec_driver_sql("PRAGMA synchronous")
+            busy_timeout = await conn.exec_driver_sql("PRAGMA busy_timeout")
+            foreign_keys = await conn.exec_driver_sql("PRAGMA foreign_keys")
+
+            assert journal_mode.scalar() == "wal"
+            assert synchronous.scalar() == 1  # NORMAL
+            assert busy_timeout.scalar() == 5000
+            assert foreign_keys.scalar() == 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_run_sqlite_maintenance(tmp_path):
+    """Test that checkpoint and optimize run without error."""
+    engine = create_engine_from_settings(f"sqlite:///{tmp_path / 'tuned.db'}")
+    try:
+        await run_sqlite_maintenance(engine)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_maintenance_runs_periodically(mocker, tmp_path):
+    """Test that the maintenance task runs on its interval until closed."""
+    engine = create_engine_from_settings(f"sqlite:///{tmp_path / 'tuned.db'}")
+    maintenance = mocker.patch(
+        "database.sqlite_tuning.run_sqlite_maintenance", new=mocker.AsyncMock()
+    )
+    try:
+        async with sqlite_maintenance(engine, interval=0.01):
+            await asyncio.sleep(0.05)
+        calls = maintenance.await_count
+        await asyncio.sleep(0.03)
+
+        assert calls >= 1
+        assert maintenance.await_count == calls
+    finally:
+        await engine.dispose()
+
+
+async def search(conn, word: str) -> list[str]:
+    results = await conn.exec_driver_sql(
+        f"SELECT journal_entry.id FROM {FTS_TABLE} "
+        f"JOIN journal_entry ON journal_entry.rowid = {FTS_TABLE}.rowid "
+        f"WHERE {FTS_TABLE} MATCH ?",
+        (word,),
+    )
+    return [row[0] for row in results.all()]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_search_index_follows_renumbered_rowids(tmp_path):
+    """Test that the search index is re-keyed after rowids change, e.g. when a
+    migration copies journal_entry, and that vacuuming keeps it usable."""
+    engine = create_engine_from_settings(f"sqlite:///{tmp_path / 'search.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.exec_driver_sql(
+                "INSERT INTO user (id, email, first_name, last_name, password) "
+                "VALUES ('u1', 'u1@example.com', 'U', 'One', 'x')"
+            )
+            for id, content in (("a", "python"), ("b", "rust"), ("c", "go")):
+                await conn.exec_driver_sql(
+                    "INSERT INTO journal_entry (id, content, date, is_private, user_id)"
+                    " VALUES (?, ?, '2024-01-01', 0, 'u1')",
+                    (id, content),
+                )
+            # Renumber behind the triggers' back, as a table copy does
+            for id, rowid in (("a", 100), ("c", 1), ("a", 3)):
+                await conn.exec_driver_sql(
+                    "UPDATE journal_entry SET rowid = ? WHERE id = ?", (rowid, id)
+                )
+            assert await search(conn, "python") == ["c"]
+
+        await rebuild_search_index(engine)
+        await vacuum_sqlite(engine)
+
+        async with engine.connect() as conn:
+            assert await search(conn, "python") == ["a"]
+            assert await search(conn, "go") == ["c"]
+    finally:
+        await engine.dispose()
@@ -0,0 +1,61 @@
+"""Tests for the summary periods and their invalidation."""
+
+from datetime import date, datetime
+
+import pytest
+from database.models import Summary
+from database.summaries import Period, mark_summaries_stale, period_end, period_start
+from sqlmodel import select
+
+
+@pytest.mark.parametrize(
+    "period, start, end",
+    [
+        (Period.DAY, date(2024, 2, 29), date(2024, 3, 1)),
+        (Period.WEEK, date(2024, 2, 26), date(2024, 3, 4)),
+        (Period.MONTH, date(2024, 2, 1), date(2024, 3, 1)),
+        (Period.YEAR, date(2024, 1, 1), date(2025, 1, 1)),
+    ],
+)
+def test_period_bounds(period, start, end):
+    """Test the period containing 2024-02-29 (a Thursday in a leap year)."""
+    assert period_start(period, date(2024, 2, 29)) == start
+    assert period_end(period, start) == end
+
+
+@pytest.mark.asyncio
+async def test_mark_summaries_stale_marks_enclosing_periods(db_session):
+    """Test that only the summaries containing the moment become stale."""
+    for period, start in [
+        (Period.DAY, date(2024, 2, 29)),
+        (Period.DAY, date(2024, 3, 1)),
+        (Period.WEEK, date(2024, 2, 26)),
+        (Period.MONTH, date(2024, 2, 1)),
+        (Period.MONTH, date(2024, 3, 1)),
+        (Period.YEAR, date(2024, 1, 1)),
+    ]:
+        for user_id in ("123", "456"):
+            db_session.add(
+                Summary(
+                    user_id=user_id,
+                    period=period.value,
+                    period_start=start,
+                    content="summary",
+                    input_hash="hash",
+                    model="extractive",
+                )
+            )
+    await db_session.commit()
+
+    await mark_summaries_stale(db_session, "123", datetime(2024, 2, 29, 23, 59))
+    await db_session.commit()
+
+    results = await db_session.exec(
+        select(Summary.period, Summary.period_start).where(Summary.stale)
+    )
+    assert sorted(results.all()) == [
+        ("day", date(2024, 2, 29)),
+        ("month", date(2024, 2, 1)),
+        ("week", date(2024, 2, 26)),
+        ("year", date(2024, 1, 1)),
+    ]
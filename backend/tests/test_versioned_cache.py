@@ -0,0 +1,54 @@
+"""Tests for the per-user versioned LRU cache."""
+
+from core.versioned_cache import VersionedCache
+
+
+def test_get_serves_only_the_cached_version():
+    cache = VersionedCache[list](max_users=2)
+    cache.put("u1", 3, ["a"])
+
+    assert cache.get("u1", 3) == ["a"]
+    assert cache.get("u1", 4) is None
+    assert cache.get("u2", 3) is None
+
+
+def test_put_evicts_the_least_recently_used_user():
+    cache = VersionedCache[str](max_users=2)
+    cache.put("u1", 1, "one")
+    cache.put("u2", 1, "two")
+    cache.get("u1", 1)
+
+    cache.put("u3", 1, "three")
+
+    assert cache.get("u2", 1) is None
+    assert cache.get("u1", 1) == "one"
+    assert cache.get("u3", 1) == "three"
+
+
+def test_advance_applies_only_the_next_version():
+    cache = VersionedCache[list](max_users=2)
+    cache.put("u1", 3, ["a"])
+
+    cache.advance("u1", 4, lambda value: value.append("b"))
+    assert cache.get("u1", 4) == ["a", "b"]
+
+    # Another write came in between
+    cache.advance("u1", 6, lambda value: value.append("c"))
+    assert cache.get("u1", 6) is None
+
+    # Nothing cached, nothing to update
+    cache.advance("u2", 1, lambda value: value.append("d"))
+    assert cache.get("u2", 1) is None
+
+
+def test_discard_and_clear_drop_values():
+    cache = VersionedCache[str](max_users=2)
+    cache.put("u1", 1, "one")
+    cache.put("u2", 1, "two")
+
+    cache.discard("u1")
+    cache.discard("u3")
+    assert cache.get("u1", 1) is None
+
+    cache.clear()
+    assert cache.get("u2", 1) is None
@@ -1,10 +1,18 @@
 import { apiClient } from './client'
-import type { JournalEntry, JournalEntryCreateDto, JournalEntryUpdateDto } from '@/types'
+import type {
+  JournalEntry,
+  JournalEntryCreateDto,
+  JournalEntryPage,
+  JournalEntryUpdateDto,
+} from '@/types'
 
 const BASE_URL = '/journal-entries'
 
-export const getJournalEntriesFromApi = async () =>
-  await apiClient.get<JournalEntry[]>(BASE_URL, { withCredentials: true })
+export const getJournalEntriesFromApi = async (cursor?: string) =>
+  await apiClient.get<JournalEntryPage>(BASE_URL, {
+    params: { cursor },
+    withCredentials: true,
+  })
 
 export const createJournalEntry = async (dto: JournalEntryCreateDto) =>
   await apiClient.post<JournalEntry>(BASE_URL, dto, {
@@ -1,6 +1,6 @@
 import { createJournalEntry, getJournalEntriesFromApi } from '@/api'
 import { useToast } from '@/components/ui/toast'
-import { useMutation, useQuery, useQueryClient } from '@tanstack/vue-query'
+import { useInfiniteQuery, useMutation, useQueryClient } from '@tanstack/vue-query'
 
 export const journalEntryQueryKeys = {
   all: ['journal-entries'] as const,
@@ -10,28 +10,39 @@ export const journalEntryQueryKeys = {
 
 export const useJournalEntryService = () => {
   const { toast } = useToast()
-  const getJournalEntries = async () => {
+  const getJournalEntries = async (cursor?: string) => {
     try {
-      return await getJournalEntriesFromApi()
+      return await getJournalEntriesFromApi(cursor)
     } catch (error: unknown) {
       console.error('getJournalEntries', error)
       toast({
         title: 'Something went wrong while fetching journal entries',
         description: 'Please try again later.',
       })
+      throw error
     }
   }
 
   const {
-    data: journalEntries,
+    data,
     isLoading,
     isFetched,
-  } = useQuery({
+    hasNextPage,
+    isFetchingNextPage,
+    fetchNextPage,
+  } = useInfiniteQuery({
     queryKey: journalEntryQueryKeys.list(),
-    queryFn: getJournalEntries,
+    queryFn: ({ pageParam }) => getJournalEntries(pageParam),
+    initialPageParam: undefined as string | undefined,
+    // Pages are newest first; the last one's cursor leads to older entries
+    getNextPageParam: (lastPage) => lastPage.nextCursor ?? undefined,
+    // A failed page is reported once, by getJournalEntries
+    retry: false,
   })
 
-  return { journalEntries, isLoading, isFetched }
+  const journalEntries = computed(() => data.value?.pages.flatMap((page) => page.items))
+
+  return { journalEntries, isLoading, isFetched, hasNextPage, isFetchingNextPage, fetchNextPage }
 }
 
 export const useJournalEntryMutationService = () => {
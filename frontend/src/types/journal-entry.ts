@@ -13,5 +13,10 @@ export type JournalEntry = {
   userId: string
 }
 
+export type JournalEntryPage = {
+  items: JournalEntry[]
+  nextCursor: string | null
+}
+
 export type JournalEntryCreateDto = z.infer<typeof journalEntryCreate>
 export type JournalEntryUpdateDto = z.infer<typeof journalEntryUpdate>
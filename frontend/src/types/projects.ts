@@ -8,6 +8,7 @@ export type Project = {
   link?: string | null
   technologies: string[]
   lastEntryDate?: string
+  entryCount: number
   isPrivate: boolean
 }
 